@@ -53,7 +53,7 @@ def checkout_pin(parsed_args, config):
                 # Capture error output from manifest parser stdout so it is hidden unless verbose is enabled
                 stdout = sys.stdout
                 sys.stdout = io.StringIO()
-                pin = ManifestXml(pin_file)
+                pin = ManifestXml(pin_file, lazy=True)
                 parse_output = sys.stdout.getvalue()
                 sys.stdout = stdout
                 if parsed_args.verbose and parse_output.strip() != '':
@@ -84,6 +84,7 @@ def main():
         config = {}
         config["cfg_file"] = config_factory.GlobalConfig()
         config["user_cfg_file"] = config_factory.GlobalUserConfig()
+        config_factory.enable_manifest_cache(config["user_cfg_file"])
         if command_name not in command_completions:
             return 1
         command_completions[command_name](parsed_args, config)
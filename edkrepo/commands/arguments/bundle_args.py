@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+#
+## @file
+# bundle_args.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+''' Contains the help and description strings for arguments in the
+bundle command meta data.
+'''
+
+COMMAND_DESCRIPTION = 'Creates git bundles that can seed offline or bandwidth limited clones and syncs.'
+CREATE_HELP = ('Write a bundle for every repository in a combination of the current workspace. The bundles can be '
+               'passed to "edkrepo clone --bundle-dir" or "edkrepo sync --bundle-dir".')
+ACTION_HELP = 'Which action to take: "create"'
+BUNDLE_DIR_HELP = 'The directory the bundles are written to. It is created if it does not exist.'
+COMBINATION_HELP = 'The combination to create bundles for. If not specified the current combination is used.'
@@ -14,3 +14,4 @@ checkout command meta data.
 COMMAND_DESCRIPTION = 'Enables checking out a specific branch combination defined in the project manifest file.'
 COMBINATION_DESCRIPTION = 'edkrepo checkout [combination]'
 COMBINATION_HELP = 'The name of the branch combination to checkout as defined in the project manifest file. If not specified, re-checks out the current combination.'
+WORKTREE_HELP = 'Give each combination its own git worktrees that share the object store of the workspace, so switching to a combination that was checked out before only re-points the workspace. Once enabled, every checkout of the workspace uses worktrees.'
@@ -37,12 +37,30 @@ SINGLE_BRANCH_HELP = ('Clone only the history leading to the tip of a single bra
                       'The branch is determined by the default combination or by the Combination parameter.')
 NO_TAGS_HELP = ('Skips download of tags and updates config settings to ensure that future pull and fetch operations do not follow tags.\n'
                 'Future explicit tag fetches will continue to work as expected.')
+FULL_FETCH_HELP = ('Configure each repository to fetch every branch of its remote. By default only the branches used by '
+                   'the project manifest are fetched.')
 REFERENCE_IF_ABLE_HELP = ('Use configured reference repositories regardless of default settings. '
                           'For each repository being cloned, if a reference repository is configured whose URL matches '
                           'the remote URL (case-insensitive), it will be passed to git clone via --reference-if-able.')
 NO_REFERENCE_IF_ABLE_HELP = 'Do not use configured reference repositories regardless of default settings.'
 DISSOCIATE_HELP = ('Use configured reference repositories only for cloning regardless of default settings, '
                    'resulting in a fully independent clone.')
+BUNDLE_DIR_HELP = ('A directory of git bundles created by "edkrepo bundle create". Each repository with a bundle matching its '
+                   'remote URL is seeded from the bundle so that only newer changes are fetched from the remote. '
+                   'Requires git 2.38 or later.')
+FROM_WORKSPACE_HELP = ('The path to an existing workspace for the same project. Repositories found in it are copied locally, '
+                       'sharing object files through hardlinks where possible, and only the changes missing from them are '
+                       'fetched from the remotes. Repositories not found in it are cloned normally.')
+MIRROR_POOL_HELP = ('Use the mirror pool maintained by edkrepo regardless of default settings. '
+                    'A bare mirror of each repository is created on first use, refreshed before each clone, '
+                    'and used as a reference repository.')
+LAZY_HELP = ('Creates the workspace without cloning its repositories. Each repository is cloned on first use, either with '
+             '"edkrepo materialize" or when a command requires it. Commands such as status, log and sync skip '
+             'repositories that have not been cloned.')
+RESUME_HELP = ('Continues a clone of the workspace that was interrupted. Repositories that finished cloning are not '
+               'downloaded again and every other repository continues from the first step that did not complete. The '
+               'settings of the interrupted clone are used. If the workspace is empty a new clone is started.')
+NO_MIRROR_POOL_HELP = 'Do not use the mirror pool maintained by edkrepo regardless of default settings.'
 NO_DISSOCIATE_HELP = ('Set up the repository as shared regardless of default configuration settings. '
                       'NOTE: This is a potentially dangerous configuration. '
-                      'See https://git-scm.com/docs/git-clone#Documentation/git-clone.txt---shared')
\ No newline at end of file
+                      'See https://git-scm.com/docs/git-clone#Documentation/git-clone.txt---shared')
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+#
+## @file
+# materialize_args.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+''' Contains the help and description strings for arguments in the
+materialize command meta data.
+'''
+
+COMMAND_DESCRIPTION = 'Clones repositories that were deferred by "edkrepo clone --lazy".'
+ROOTS_HELP = ('The local roots of the repositories to clone. A repository containing a requested nested repository is '
+              'cloned as well. If not specified all deferred repositories in the current combination are cloned.')
+LIST_HELP = 'List the repositories in the current combination that have not been cloned.'
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+#
+## @file
+# prefetch_args.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+''' Contains the help and description strings for arguments in the
+prefetch command meta data.
+'''
+
+COMMAND_DESCRIPTION = ('Fetches the repositories of registered workspaces in the background so that "edkrepo sync" '
+                       'downloads less. Branches and working trees are not modified.')
+REGISTER_HELP = 'Register a workspace for background prefetching.'
+UNREGISTER_HELP = 'Stop prefetching a workspace.'
+LIST_HELP = 'List the registered workspaces and whether the prefetch service is running.'
+RUN_HELP = 'Prefetch the global manifest repositories and every registered workspace once.'
+START_HELP = 'Start the background prefetch service.'
+STOP_HELP = 'Stop the background prefetch service.'
+ACTION_HELP = 'Which action to take: "register", "unregister", "list", "run", "start" or "stop"'
+WORKSPACE_HELP = ('The workspace to register or unregister. If not specified the workspace containing the current '
+                  'directory is used.')
+INTERVAL_HELP = 'The number of minutes between prefetches of the background service. Default is 60.'
+LOOP_HELP = 'Keep prefetching every interval minutes until stopped. Used by the background service.'
+JOBS_HELP = 'The number of repositories to fetch concurrently. Default is 4.'
@@ -14,4 +14,7 @@ sync command meta data.
 COMMAND_DESCRIPTION = 'Updates the local copy of the current combination\'s target branches by pulling the latest changes from the server. Does not update local branches.'
 FETCH_HELP = 'Performs a fetch only sync, no changes will be made to the local workspace.'
 UPDATE_LOCAL_MANIFEST_HELP = 'Updates the local copy of the project manifest file prior to performing sync operations.'
-OVERRIDE_HELP = 'Ignore warnings and proceed with sync operations.'
\ No newline at end of file
+OVERRIDE_HELP = 'Ignore warnings and proceed with sync operations.'
+NO_RESUME_HELP = 'Discards the progress of an interrupted sync and starts a new sync instead of resuming it.'
+BUNDLE_DIR_HELP = ('A directory of git bundles created by "edkrepo bundle create". Each repository with a bundle matching its '
+                   'remote URL is seeded from the bundle so that only newer changes are fetched from the remote.')
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+#
+## @file
+# bundle_command.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+
+import edkrepo.commands.edkrepo_command as edkrepo_command
+import edkrepo.commands.arguments.bundle_args as arguments
+import edkrepo.commands.humble.bundle_humble as humble
+import edkrepo.common.bundle_utilities as bundle_utilities
+import edkrepo.common.clone_utilities as clone_utilities
+import edkrepo.common.common_repo_functions as common_repo_functions
+import edkrepo.common.edkrepo_exception as edkrepo_exception
+import edkrepo.common.ui_functions as ui_functions
+from edkrepo.config.config_factory import get_workspace_path, get_workspace_manifest
+
+
+class BundleCommand(edkrepo_command.EdkrepoCommand):
+    def __init__(self):
+        super().__init__()
+
+    def get_metadata(self):
+        metadata = {}
+        metadata['name'] = 'bundle'
+        metadata['help-text'] = arguments.COMMAND_DESCRIPTION
+        args = []
+        metadata['arguments'] = args
+        args.append({'choice': 'create',
+                     'parent': 'action',
+                     'help-text': arguments.CREATE_HELP})
+        args.append({'name': 'action',
+                     'positional': True,
+                     'position': 0,
+                     'required': True,
+                     'choices': True,
+                     'help-text': arguments.ACTION_HELP})
+        args.append({'name': 'BundleDir',
+                     'positional': True,
+                     'required': False,
+                     'position': 1,
+                     'help-text': arguments.BUNDLE_DIR_HELP})
+        args.append({'name': 'Combination',
+                     'positional': True,
+                     'required': False,
+                     'position': 2,
+                     'help-text': arguments.COMBINATION_HELP})
+        return metadata
+
+    def run_command(self, args, config):
+        if args.action == 'create':
+            if not args.BundleDir:
+                raise edkrepo_exception.EdkrepoInvalidParametersException(humble.BUNDLE_DIR_REQUIRED)
+            self._create_bundles(args)
+
+    def _create_bundles(self, args):
+        workspace_path = get_workspace_path()
+        manifest = get_workspace_manifest()
+        combo = manifest.general_config.current_combo
+        if args.Combination is not None:
+            if not common_repo_functions.combination_is_in_manifest(args.Combination, manifest):
+                raise edkrepo_exception.EdkrepoInvalidParametersException(humble.INVALID_COMBO.format(args.Combination))
+            combo = args.Combination
+        bundle_dir = os.path.abspath(args.BundleDir)
+        os.makedirs(bundle_dir, exist_ok=True)
+
+        bundled_urls = set()
+        for repo_source in manifest.get_repo_sources(combo):
+            normalized_url = clone_utilities.normalize_remote_url(repo_source.remote_url)
+            if normalized_url in bundled_urls:
+                ui_functions.print_info_msg(humble.BUNDLE_DUPLICATE_URL.format(repo_source.root, repo_source.remote_url), header=False)
+                continue
+            local_repo_path = os.path.join(workspace_path, repo_source.root)
+            if not os.path.isdir(local_repo_path):
+                ui_functions.print_warning_msg(humble.REPO_NOT_PRESENT.format(repo_source.root), header=False)
+                continue
+            ui_functions.print_info_msg(humble.CREATING_BUNDLE.format(repo_source.root), header=False)
+            bundle_path = bundle_utilities.get_bundle_path(bundle_dir, repo_source.remote_url)
+            try:
+                created = bundle_utilities.create_bundle(local_repo_path, bundle_path)
+            except edkrepo_exception.EdkrepoGitException as e:
+                raise edkrepo_exception.EdkrepoGitException(humble.BUNDLE_FAILED.format(repo_source.root, e))
+            if created:
+                bundled_urls.add(normalized_url)
+                ui_functions.print_info_msg(humble.BUNDLE_CREATED.format(bundle_path), header=False)
+            else:
+                ui_functions.print_warning_msg(humble.NO_REFS_TO_BUNDLE.format(repo_source.root), header=False)
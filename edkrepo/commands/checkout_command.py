@@ -8,10 +8,10 @@
 #
 
 # Our modules
-from edkrepo.commands.edkrepo_command import EdkrepoCommand, OverrideArgument
+from edkrepo.commands.edkrepo_command import EdkrepoCommand, OverrideArgument, JobsArgument
 import edkrepo.commands.arguments.checkout_args as arguments
 import edkrepo.commands.humble.checkout_humble as humble
-from edkrepo.common.common_repo_functions import checkout, combination_is_in_manifest
+from edkrepo.common.common_repo_functions import checkout, combination_is_in_manifest, get_job_count
 from edkrepo.common.edkrepo_exception import EdkrepoInvalidParametersException
 from edkrepo.config.config_factory import get_workspace_manifest
 from edkrepo.common.workspace_maintenance.manifest_repos_maintenance import get_manifest_repo_path
@@ -34,6 +34,11 @@ class CheckoutCommand(EdkrepoCommand):
                      'description' : arguments.COMBINATION_DESCRIPTION,
                      'help-text' : arguments.COMBINATION_HELP})
         args.append(OverrideArgument)
+        args.append(JobsArgument)
+        args.append({'name' : 'worktree',
+                     'positional' : False,
+                     'required' : False,
+                     'help-text' : arguments.WORKTREE_HELP})
         return metadata
 
     def run_command(self, args, config):
@@ -41,6 +46,7 @@ class CheckoutCommand(EdkrepoCommand):
         manifest_repo = manifest.general_config.source_manifest_repo
         global_manifest_path = get_manifest_repo_path(manifest_repo, config)
         if combination_is_in_manifest(args.Combination, manifest):
-            checkout(args.Combination, global_manifest_path, args.verbose, args.override)
+            checkout(args.Combination, global_manifest_path, args.verbose, args.override, jobs=get_job_count(args),
+                     worktree=args.worktree)
         else:
             raise EdkrepoInvalidParametersException(humble.NO_COMBO.format(args.Combination))
@@ -16,12 +16,14 @@ import edkrepo.commands.arguments.checkout_pin_args as arguments
 import edkrepo.commands.humble.checkout_pin_humble as humble
 from edkrepo.common.common_repo_functions import sparse_checkout_enabled, reset_sparse_checkout, sparse_checkout
 from edkrepo.common.common_repo_functions import check_dirty_repos, checkout_repos, combinations_in_manifest, fetch_from_remote
+from edkrepo.common.common_repo_functions import materialize_repos, find_missing_commits, fetch_missing_commits
 from edkrepo.common.humble import SPARSE_CHECKOUT, SPARSE_RESET, SUBMODULE_DEINIT_FAILED
 from edkrepo.common.edkrepo_exception import EdkrepoInvalidParametersException, EdkrepoProjectMismatchException
 from edkrepo.common.workspace_maintenance.manifest_repos_maintenance import list_available_manifest_repos
 from edkrepo.common.workspace_maintenance.manifest_repos_maintenance import find_source_manifest_repo, get_manifest_repo_path
 from edkrepo.config.config_factory import get_workspace_path, get_workspace_manifest
 from edkrepo_manifest_parser.edk_manifest import ManifestXml
+from edkrepo_manifest_parser.edk_manifest_diff import ManifestDiff
 from project_utils.submodule import deinit_full, maintain_submodules
 import edkrepo.common.ui_functions as ui_functions
 
@@ -63,23 +65,25 @@ class CheckoutPinCommand(EdkrepoCommand):
         pin_path = self.__get_pin_path(args, workspace_path, manifest_repo_path, manifest)
         pin = ManifestXml(pin_path)
         manifest_sources = manifest.get_repo_sources(manifest.general_config.current_combo)
+        # Every repository is moved onto the commit recorded in the pin so any deferred repositories are needed
+        materialize_repos(args, config, workspace_path, manifest, manifest_sources)
         check_dirty_repos(manifest, workspace_path)
-        for source in manifest_sources:
-            local_path = os.path.join(workspace_path, source.root)
-            repo = Repo(local_path)
-            fetch_from_remote(repo, repo.remotes.origin)
         self.__pin_matches_project(pin, manifest, workspace_path)
+        self.__fetch_pinned_commits(pin, workspace_path)
         sparse_enabled = sparse_checkout_enabled(workspace_path, manifest_sources)
         if sparse_enabled:
             ui_functions.print_info_msg(SPARSE_RESET, header = False)
             reset_sparse_checkout(workspace_path, manifest_sources)
         submodule_combo = pin.general_config.current_combo
-        try:
-            deinit_full(workspace_path, manifest, args.verbose)
-        except Exception as e:
-            ui_functions.print_error_msg(SUBMODULE_DEINIT_FAILED, header=False)
-            if args.verbose:
-                ui_functions.print_error_msg(e, header = False)
+        # Submodules only need to be reinitialized if the pin moves a repository or changes the submodule settings
+        pin_diff = ManifestDiff(manifest, manifest.general_config.current_combo, pin, submodule_combo)
+        if pin_diff.ref_changes or pin_diff.has_source_changes or pin_diff.submodules_changed:
+            try:
+                deinit_full(workspace_path, manifest, args.verbose)
+            except Exception as e:
+                ui_functions.print_error_msg(SUBMODULE_DEINIT_FAILED, header=False)
+                if args.verbose:
+                    ui_functions.print_error_msg(e, header = False)
         pin_repo_sources = pin.get_repo_sources(pin.general_config.current_combo)
         try:
             checkout_repos(args.verbose, args.override, pin_repo_sources, workspace_path, manifest, manifest_repo_path)
@@ -158,9 +162,17 @@ class CheckoutPinCommand(EdkrepoCommand):
         manifest_root_remote = {source.root:source.remote_name for source in manifest_sources}
         if set(pin_root_remote.items()).isdisjoint(set(manifest_root_remote.items())):
             raise EdkrepoProjectMismatchException(humble.MANIFEST_MISMATCH)
-        pin_root_commit = {source.root:source.commit for source in pin_sources}
-        for source in pin_sources:
-            source_repo_path = os.path.join(workspace_path, source.root)
-            repo = Repo(source_repo_path)
-            if repo.commit(pin_root_commit[source.root]) is None:
-                raise EdkrepoProjectMismatchException(humble.NOT_FOUND)
+
+    def __fetch_pinned_commits(self, pin, workspace_path):
+        # Pins are usually of commits that were fetched before, so only the commits missing locally are fetched
+        for source in pin.get_repo_sources(pin.general_config.current_combo):
+            repo = Repo(os.path.join(workspace_path, source.root))
+            if source.commit is None:
+                fetch_from_remote(repo, repo.remotes.origin)
+                continue
+            missing_commits = find_missing_commits(repo, [source.commit])
+            if not missing_commits:
+                continue
+            ui_functions.print_info_msg(humble.FETCH_MISSING_COMMIT.format(source.root), header=False)
+            if fetch_missing_commits(repo, missing_commits):
+                raise EdkrepoProjectMismatchException(humble.COMMIT_NOT_FOUND)
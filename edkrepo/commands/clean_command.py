@@ -14,6 +14,7 @@ from git import Repo
 from edkrepo.commands.edkrepo_command import EdkrepoCommand
 import edkrepo.commands.arguments.clean_args as arguments
 from edkrepo.config.config_factory import get_workspace_path, get_workspace_manifest
+from edkrepo.common.workspace_maintenance.deferred_repos_maintenance import filter_materialized
 import edkrepo.common.ui_functions as ui_functions
 
 class CleanCommand(EdkrepoCommand):
@@ -52,7 +53,7 @@ class CleanCommand(EdkrepoCommand):
         workspace_path = get_workspace_path()
         manifest = get_workspace_manifest()
         manifest_config = manifest.general_config
-        repo_sources_to_clean = manifest.get_repo_sources(manifest_config.current_combo)
+        repo_sources_to_clean = filter_materialized(workspace_path, manifest.get_repo_sources(manifest_config.current_combo))
         for repo_to_clean in repo_sources_to_clean:
             local_repo_path = os.path.join(workspace_path, repo_to_clean.root)
             repo = Repo(local_repo_path)
@@ -13,14 +13,19 @@ import sys
 
 import edkrepo.commands.arguments.clone_args as arguments
 import edkrepo.commands.edkrepo_command as edkrepo_command
+import edkrepo.common.clone_journal as clone_journal
 import edkrepo.common.common_repo_functions as common_repo_functions
+import edkrepo.common.clone_utilities as clone_utilities
 import edkrepo.common.edkrepo_exception as edkrepo_exception
 import edkrepo.common.humble as humble
+import edkrepo.common.mirror_pool as mirror_pool
 import edkrepo.common.pathfix as pathfix
 import edkrepo.common.ui_functions as ui_functions
 import edkrepo.common.workspace_maintenance.humble.manifest_repos_maintenance_humble as manifest_repos_maintenance_humble
 import edkrepo.common.workspace_maintenance.manifest_repos_maintenance as manifest_repos_maintenance
 import edkrepo.common.workspace_maintenance.workspace_maintenance as workspace_maintenance
+import edkrepo.common.workspace_maintenance.deferred_repos_maintenance as deferred_repos_maintenance
+import edkrepo.common.workspace_maintenance.fetch_refspec_maintenance as fetch_refspec_maintenance
 import edkrepo_manifest_parser.edk_manifest as edk_manifest
 import project_utils.submodule as submodule_utils
 from colorama import Fore
@@ -80,6 +85,10 @@ class CloneCommand(edkrepo_command.EdkrepoCommand):
                      'positional': False,
                      'required': False,
                      'help-text': arguments.NO_TAGS_HELP}))
+        args.append({'name': 'full-fetch',
+                     'positional': False,
+                     'required': False,
+                     'help-text': arguments.FULL_FETCH_HELP})
         args.append({'name': 'reference-if-able',
                      'positional': False,
                      'required': False,
@@ -96,12 +105,51 @@ class CloneCommand(edkrepo_command.EdkrepoCommand):
                      'positional': False,
                      'required': False,
                      'help-text': arguments.NO_DISSOCIATE_HELP})
+        args.append({'name': 'bundle-dir',
+                     'positional': False,
+                     'required': False,
+                     'action': 'store',
+                     'help-text': arguments.BUNDLE_DIR_HELP})
+        args.append({'name': 'from-workspace',
+                     'positional': False,
+                     'required': False,
+                     'action': 'store',
+                     'help-text': arguments.FROM_WORKSPACE_HELP})
+        args.append({'name': 'mirror-pool',
+                     'positional': False,
+                     'required': False,
+                     'help-text': arguments.MIRROR_POOL_HELP})
+        args.append({'name': 'no-mirror-pool',
+                     'positional': False,
+                     'required': False,
+                     'help-text': arguments.NO_MIRROR_POOL_HELP})
+        args.append({'name': 'lazy',
+                     'positional': False,
+                     'required': False,
+                     'help-text': arguments.LAZY_HELP})
+        args.append({'name': 'resume',
+                     'positional': False,
+                     'required': False,
+                     'help-text': arguments.RESUME_HELP})
+        args.append(edkrepo_command.JobsArgument)
         args.append(edkrepo_command.SubmoduleSkipArgument)
         args.append(edkrepo_command.SourceManifestRepoArgument)
         return metadata
 
 
     def run_command(self, args, config):
+        # Validate the job count and bundle directory before doing any work
+        common_repo_functions.get_job_count(args)
+        bundle_dir = None
+        if args.bundle_dir:
+            if not os.path.isdir(args.bundle_dir):
+                raise edkrepo_exception.EdkrepoInvalidParametersException(humble.BUNDLE_DIR_NOT_FOUND.format(args.bundle_dir))
+            bundle_dir = os.path.abspath(args.bundle_dir)
+        template_workspace_dir = None
+        if args.from_workspace:
+            template_workspace_dir = os.path.abspath(args.from_workspace)
+            if not os.path.isfile(os.path.join(template_workspace_dir, 'repo', 'Manifest.xml')):
+                raise edkrepo_exception.EdkrepoInvalidParametersException(humble.CLONE_TEMPLATE_NOT_WORKSPACE.format(args.from_workspace))
         manifest_repos_maintenance.pull_all_manifest_repos(config['cfg_file'], config['user_cfg_file'], False)
 
         workspace_dir = args.Workspace
@@ -117,7 +165,20 @@ class CloneCommand(edkrepo_command.EdkrepoCommand):
             if drive in subst:
                 workspace_dir = os.path.join(subst[drive], os.path.splitdrive(workspace_dir)[1][1:])
                 workspace_dir = os.path.normpath(workspace_dir)
+        if args.resume and clone_journal.clone_journal_exists(workspace_dir):
+            local_manifest_path = os.path.join(workspace_dir, 'repo', 'Manifest.xml')
+            if os.path.isfile(local_manifest_path):
+                # Continue the interrupted clone with the manifest and settings it was started with
+                manifest = edk_manifest.ManifestXml(local_manifest_path)
+                clone_times = common_repo_functions.resume_clone(args, config, workspace_dir, manifest)
+                if args.performance:
+                    self._print_clone_times(clone_times)
+                return
+            # The clone was interrupted before the manifest was copied, nothing else has to be kept
+            shutil.rmtree(os.path.join(workspace_dir, 'repo'))
         if os.path.isdir(workspace_dir) and os.listdir(workspace_dir):
+            if args.resume:
+                raise edkrepo_exception.EdkrepoInvalidParametersException(humble.CLONE_RESUME_NO_JOURNAL.format(workspace_dir))
             raise edkrepo_exception.EdkrepoInvalidParametersException(humble.CLONE_INVALID_WORKSPACE)
         if not os.path.isdir(workspace_dir):
             os.makedirs(workspace_dir)
@@ -146,6 +207,9 @@ class CloneCommand(edkrepo_command.EdkrepoCommand):
         # Copy project manifest to local manifest dir and rename it Manifest.xml.
         local_manifest_dir = os.path.join(workspace_dir, "repo")
         os.makedirs(local_manifest_dir)
+        # Journal the progress of the clone from the start so that an interrupted clone is never mistaken for a
+        # complete workspace. The clone settings are recorded once they are known.
+        journal = clone_journal.CloneJournal(workspace_dir)
         local_manifest_path = os.path.join(local_manifest_dir, "Manifest.xml")
         # If JSON, write to XML. Else, simple copy
         file_ext = os.path.splitext(global_manifest_path)[1]
@@ -196,6 +260,15 @@ class CloneCommand(edkrepo_command.EdkrepoCommand):
                 #workspace
                 shutil.rmtree(local_manifest_dir)
                 raise edkrepo_exception.EdkrepoManifestInvalidException(humble.CLONE_INVALID_LOCAL_ROOTS)
+        # Find the repositories that can be copied from the template workspace
+        template_path_map = {}
+        if template_workspace_dir is not None:
+            template_manifest = edk_manifest.ManifestXml(os.path.join(template_workspace_dir, 'repo', 'Manifest.xml'))
+            if template_manifest.project_info.codename != manifest.project_info.codename:
+                shutil.rmtree(local_manifest_dir)
+                raise edkrepo_exception.EdkrepoInvalidParametersException(humble.CLONE_TEMPLATE_PROJECT_MISMATCH.format(
+                    args.from_workspace, template_manifest.project_info.codename, manifest.project_info.codename))
+            template_path_map = clone_utilities.generate_template_path_map(template_workspace_dir, repo_sources_to_clone)
         project_client_side_hooks = manifest.repo_hooks
         # Set up submodule alt url config settings prior to cloning any repos
         submodule_included_configs = common_repo_functions.write_included_config(manifest.remotes, manifest.submodule_alternate_remotes, local_manifest_dir)
@@ -212,23 +285,12 @@ class CloneCommand(edkrepo_command.EdkrepoCommand):
             use_dissociate = True
         if args.no_dissociate:
             use_dissociate = False
-        if use_reference and not use_dissociate:
-            ui_functions.print_info_msg('{}{}{}'.format(Fore.YELLOW, NO_DISSOCIATE_WARNING, Fore.RESET), header=False)
-        reference_path_map = {}
-        if use_reference:
-            for ref_name in config['user_cfg_file'].reference_repos_enabled_for:
-                ref_url = config['user_cfg_file'].get_reference_repo_url(ref_name)
-                ref_path = config['user_cfg_file'].get_reference_repo_path(ref_name)
-                if ref_url and ref_path:
-                    reference_path_map[ref_url.lower()] = ref_path
-
-        clone_times = common_repo_functions.clone_repos(args, workspace_dir, repo_sources_to_clone, project_client_side_hooks, config, manifest, manifest_repository_path, reference_path_map=reference_path_map, dissociate=use_dissociate)
-
-        # Init submodules
-        if not args.skip_submodule:
-            submodule_utils.maintain_submodules(workspace_dir, manifest, combo_name, args.verbose)
-
-        # Perform a sparse checkout if requested.
+        use_mirror_pool = config['user_cfg_file'].mirror_pool_enabled_by_default
+        if args.mirror_pool:
+            use_mirror_pool = True
+        if args.no_mirror_pool:
+            use_mirror_pool = False
+        # Determine if sparse checkout is requested so that it can be applied as each repository is cloned
         use_sparse = args.sparse
         sparse_settings = manifest.sparse_settings
         if sparse_settings is None:
@@ -240,13 +302,56 @@ class CloneCommand(edkrepo_command.EdkrepoCommand):
         if args.nosparse:
             # Command line disables sparse checkout
             use_sparse = False
+        if (use_reference or use_mirror_pool) and not use_dissociate:
+            ui_functions.print_info_msg('{}{}{}'.format(Fore.YELLOW, NO_DISSOCIATE_WARNING, Fore.RESET), header=False)
+        clone_options = common_repo_functions.get_clone_options(args)
+        clone_options.update({'reference': use_reference, 'dissociate': use_dissociate, 'mirror_pool': use_mirror_pool,
+                              'sparse': use_sparse})
+        if args.full_fetch:
+            # Later commands keep fetching every branch of the workspace repositories
+            fetch_refspec_maintenance.set_workspace_full_fetch(workspace_dir)
+        if args.lazy:
+            # Record the repositories and the clone settings so that each repository can be cloned on first use
+            deferred_repos_maintenance.write_deferred_repos(workspace_dir, local_roots, clone_options)
+            journal.finish()
+            ui_functions.print_info_msg(humble.CLONE_LAZY.format(len(local_roots)), header=False)
+            return
+        # Record the clone settings so that an interrupted clone is resumed with them
+        clone_options.update({'skip_submodule': args.skip_submodule, 'bundle_dir': bundle_dir,
+                              'from_workspace': template_workspace_dir})
+        journal.set_options(clone_options)
+
+        reference_path_map = {}
+        if use_mirror_pool:
+            # Repositories copied from a template workspace do not need a mirror
+            mirrored_sources = [source for source in repo_sources_to_clone if source.remote_url.lower() not in template_path_map]
+            reference_path_map.update(mirror_pool.update_mirrors(mirrored_sources, common_repo_functions.get_job_count(args)))
+        if use_reference:
+            # User configured reference repositories take precedence over the managed mirror pool
+            reference_path_map.update(clone_utilities.generate_reference_path_map(config['user_cfg_file']))
+
+        sparse_data = None
         if use_sparse:
             ui_functions.print_info_msg(humble.SPARSE_CHECKOUT)
-            common_repo_functions.sparse_checkout(workspace_dir, repo_sources_to_clone, manifest)
+            sparse_data = common_repo_functions.get_sparse_checkout_data(repo_sources_to_clone, manifest)
+
+        clone_times = common_repo_functions.clone_repos(args, workspace_dir, repo_sources_to_clone, project_client_side_hooks, config, manifest, manifest_repository_path, reference_path_map=reference_path_map, dissociate=use_dissociate, bundle_dir=bundle_dir, template_path_map=template_path_map, sparse_data=sparse_data, journal=journal)
+
+        # Init submodules
+        if not args.skip_submodule:
+            submodule_utils.maintain_submodules(workspace_dir, manifest, combo_name, args.verbose)
+            journal.record_workspace_stage(clone_journal.STAGE_SUBMODULES)
+        if use_sparse:
+            # Repositories with submodules enabled get sparse checkout after their submodules are updated
+            common_repo_functions.sparse_checkout_submodule_repos(workspace_dir, repo_sources_to_clone, manifest)
+        journal.finish()
 
 
         # Print performance timing if requested
         if args.performance:
-            print()
-            for repo_root, duration in clone_times:
-                ui_functions.print_info_msg(humble.CLONE_TIME.format(repo_root, duration), header=False)
+            self._print_clone_times(clone_times)
+
+    def _print_clone_times(self, clone_times):
+        print()
+        for repo_root, duration in clone_times:
+            ui_functions.print_info_msg(humble.CLONE_TIME.format(repo_root, duration), header=False)
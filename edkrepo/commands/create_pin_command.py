@@ -13,6 +13,7 @@ from git import Repo
 
 from edkrepo.commands.edkrepo_command import EdkrepoCommand, SourceManifestRepoArgument
 import edkrepo.commands.arguments.create_pin_args as arguments
+from edkrepo.common.common_repo_functions import materialize_repos
 import edkrepo.common.edkrepo_exception as edkrepo_exception
 import edkrepo.common.humble as humble
 from edkrepo.config.config_factory import get_workspace_manifest, get_workspace_path
@@ -61,6 +62,9 @@ class CreatePinCommand(EdkrepoCommand):
         if not os.path.exists(os.path.dirname(pin_file_name)):
             os.mkdir(os.path.dirname(pin_file_name))
 
+        # A pin records the commit of every repository so any repositories deferred by clone --lazy are needed
+        materialize_repos(args, config, workspace_path, manifest, manifest.get_repo_sources(manifest.general_config.current_combo))
+
         updated_repo_sources = []
         updated_repo_sources = self._generate_pin_data(args, manifest, workspace_path)
 
@@ -93,4 +97,4 @@ class CreatePinCommand(EdkrepoCommand):
                     ui_functions.print_info_msg(humble.COMMIT.format(commit_id), header = False)
                 updated_repo_source = repo_source._replace(commit=commit_id)
                 updated_repo_sources.append(updated_repo_source)
-        return updated_repo_sources
\ No newline at end of file
+        return updated_repo_sources
@@ -60,6 +60,13 @@ PerformanceArgument = {'name': 'performance',
                        'required': False,
                        'help-text': arguments.PERFORMANCE_HELP}
 
+JobsArgument = {'name': 'jobs',
+                'short-name': 'j',
+                'positional': False,
+                'required': False,
+                'action': 'store',
+                'help-text': arguments.JOBS_HELP}
+
 FormatArgument = {'name': 'format',
                   'positional': False,
                   'required': False,
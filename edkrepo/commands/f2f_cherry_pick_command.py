@@ -24,6 +24,7 @@ from edkrepo.common.common_repo_functions import sparse_checkout_enabled, get_fu
 from edkrepo.commands.edkrepo_command import EdkrepoCommand
 from edkrepo.common.edkrepo_exception import EdkrepoAbortCherryPickException, EdkrepoInvalidParametersException, EdkrepoWorkspaceInvalidException
 from edkrepo.common.edkrepo_exception import EdkrepoNotFoundException, EdkrepoGitException
+from edkrepo.common.git_object_query import get_object_query
 from edkrepo.common.humble import NOT_GIT_REPO, COMMIT_NOT_FOUND
 from edkrepo.common.squash import get_git_repo_root, split_commit_range, get_start_and_end_commit
 from edkrepo.common.squash import commit_list_to_message, squash_commits
@@ -97,11 +98,10 @@ class F2fCherryPickCommand(EdkrepoCommand):
             return
         continue_operation = vars(args)['continue']
         commit_ish = vars(args)['commit-ish']
-        json_path = os.path.join('.git', 'f2f_cherry_pick_status.json')
         if commit_ish is None and not continue_operation and not args.abort:
             raise EdkrepoInvalidParametersException(humble.F2F_CHERRY_PICK_COMMIT_REQUIRED)
         if not continue_operation and not args.abort:
-            (repo_info, cherry_pick_operations) = _start_new_cherry_pick(args, json_path)
+            (repo_info, cherry_pick_operations) = _start_new_cherry_pick(args)
             (commit_info, cherry_pick_operations) = _prep_new_cherry_pick(args, repo_info.repo, commit_ish, config, cherry_pick_operations)
             f2f_src_branch = None
             f2f_dest_branch = None
@@ -111,19 +111,23 @@ class F2fCherryPickCommand(EdkrepoCommand):
             cherry_pick_info = CherryPickInfo(f2f_cherry_pick_src, f2f_src_branch, f2f_dest_branch, num_cherry_picks, cherry_pick_operations, cherry_pick_operations_template)
         else:
             try:
-                (repo_info, commit_info, cherry_pick_info) = _resume_cherry_pick(args, json_path) # Continuing or aborting
+                (repo_info, commit_info, cherry_pick_info) = _resume_cherry_pick(args) # Continuing or aborting
             except EdkrepoAbortCherryPickException:
                 return
 
         _complete_cherry_pick(args, continue_operation, repo_info, commit_info, cherry_pick_info)
 
-def _start_new_cherry_pick(args, json_path):
+def _get_status_file_path(repo):
+    # The git directory of a linked worktree is not .git, which is a file there
+    return os.path.join(repo.git_dir, 'f2f_cherry_pick_status.json')
+
+def _start_new_cherry_pick(args):
     (cherry_pick_operations, repo_path) = _parse_arguments(args)
-    json_path = os.path.join(repo_path, json_path)
-    if os.path.isfile(json_path):
-        raise EdkrepoInvalidParametersException(humble.F2F_CHERRY_PICK_IN_PROGRESS)
     # Initialize GitPython
     repo = Repo(repo_path)
+    json_path = _get_status_file_path(repo)
+    if os.path.isfile(json_path):
+        raise EdkrepoInvalidParametersException(humble.F2F_CHERRY_PICK_IN_PROGRESS)
     repo_info = RepoInfo(repo_path, json_path, repo)
     return (repo_info, cherry_pick_operations)
 
@@ -180,12 +184,12 @@ def _prep_new_cherry_pick(args, repo, commit_ish, config, cherry_pick_operations
     commit_info = CommitInfo(start_commit, end_commit, source_commit, single_commit, original_branch, original_head, append_sha, squash, todo_commits, complete_commits)
     return commit_info, cherry_pick_operations
 
-def _resume_cherry_pick(args, json_path):
+def _resume_cherry_pick(args):
     # Get path to Git repository
     repo_path = get_git_repo_root()
-    json_path = os.path.join(repo_path, json_path)
     # Initialize GitPython
     repo = Repo(repo_path)
+    json_path = _get_status_file_path(repo)
     if not os.path.isfile(json_path):
         if args.abort:
             raise EdkrepoInvalidParametersException(humble.F2F_CHERRY_PICK_NO_IN_PROGRESS_ABORT)
@@ -318,7 +322,8 @@ def _complete_cherry_pick(args, continue_operation, repo_info, commit_info, cher
                     repo.heads[f2f_src_branch].checkout()
                     repo.git.reset('--hard')
                     _prepare_source_branch(cherry_pick_operation, f2f_src_branch, repo)
-                    if len(repo.commit(f2f_src_branch).stats.files) <= 0:
+                    src_branch_commit = repo.heads[f2f_src_branch].commit.hexsha
+                    if len(get_object_query(repo).changed_files([src_branch_commit])[src_branch_commit]) <= 0:
                         # After the filter-branch, there is nothing left to cherry pick, so move on to the next cherry pick
                         repo.heads[original_branch].checkout()
                         repo.git.reset('--hard')
@@ -428,9 +433,11 @@ def cherry_pick_operations_to_include_folder_list(cherry_pick_operations):
 
 def get_commit_list(include_folder_list, repo, start_commit, end_commit):
     commit_list = repo.git.rev_list('{}..{}'.format(start_commit, end_commit)).split()
+    # Diff every commit with one git diff-tree instead of one git diff per commit
+    commit_changed_files = get_object_query(repo).changed_files(commit_list)
     include_commit_list = []
     for commit in commit_list:
-        changed_files = list(repo.commit(commit).stats.files)
+        changed_files = commit_changed_files[commit]
         for folder in include_folder_list:
             if _path_in_changed_files(folder, changed_files):
                 include_commit_list.append(commit)
@@ -691,9 +698,9 @@ def git_path_exists(path, tree_ish, repo, case_insensitive=False):
 def _save_f2f_cherry_pick_state(repo_path, original_branch, original_head, single_commit, remaining_cp_operations,
                                 f2f_src_branch, f2f_dest_branch, f2f_cp_src_branch, num_cherry_picks, source_commit,
                                 append_sha, todo_commits, complete_commits, cp_operations_template, squash):
-    if not os.path.isdir(os.path.join(repo_path, '.git')):
+    if not os.path.exists(os.path.join(repo_path, '.git')):
         raise EdkrepoWorkspaceInvalidException(NOT_GIT_REPO)
-    json_path = os.path.join(repo_path, '.git', 'f2f_cherry_pick_status.json')
+    json_path = _get_status_file_path(Repo(repo_path))
     if os.path.isfile(json_path):
         os.remove(json_path)
     data = {}
@@ -734,9 +741,9 @@ def _save_f2f_cherry_pick_state(repo_path, original_branch, original_head, singl
         json.dump(data, f, indent=2, sort_keys=True)
 
 def _restore_f2f_cherry_pick_state(repo_path):
-    if not os.path.isdir(os.path.join(repo_path, '.git')):
+    if not os.path.exists(os.path.join(repo_path, '.git')):
         raise EdkrepoWorkspaceInvalidException(NOT_GIT_REPO)
-    json_path = os.path.join(repo_path, '.git', 'f2f_cherry_pick_status.json')
+    json_path = _get_status_file_path(Repo(repo_path))
     with open(json_path, 'r') as f:
         data = json.load(f)
     # Convert the dictionaries to namedtuples
@@ -908,7 +915,8 @@ def _check_for_name_collision(path, repo, src_commit, dest_commit):
     return False
 
 def _optimize_f2f_cherry_pick_operations(cherry_pick_operations, repo, source_commit):
-    changed_files = list(repo.commit(source_commit).stats.files)
+    source_sha = get_object_query(repo).resolve(source_commit)
+    changed_files = get_object_query(repo).changed_files([source_sha])[source_sha]
     temp_cherry_pick_operations = []
     for operation in cherry_pick_operations:
         temp_folders = []
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+#
+## @file
+# bundle_humble.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''
+Contains user visible strings printed by the bundle command.
+'''
+
+BUNDLE_DIR_REQUIRED = 'A bundle directory is required with "create".'
+INVALID_COMBO = 'The combination {} does not exist in the current project.'
+CREATING_BUNDLE = 'Creating bundle for {} ...'
+BUNDLE_CREATED = 'Bundle written to {}'
+BUNDLE_DUPLICATE_URL = 'Skipping {}, a bundle for {} has already been written.'
+NO_REFS_TO_BUNDLE = 'Skipping {}, it has no remote branches or tags to bundle.'
+REPO_NOT_PRESENT = 'Skipping {}, it is not present in the workspace.'
+BUNDLE_FAILED = 'Unable to create a bundle for {}:\n{}'
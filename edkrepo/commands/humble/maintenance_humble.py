@@ -13,4 +13,9 @@ NO_WOKKSPACE = 'Not currently in a valid workspace. No workspace level maintenan
 REPO_MAINTENANCE = 'Currently conducting maintenance operations for the {} repository'
 GC_AGGRESSIVE = '   Running: git gc --aggressive --prune=now (this may take a significant amount of time)'
 REFLOG_EXPIRE = '   Running: git reflog expire --expire=now --all'
-REMOTE_PRUNE = '   Running: git remote prune origin'
\ No newline at end of file
+REMOTE_PRUNE = '   Running: git remote prune origin'
+SCOPE_REFSPECS = '   Limiting the fetch refspecs to the branches used by the manifest'
+REMOVED_REMOTE_REFS = '   Removed {} remote-tracking branches that are no longer fetched'
+STATUS_CACHES = '   Enabled the untracked cache and split index'
+FSMONITOR_ENABLED = '   Registered the repository with the filesystem monitor'
+FSMONITOR_DISABLED = '   Removed the repository from the filesystem monitor'
\ No newline at end of file
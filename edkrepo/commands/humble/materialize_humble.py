@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+#
+## @file
+# materialize_humble.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''
+Contains user visible strings printed by the materialize command.
+'''
+
+NOT_LAZY_WORKSPACE = 'The workspace was not cloned with --lazy, all of its repositories are present.'
+NO_DEFERRED_REPOS = 'All repositories in the current combination are present.'
+INVALID_ROOT = 'The repository {} is not part of the current combination.'
+ALREADY_MATERIALIZED = 'The repository {} is already present.'
+DEFERRED_REPOS_HEADER = 'Repositories that have not been cloned:'
+DEFERRED_REPO = '  {}'
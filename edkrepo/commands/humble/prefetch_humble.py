@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+#
+## @file
+# prefetch_humble.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''
+Contains user visible strings printed by the prefetch command.
+'''
+
+WORKSPACE_REGISTERED = 'Registered {} for prefetching.'
+WORKSPACE_ALREADY_REGISTERED = '{} is already registered for prefetching.'
+WORKSPACE_UNREGISTERED = 'Unregistered {}.'
+WORKSPACE_NOT_REGISTERED = '{} is not registered for prefetching.'
+NOT_A_WORKSPACE = '{} is not an edkrepo workspace.'
+NO_REGISTERED_WORKSPACES = 'No workspaces are registered for prefetching.'
+REGISTERED_WORKSPACES_HEADER = 'Workspaces registered for prefetching:'
+REGISTERED_WORKSPACE = '  {}'
+PREFETCH_COMPLETE = 'Prefetched {} repositories.'
+SERVICE_RUNNING = 'The prefetch service is running (process {}).'
+SERVICE_NOT_RUNNING = 'The prefetch service is not running.'
+SERVICE_STARTED = 'Started the prefetch service (process {}), it prefetches every {} minutes.'
+SERVICE_STOPPED = 'Stopped the prefetch service.'
+INVALID_INTERVAL = 'The interval must be a positive number of minutes: {}'
@@ -17,4 +17,5 @@ from colorama import Style
 #Messages for status_command.py
 STATUS_CURRENT_COMBO = "{}Current combo: {}{{}}{}".format(Style.BRIGHT, Fore.GREEN, Style.RESET_ALL)
 REPO_HEADER = "{}{}{{}}{}:".format(Style.BRIGHT, Fore.CYAN, Style.RESET_ALL)
-REPO_HEADER_VERBOSE = "{}{}{{}}{} - [ {}{}{{}}{} ]:".format(Style.BRIGHT, Fore.CYAN, Style.RESET_ALL, Style.BRIGHT, Fore.RED, Style.RESET_ALL)
\ No newline at end of file
+REPO_HEADER_VERBOSE = "{}{}{{}}{} - [ {}{}{{}}{} ]:".format(Style.BRIGHT, Fore.CYAN, Style.RESET_ALL, Style.BRIGHT, Fore.RED, Style.RESET_ALL)
+REPO_NOT_MATERIALIZED = "Not cloned, use \"edkrepo materialize {}\" to clone it"
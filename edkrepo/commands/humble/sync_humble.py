@@ -37,3 +37,8 @@ It is likely that {new_dir} contains your original code now.
 Please close any open editors to reconcile this problem.
 You may need to manually rename {new_dir} to {initial_dir} in some circumstances.\n'''
 SYNC_AUTOMATIC_REMOTE_PRUNE = 'Performing automatic remote prune...'
+SEEDING_FROM_BUNDLE = 'Seeding {} from bundle {} ...'
+SYNC_REPOS_UP_TO_DATE = 'Skipping the fetch of {} repositories whose remote branches have not changed'
+SYNC_RESUMING = 'Resuming an interrupted sync'
+SYNC_JOURNAL_STALE = 'The workspace was changed after a sync was interrupted, starting a new sync instead of resuming it'
+SYNC_JOURNAL_DISCARDED = 'Discarding the progress of an interrupted sync'
@@ -82,7 +82,7 @@ class ListPinsCommand(EdkrepoCommand):
                     manifest_directory = config['cfg_file'].manifest_repo_abs_path(manifest_repo)
                 elif manifest_repo in user_cfg:
                     manifest_directory = config['user_cfg_file'].manifest_repo_abs_path(manifest_repo)
-                manifest = ManifestXml(manifest_path)
+                manifest = ManifestXml(manifest_path, lazy=True)
         if manifest.general_config.pin_path is None:
             print(humble.NO_PIN_FOLDER)
             return
@@ -99,7 +99,8 @@ class ListPinsCommand(EdkrepoCommand):
                 stdout = sys.stdout
                 sys.stdout = io.StringIO()
                 try:
-                    pin = ManifestXml(pin_file)
+                    # Only the project info of each pin is used
+                    pin = ManifestXml(pin_file, lazy=True)
                 except TypeError:
                     continue
                 finally:
@@ -17,6 +17,11 @@ from edkrepo.commands.arguments import maintenance_args as arguments
 from edkrepo.commands.humble import maintenance_humble as humble
 from edkrepo.common.workspace_maintenance.git_config_maintenance import clean_git_globalconfig, set_long_path_support
 from edkrepo.common.edkrepo_exception import EdkrepoWorkspaceInvalidException
+from edkrepo.common.workspace_maintenance.deferred_repos_maintenance import filter_materialized
+from edkrepo.common.workspace_maintenance.fetch_refspec_maintenance import is_workspace_full_fetch, scope_fetch_refspecs
+from edkrepo.common.workspace_maintenance.status_cache_maintenance import enable_status_caches
+from edkrepo.common.common_repo_functions import update_fsmonitor
+from edkrepo.common.git_object_query import close_object_queries
 from edkrepo.config.config_factory import get_workspace_path, get_workspace_manifest
 from edkrepo_manifest_parser.edk_manifest import ManifestXml
 import edkrepo.common.ui_functions as ui_functions
@@ -51,27 +56,43 @@ class MaintenanceCommande(EdkrepoCommand):
         clean_git_globalconfig()
         print()
 
-        # If in a valid workspace run the following for each repo:
-        # git reflog --expire, git gc, git remote prune origin
-        if not args.no_gc:
-            try:
-                workspace_path = get_workspace_path()
-            except EdkrepoWorkspaceInvalidException:
-                workspace_path = None
-                ui_functions.print_error_msg(humble.NO_WOKKSPACE, header = False)
-                print()
+        # If in a valid workspace limit the fetch refspecs to the manifest and, unless --no-gc is used, run the
+        # following for each repo: git reflog --expire, git gc, git remote prune origin
+        try:
+            workspace_path = get_workspace_path()
+        except EdkrepoWorkspaceInvalidException:
+            workspace_path = None
+            ui_functions.print_error_msg(humble.NO_WOKKSPACE, header = False)
+            print()
 
-            if workspace_path:
-                manifest = get_workspace_manifest()
-                repos_to_maintain = manifest.get_repo_sources(manifest.general_config.current_combo)
-                for repo_to_maintain in repos_to_maintain:
-                    local_repo_path = os.path.join(workspace_path, repo_to_maintain.root)
-                    repo = Repo(local_repo_path)
-                    ui_functions.print_info_msg(humble.REPO_MAINTENANCE.format(repo_to_maintain.root), header = False)
+        if workspace_path:
+            manifest = get_workspace_manifest()
+            full_fetch = config['user_cfg_file'].full_fetch_enabled or is_workspace_full_fetch(workspace_path)
+            repos_to_maintain = filter_materialized(workspace_path, manifest.get_repo_sources(manifest.general_config.current_combo))
+            for repo_to_maintain in repos_to_maintain:
+                local_repo_path = os.path.join(workspace_path, repo_to_maintain.root)
+                repo = Repo(local_repo_path)
+                ui_functions.print_info_msg(humble.REPO_MAINTENANCE.format(repo_to_maintain.root), header = False)
+                if not full_fetch:
+                    # Runs before gc so that objects only reachable from the removed refs can be pruned
+                    ui_functions.print_info_msg(humble.SCOPE_REFSPECS, header = False)
+                    removed_refs = scope_fetch_refspecs(repo, manifest, repo_to_maintain)
+                    if removed_refs:
+                        ui_functions.print_info_msg(humble.REMOVED_REMOTE_REFS.format(len(removed_refs)), header = False)
+                if enable_status_caches(repo):
+                    ui_functions.print_info_msg(humble.STATUS_CACHES, header = False)
+                if update_fsmonitor(repo, config):
+                    if config['user_cfg_file'].fsmonitor_enabled:
+                        ui_functions.print_info_msg(humble.FSMONITOR_ENABLED, header = False)
+                    else:
+                        ui_functions.print_info_msg(humble.FSMONITOR_DISABLED, header = False)
+                if not args.no_gc:
+                    # git gc rewrites the packs that the shared git cat-file processes have open
+                    close_object_queries(repo.common_dir)
                     ui_functions.print_info_msg(humble.REFLOG_EXPIRE, header = False)
                     repo.git.reflog('expire', '--expire=now', '--all')
                     ui_functions.print_info_msg(humble.GC_AGGRESSIVE, header = False)
                     repo.git.gc('--aggressive', '--prune=now')
                     ui_functions.print_info_msg(humble.REMOTE_PRUNE, header = False)
                     repo.git.remote('prune', 'origin')
-                    print()
+                print()
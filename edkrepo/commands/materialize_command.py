@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+#
+## @file
+# materialize_command.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+
+import edkrepo.commands.edkrepo_command as edkrepo_command
+import edkrepo.commands.arguments.materialize_args as arguments
+import edkrepo.commands.humble.materialize_humble as humble
+import edkrepo.common.common_repo_functions as common_repo_functions
+import edkrepo.common.edkrepo_exception as edkrepo_exception
+import edkrepo.common.humble as common_humble
+import edkrepo.common.ui_functions as ui_functions
+import edkrepo.common.workspace_maintenance.deferred_repos_maintenance as deferred_repos_maintenance
+from edkrepo.config.config_factory import get_workspace_path, get_workspace_manifest
+import project_utils.submodule as submodule_utils
+
+
+class MaterializeCommand(edkrepo_command.EdkrepoCommand):
+    def __init__(self):
+        super().__init__()
+
+    def get_metadata(self):
+        metadata = {}
+        metadata['name'] = 'materialize'
+        metadata['help-text'] = arguments.COMMAND_DESCRIPTION
+        args = []
+        metadata['arguments'] = args
+        args.append({'name': 'Roots',
+                     'positional': True,
+                     'position': 0,
+                     'required': False,
+                     'nargs': '*',
+                     'help-text': arguments.ROOTS_HELP})
+        args.append({'name': 'list',
+                     'short-name': 'l',
+                     'positional': False,
+                     'required': False,
+                     'help-text': arguments.LIST_HELP})
+        args.append(edkrepo_command.JobsArgument)
+        args.append(edkrepo_command.SubmoduleSkipArgument)
+        return metadata
+
+    def run_command(self, args, config):
+        common_repo_functions.get_job_count(args)
+        workspace_path = get_workspace_path()
+        manifest = get_workspace_manifest()
+        if not deferred_repos_maintenance.is_lazy_workspace(workspace_path):
+            ui_functions.print_info_msg(humble.NOT_LAZY_WORKSPACE, header=False)
+            return
+        current_combo = manifest.general_config.current_combo
+        combo_sources = manifest.get_repo_sources(current_combo)
+        deferred_sources = deferred_repos_maintenance.filter_deferred(workspace_path, combo_sources)
+
+        if args.list:
+            if not deferred_sources:
+                ui_functions.print_info_msg(humble.NO_DEFERRED_REPOS, header=False)
+                return
+            ui_functions.print_info_msg(humble.DEFERRED_REPOS_HEADER, header=False)
+            for repo_source in deferred_sources:
+                ui_functions.print_info_msg(humble.DEFERRED_REPO.format(repo_source.root), header=False)
+            return
+
+        if args.Roots:
+            repos_to_materialize = []
+            for root in args.Roots:
+                repo_source = self._find_source(workspace_path, root, combo_sources)
+                if repo_source is None:
+                    raise edkrepo_exception.EdkrepoInvalidParametersException(humble.INVALID_ROOT.format(root))
+                if repo_source not in deferred_sources:
+                    ui_functions.print_info_msg(humble.ALREADY_MATERIALIZED.format(repo_source.root), header=False)
+                repos_to_materialize.append(repo_source)
+        else:
+            repos_to_materialize = deferred_sources
+
+        # Match the sparse checkout state of the workspace as each repository is cloned
+        sparse_data = None
+        if manifest.sparse_settings is not None:
+            clone_options = deferred_repos_maintenance.read_deferred_repos(workspace_path)['clone_options']
+            present_sources = deferred_repos_maintenance.filter_materialized(workspace_path, combo_sources)
+            if clone_options.get('sparse') or common_repo_functions.sparse_checkout_enabled(workspace_path, present_sources):
+                ui_functions.print_info_msg(common_humble.SPARSE_CHECKOUT, header=False)
+                sparse_data = common_repo_functions.get_sparse_checkout_data(combo_sources, manifest)
+        materialized = common_repo_functions.materialize_repos(args, config, workspace_path, manifest, repos_to_materialize,
+                                                               sparse_data=sparse_data)
+        if materialized and not args.skip_submodule:
+            submodule_utils.maintain_submodules(workspace_path, manifest, current_combo, args.verbose)
+        if sparse_data is not None:
+            # Repositories with submodules enabled get sparse checkout after their submodules are updated
+            common_repo_functions.sparse_checkout_submodule_repos(workspace_path, materialized, manifest)
+
+    def _find_source(self, workspace_path, root, combo_sources):
+        # Accept the root as written in the manifest or as a path to the repository
+        root_path = os.path.normcase(os.path.abspath(root))
+        for repo_source in combo_sources:
+            if os.path.normcase(os.path.normpath(repo_source.root)) == os.path.normcase(os.path.normpath(root)):
+                return repo_source
+            if os.path.normcase(os.path.abspath(os.path.join(workspace_path, repo_source.root))) == root_path:
+                return repo_source
+        return None
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+#
+## @file
+# prefetch_command.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+
+import edkrepo.commands.edkrepo_command as edkrepo_command
+import edkrepo.commands.arguments.prefetch_args as arguments
+import edkrepo.commands.humble.prefetch_humble as humble
+import edkrepo.common.common_repo_functions as common_repo_functions
+import edkrepo.common.edkrepo_exception as edkrepo_exception
+import edkrepo.common.prefetch_service as prefetch_service
+import edkrepo.common.ui_functions as ui_functions
+from edkrepo.config.config_factory import get_workspace_path
+
+
+class PrefetchCommand(edkrepo_command.EdkrepoCommand):
+    def __init__(self):
+        super().__init__()
+
+    def get_metadata(self):
+        metadata = {}
+        metadata['name'] = 'prefetch'
+        metadata['help-text'] = arguments.COMMAND_DESCRIPTION
+        args = []
+        metadata['arguments'] = args
+        args.append({'choice': 'register',
+                     'parent': 'action',
+                     'help-text': arguments.REGISTER_HELP})
+        args.append({'choice': 'unregister',
+                     'parent': 'action',
+                     'help-text': arguments.UNREGISTER_HELP})
+        args.append({'choice': 'list',
+                     'parent': 'action',
+                     'help-text': arguments.LIST_HELP})
+        args.append({'choice': 'run',
+                     'parent': 'action',
+                     'help-text': arguments.RUN_HELP})
+        args.append({'choice': 'start',
+                     'parent': 'action',
+                     'help-text': arguments.START_HELP})
+        args.append({'choice': 'stop',
+                     'parent': 'action',
+                     'help-text': arguments.STOP_HELP})
+        args.append({'name': 'action',
+                     'positional': True,
+                     'position': 0,
+                     'required': True,
+                     'choices': True,
+                     'help-text': arguments.ACTION_HELP})
+        args.append({'name': 'Workspace',
+                     'positional': True,
+                     'required': False,
+                     'position': 1,
+                     'help-text': arguments.WORKSPACE_HELP})
+        args.append({'name': 'interval',
+                     'positional': False,
+                     'required': False,
+                     'action': 'store',
+                     'help-text': arguments.INTERVAL_HELP})
+        args.append({'name': 'loop',
+                     'positional': False,
+                     'required': False,
+                     'help-text': arguments.LOOP_HELP})
+        # Prefetching uses more jobs by default than the other commands
+        args.append(dict(edkrepo_command.JobsArgument, **{'help-text': arguments.JOBS_HELP}))
+        return metadata
+
+    def run_command(self, args, config):
+        jobs = prefetch_service.DEFAULT_PREFETCH_JOBS
+        if args.jobs is not None:
+            jobs = common_repo_functions.get_job_count(args)
+        interval = self._get_interval(args)
+        if args.action == 'register':
+            workspace_path = self._get_workspace(args)
+            if prefetch_service.register_workspace(workspace_path):
+                ui_functions.print_info_msg(humble.WORKSPACE_REGISTERED.format(workspace_path), header=False)
+            else:
+                ui_functions.print_info_msg(humble.WORKSPACE_ALREADY_REGISTERED.format(workspace_path), header=False)
+        elif args.action == 'unregister':
+            # A workspace that was deleted can still be unregistered
+            workspace_path = os.path.abspath(args.Workspace) if args.Workspace else get_workspace_path()
+            if prefetch_service.unregister_workspace(workspace_path):
+                ui_functions.print_info_msg(humble.WORKSPACE_UNREGISTERED.format(workspace_path), header=False)
+            else:
+                ui_functions.print_info_msg(humble.WORKSPACE_NOT_REGISTERED.format(workspace_path), header=False)
+        elif args.action == 'list':
+            self._list()
+        elif args.action == 'run':
+            if args.loop:
+                prefetch_service.run_prefetch_loop(config, jobs, interval)
+            else:
+                repo_count = prefetch_service.prefetch_all(config, jobs)
+                ui_functions.print_info_msg(humble.PREFETCH_COMPLETE.format(repo_count), header=False)
+        elif args.action == 'start':
+            pid = prefetch_service.get_service_pid()
+            if pid is not None:
+                ui_functions.print_info_msg(humble.SERVICE_RUNNING.format(pid), header=False)
+                return
+            pid = prefetch_service.start_service(jobs, interval)
+            ui_functions.print_info_msg(humble.SERVICE_STARTED.format(pid, interval), header=False)
+        elif args.action == 'stop':
+            if prefetch_service.stop_service():
+                ui_functions.print_info_msg(humble.SERVICE_STOPPED, header=False)
+            else:
+                ui_functions.print_info_msg(humble.SERVICE_NOT_RUNNING, header=False)
+
+    def _get_interval(self, args):
+        if args.interval is None:
+            return prefetch_service.DEFAULT_INTERVAL_MINUTES
+        try:
+            interval = int(args.interval)
+        except ValueError:
+            raise edkrepo_exception.EdkrepoInvalidParametersException(humble.INVALID_INTERVAL.format(args.interval))
+        if interval < 1:
+            raise edkrepo_exception.EdkrepoInvalidParametersException(humble.INVALID_INTERVAL.format(args.interval))
+        return interval
+
+    def _get_workspace(self, args):
+        if not args.Workspace:
+            return get_workspace_path()
+        workspace_path = os.path.abspath(args.Workspace)
+        if not os.path.isfile(os.path.join(workspace_path, 'repo', 'Manifest.xml')):
+            raise edkrepo_exception.EdkrepoInvalidParametersException(humble.NOT_A_WORKSPACE.format(workspace_path))
+        return workspace_path
+
+    def _list(self):
+        pid = prefetch_service.get_service_pid()
+        if pid is not None:
+            ui_functions.print_info_msg(humble.SERVICE_RUNNING.format(pid), header=False)
+        else:
+            ui_functions.print_info_msg(humble.SERVICE_NOT_RUNNING, header=False)
+        workspaces = prefetch_service.get_registered_workspaces()
+        if not workspaces:
+            ui_functions.print_info_msg(humble.NO_REGISTERED_WORKSPACES, header=False)
+            return
+        ui_functions.print_info_msg(humble.REGISTERED_WORKSPACES_HEADER, header=False)
+        for workspace_path in workspaces:
+            ui_functions.print_info_msg(humble.REGISTERED_WORKSPACE.format(workspace_path), header=False)
@@ -25,6 +25,7 @@ from git import Repo
 from edkrepo.commands.edkrepo_command import EdkrepoCommand
 import edkrepo.commands.arguments.reset_args as arguments
 from edkrepo.config.config_factory import get_workspace_path, get_workspace_manifest
+from edkrepo.common.workspace_maintenance.deferred_repos_maintenance import filter_materialized
 import edkrepo.common.ui_functions as ui_functions
 
 class ResetCommand(EdkrepoCommand):
@@ -47,7 +48,7 @@ class ResetCommand(EdkrepoCommand):
         workspace_path = get_workspace_path()
         manifest = get_workspace_manifest()
         manifest_config = manifest.general_config
-        repo_sources_to_reset = manifest.get_repo_sources(manifest_config.current_combo)
+        repo_sources_to_reset = filter_materialized(workspace_path, manifest.get_repo_sources(manifest_config.current_combo))
         for repo_to_reset in repo_sources_to_reset:
             local_repo_path = os.path.join(workspace_path, repo_to_reset.root)
             repo = Repo(local_repo_path)
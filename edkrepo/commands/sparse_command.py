@@ -15,7 +15,8 @@ from edkrepo.common.common_repo_functions import check_dirty_repos
 from edkrepo.common.edkrepo_exception import EdkrepoSparseException
 from edkrepo.common.humble import SPARSE_ENABLE_DISABLE, SPARSE_NO_CHANGE, SPARSE_ENABLE, SPARSE_DISABLE
 from edkrepo.common.humble import SPARSE_STATUS, SPARSE_CHECKOUT_STATUS
-from edkrepo.common.humble import SPARSE_BY_DEFAULT_STATUS, SPARSE_ENABLED_REPOS
+from edkrepo.common.humble import SPARSE_BY_DEFAULT_STATUS, SPARSE_ENABLED_REPOS, SPARSE_COMBO_WORKTREES
+from edkrepo.common.workspace_maintenance.combo_worktrees_maintenance import combo_worktrees_enabled
 import edkrepo.common.ui_functions as ui_functions
 
 
@@ -55,6 +56,8 @@ class SparseCommand(EdkrepoCommand):
                 raise EdkrepoSparseException(SPARSE_ENABLE_DISABLE)
             elif (args.enable and sparse_enabled) or (args.disable and not sparse_enabled):
                 raise EdkrepoSparseException(SPARSE_NO_CHANGE)
+            elif args.enable and combo_worktrees_enabled(workspace_path):
+                raise EdkrepoSparseException(SPARSE_COMBO_WORKTREES)
 
             check_dirty_repos(manifest, workspace_path)
 
@@ -18,6 +18,7 @@ import edkrepo.commands.arguments.status_args as arguments
 import edkrepo.commands.humble.status_humble as humble
 from edkrepo.config.config_factory import get_workspace_path, get_workspace_manifest
 import edkrepo.common.ui_functions as ui_functions
+from edkrepo.common.workspace_maintenance.deferred_repos_maintenance import get_deferred_roots
 
 class StatusCommand(EdkrepoCommand):
 
@@ -37,14 +38,19 @@ class StatusCommand(EdkrepoCommand):
         ui_functions.display_current_project(initial_manifest, verbose=args.verbose)
         current_combo = initial_manifest.general_config.current_combo
         current_sources = initial_manifest.get_repo_sources(current_combo)
+        deferred_roots = get_deferred_roots(workspace_path)
         ui_functions.print_info_msg(humble.STATUS_CURRENT_COMBO.format(initial_manifest.current_combo), header=False)
         print()
         for current_repo in current_sources:
-            local_repo_path = os.path.join(workspace_path, current_repo.root)
-            repo = Repo(local_repo_path)
             if not args.verbose:
                 ui_functions.print_info_msg(humble.REPO_HEADER.format(current_repo.root), header=False)
             else:
                 ui_functions.print_info_msg(humble.REPO_HEADER_VERBOSE.format(current_repo.root, current_repo.remote_url), header=False)
+            if current_repo.root in deferred_roots:
+                ui_functions.print_info_msg(humble.REPO_NOT_MATERIALIZED.format(current_repo.root), header=False)
+                print()
+                continue
+            local_repo_path = os.path.join(workspace_path, current_repo.root)
+            repo = Repo(local_repo_path)
             ui_functions.print_info_msg(repo.git.execute(['git', '-c', 'color.ui=always','status']), header=False)
-            print()
\ No newline at end of file
+            print()
@@ -13,6 +13,7 @@ import shutil
 import sys
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 import git
 from git import Repo
@@ -20,25 +21,37 @@ from git.exc import GitCommandError
 
 # Our modules
 from edkrepo.commands.edkrepo_command import EdkrepoCommand
-from edkrepo.commands.edkrepo_command import SubmoduleSkipArgument, SourceManifestRepoArgument
+from edkrepo.commands.edkrepo_command import SubmoduleSkipArgument, SourceManifestRepoArgument, JobsArgument
 import edkrepo.commands.arguments.sync_args as arguments
 import edkrepo.commands.humble.sync_humble as humble
 from edkrepo.common.edkrepo_exception import EdkrepoException, EdkrepoManifestNotFoundException
-from edkrepo.common.edkrepo_exception import EdkrepoManifestChangedException
+from edkrepo.common.edkrepo_exception import EdkrepoManifestChangedException, EdkrepoInvalidParametersException
 from edkrepo.common.humble import SPARSE_RESET, SPARSE_CHECKOUT, INCLUDED_FILE_NAME
+from edkrepo.common.humble import BUNDLE_DIR_NOT_FOUND, BUNDLE_SEED_FAILED
+from edkrepo.common.bundle_utilities import find_bundle, seed_from_bundle, delete_bundle_refs
 from edkrepo.common.workspace_maintenance.humble.manifest_repos_maintenance_humble import SOURCE_MANIFEST_REPO_NOT_FOUND
 from edkrepo.common.pathfix import get_actual_path, expanduser
 from edkrepo.common.common_repo_functions import clone_repos, create_repos, patchset_branch_creation_flow, patchset_operations_similarity, sparse_checkout_enabled
 from edkrepo.common.common_repo_functions import reset_sparse_checkout, sparse_checkout, verify_single_manifest
 from edkrepo.common.common_repo_functions import checkout_repos, check_dirty_repos
 from edkrepo.common.common_repo_functions import update_editor_config
-from edkrepo.common.common_repo_functions import update_repo_commit_template, get_latest_sha
+from edkrepo.common.common_repo_functions import update_repo_commit_template, get_configured_refspecs, get_remote_tips
 from edkrepo.common.common_repo_functions import update_hooks, combinations_in_manifest
 from edkrepo.common.common_repo_functions import write_included_config, remove_included_config
 from edkrepo.common.common_repo_functions import find_git_version, fetch_from_remote
+from edkrepo.common.common_repo_functions import get_job_count, resume_clone
+from edkrepo.common.clone_journal import clone_journal_exists
+import edkrepo.common.sync_journal as sync_journal
+from edkrepo.common.clone_utilities import generate_reference_path_map
 from edkrepo.common.git_version import GitVersion
+import edkrepo.common.mirror_pool as mirror_pool
+from edkrepo.common.progress_handler import MultiProgressRenderer, RepoProgressHandler, redirect_stdout
 from edkrepo.common.workspace_maintenance.git_config_maintenance import clean_git_globalconfig
 from edkrepo.common.workspace_maintenance.workspace_maintenance import generate_name_for_obsolete_backup
+from edkrepo.common.workspace_maintenance.deferred_repos_maintenance import defer_repos, filter_materialized
+from edkrepo.common.workspace_maintenance.deferred_repos_maintenance import get_deferred_roots, is_lazy_workspace
+from edkrepo.common.workspace_maintenance.deferred_repos_maintenance import mark_materialized
+from edkrepo.common.workspace_maintenance.fetch_refspec_maintenance import NOTES_REFSPEC
 from edkrepo.common.workspace_maintenance.manifest_repos_maintenance import pull_workspace_manifest_repo
 from edkrepo.common.workspace_maintenance.manifest_repos_maintenance import pull_all_manifest_repos
 from edkrepo.common.workspace_maintenance.manifest_repos_maintenance import find_source_manifest_repo
@@ -46,10 +59,15 @@ from edkrepo.common.workspace_maintenance.manifest_repos_maintenance import list
 from edkrepo.config.config_factory import get_workspace_path, get_workspace_manifest
 from edkrepo.config.config_factory import get_workspace_manifest_file
 from edkrepo_manifest_parser.edk_manifest import CiIndexXml, ManifestXml
+from edkrepo_manifest_parser.edk_manifest_diff import ManifestDiff
 from project_utils.submodule import deinit_submodules, maintain_submodules
 import edkrepo.common.ui_functions as ui_functions
 
 
+NOTES_PATTERN = 'refs/notes/*'
+# ls-remote only downloads the ref advertisement, so remotes are always probed concurrently
+MIN_REMOTE_PROBE_JOBS = 8
+
 class SyncCommand(EdkrepoCommand):
 
     def __init__(self):
@@ -74,13 +92,46 @@ class SyncCommand(EdkrepoCommand):
                      'positional' : False,
                      'required' : False,
                      'help-text' : arguments.OVERRIDE_HELP})
+        args.append({'name' : 'bundle-dir',
+                     'positional' : False,
+                     'required' : False,
+                     'action' : 'store',
+                     'help-text' : arguments.BUNDLE_DIR_HELP})
+        args.append({'name' : 'no-resume',
+                     'positional' : False,
+                     'required' : False,
+                     'help-text' : arguments.NO_RESUME_HELP})
+        args.append(JobsArgument)
         args.append(SubmoduleSkipArgument)
         args.append(SourceManifestRepoArgument)
         return metadata
 
     def run_command(self, args, config):
+        get_job_count(args)
+        if args.bundle_dir:
+            if not os.path.isdir(args.bundle_dir):
+                raise EdkrepoInvalidParametersException(BUNDLE_DIR_NOT_FOUND.format(args.bundle_dir))
+            args.bundle_dir = os.path.abspath(args.bundle_dir)
         workspace_path = get_workspace_path()
-        initial_manifest = get_workspace_manifest()
+        journal = None
+        if sync_journal.sync_journal_exists(workspace_path):
+            journal = sync_journal.SyncJournal(workspace_path)
+            if args.no_resume:
+                ui_functions.print_info_msg(humble.SYNC_JOURNAL_DISCARDED, header=False)
+                journal.finish()
+                journal = None
+            elif journal.is_stale(get_workspace_manifest().general_config.current_combo):
+                ui_functions.print_warning_msg(humble.SYNC_JOURNAL_STALE, header=False)
+                journal.finish()
+                journal = None
+        if journal is not None:
+            # Continue from the manifest the interrupted sync started with, repo/Manifest.xml may already be replaced
+            ui_functions.print_info_msg(humble.SYNC_RESUMING, header=False)
+            initial_manifest = ManifestXml(journal.initial_manifest_path)
+            if journal.sync_options.get('update_local_manifest', False):
+                args.update_local_manifest = True
+        else:
+            initial_manifest = get_workspace_manifest()
         current_combo = initial_manifest.general_config.current_combo
         initial_sources = initial_manifest.get_repo_sources(current_combo)
         initial_hooks = initial_manifest.repo_hooks
@@ -108,26 +159,43 @@ class SyncCommand(EdkrepoCommand):
         if global_manifest_directory is not None:
             update_editor_config(config, global_manifest_directory)
 
+        # Finish an interrupted clone before the workspace is updated
+        if clone_journal_exists(workspace_path):
+            resume_clone(args, config, workspace_path, get_workspace_manifest())
+
         if not args.update_local_manifest:
             self.__check_for_new_manifest(args, config, initial_manifest, workspace_path, global_manifest_directory)
         check_dirty_repos(initial_manifest, workspace_path)
 
         # Determine if sparse checkout needs to be disabled for this operation
         sparse_settings = initial_manifest.sparse_settings
-        sparse_enabled = sparse_checkout_enabled(workspace_path, initial_sources)
+        sparse_active = sparse_checkout_enabled(workspace_path, initial_sources)
+        if journal is None:
+            journal = sync_journal.SyncJournal(workspace_path, {'update_local_manifest': bool(args.update_local_manifest),
+                                                                'sparse_enabled': sparse_active})
+            journal.record_workspace_state(current_combo)
+        # The interrupted sync may have reset sparse checkout before it could be restored
+        sparse_enabled = sparse_active or journal.sync_options.get('sparse_enabled', False)
+
+        # Seed repositories from local bundles so that only newer changes are fetched from the remotes
+        seeded_sources = []
+        if args.bundle_dir:
+            seeded_sources = self.__seed_from_bundles(args.bundle_dir, workspace_path, filter_materialized(workspace_path, initial_sources))
+
         sparse_reset_required = False
         if sparse_settings is None:
             sparse_reset_required = True
         elif args.update_local_manifest:
             sparse_reset_required = True
-        if sparse_enabled and sparse_reset_required:
+        if sparse_active and sparse_reset_required:
             ui_functions.print_info_msg(SPARSE_RESET, header = False)
             reset_sparse_checkout(workspace_path, initial_sources)
 
         # Get the latest manifest if requested
-        if args.update_local_manifest:  # NOTE: hyphens in arg name replaced with underscores due to argparse
+        if args.update_local_manifest and not journal.has_workspace_stage(sync_journal.STAGE_MANIFEST_UPDATED):  # NOTE: hyphens in arg name replaced with underscores due to argparse
             try:
-                self.__update_local_manifest(args, config, initial_manifest, workspace_path, global_manifest_directory)
+                self.__update_local_manifest(args, config, initial_manifest, workspace_path, global_manifest_directory, journal)
+                journal.record_workspace_stage(sync_journal.STAGE_MANIFEST_UPDATED)
             except EdkrepoException as e:
                 ui_functions.print_error_msg(e, header=True)
                 ui_functions.print_error_msg(humble.SYNC_MANIFEST_UPDATE_FAILED, header=True)
@@ -142,6 +210,9 @@ class SyncCommand(EdkrepoCommand):
         else:
             repo_sources_to_sync = manifest.get_repo_sources(current_combo)
         manifest.write_current_combo(current_combo)
+        journal.record_workspace_state(current_combo)
+        # Repositories deferred by clone --lazy are synced when they are materialized
+        repo_sources_to_sync = filter_materialized(workspace_path, repo_sources_to_sync)
 
         # At this point both new and old manifest files are ready so we can deinit any
         # submodules that are removed due to a manifest update.
@@ -152,10 +223,10 @@ class SyncCommand(EdkrepoCommand):
         sync_error = False
         # Calculate the hooks which need to be updated, added or removed for the sync
         if args.update_local_manifest:
-            new_hooks = manifest.repo_hooks
-            hooks_add = set(new_hooks).difference(set(initial_hooks))
-            hooks_update = set(initial_hooks).intersection(set(new_hooks))
-            hooks_uninstall = set(initial_hooks).difference(set(new_hooks))
+            hooks_diff = ManifestDiff(initial_manifest, initial_combo, manifest, current_combo)
+            hooks_add = hooks_diff.hooks_added
+            hooks_update = hooks_diff.hooks_kept
+            hooks_uninstall = hooks_diff.hooks_removed
         else:
             hooks_add = None
             hooks_update = initial_hooks
@@ -166,27 +237,38 @@ class SyncCommand(EdkrepoCommand):
         clean_git_globalconfig()
         manifest_repo = manifest.general_config.source_manifest_repo
         global_manifest_path = get_manifest_repo_path(manifest_repo, config)
+        # Network phase: download everything the sync needs, the remaining steps only touch the local repositories.
+        # Repositories whose remote refs have not changed since the last fetch are skipped.
+        # Repositories fetched by an interrupted sync are not fetched again.
+        repo_sources_to_probe = [x for x in repo_sources_to_sync
+                                 if not journal.has_stage(x.root, sync_journal.STAGE_FETCHED) and
+                                 not journal.has_stage(x.root, sync_journal.STAGE_SYNCED)]
+        repo_sources_to_fetch = self.__find_stale_repos(args, workspace_path, repo_sources_to_probe)
+        if len(repo_sources_to_fetch) < len(repo_sources_to_probe):
+            ui_functions.print_info_msg(humble.SYNC_REPOS_UP_TO_DATE.format(len(repo_sources_to_probe) - len(repo_sources_to_fetch)), header=False)
+        self.__fetch_repos(args, workspace_path, repo_sources_to_fetch, journal=journal)
+        # The bundle refs were only needed so that the fetch could skip the objects they contain
+        for repo_source in seeded_sources:
+            delete_bundle_refs(Repo(os.path.join(workspace_path, repo_source.root)))
         for repo_to_sync in repo_sources_to_sync:
+            if journal.has_stage(repo_to_sync.root, sync_journal.STAGE_SYNCED):
+                continue
             local_repo_path = os.path.join(workspace_path, repo_to_sync.root)
             # Update any hooks
             if global_manifest_directory is not None:
                 update_hooks(hooks_add, hooks_update, hooks_uninstall, local_repo_path, repo_to_sync, config, global_manifest_directory)
             repo = Repo(local_repo_path)
-            #Fetch notes
-            fetch_from_remote(repo, repo.remotes.origin, "refs/notes/*:refs/notes/*")
             if repo_to_sync.patch_set:
                 patchset_branch_creation_flow(repo_to_sync, repo, workspace_path, manifest, global_manifest_path, args.override)
             elif repo_to_sync.commit is None and repo_to_sync.tag is None:
                 local_commits = False
                 initial_active_branch = repo.active_branch
-                fetch_from_remote(repo, repo.remotes.origin, "refs/heads/{0}:refs/remotes/origin/{0}".format(repo_to_sync.branch))
                 #The new branch may not exist in the heads list yet if it is a new branch
                 repo.git.checkout(repo_to_sync.branch)
                 if not args.fetch:
                     ui_functions.print_info_msg(humble.SYNCING.format(repo_to_sync.root, repo.active_branch), header = False)
                 else:
                     ui_functions.print_info_msg(humble.FETCHING.format(repo_to_sync.root, repo.active_branch), header = False)
-                fetch_from_remote(repo, repo.remotes.origin)
 
                 if not args.override and not repo.is_ancestor(ancestor_rev='HEAD', rev='origin/{}'.format(repo_to_sync.branch)):
                     ui_functions.print_info_msg(humble.SYNC_COMMITS_ON_TARGET.format(repo_to_sync.branch, repo_to_sync.root), header=False)
@@ -198,9 +280,9 @@ class SyncCommand(EdkrepoCommand):
                 # Switch back to the initially active branch before exiting
                 repo.heads[initial_active_branch.name].checkout()
 
-                # Warn user if local branch is behind target branch
+                # Warn user if local branch is behind target branch, origin was updated by the fetch phase
                 try:
-                    latest_sha = get_latest_sha(repo, repo_to_sync.branch)
+                    latest_sha = repo.commit('origin/{}'.format(repo_to_sync.branch)).hexsha
                     commit_count = int(repo.git.rev_list('--count', '{}..HEAD'.format(latest_sha)))
                     branch_origin = next(itertools.islice(repo.iter_commits(), commit_count, commit_count + 1))
                     behind_count = int(repo.git.rev_list('--count', '{}..{}'.format(branch_origin.hexsha, latest_sha)))
@@ -219,20 +301,148 @@ class SyncCommand(EdkrepoCommand):
             # Update commit message templates
             if global_manifest_directory is not None:
                 update_repo_commit_template(workspace_path, repo, repo_to_sync, global_manifest_directory)
+            journal.record(repo_to_sync.root, sync_journal.STAGE_SYNCED)
 
         if sync_error:
             ui_functions.print_error_msg(humble.SYNC_ERROR, header=False)
 
         # Initialize submodules
-        if not args.skip_submodule:
+        if not args.skip_submodule and not journal.has_workspace_stage(sync_journal.STAGE_SUBMODULES):
             maintain_submodules(workspace_path, manifest, current_combo, args.verbose)
+            journal.record_workspace_stage(sync_journal.STAGE_SUBMODULES)
 
         # Restore sparse checkout state
         if sparse_enabled:
             ui_functions.print_info_msg(SPARSE_CHECKOUT, header = False)
             sparse_checkout(workspace_path, repo_sources_to_sync, manifest)
+        journal.finish()
+
+    def __find_stale_repos(self, args, workspace_path, repo_sources):
+        '''Returns the repo sources whose notes or manifest branch on the remote differ from the local copies.
+
+        The remotes are probed with one git ls-remote per remote URL. Repositories that can not be probed are treated
+        as stale so that the fetch reports any error.
+        '''
+        remote_patterns = {}
+        for repo_source in repo_sources:
+            patterns = remote_patterns.setdefault(repo_source.remote_url, set())
+            patterns.add(NOTES_PATTERN)
+            if self.__is_branch_tracking(repo_source):
+                patterns.add('refs/heads/{}'.format(repo_source.branch))
+        remote_tips = get_remote_tips(remote_patterns, max(get_job_count(args), MIN_REMOTE_PROBE_JOBS))
+        stale_repos = []
+        for repo_source in repo_sources:
+            tips = remote_tips.get(repo_source.remote_url)
+            if tips is None or not self.__is_up_to_date(workspace_path, repo_source, tips):
+                stale_repos.append(repo_source)
+        return stale_repos
+
+    def __is_up_to_date(self, workspace_path, repo_source, remote_tips):
+        repo = Repo(os.path.join(workspace_path, repo_source.root))
+        local_refs = {}
+        ref_patterns = ['refs/notes']
+        if self.__is_branch_tracking(repo_source):
+            ref_patterns.append('refs/remotes/origin/{}'.format(repo_source.branch))
+        try:
+            for line in repo.git.for_each_ref('--format=%(objectname) %(refname)', *ref_patterns).splitlines():
+                sha, ref_name = line.split(' ', 1)
+                local_refs[ref_name] = sha
+        except GitCommandError:
+            return False
+        # Notes that only exist locally are never removed by the fetch, so they do not make the repository stale
+        for ref_name, sha in remote_tips.items():
+            if ref_name.startswith('refs/notes/') and local_refs.get(ref_name) != sha:
+                return False
+        if self.__is_branch_tracking(repo_source):
+            remote_sha = remote_tips.get('refs/heads/{}'.format(repo_source.branch))
+            if remote_sha is None or remote_sha != local_refs.get('refs/remotes/origin/{}'.format(repo_source.branch)):
+                return False
+        return True
+
+    def __is_branch_tracking(self, repo_source):
+        return not repo_source.patch_set and repo_source.commit is None and repo_source.tag is None
+
+    def __fetch_repos(self, args, workspace_path, repo_sources, branches=True, journal=None):
+        '''Fetches all of the given repositories, running up to --jobs fetches at the same time.
+
+        If a fetch fails the fetches that have not started are cancelled and the error of the first repository in
+        repo_sources that failed is raised once the running fetches have finished.
+
+        Arguments:
+        args - all command line arguments
+        workspace_path - the path to the workspace
+        repo_sources - the repo sources to fetch
+        branches - when True the notes and the manifest branch of each repository are fetched as well
+        journal - an optional SyncJournal in which each completed fetch is recorded
+        '''
+        jobs = min(get_job_count(args), max(len(repo_sources), 1))
+        progress = None
+        if jobs > 1:
+            progress = MultiProgressRenderer()
+            for repo_source in repo_sources:
+                progress.add(repo_source.root, 'Fetching')
+        try:
+            with redirect_stdout(progress), ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = [(repo_source, executor.submit(self.__fetch_repo, workspace_path, repo_source, branches, progress, journal))
+                           for repo_source in repo_sources]
+                try:
+                    for repo_source, future in futures:
+                        future.result()
+                except BaseException:
+                    for repo_source, future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            if progress is not None:
+                progress.close()
 
-    def __update_local_manifest(self, args, config, initial_manifest, workspace_path, global_manifest_directory):
+    def __fetch_repo(self, workspace_path, repo_to_sync, branches, progress, journal):
+        if progress is not None:
+            progress.start(repo_to_sync.root, 'Fetching')
+        try:
+            repo = Repo(os.path.join(workspace_path, repo_to_sync.root))
+            fetch_args = {}
+            if progress is not None:
+                fetch_args['progress'] = RepoProgressHandler(progress, repo_to_sync.root)
+            if not branches:
+                fetch_from_remote(repo, repo.remotes.origin, **fetch_args)
+            elif not self.__is_branch_tracking(repo_to_sync):
+                # Patchsets fetch what they need while the branch is created, commits and tags are not synced
+                fetch_from_remote(repo, repo.remotes.origin, NOTES_REFSPEC)
+            else:
+                # Fetch the notes, the manifest branch and the configured refspecs over a single connection. The
+                # manifest branch is listed explicitly since single branch clones may not fetch it otherwise.
+                refspecs = get_configured_refspecs(repo)
+                for refspec in (NOTES_REFSPEC, "refs/heads/{0}:refs/remotes/origin/{0}".format(repo_to_sync.branch)):
+                    if refspec not in refspecs and '+{}'.format(refspec) not in refspecs:
+                        refspecs.append(refspec)
+                fetch_from_remote(repo, repo.remotes.origin, refspecs, **fetch_args)
+        except Exception:
+            if progress is not None:
+                progress.finish(repo_to_sync.root, success=False)
+            raise
+        if journal is not None:
+            journal.record(repo_to_sync.root, sync_journal.STAGE_FETCHED)
+        if progress is not None:
+            progress.finish(repo_to_sync.root)
+
+    def __seed_from_bundles(self, bundle_dir, workspace_path, repo_sources):
+        '''Seeds each repository that has a bundle in bundle_dir and returns the repo sources that were seeded.'''
+        seeded_sources = []
+        for repo_source in repo_sources:
+            bundle_path = find_bundle(bundle_dir, repo_source.remote_url)
+            if bundle_path is None:
+                continue
+            ui_functions.print_info_msg(humble.SEEDING_FROM_BUNDLE.format(repo_source.root, bundle_path), header=False)
+            try:
+                seed_from_bundle(Repo(os.path.join(workspace_path, repo_source.root)), bundle_path)
+            except GitCommandError as e:
+                ui_functions.print_warning_msg(BUNDLE_SEED_FAILED.format(repo_source.root, bundle_path, e.stderr), header=False)
+                continue
+            seeded_sources.append(repo_source)
+        return seeded_sources
+
+    def __update_local_manifest(self, args, config, initial_manifest, workspace_path, global_manifest_directory, journal):
         #if the manifest repository for the current manifest was not found then there is no project with the manifest
         #specified project name in the index file for any of the manifest repositories
         if global_manifest_directory is None:
@@ -242,10 +452,7 @@ class SyncCommand(EdkrepoCommand):
         current_combo = initial_manifest.general_config.current_combo
         initial_sources = initial_manifest.get_repo_sources(current_combo)
         # Do a fetch for each repo in the initial to ensure that newly created upstream branches are available
-        for initial_repo in initial_sources:
-            local_repo_path = os.path.join(workspace_path, initial_repo.root)
-            repo = Repo(local_repo_path)
-            fetch_from_remote(repo, repo.remotes.origin)
+        self.__fetch_repos(args, workspace_path, filter_materialized(workspace_path, initial_sources), branches=False)
 
         #see if there is an entry in CiIndex.xml that matches the prject name of the current manifest
         index_path = os.path.join(global_manifest_directory, 'CiIndex.xml')
@@ -261,83 +468,36 @@ class SyncCommand(EdkrepoCommand):
         # the default combo
         new_combos = combinations_in_manifest(new_manifest_to_check)
         if current_combo not in new_combos:
-            new_sources_for_current_combo = new_manifest_to_check.get_repo_sources(new_manifest_to_check.general_config.default_combo)
-            new_sources = new_sources_for_current_combo
+            new_combo = new_manifest_to_check.general_config.default_combo
         else:
-            new_sources_for_current_combo = new_manifest_to_check.get_repo_sources(current_combo)
-            new_sources = new_manifest_to_check.get_repo_sources(current_combo)
+            new_combo = current_combo
+        new_sources_for_current_combo = new_manifest_to_check.get_repo_sources(new_combo)
+        new_sources = new_sources_for_current_combo
+        manifest_diff = ManifestDiff(initial_manifest, current_combo, new_manifest_to_check, new_combo)
 
         remove_included_config(initial_manifest.remotes, initial_manifest.submodule_alternate_remotes, local_manifest_dir)
         write_included_config(new_manifest_to_check.remotes, new_manifest_to_check.submodule_alternate_remotes, local_manifest_dir)
 
         self.__check_submodule_config(workspace_path, new_manifest_to_check, new_sources_for_current_combo)
         # Check that the repo sources lists are the same. If they are not the same and the override flag is not set, throw an exception.
-        initial_source_repos = set([(source.remote_name, source.remote_url, source.root) for source in set(initial_sources)])
-        new_source_repos = set([(source.remote_name, source.remote_url, source.root) for source in set(new_sources)])
-        if not args.override and initial_source_repos != new_source_repos:
+        if not args.override and manifest_diff.has_source_changes:
             raise EdkrepoManifestChangedException(humble.SYNC_REPO_CHANGE.format(initial_manifest.project_info.codename))
-        elif args.override and initial_source_repos != new_source_repos:
-            # get a set of repo source tuples that are not in both the new and old manifest
-            uncommon_sources = []
-            initial_common = []
-            new_common = []
-            for initial in initial_sources:
-                common = False
-                for new in new_sources:
-                    if initial.root == new.root:
-                        if initial.remote_name == new.remote_name:
-                            if initial.remote_url == new.remote_url:
-                                # If the source is unchanged between the old and the new manifest,
-                                # add it to the common lists
-                                common = True
-                                initial_common.append(initial)
-                                new_common.append(new)
-                                break
-                # If the source is different between the old and the new manifest, add it to the uncommon list
-                if not common:
-                    uncommon_sources.append(initial)
-            for new in new_sources:
-                common = False
-                for initial in initial_sources:
-                    if new.root == initial.root:
-                        if new.remote_name == initial.remote_name:
-                            if new.remote_url == initial.remote_url:
-                                common = True
-                                break
-                # If the source is different between the old and the new manifest, add it to the uncommon list
-                if not common:
-                    uncommon_sources.append(new)
-            uncommon_sources = set(uncommon_sources)
-            initial_common = set(initial_common)
-            new_common = set(new_common)
-            sources_to_move = []
-            sources_to_remove = []
-            sources_to_clone = []
-            for source in uncommon_sources:
-                found_source = False
-                for source_to_check in initial_sources:
-                    if source_to_check.root == source.root:
-                        if source_to_check.remote_name == source.remote_name:
-                            if source_to_check.remote_url == source.remote_url:
-                                found_source = True
-                                break
-                # If the source that is different came from the old manifest, then it is now outdated and either needs
-                # to be deleted or moved to an archival location.
-                if found_source:
-                    roots = [s.root for s in new_sources]
-                    # If there is a source in the new manifest that goes into the same folder name as a source in the
-                    # old manifest, then we need to move that old folder to an archival location.
-                    if source.root in roots:
-                        sources_to_move.append(source)
-                    else:
-                        # If it doesn't exist at all in the new manifest, tell the user it is old and no longer used.
-                        sources_to_remove.append(source)
-                else:
-                    # If the source that is different came from the new manifest, then we need to clone that new
-                    # Git repository.
-                    sources_to_clone.append(source)
+        elif args.override and manifest_diff.has_source_changes:
+            # Sources whose folder is used by a different repository in the new manifest are moved to an archival
+            # location, sources that no longer exist at all are reported to the user as old and no longer used, and
+            # sources that only exist in the new manifest are cloned.
+            sources_to_move = manifest_diff.replaced
+            sources_to_remove = manifest_diff.removed
+            sources_to_clone = manifest_diff.added
+            # Repositories that were never cloned have nothing to move or remove
+            deferred_roots = get_deferred_roots(workspace_path)
+            sources_to_move = [source for source in sources_to_move if source.root not in deferred_roots]
+            mark_materialized(workspace_path, [source.root for source in sources_to_remove if source.root in deferred_roots])
+            sources_to_remove = [source for source in sources_to_remove if source.root not in deferred_roots]
             # Move the obsolete Git repositories to archival locations.
             for source in sources_to_move:
+                if journal.has_stage(source.root, sync_journal.STAGE_ARCHIVED):
+                    continue
                 old_dir = os.path.join(workspace_path, source.root)
                 new_dir = generate_name_for_obsolete_backup(old_dir)
                 ui_functions.print_warning_msg(humble.SYNC_SOURCE_MOVE_WARNING.format(source.root, new_dir), header=True)
@@ -347,6 +507,7 @@ class SyncCommand(EdkrepoCommand):
                 except:
                     ui_functions.print_error_msg(humble.SYNC_MOVE_FAILED.format(initial_dir=source.root, new_dir=new_dir), header=True)
                     raise
+                journal.record(source.root, sync_journal.STAGE_ARCHIVED)
             # Tell the user about any Git repositories that are no longer used.
             if len(sources_to_remove) > 0:
                 ui_functions.print_warning_msg(humble.SYNC_REMOVE_WARNING, header = False)
@@ -354,38 +515,35 @@ class SyncCommand(EdkrepoCommand):
                 path_to_source = os.path.join(workspace_path, source.root)
                 ui_functions.print_warning_msg(path_to_source, header = False)
 
+            # Defer any new Git repositories in a workspace created with clone --lazy
+            if is_lazy_workspace(workspace_path):
+                defer_repos(workspace_path, [source.root for source in sources_to_clone])
+                sources_to_clone = []
             # Clone any new Git repositories
             use_reference = config['user_cfg_file'].reference_repos_enabled_by_default
             use_dissociate = config['user_cfg_file'].reference_repos_dissociate_by_default
             reference_path_map = {}
+            if config['user_cfg_file'].mirror_pool_enabled_by_default:
+                reference_path_map.update(mirror_pool.update_mirrors(sources_to_clone, get_job_count(args)))
             if use_reference:
-                for ref_name in config['user_cfg_file'].reference_repos_enabled_for:
-                    ref_url = config['user_cfg_file'].get_reference_repo_url(ref_name)
-                    ref_path = config['user_cfg_file'].get_reference_repo_path(ref_name)
-                    if ref_url and ref_path:
-                        reference_path_map[ref_url.lower()] = ref_path
-            _ = clone_repos(args, workspace_path, sources_to_clone, new_manifest_to_check.repo_hooks, config, new_manifest_to_check, global_manifest_directory, reference_path_map=reference_path_map, dissociate=use_dissociate)
+                reference_path_map.update(generate_reference_path_map(config['user_cfg_file']))
+            _ = clone_repos(args, workspace_path, sources_to_clone, new_manifest_to_check.repo_hooks, config, new_manifest_to_check, global_manifest_directory, reference_path_map=reference_path_map, dissociate=use_dissociate, bundle_dir=args.bundle_dir, journal=journal)
             # Make a list of and only checkout repos that were newly cloned. Sync keeps repos on their initial active branches
             # cloning the entire combo can prevent existing repos from correctly being returned to their proper branch
-            repos_to_checkout = []
-            if sources_to_clone:
-                for new_source in new_sources_for_current_combo:
-                    for source in sources_to_clone:
-                        if source.root == new_source.root:
-                            repos_to_checkout.append(source)
-
-            new_repos_to_checkout, repos_to_create = self.__check_combo_patchset_sha_tag_branch(workspace_path, initial_common, new_common, initial_manifest, new_manifest_to_check)
+            repos_to_checkout = list(sources_to_clone)
+
+            new_repos_to_checkout, repos_to_create = self.__check_combo_patchset_sha_tag_branch(workspace_path, manifest_diff.common, initial_manifest, new_manifest_to_check)
             repos_to_checkout.extend(new_repos_to_checkout)
             if repos_to_checkout:
-                checkout_repos(args.verbose, args.override, repos_to_checkout, workspace_path, new_manifest_to_check, global_manifest_directory)
+                checkout_repos(args.verbose, args.override, repos_to_checkout, workspace_path, new_manifest_to_check, global_manifest_directory, get_job_count(args))
 
             if repos_to_create:
                 create_repos(repos_to_create, workspace_path, new_manifest_to_check, global_manifest_directory)
 
         if set(initial_sources) == set(new_sources):
-            repos_to_checkout, repos_to_create = self.__check_combo_patchset_sha_tag_branch(workspace_path, initial_sources, new_sources, initial_manifest, new_manifest_to_check)
+            repos_to_checkout, repos_to_create = self.__check_combo_patchset_sha_tag_branch(workspace_path, manifest_diff.common, initial_manifest, new_manifest_to_check)
             if repos_to_checkout:
-                checkout_repos(args.verbose, args.override, repos_to_checkout, workspace_path, new_manifest_to_check, global_manifest_directory)
+                checkout_repos(args.verbose, args.override, repos_to_checkout, workspace_path, new_manifest_to_check, global_manifest_directory, get_job_count(args))
 
             if repos_to_create:
                 create_repos(repos_to_create, workspace_path, new_manifest_to_check, global_manifest_directory)
@@ -405,45 +563,43 @@ class SyncCommand(EdkrepoCommand):
                 find_source_manifest_repo(new_manifest, config['cfg_file'], config['user_cfg_file'], None)
         except EdkrepoManifestNotFoundException:
             pass
+        journal.record_workspace_state(ManifestXml(local_manifest_path).general_config.current_combo)
 
-    def __check_combo_patchset_sha_tag_branch(self, workspace_path, initial_sources, new_sources, initial_manifest, new_manifest_to_check):
+    def __check_combo_patchset_sha_tag_branch(self, workspace_path, common_sources, initial_manifest, new_manifest_to_check):
         # Checks for changes in the defined SHAs, Tags or branches in the checked out combo. Returns
         # a list of repos to checkout. Checks to see if user is on appropriate SHA, tag or branch and
-        # throws and exception if not.
+        # throws and exception if not. common_sources is the list of SourceChange tuples from a ManifestDiff.
         repos_to_checkout = []
         repos_to_create = []
-        for initial_source in initial_sources:
-            for new_source in new_sources:
-                if initial_source.root == new_source.root and initial_source.remote_name == new_source.remote_name and initial_source.remote_url == new_source.remote_url:
-                    local_repo_path = os.path.join(workspace_path, initial_source.root)
-                    repo = Repo(local_repo_path)
-                    if initial_source.patch_set:
-                        initial_patchset = initial_manifest.get_patchset(initial_source.patch_set, initial_source.remote_name)
-                        new_patchset = new_manifest_to_check.get_patchset(new_source.patch_set, new_source.remote_name)
-                        if initial_patchset == new_patchset:
-                            if not patchset_operations_similarity(initial_patchset, new_patchset, initial_manifest, new_manifest_to_check):
-                                repos_to_create.append(new_source)
-                                break
-                            repos_to_checkout.append(new_source)
-                        else:
-                            repos_to_create.append(new_source)
-                        break
-                    elif initial_source.commit and initial_source.commit != new_source.commit:
-                        if repo.head.object.hexsha != initial_source.commit:
-                            ui_functions.print_info_msg(humble.SYNC_BRANCH_CHANGE_ON_LOCAL.format(initial_source.branch, new_source.branch, initial_source.root), header=False)
-                        repos_to_checkout.append(new_source)
-                        break
-                    elif initial_source.tag and initial_source.tag != new_source.tag:
-                        tag_sha = repo.git.rev_list('-n 1', initial_source.tag) #according to gitpython docs must change - to _
-                        if tag_sha != repo.head.object.hexsha:
-                            ui_functions.print_info_msg(humble.SYNC_BRANCH_CHANGE_ON_LOCAL.format(initial_source.branch, new_source.branch, initial_source.root), header=False)
-                        repos_to_checkout.append(new_source)
-                        break
-                    elif initial_source.branch and initial_source.branch != new_source.branch:
-                        if repo.active_branch.name != initial_source.branch:
-                            ui_functions.print_info_msg(humble.SYNC_BRANCH_CHANGE_ON_LOCAL.format(initial_source.branch, new_source.branch, initial_source.root), header = False)
-                        repos_to_checkout.append(new_source)
-                        break
+        deferred_roots = get_deferred_roots(workspace_path)
+        for initial_source, new_source in common_sources:
+            if initial_source.root in deferred_roots:
+                continue
+            local_repo_path = os.path.join(workspace_path, initial_source.root)
+            repo = Repo(local_repo_path)
+            if initial_source.patch_set:
+                initial_patchset = initial_manifest.get_patchset(initial_source.patch_set, initial_source.remote_name)
+                new_patchset = new_manifest_to_check.get_patchset(new_source.patch_set, new_source.remote_name)
+                if initial_patchset == new_patchset:
+                    if not patchset_operations_similarity(initial_patchset, new_patchset, initial_manifest, new_manifest_to_check):
+                        repos_to_create.append(new_source)
+                        continue
+                    repos_to_checkout.append(new_source)
+                else:
+                    repos_to_create.append(new_source)
+            elif initial_source.commit and initial_source.commit != new_source.commit:
+                if repo.head.object.hexsha != initial_source.commit:
+                    ui_functions.print_info_msg(humble.SYNC_BRANCH_CHANGE_ON_LOCAL.format(initial_source.branch, new_source.branch, initial_source.root), header=False)
+                repos_to_checkout.append(new_source)
+            elif initial_source.tag and initial_source.tag != new_source.tag:
+                tag_sha = repo.git.rev_list('-n 1', initial_source.tag) #according to gitpython docs must change - to _
+                if tag_sha != repo.head.object.hexsha:
+                    ui_functions.print_info_msg(humble.SYNC_BRANCH_CHANGE_ON_LOCAL.format(initial_source.branch, new_source.branch, initial_source.root), header=False)
+                repos_to_checkout.append(new_source)
+            elif initial_source.branch and initial_source.branch != new_source.branch:
+                if repo.active_branch.name != initial_source.branch:
+                    ui_functions.print_info_msg(humble.SYNC_BRANCH_CHANGE_ON_LOCAL.format(initial_source.branch, new_source.branch, initial_source.root), header = False)
+                repos_to_checkout.append(new_source)
         return repos_to_checkout, repos_to_create
 
     def __check_for_new_manifest(self, args, config, initial_manifest, workspace_path, global_manifest_directory):
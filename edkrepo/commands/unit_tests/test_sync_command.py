@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_sync_command.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import argparse
+import os
+import subprocess
+import sys
+
+import pytest
+from git import Repo
+from git.exc import GitCommandError
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+import edkrepo.commands.sync_command as sync_command
+import edkrepo.common.common_repo_functions as common_repo_functions
+from edkrepo.commands.sync_command import SyncCommand
+from edkrepo.common.workspace_maintenance.fetch_refspec_maintenance import NOTES_REFSPEC
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+ROOTS = ['Repo1', 'Repo2']
+
+def _make_workspace(tmp_path, remotes=None):
+    '''Clones a remote for each of ROOTS into a workspace. remotes replaces the URLs written to the manifest. Returns
+    the workspace path, the repo sources and the paths of the remotes.'''
+    workspace = str(tmp_path / 'workspace')
+    os.makedirs(workspace)
+    cloned_remotes = bt.clone_remotes(tmp_path, workspace, ROOTS)
+    cloned_remotes.update(remotes or {})
+    manifest = bt.write_manifest(workspace, cloned_remotes, {'main': bt.source_elements(ROOTS)})
+    remote_paths = {root: str(tmp_path / 'remotes' / root) for root in ROOTS}
+    return workspace, manifest.get_repo_sources('main'), remote_paths
+
+def _find_stale_roots(workspace, repo_sources):
+    stale_repos = SyncCommand()._SyncCommand__find_stale_repos(argparse.Namespace(jobs=None), workspace, repo_sources)
+    return [repo_source.root for repo_source in stale_repos]
+
+def _fetch_repos(workspace, repo_sources, jobs=None):
+    SyncCommand()._SyncCommand__fetch_repos(argparse.Namespace(jobs=jobs), workspace, repo_sources)
+
+@pytest.fixture
+def fetch_calls(monkeypatch):
+    '''Records the repository path and the refspecs of each fetch made by sync.'''
+    calls = []
+    def _fetch_from_remote(repo, remote, *args, **kwargs):
+        calls.append((repo.working_dir, list(args[0]) if args else None))
+        return common_repo_functions.fetch_from_remote(repo, remote, *args, **kwargs)
+    monkeypatch.setattr(sync_command, 'fetch_from_remote', _fetch_from_remote)
+    return calls
+
+class TestFindStaleRepos:
+
+    def test_unchanged_repo_skipped(self, tmp_path):
+        workspace, repo_sources, _ = _make_workspace(tmp_path)
+        assert _find_stale_roots(workspace, repo_sources) == []
+
+    def test_branch_commit_is_stale(self, tmp_path):
+        workspace, repo_sources, remote_paths = _make_workspace(tmp_path)
+        bt.commit_files(remote_paths['Repo1'], 'update')
+        assert _find_stale_roots(workspace, repo_sources) == ['Repo1']
+
+    def test_notes_are_stale(self, tmp_path):
+        workspace, repo_sources, remote_paths = _make_workspace(tmp_path)
+        bt.run_git(remote_paths['Repo2'], 'notes', 'add', '-m', 'note', 'HEAD')
+        assert _find_stale_roots(workspace, repo_sources) == ['Repo2']
+
+    def test_local_notes_not_stale(self, tmp_path):
+        workspace, repo_sources, _ = _make_workspace(tmp_path)
+        bt.run_git(os.path.join(workspace, 'Repo1'), 'notes', 'add', '-m', 'note', 'HEAD')
+        assert _find_stale_roots(workspace, repo_sources) == []
+
+    def test_unreachable_remote_is_stale(self, tmp_path):
+        missing_remote = (tmp_path / 'missing').as_posix()
+        workspace, repo_sources, _ = _make_workspace(tmp_path, {'Repo1': missing_remote})
+        assert _find_stale_roots(workspace, repo_sources) == ['Repo1']
+
+class TestGetRemoteTips:
+
+    def test_remote_tips(self, tmp_path):
+        remote = str(tmp_path / 'remote')
+        sha = bt.init_repo(remote)
+        missing_remote = str(tmp_path / 'missing')
+        tips = common_repo_functions.get_remote_tips({remote: {'refs/heads/main'}, missing_remote: {'refs/heads/main'}})
+        assert tips == {remote: {'refs/heads/main': sha}, missing_remote: None}
+
+    def test_no_remotes(self):
+        assert common_repo_functions.get_remote_tips({}) == {}
+
+    def test_never_prompts(self, tmp_path, monkeypatch):
+        calls = []
+        def _run(cmd, **kwargs):
+            calls.append(kwargs)
+            return subprocess.CompletedProcess(cmd, 128, stdout='')
+        monkeypatch.setattr(common_repo_functions.subprocess, 'run', _run)
+        assert common_repo_functions.get_remote_tips({'https://example.com/repo.git': {'refs/heads/main'}}) == \
+            {'https://example.com/repo.git': None}
+        assert calls[0]['stdin'] == subprocess.DEVNULL
+        assert calls[0]['env']['GIT_TERMINAL_PROMPT'] == '0'
+
+class TestFetchRepos:
+
+    def test_duplicate_refspecs_removed(self, tmp_path, fetch_calls):
+        workspace, repo_sources, _ = _make_workspace(tmp_path)
+        repo = Repo(os.path.join(workspace, 'Repo1'))
+        repo.git.config('--add', 'remote.origin.fetch', '+{}'.format(NOTES_REFSPEC))
+        repo.git.config('--add', 'remote.origin.fetch', '+refs/heads/main:refs/remotes/origin/main')
+        _fetch_repos(workspace, repo_sources[:1])
+        assert fetch_calls == [(repo.working_dir, ['+refs/heads/*:refs/remotes/origin/*', '+{}'.format(NOTES_REFSPEC),
+                                                   '+refs/heads/main:refs/remotes/origin/main'])]
+
+    def test_single_fetch(self, tmp_path, fetch_calls):
+        workspace, repo_sources, remote_paths = _make_workspace(tmp_path)
+        repo = Repo(os.path.join(workspace, 'Repo1'))
+        repo.git.config('remote.origin.fetch', '+refs/heads/dev:refs/remotes/origin/dev')
+        repo.git.config('--add', 'remote.origin.fetch', '+refs/tags/release:refs/tags/release')
+        main_sha = bt.commit_files(remote_paths['Repo1'], 'update')
+        bt.run_git(remote_paths['Repo1'], 'notes', 'add', '-m', 'note', 'HEAD')
+        bt.run_git(remote_paths['Repo1'], 'tag', 'release', 'dev')
+        _fetch_repos(workspace, repo_sources[:1])
+        assert fetch_calls == [(repo.working_dir, ['+refs/heads/dev:refs/remotes/origin/dev',
+                                                   '+refs/tags/release:refs/tags/release', NOTES_REFSPEC,
+                                                   'refs/heads/main:refs/remotes/origin/main'])]
+        assert repo.git.rev_parse('origin/main') == main_sha
+        assert repo.git.rev_parse('release') == bt.run_git(remote_paths['Repo1'], 'rev-parse', 'release')
+        assert repo.git.notes('show', main_sha) == 'note'
+
+    def test_fetch_error_raised(self, tmp_path):
+        workspace, repo_sources, _ = _make_workspace(tmp_path)
+        Repo(os.path.join(workspace, 'Repo1')).git.remote('set-url', 'origin', str(tmp_path / 'missing'))
+        with pytest.raises(GitCommandError):
+            _fetch_repos(workspace, repo_sources[:1])
+
+    def test_concurrent_fetch(self, tmp_path, fetch_calls):
+        workspace, repo_sources, _ = _make_workspace(tmp_path)
+        _fetch_repos(workspace, repo_sources, jobs=2)
+        assert sorted(path for path, _ in fetch_calls) == [os.path.join(workspace, root) for root in ROOTS]
+
+    def test_concurrent_fetch_error_raised(self, tmp_path, fetch_calls):
+        workspace, repo_sources, _ = _make_workspace(tmp_path)
+        Repo(os.path.join(workspace, 'Repo2')).git.remote('set-url', 'origin', str(tmp_path / 'missing'))
+        with pytest.raises(GitCommandError):
+            _fetch_repos(workspace, repo_sources, jobs=2)
+        assert sorted(path for path, _ in fetch_calls) == [os.path.join(workspace, root) for root in ROOTS]
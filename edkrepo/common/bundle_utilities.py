@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+#
+## @file
+# bundle_utilities.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import subprocess
+import tempfile
+
+from git import Repo
+
+import edkrepo.common.edkrepo_exception as edkrepo_exception
+import edkrepo.common.humble as humble
+from edkrepo.common.clone_utilities import generate_remote_url_key
+from edkrepo.common.git_version import GitVersion
+
+BUNDLE_FILE_EXTENSION = '.bundle'
+BUNDLE_URI_MIN_GIT_VERSION = GitVersion('2.38.0')
+BUNDLE_REF_PREFIX = 'refs/bundles'
+BUNDLE_REFSPEC = '+refs/heads/*:{}/*'.format(BUNDLE_REF_PREFIX)
+
+def get_bundle_path(bundle_dir, url):
+    '''Returns the path of the bundle file for the repository at url within bundle_dir.
+
+    Arguments:
+    bundle_dir - the directory containing the bundle files.
+    url - the remote URL of the repository.
+    '''
+    return os.path.join(bundle_dir, '{}{}'.format(generate_remote_url_key(url), BUNDLE_FILE_EXTENSION))
+
+def find_bundle(bundle_dir, url):
+    '''Returns the path of the bundle file for url if bundle_dir contains one, otherwise None.'''
+    if not bundle_dir:
+        return None
+    bundle_path = get_bundle_path(bundle_dir, url)
+    if os.path.isfile(bundle_path):
+        return bundle_path
+    return None
+
+def _run_git(cmd, cwd=None, input_data=None):
+    result = subprocess.run(cmd, cwd=cwd, input=input_data, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            universal_newlines=True)
+    if result.returncode != 0:
+        raise edkrepo_exception.EdkrepoGitException(humble.BUNDLE_GIT_FAILED.format(' '.join(cmd), result.stdout))
+    return result.stdout
+
+def create_bundle(repo_path, bundle_path):
+    '''Writes a bundle containing the remote tracking branches and tags of the repository at repo_path.
+
+    The remote tracking branches are stored in the bundle as refs/heads/*, the same layout that git bundle create
+    produces for a mirror of the remote, so that git clone --bundle-uri can consume the bundle. Returns False if the
+    repository has no refs to bundle.
+
+    Arguments:
+    repo_path - the path to a workspace repository.
+    bundle_path - the path of the bundle file to write.
+    '''
+    repo = Repo(repo_path)
+    refs = _run_git(['git', 'for-each-ref', '--format=%(objectname) %(refname)', 'refs/remotes/origin', 'refs/tags'],
+                    cwd=repo_path)
+    ref_updates = []
+    for line in refs.splitlines():
+        sha, ref_name = line.split(' ', 1)
+        if ref_name == 'refs/remotes/origin/HEAD':
+            continue
+        if ref_name.startswith('refs/remotes/origin/'):
+            ref_name = 'refs/heads/{}'.format(ref_name[len('refs/remotes/origin/'):])
+        ref_updates.append('create {} {}\n'.format(ref_name, sha))
+    if not ref_updates:
+        return False
+    # Build the renamed refs in a temporary repository that borrows the workspace repository's objects
+    with tempfile.TemporaryDirectory() as temp_repo:
+        _run_git(['git', 'init', '--bare', '-q', temp_repo])
+        with open(os.path.join(temp_repo, 'objects', 'info', 'alternates'), 'w') as alternates:
+            alternates.write('{}\n'.format(os.path.abspath(os.path.join(repo.common_dir, 'objects'))))
+        _run_git(['git', 'update-ref', '--stdin'], cwd=temp_repo, input_data=''.join(ref_updates))
+        temp_bundle_path = '{}.tmp'.format(bundle_path)
+        try:
+            _run_git(['git', 'bundle', 'create', '-q', temp_bundle_path, '--all'], cwd=temp_repo)
+        except edkrepo_exception.EdkrepoGitException:
+            # Do not leave a partially written bundle behind
+            if os.path.exists(temp_bundle_path):
+                os.remove(temp_bundle_path)
+            raise
+    os.replace(temp_bundle_path, bundle_path)
+    return True
+
+def seed_from_bundle(repo, bundle_path):
+    '''Fetches the contents of a bundle into refs/bundles/* so that a following fetch from the remote only needs to
+    transfer the objects created after the bundle.
+
+    Arguments:
+    repo - the GitPython Repo object to seed.
+    bundle_path - the path to the bundle file.
+    '''
+    repo.git.fetch(bundle_path, BUNDLE_REFSPEC, '--quiet', '--no-tags', '--no-write-fetch-head')
+
+def delete_bundle_refs(repo):
+    '''Deletes the refs/bundles/* refs written by seed_from_bundle once the fetch they seeded has completed, so that
+    they do not accumulate or keep objects from being garbage collected.
+
+    Arguments:
+    repo - the GitPython Repo object that was seeded.
+    '''
+    refs = _run_git(['git', 'for-each-ref', '--format=%(refname)', BUNDLE_REF_PREFIX], cwd=repo.working_tree_dir)
+    ref_updates = ''.join('delete {}\n'.format(ref_name) for ref_name in refs.splitlines() if ref_name)
+    if ref_updates:
+        _run_git(['git', 'update-ref', '--stdin'], cwd=repo.working_tree_dir, input_data=ref_updates)
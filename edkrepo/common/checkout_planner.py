@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+#
+## @file
+# checkout_planner.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Plans the smallest set of per repository steps needed to switch a workspace to another combination.
+
+A repository is left untouched when it is already checked out onto the ref the new combination uses, the ref
+resolves to the commit it is on, and its submodule and sparse checkout settings are the same in both combinations.
+'''
+
+import os
+from collections import namedtuple
+
+import git
+from git import Repo
+
+import edkrepo.common.workspace_maintenance.deferred_repos_maintenance as deferred_repos_maintenance
+import project_utils.sparse as sparse
+from edkrepo_manifest_parser.edk_manifest_diff import ManifestDiff
+
+#
+# The steps needed for one repository of the new combination. initial is the RepoSource of the repository in the
+# initial combination or None if it was added.
+#
+RepoPlan = namedtuple('RepoPlan', ['source', 'initial', 'checkout', 'submodules', 'sparse'])
+
+def _get_source_ref(source):
+    return (source.branch, source.commit, source.tag, source.patch_set)
+
+def resolve_commit(repo, ref):
+    try:
+        return repo.git.rev_parse('--verify', '--quiet', '{}^{{commit}}'.format(ref))
+    except git.GitCommandError:
+        return None
+
+def get_target_ref(repo, source):
+    '''Returns the ref that checkout_repos checks source out onto, or None if it cannot be determined in advance.'''
+    if source.patch_set:
+        # Patchset branches may be recreated by the checkout
+        return None
+    if source.commit:
+        return source.commit
+    if source.tag:
+        return 'refs/tags/{}'.format(source.tag)
+    if source.branch:
+        # An existing local branch is checked out as is, without updating it from the remote
+        if source.branch in repo.heads:
+            return 'refs/heads/{}'.format(source.branch)
+        return 'refs/remotes/origin/{}'.format(source.branch)
+    return None
+
+def _get_head_commit(repo):
+    try:
+        return repo.head.commit.hexsha
+    except ValueError:
+        return None
+
+def _is_on_source(repo, source, head_commit, target_commit):
+    '''Returns True if repo is already checked out the way checkout_repos would check out source.'''
+    if repo.head.is_detached:
+        if source.patch_set or (source.commit is None and source.tag is None):
+            return False
+        return target_commit is not None and head_commit == target_commit
+    if source.patch_set:
+        return repo.active_branch.name == source.patch_set
+    if source.commit or source.tag:
+        return False
+    return repo.active_branch.name == source.branch
+
+def _get_submodule_config(manifest, combo, source):
+    inits = set((x.path, x.recursive) for x in manifest.get_submodule_init_paths(source.remote_name, combo))
+    return source.enable_submodule, inits
+
+def _get_sparse_patterns(manifest, combo, sources):
+    if manifest.sparse_settings is None:
+        return {}
+    return sparse.get_sparse_checkout_data(sources, combo, manifest)
+
+class CheckoutPlan():
+    '''Compares the repositories of the initial and new combination of a workspace and determines which of them need
+    to be checked out, have their submodules updated or have their sparse checkout patterns applied again.
+
+    Arguments:
+    workspace_path - the path to the workspace
+    manifest - the ManifestXml object of the workspace
+    initial_combo - the combination the workspace is checked out onto
+    new_combo - the combination being checked out
+    '''
+    def __init__(self, workspace_path, manifest, initial_combo, new_combo):
+        diff = ManifestDiff(manifest, initial_combo, manifest, new_combo)
+        initial_by_root = {change.new.root: change.initial for change in diff.common}
+        new_sources = deferred_repos_maintenance.filter_materialized(workspace_path,
+                                                                     manifest.get_repo_sources(new_combo))
+        initial_patterns = _get_sparse_patterns(manifest, initial_combo, list(initial_by_root.values()))
+        new_patterns = _get_sparse_patterns(manifest, new_combo, new_sources)
+
+        self._repo_plans = []
+        for source in new_sources:
+            initial = initial_by_root.get(source.root)
+            if initial is None:
+                added_sparse = source.sparse and manifest.sparse_settings is not None
+                self._repo_plans.append(RepoPlan(source, None, True, True, added_sparse))
+                continue
+            repo = Repo(os.path.join(workspace_path, source.root))
+            head_commit = _get_head_commit(repo)
+            target_ref = get_target_ref(repo, source)
+            target_commit = resolve_commit(repo, target_ref) if target_ref is not None else None
+            on_source = _is_on_source(repo, source, head_commit, target_commit)
+            checkout = not on_source or _get_source_ref(initial) != _get_source_ref(source)
+            commit_changes = checkout and (target_commit is None or target_commit != head_commit)
+            submodule_config_changed = (_get_submodule_config(manifest, initial_combo, initial) !=
+                                        _get_submodule_config(manifest, new_combo, source))
+            submodules = ((initial.enable_submodule or source.enable_submodule) and
+                          (commit_changes or submodule_config_changed))
+            sparse_changed = (initial.sparse != source.sparse or
+                              initial_patterns.get(initial.root) != new_patterns.get(source.root))
+            self._repo_plans.append(RepoPlan(source, initial, checkout, submodules, sparse_changed))
+
+        # Repositories that are not part of the new combination keep their working tree, only their submodules are
+        # deinitialized
+        self._obsolete = deferred_repos_maintenance.filter_materialized(workspace_path, diff.removed + diff.replaced)
+
+    @property
+    def repo_plans(self):
+        '''Returns the RepoPlan tuples of the repositories of the new combination.'''
+        return list(self._repo_plans)
+
+    @property
+    def checkout_sources(self):
+        '''Returns the RepoSource tuples of the repositories that need to be checked out.'''
+        return [x.source for x in self._repo_plans if x.checkout]
+
+    @property
+    def unchanged_sources(self):
+        '''Returns the RepoSource tuples of the repositories that are left untouched.'''
+        return [x.source for x in self._repo_plans if not (x.checkout or x.submodules or x.sparse)]
+
+    @property
+    def submodule_deinit_sources(self):
+        '''Returns the RepoSource tuples of the initial combination whose submodules need to be deinitialized.'''
+        sources = [x.initial for x in self._repo_plans if x.submodules and x.initial is not None]
+        sources.extend(x for x in self._obsolete if x.enable_submodule)
+        return sources
+
+    @property
+    def submodule_update_sources(self):
+        '''Returns the RepoSource tuples of the new combination whose submodules need to be updated.'''
+        return [x.source for x in self._repo_plans if x.submodules]
+
+    @property
+    def sparse_reset_sources(self):
+        '''Returns the RepoSource tuples of the initial combination whose sparse checkout needs to be reset.'''
+        return [x.initial for x in self._repo_plans if x.sparse and x.initial is not None]
+
+    @property
+    def sparse_sources(self):
+        '''Returns the RepoSource tuples of the new combination whose sparse checkout patterns need to be applied.'''
+        return [x.source for x in self._repo_plans if x.sparse]
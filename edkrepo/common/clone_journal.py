@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+#
+## @file
+# clone_journal.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Records the progress of edkrepo clone so that an interrupted clone can be resumed.
+
+The journal is written to the workspace's repo directory when a clone starts and lists the stages each repository has
+completed. It is removed once the clone has finished, so a workspace containing a journal was not cloned completely.
+'''
+
+import os
+
+from edkrepo.common.workspace_journal import WorkspaceJournal, get_journal_path
+
+CLONE_JOURNAL_FILE = 'clone_journal.json'
+
+# Stages completed by each repository, in order
+STAGE_CLONE_STARTED = 'clone_started'
+STAGE_CLONED = 'cloned'
+STAGE_CHECKED_OUT = 'checked_out'
+STAGE_HOOKS = 'hooks'
+REPO_STAGES = [STAGE_CLONE_STARTED, STAGE_CLONED, STAGE_CHECKED_OUT, STAGE_HOOKS]
+
+# Stages completed once for the entire workspace
+STAGE_SUBMODULES = 'submodules'
+
+def get_clone_journal_path(workspace_path):
+    return get_journal_path(workspace_path, CLONE_JOURNAL_FILE)
+
+def clone_journal_exists(workspace_path):
+    '''Returns True if the workspace contains the journal of a clone that did not finish.'''
+    return os.path.isfile(get_clone_journal_path(workspace_path))
+
+class CloneJournal(WorkspaceJournal):
+    '''Tracks the clone stages completed by each repository of a workspace.'''
+    JOURNAL_FILE = CLONE_JOURNAL_FILE
+    OPTIONS_KEY = 'clone_options'
+
+    def __init__(self, workspace_path, clone_options=None):
+        '''Opens the journal of workspace_path, creating it if it does not exist.
+
+        Arguments:
+        workspace_path - the path to the workspace being cloned.
+        clone_options - a dictionary of the clone settings, stored when a new journal is created so that a resumed
+                        clone uses the same settings.
+        '''
+        super().__init__(workspace_path, clone_options)
+
+    @property
+    def clone_options(self):
+        return self.options
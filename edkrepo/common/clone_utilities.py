@@ -7,7 +7,9 @@
 # SPDX-License-Identifier: BSD-2-Clause-Patent
 #
 
+import hashlib
 import os
+import re
 import subprocess
 
 import git
@@ -17,8 +19,11 @@ import edkrepo.common.edkrepo_exception as edkrepo_exception
 import edkrepo.common.humble as humble
 import edkrepo.common.ui_functions as ui_functions
 import edkrepo.common.workspace_maintenance.manifest_repos_maintenance as manifest_repos_maintenance
+import edkrepo_manifest_parser.edk_manifest as edk_manifest
 
-def generate_clone_cmd(repo_to_clone, workspace_dir, args=None, reference_path=None, dissociate=False):
+PARTIAL_CLONE_CONFIG_KEYS = ['extensions.partialclone', 'remote.origin.promisor', 'remote.origin.partialclonefilter']
+
+def generate_clone_cmd(repo_to_clone, workspace_dir, args=None, reference_path=None, dissociate=False, bundle_path=None, no_checkout=False, single_branch=False):
     '''Generates and returns a string representing a git clone command which can be passed to subprocess for execution.
 
     Arguments:
@@ -27,19 +32,28 @@ def generate_clone_cmd(repo_to_clone, workspace_dir, args=None, reference_path=N
     workspace_dir - the workspace directory into which the repository will be cloned.
     reference_path - The path to a user-configured reference repository mirror matching this repo's URL
     dissociate - When True, append --dissociate to borrow from the reference only during cloning
+    bundle_path - The path to a git bundle used to seed the clone before the remaining objects are fetched
+    no_checkout - When True, append --no-checkout so that the working tree can be populated after sparse checkout is configured
+    single_branch - When True, clone only the branch of repo_to_clone regardless of args
     '''
     local_repo_path = os.path.join(workspace_dir, repo_to_clone.root)
     base_clone_cmd = 'git clone {} {} --progress'.format(repo_to_clone.remote_url, local_repo_path)
     base_clone_cmd_with_ref = ('git clone {} {} --reference-if-able {} --progress'.format(
         repo_to_clone.remote_url, local_repo_path, reference_path)
         if reference_path is not None else None)
-    dissociate_arg = ' --dissociate' if (dissociate and reference_path is not None) else ''
+    extra_args = ' --dissociate' if (dissociate and reference_path is not None) else ''
+    if bundle_path is not None:
+        extra_args += ' --bundle-uri={}'.format(bundle_path)
+    if no_checkout:
+        extra_args += ' --no-checkout'
     clone_arg_string = None
     clone_cmd_args = {}
     active_filters = []
 
     if repo_to_clone.branch:
         clone_cmd_args['target_branch'] = '-b {}'.format(repo_to_clone.branch)
+    if single_branch:
+        clone_cmd_args['single-branch'] = '--single-branch'
 
     if args:
         try:
@@ -95,14 +109,86 @@ def generate_clone_cmd(repo_to_clone, workspace_dir, args=None, reference_path=N
 
     if clone_arg_string is None:
         if reference_path is None:
-            return base_clone_cmd + dissociate_arg
+            return base_clone_cmd + extra_args
         else:
-            return base_clone_cmd_with_ref + dissociate_arg
+            return base_clone_cmd_with_ref + extra_args
     else:
         if reference_path is None:
-            return ' '.join([base_clone_cmd, clone_arg_string]) + dissociate_arg
+            return ' '.join([base_clone_cmd, clone_arg_string]) + extra_args
         else:
-            return ' '.join([base_clone_cmd_with_ref, clone_arg_string]) + dissociate_arg
+            return ' '.join([base_clone_cmd_with_ref, clone_arg_string]) + extra_args
+
+def normalize_remote_url(url):
+    '''Normalizes a remote URL so that equivalent spellings of the same remote compare equal.
+
+    Arguments:
+    url - the remote URL to normalize.
+    '''
+    normalized = url.strip().replace('\\', '/').rstrip('/')
+    if normalized.lower().endswith('.git'):
+        normalized = normalized[:-len('.git')]
+    return normalized.casefold()
+
+def generate_remote_url_key(url):
+    '''Generates and returns a file system safe name which identifies a remote URL. The name combines the last path
+    component of the URL, for readability, with a hash of the normalized URL.
+
+    Arguments:
+    url - the remote URL to generate a key for.
+    '''
+    normalized = normalize_remote_url(url)
+    base_name = re.sub(r'[^a-z0-9._-]', '_', normalized.split('/')[-1].split(':')[-1]) or 'repo'
+    url_hash = hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]
+    return '{}-{}'.format(base_name, url_hash)
+
+def generate_reference_path_map(user_cfg_file):
+    '''Generates and returns a dictionary mapping the lower case remote URL of each enabled user configured reference
+    repository to its local path.
+
+    Arguments:
+    user_cfg_file - the GlobalUserConfig object containing the reference repository settings.
+    '''
+    reference_path_map = {}
+    for ref_name in user_cfg_file.reference_repos_enabled_for:
+        ref_url = user_cfg_file.get_reference_repo_url(ref_name)
+        ref_path = user_cfg_file.get_reference_repo_path(ref_name)
+        if ref_url and ref_path:
+            reference_path_map[ref_url.lower()] = ref_path
+    return reference_path_map
+
+def generate_template_clone_cmd(repo_to_clone, workspace_dir, template_repo_path):
+    '''Generates and returns a string representing a git clone command which copies a repository from an existing
+    workspace. Git hardlinks the object files of a local clone, so no objects are copied or downloaded. The working
+    tree is not checked out because the template may be on a different branch.
+
+    Arguments:
+    repo_to_clone - a repo_source tuple describing the repository to be cloned
+    workspace_dir - the workspace directory into which the repository will be cloned.
+    template_repo_path - the path to the matching repository in the template workspace.
+    '''
+    local_repo_path = os.path.join(workspace_dir, repo_to_clone.root)
+    return 'git clone {} {} --local --no-checkout --progress'.format(template_repo_path, local_repo_path)
+
+def generate_template_path_map(template_workspace_dir, repo_sources):
+    '''Generates and returns a dictionary mapping the lower case remote URL of each repo_source to the path of the
+    repository with the same remote in a template workspace. Repositories without a match are omitted.
+
+    Arguments:
+    template_workspace_dir - the root directory of an existing workspace for the same project.
+    repo_sources - a list of repo_source tuples representing all repositories to be cloned.
+    '''
+    template_manifest = edk_manifest.ManifestXml(os.path.join(template_workspace_dir, 'repo', 'Manifest.xml'))
+    template_repos = {}
+    for template_source in template_manifest.get_repo_sources(template_manifest.general_config.current_combo):
+        template_repo_path = os.path.join(template_workspace_dir, template_source.root)
+        if os.path.isdir(os.path.join(template_repo_path, '.git')):
+            template_repos[normalize_remote_url(template_source.remote_url)] = template_repo_path
+    template_path_map = {}
+    for repo_source in repo_sources:
+        template_repo_path = template_repos.get(normalize_remote_url(repo_source.remote_url))
+        if template_repo_path is not None:
+            template_path_map[repo_source.remote_url.lower()] = template_repo_path
+    return template_path_map
 
 def generate_clone_order(manifest, repo_sources):
     '''Generates and returns a list of repo_source tuples representing the order in which repositories should be cloned.
@@ -120,6 +206,23 @@ def generate_clone_order(manifest, repo_sources):
         remaining_repos = nested_repos
     return ordered_repos
 
+def generate_clone_dependencies(manifest, repo_sources):
+    '''Generates and returns a dictionary mapping the local root of each repo_source to the repo_source tuple of the
+    repository it is nested within, or None if the repository is not nested. A nested repository must not be cloned
+    until its parent has been cloned.
+
+    Arguments:
+    manifest - the ManifestXml object representing the workspace to be created.
+    repo_sources - a list of repo_source tuples representing all repositories to be cloned.
+    '''
+    dependencies = {}
+    for repo_source in repo_sources:
+        try:
+            dependencies[repo_source.root] = manifest.get_parent_of_nested_repo(repo_sources, repo_source.root)
+        except ValueError:
+            dependencies[repo_source.root] = None
+    return dependencies
+
 def calculate_source_manifest_repo_directory(args, config, manifest):
     '''Calculates and returns the absolute path to the source manifest repository directory.
 
@@ -7,8 +7,10 @@
 # SPDX-License-Identifier: BSD-2-Clause-Patent
 #
 
+import argparse
 import json
 import os
+import random
 import re
 import shutil
 import sys
@@ -18,24 +20,37 @@ import traceback
 import hashlib
 import time
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 import git
 from git import Repo
 import colorama
 
+import edkrepo.common.bundle_utilities as bundle_utilities
+import edkrepo.common.clone_journal as clone_journal
 import edkrepo.common.clone_utilities as clone_utils
 import edkrepo.common.edkrepo_exception as edkrepo_exception
+import edkrepo.common.git_object_query as git_object_query
 import edkrepo.common.progress_handler as progress_handler
 import edkrepo.common.humble as humble
 import edkrepo.common.pathfix as pathfix
 import edkrepo.common.git_version as git_version
+import edkrepo.common.mirror_pool as mirror_pool
+import edkrepo.common.ref_health as ref_health
 import edkrepo.common.repo_case_conflict_solver as repo_case_conflict_solver
 import project_utils.sparse as sparse
 import edkrepo.config.config_factory as config_factory
 import edkrepo.config.tool_config as tool_config
 import edkrepo_manifest_parser.edk_manifest as edk_manifest
+from edkrepo.common.checkout_planner import CheckoutPlan
 import edkrepo.common.workspace_maintenance.workspace_maintenance as workspace_maintenance
 import edkrepo.common.workspace_maintenance.git_exclude_maintenance as git_exclude_maintenance
+import edkrepo.common.workspace_maintenance.combo_worktrees_maintenance as combo_worktrees_maintenance
+import edkrepo.common.workspace_maintenance.deferred_repos_maintenance as deferred_repos_maintenance
+import edkrepo.common.workspace_maintenance.fetch_refspec_maintenance as fetch_refspec_maintenance
+import edkrepo.common.workspace_maintenance.fsmonitor_maintenance as fsmonitor_maintenance
+import edkrepo.common.workspace_maintenance.manifest_repos_maintenance as manifest_repos_maintenance
+import edkrepo.common.workspace_maintenance.status_cache_maintenance as status_cache_maintenance
 import edkrepo.common.ui_functions as ui_functions
 import edkrepo_manifest_parser.edk_manifest_validation as edk_manifest_validation
 import project_utils.submodule as submodule_utils
@@ -46,8 +61,20 @@ PRIMARY_REMOTE_NAME = 'primary'
 PATCH = "Patch"
 REVERT = "Revert"
 PATCHSET_CIRCULAR_DEPENDENCY_ERROR = "The PatchSet {} has a circular dependency with another PatchSet"
-
-def clone_single_repository(manifest, repo_to_clone, workspace_dir, global_manifest_path, args=None, reference_path_map=None, dissociate=False):
+FETCH_RETRY_LIMIT = 4
+FETCH_RETRY_BASE_DELAY = 1.0
+FETCH_RETRY_MAX_DELAY = 30.0
+# Windows may keep files git just wrote open for a short time, for example while they are scanned
+FILE_HANDLE_RELEASE_DELAY = 1.0
+# Compared with the lower case git output
+TRANSIENT_FETCH_ERRORS = ('could not resolve host', 'connection timed out', 'connection reset', 'operation timed out',
+                          'the remote end hung up unexpectedly', 'early eof', 'rpc failed', 'unexpected disconnect',
+                          'the requested url returned error: 429', 'the requested url returned error: 50',
+                          'gnutls_handshake() failed', 'ssl_read', 'failed to connect to')
+# git status is bound by the local disk rather than the network, so it does not follow --jobs
+DIRTY_CHECK_JOBS = 8
+
+def clone_single_repository(manifest, repo_to_clone, workspace_dir, global_manifest_path, args=None, reference_path_map=None, dissociate=False, progress=None, bundle_dir=None, template_path_map=None, sparse_data=None, journal=None, scope_refspecs=False):
     '''Clones a single repository and checks it out onto the ref defined in the project manifest file.
 
     Arguments:
@@ -56,55 +83,356 @@ def clone_single_repository(manifest, repo_to_clone, workspace_dir, global_manif
     workspace_dir - the workspace directory into which the repository will be cloned
     global_manifest_path - the path to the global manifest dir
     args - all command line arguments
+    progress - an optional MultiProgressRenderer which receives the git clone progress output instead of the console.
+               Used when several clones run at the same time.
+    bundle_dir - an optional directory of git bundles, a matching bundle seeds the clone before the remote is contacted
+    template_path_map - an optional dictionary mapping remote URLs to repositories in an existing workspace, a matching
+                        repository is copied locally and only the changes missing from it are fetched from the remote
+    sparse_data - an optional dictionary mapping repository roots to the (always_include, always_exclude) sparse checkout
+                  lists returned by sparse.get_sparse_checkout_data. A matching repository is cloned without a checkout
+                  and its working tree is populated only after the sparse checkout patterns are installed.
+    journal - an optional CloneJournal recording the completed stages. If the journal shows the repository was already
+              cloned only the checkout is repeated. A directory left behind by a clone the journal shows was started is
+              removed first, any other existing directory raises an EdkrepoWorkspaceInvalidException.
+    scope_refspecs - when True the repository only fetches the branches the manifest uses. A repository that follows a
+                     branch is cloned with --single-branch.
     '''
     if repo_to_clone.patch_set:
         patchset = manifest.get_patchset(repo_to_clone.patch_set, repo_to_clone.remote_name)
     elif not repo_to_clone.branch and not repo_to_clone.tag and not repo_to_clone.commit:
         raise edkrepo_exception.EdkrepoManifestInvalidException(humble.MISSING_BRANCH_COMMIT)
 
-    ui_functions.print_info_msg('Cloning {} Repository from: {}'.format(repo_to_clone.root, str(repo_to_clone.remote_url)), header=False)
-
-    reference_path = reference_path_map.get(repo_to_clone.remote_url.lower()) if reference_path_map else None
-    clone_cmd = clone_utils.generate_clone_cmd(repo_to_clone, workspace_dir, args, reference_path=reference_path, dissociate=dissociate)
-    clone_cmd_output = subprocess.run(clone_cmd, stdout=subprocess.PIPE, universal_newlines=True, shell=True)
-    if not os.path.isdir(os.path.join(workspace_dir, repo_to_clone.root)):
-        raise edkrepo_exception.EdkrepoNotFoundException(humble.CLONE_FAIL.format(repo_to_clone.root, clone_cmd_output))
-    repo = Repo(os.path.join(workspace_dir, repo_to_clone.root))
+    repo_path = os.path.join(workspace_dir, repo_to_clone.root)
+    already_cloned = journal is not None and journal.has_stage(repo_to_clone.root, clone_journal.STAGE_CLONED)
+    status = 'Resuming' if already_cloned else 'Cloning'
+    if progress is None:
+        if already_cloned:
+            ui_functions.print_info_msg(humble.CLONE_RESUME_CHECKOUT.format(repo_to_clone.root), header=False)
+        else:
+            ui_functions.print_info_msg('Cloning {} Repository from: {}'.format(repo_to_clone.root, str(repo_to_clone.remote_url)), header=False)
+    else:
+        progress.start(repo_to_clone.root, status)
+
+    template_path = template_path_map.get(repo_to_clone.remote_url.lower()) if template_path_map else None
+    sparse_patterns = sparse_data.get(repo_to_clone.root) if sparse_data else None
+    if not already_cloned:
+        if os.path.isdir(repo_path) and os.listdir(repo_path):
+            # Only a directory left behind by a clone this journal started is removed, anything else may hold the
+            # user's work
+            if journal is None or not journal.has_stage(repo_to_clone.root, clone_journal.STAGE_CLONE_STARTED):
+                raise edkrepo_exception.EdkrepoWorkspaceInvalidException(humble.CLONE_TARGET_NOT_EMPTY.format(repo_to_clone.root, repo_path))
+            git_object_query.close_object_queries(repo_path)
+            shutil.rmtree(repo_path)
+        if journal is not None:
+            journal.record(repo_to_clone.root, clone_journal.STAGE_CLONE_STARTED)
+        if template_path is not None:
+            clone_cmd = clone_utils.generate_template_clone_cmd(repo_to_clone, workspace_dir, template_path)
+        else:
+            reference_path = reference_path_map.get(repo_to_clone.remote_url.lower()) if reference_path_map else None
+            bundle_path = bundle_utilities.find_bundle(bundle_dir, repo_to_clone.remote_url)
+            # Tags may not be reachable from the branch, so those repositories clone every branch. A commit that is not
+            # reachable from the cloned branch is fetched by its SHA before it is checked out.
+            single_branch = scope_refspecs and not repo_to_clone.patch_set and (repo_to_clone.commit is not None or repo_to_clone.tag is None)
+            clone_cmd = clone_utils.generate_clone_cmd(repo_to_clone, workspace_dir, args, reference_path=reference_path, dissociate=dissociate, bundle_path=bundle_path, no_checkout=sparse_patterns is not None, single_branch=single_branch)
+        if progress is not None:
+            # Leaving the with block closes the stderr pipe and waits for git to exit
+            with subprocess.Popen(clone_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True, shell=True) as clone_process:
+                clone_cmd_output = progress.stream_output(repo_to_clone.root, clone_process.stderr)
+        else:
+            clone_cmd_output = subprocess.run(clone_cmd, stdout=subprocess.PIPE, universal_newlines=True, shell=True)
+        if not os.path.isdir(repo_path):
+            raise edkrepo_exception.EdkrepoNotFoundException(humble.CLONE_FAIL.format(repo_to_clone.root, clone_cmd_output))
+        if journal is not None:
+            journal.record(repo_to_clone.root, clone_journal.STAGE_CLONED)
+    repo = Repo(repo_path)
+    if sparse_patterns is not None:
+        # Install the sparse checkout patterns before anything is written to the working tree
+        sparse.install_sparse_patterns(repo, *sparse_patterns)
+    if template_path is not None:
+        _adopt_template_clone(repo, repo_to_clone, template_path)
+    elif sparse_patterns is not None:
+        repo.head.reset(working_tree=True)
 
     if repo_to_clone.patch_set:
         create_local_branch(repo_to_clone.patch_set, patchset, global_manifest_path, manifest, repo)
     elif repo_to_clone.commit:
         if args.verbose and (repo_to_clone.branch or repo_to_clone.tag):
                 ui_functions.print_info_msg(humble.MULTIPLE_SOURCE_ATTRIBUTES_SPECIFIED.format(repo_to_clone.root))
+        fetch_missing_commits(repo, [repo_to_clone.commit])
         repo.git.checkout(repo_to_clone.commit)
     elif repo_to_clone.tag and repo_to_clone.commit is None:
             if args.verbose and repo_to_clone.branch:
                 ui_functions.print_info_msg(humble.TAG_AND_BRANCH_SPECIFIED.format(repo_to_clone.root))
             repo.git.checkout(repo_to_clone.tag)
+    if scope_refspecs:
+        fetch_refspec_maintenance.scope_fetch_refspecs(repo, manifest, repo_to_clone)
+    status_cache_maintenance.enable_status_caches(repo)
+    if journal is not None:
+        journal.record(repo_to_clone.root, clone_journal.STAGE_CHECKED_OUT)
+
+def _adopt_template_clone(repo, repo_to_clone, template_path):
+    '''Points a repository copied from a template workspace at the real remote, fetches anything the template was
+    missing and checks out the branch defined in the manifest.'''
+    template_repo = Repo(template_path)
+    with template_repo.config_reader() as template_config, repo.config_writer() as config:
+        # A partial clone must keep fetching missing objects on demand from the original remote
+        for key in clone_utils.PARTIAL_CLONE_CONFIG_KEYS:
+            section, option = key.rsplit('.', 1)
+            if template_config.has_option(section, option):
+                config.set_value(section, option, template_config.get_value(section, option))
+    # The clone created a local branch for the branch the template had checked out, detach from it without touching
+    # the empty working tree so that it can be deleted once the manifest defined ref is checked out
+    template_branch = None if repo.head.is_detached else repo.active_branch.name
+    repo.git.update_ref('--no-deref', 'HEAD', 'HEAD')
+    repo.remotes.origin.set_url(repo_to_clone.remote_url)
+    try:
+        repo.git.remote('set-head', DEFAULT_REMOTE_NAME, '--delete')
+    except git.GitCommandError:
+        # Already removed when a resumed clone repeats the adoption
+        pass
+    fetch_from_remote(repo, repo.remotes.origin, prune=True)
+    try:
+        repo.git.remote('set-head', DEFAULT_REMOTE_NAME, '--auto')
+    except git.GitCommandError:
+        pass
+    if repo_to_clone.branch:
+        repo.git.checkout('-B', repo_to_clone.branch, '--track', '{}/{}'.format(DEFAULT_REMOTE_NAME, repo_to_clone.branch))
+    if template_branch is not None and template_branch != repo_to_clone.branch:
+        repo.git.branch('-D', template_branch)
 
-def clone_repos(args, workspace_dir, repos_to_clone, project_client_side_hooks, config, manifest, global_manifest_path, reference_path_map=None, dissociate=False):
+def get_job_count(args):
+    '''Returns the number of concurrent jobs requested with the --jobs argument, defaulting to 1.'''
+    try:
+        jobs = args.jobs
+    except AttributeError:
+        jobs = None
+    if jobs is None:
+        return 1
+    try:
+        job_count = int(jobs)
+    except ValueError:
+        raise edkrepo_exception.EdkrepoInvalidParametersException(humble.INVALID_JOBS_ARG.format(jobs))
+    if job_count < 1:
+        raise edkrepo_exception.EdkrepoInvalidParametersException(humble.INVALID_JOBS_ARG.format(jobs))
+    return job_count
+
+def _timed_clone(manifest, repo_to_clone, workspace_dir, global_manifest_path, args, reference_path_map, dissociate, progress, bundle_dir, template_path_map, sparse_data, journal, scope_refspecs):
+    start = time.perf_counter()
+    if journal is not None and journal.has_stage(repo_to_clone.root, clone_journal.STAGE_CHECKED_OUT):
+        # Only the hooks are missing, they are installed by the caller
+        return dt.timedelta(seconds=0)
+    try:
+        clone_single_repository(manifest, repo_to_clone, workspace_dir, global_manifest_path, args, reference_path_map=reference_path_map, dissociate=dissociate, progress=progress, bundle_dir=bundle_dir, template_path_map=template_path_map, sparse_data=sparse_data, journal=journal, scope_refspecs=scope_refspecs)
+    except Exception:
+        if progress is not None:
+            progress.finish(repo_to_clone.root, success=False)
+        raise
+    return dt.timedelta(seconds=time.perf_counter() - start)
+
+def _finish_cloned_repo(repo_to_clone, parent, workspace_dir, project_client_side_hooks, config, global_manifest_directory):
+    update_fsmonitor(Repo(os.path.join(workspace_dir, repo_to_clone.root)), config)
+    if parent:
+        parent_path = os.path.join(workspace_dir, parent.root)
+        nested_path = os.path.join(workspace_dir, repo_to_clone.root)
+        git_exclude_maintenance.write_git_exclude(parent_path, git_exclude_maintenance.generate_exclude_pattern(parent_path, nested_path))
+    if global_manifest_directory:
+        repo = Repo(os.path.join(workspace_dir, repo_to_clone.root))
+        # Install git hooks if there is a manifest repo associated with the manifest being cloned
+        install_hooks(project_client_side_hooks, os.path.join(workspace_dir, repo_to_clone.root), repo_to_clone, config, global_manifest_directory)
+        # Add the commit template if it exists.
+        update_repo_commit_template(workspace_dir, repo, repo_to_clone, global_manifest_directory)
+
+def clone_repos(args, workspace_dir, repos_to_clone, project_client_side_hooks, config, manifest, global_manifest_path, reference_path_map=None, dissociate=False, bundle_dir=None, template_path_map=None, sparse_data=None, journal=None, repo_cloned=None):
+    '''Clones all of the given repositories, running up to --jobs clones at the same time.
+
+    A nested repository is not started until the repository containing it has finished cloning. Hooks and the commit
+    template are installed for each repository as soon as its clone completes. Returns a list of (root, timedelta)
+    tuples in the order the clones completed.
+
+    If bundle_dir is given, repositories with a matching bundle in it are seeded from the bundle before the remote is
+    contacted. If template_path_map is given, repositories found in it are copied from an existing workspace instead.
+    If sparse_data is given, the repositories in it are checked out with sparse checkout already applied.
+    If journal is given, each completed stage is recorded in it and the stages it already lists are skipped.
+    If repo_cloned is given, it is called with the repo source of each repository once its hooks are installed, so
+    that the repositories that completed are known even if a later clone fails.
+    Unless --full-fetch or the full-fetch setting of the user configuration file is used, or the workspace was cloned
+    with --full-fetch, each repository only fetches the branches the manifest uses.
+    '''
+    if bundle_dir and find_git_version() < bundle_utilities.BUNDLE_URI_MIN_GIT_VERSION:
+        ui_functions.print_warning_msg(humble.BUNDLE_GIT_TOO_OLD.format(bundle_utilities.BUNDLE_URI_MIN_GIT_VERSION), header=False)
+        bundle_dir = None
     global_manifest_directory = clone_utils.calculate_source_manifest_repo_directory(args, config, manifest)
+    scope_refspecs = not (getattr(args, 'full_fetch', False) or config['user_cfg_file'].full_fetch_enabled or
+                          fetch_refspec_maintenance.is_workspace_full_fetch(workspace_dir))
     clone_order = clone_utils.generate_clone_order(manifest, repos_to_clone)
+    parents = clone_utils.generate_clone_dependencies(manifest, clone_order)
+    cloned_roots = set()
+    if journal is not None:
+        cloned_roots.update(repo.root for repo in clone_order if journal.has_stage(repo.root, clone_journal.STAGE_HOOKS))
+    pending = [repo for repo in clone_order if repo.root not in cloned_roots]
+    jobs = min(get_job_count(args), max(len(pending), 1))
+    progress = None
+    if jobs > 1:
+        progress = progress_handler.MultiProgressRenderer()
+        for repo_to_clone in pending:
+            progress.add(repo_to_clone.root, 'Cloning')
     clone_times = []
-    for repo_to_clone in clone_order:
-        start = time.perf_counter()
-        clone_single_repository(manifest, repo_to_clone, workspace_dir, global_manifest_path, args, reference_path_map=reference_path_map, dissociate=dissociate)
-        duration = time.perf_counter() - start
-        clone_times.append((repo_to_clone.root, dt.timedelta(seconds=duration)))
+    running = {}
+    with progress_handler.redirect_stdout(progress), ThreadPoolExecutor(max_workers=jobs) as executor:
         try:
-            parent = manifest.get_parent_of_nested_repo(clone_order, repo_to_clone.root)
-        except ValueError:
-            parent = None
-        if parent:
-            parent_path = os.path.join(workspace_dir, parent.root)
-            nested_path = os.path.join(workspace_dir, repo_to_clone.root)
-            git_exclude_maintenance.write_git_exclude(parent_path, git_exclude_maintenance.generate_exclude_pattern(parent_path, nested_path))
-        if global_manifest_directory:
-            repo = Repo(os.path.join(workspace_dir, repo_to_clone.root))
-            # Install git hooks if there is a manifest repo associated with the manifest being cloned
-            install_hooks(project_client_side_hooks, os.path.join(workspace_dir, repo_to_clone.root), repo_to_clone, config, global_manifest_directory)
-            # Add the commit template if it exists.
-            update_repo_commit_template(workspace_dir, repo, repo_to_clone, global_manifest_directory)
+            while pending or running:
+                for repo_to_clone in list(pending):
+                    if len(running) >= jobs:
+                        break
+                    parent = parents[repo_to_clone.root]
+                    if parent is not None and parent.root not in cloned_roots:
+                        continue
+                    pending.remove(repo_to_clone)
+                    future = executor.submit(_timed_clone, manifest, repo_to_clone, workspace_dir, global_manifest_path,
+                                             args, reference_path_map, dissociate, progress, bundle_dir, template_path_map,
+                                             sparse_data, journal, scope_refspecs)
+                    running[future] = repo_to_clone
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    repo_to_clone = running.pop(future)
+                    duration = future.result()
+                    if progress is not None:
+                        progress.finish(repo_to_clone.root, status=humble.CLONE_COMPLETE.format(duration))
+                    clone_times.append((repo_to_clone.root, duration))
+                    _finish_cloned_repo(repo_to_clone, parents[repo_to_clone.root], workspace_dir,
+                                        project_client_side_hooks, config, global_manifest_directory)
+                    if journal is not None:
+                        journal.record(repo_to_clone.root, clone_journal.STAGE_HOOKS)
+                    if repo_cloned is not None:
+                        repo_cloned(repo_to_clone)
+                    cloned_roots.add(repo_to_clone.root)
+        except BaseException:
+            # Do not start any further clones, let the ones in flight finish before reporting the failure
+            for future in running:
+                future.cancel()
+            raise
+        finally:
+            if progress is not None:
+                progress.close()
+    return clone_times
+
+def get_clone_options(args):
+    '''Returns a dictionary of the clone command line options that also apply to repositories cloned later, such as
+    the repositories deferred by edkrepo clone --lazy.'''
+    return {option: bool(getattr(args, option, False)) for option in deferred_repos_maintenance.DEFERRED_CLONE_OPTIONS}
+
+def materialize_repos(args, config, workspace_path, manifest, repo_sources, sparse_data=None):
+    '''Clones any of the given repositories that were deferred by edkrepo clone --lazy.
+
+    The repository containing a deferred nested repository is materialized first. The repositories are cloned with the
+    options recorded when the workspace was created and are checked out onto the current combination. Returns the list
+    of repo sources that were cloned.
+
+    Arguments:
+    args - all command line arguments, used for the --jobs and --verbose settings
+    config - the dictionary representing both the cfg_file and the user_cfg_file contents
+    workspace_path - the path to the workspace
+    manifest - the ManifestXml object of the workspace
+    repo_sources - the repo sources to materialize
+    sparse_data - an optional dictionary of sparse checkout data to apply as each repository is cloned
+    '''
+    state = deferred_repos_maintenance.read_deferred_repos(workspace_path)
+    if state is None or not state['roots']:
+        return []
+    deferred_roots = set(state['roots'])
+    combo_sources = manifest.get_repo_sources(manifest.general_config.current_combo)
+    parents = clone_utils.generate_clone_dependencies(manifest, combo_sources)
+    repos_to_clone = []
+    for repo_source in repo_sources:
+        while repo_source is not None:
+            if repo_source.root in deferred_roots and repo_source not in repos_to_clone:
+                repos_to_clone.append(repo_source)
+            repo_source = parents.get(repo_source.root)
+    if not repos_to_clone:
+        return []
+
+    clone_args, reference_path_map, use_dissociate = _resolve_clone_settings(args, config, state['clone_options'], repos_to_clone)
+    global_manifest_path = manifest_repos_maintenance.get_manifest_repo_path(manifest.general_config.source_manifest_repo, config)
+
+    # Only a directory left behind by a clone that an earlier materialize started is removed, anything else may hold
+    # the user's work
+    started_roots = deferred_repos_maintenance.get_started_roots(workspace_path)
+    for repo_source in repos_to_clone:
+        repo_path = os.path.join(workspace_path, repo_source.root)
+        if os.path.isdir(repo_path) and os.listdir(repo_path) and repo_source.root not in started_roots:
+            raise edkrepo_exception.EdkrepoWorkspaceInvalidException(humble.MATERIALIZE_TARGET_NOT_EMPTY.format(repo_source.root, repo_path))
+    ui_functions.print_info_msg(humble.MATERIALIZING_REPOS.format(len(repos_to_clone)), header=False)
+    for repo_source in repos_to_clone:
+        repo_path = os.path.join(workspace_path, repo_source.root)
+        if repo_source.root in started_roots and os.path.isdir(repo_path):
+            git_object_query.close_object_queries(repo_path)
+            shutil.rmtree(repo_path)
+    deferred_repos_maintenance.mark_materialize_started(workspace_path, [x.root for x in repos_to_clone])
+    # Each repository is marked as soon as it completes, so that repositories cloned before a failure are not cloned
+    # again by the next materialize
+    clone_repos(clone_args, workspace_path, repos_to_clone, manifest.repo_hooks, config, manifest, global_manifest_path,
+                reference_path_map=reference_path_map, dissociate=use_dissociate, sparse_data=sparse_data,
+                repo_cloned=lambda x: deferred_repos_maintenance.mark_materialized(workspace_path, [x.root]))
+    return repos_to_clone
+
+def _resolve_clone_settings(args, config, clone_options, repo_sources):
+    '''Applies clone settings recorded in a workspace to a copy of args and builds the reference path map for
+    repo_sources. Returns a (clone_args, reference_path_map, dissociate) tuple.'''
+    clone_args = argparse.Namespace(**vars(args))
+    for option in deferred_repos_maintenance.DEFERRED_CLONE_OPTIONS:
+        setattr(clone_args, option, clone_options.get(option, False))
+    use_dissociate = clone_options.get('dissociate', config['user_cfg_file'].reference_repos_dissociate_by_default)
+    reference_path_map = {}
+    if clone_options.get('mirror_pool', config['user_cfg_file'].mirror_pool_enabled_by_default):
+        reference_path_map.update(mirror_pool.update_mirrors(repo_sources, get_job_count(args)))
+    if clone_options.get('reference', config['user_cfg_file'].reference_repos_enabled_by_default):
+        reference_path_map.update(clone_utils.generate_reference_path_map(config['user_cfg_file']))
+    return clone_args, reference_path_map, use_dissociate
+
+def resume_clone(args, config, workspace_path, manifest):
+    '''Completes a clone that was interrupted, continuing each repository from the first stage missing from the clone
+    journal. Repositories that finished cloning are never downloaded again. Returns a list of (root, timedelta) tuples
+    for the repositories that were cloned or checked out.
+
+    Arguments:
+    args - all command line arguments, used for the --jobs and --verbose settings
+    config - the dictionary representing both the cfg_file and the user_cfg_file contents
+    workspace_path - the path to the workspace containing the clone journal
+    manifest - the ManifestXml object of the workspace
+    '''
+    journal = clone_journal.CloneJournal(workspace_path)
+    clone_options = journal.clone_options
+    combo_name = manifest.general_config.current_combo
+    repo_sources = deferred_repos_maintenance.filter_materialized(workspace_path, manifest.get_repo_sources(combo_name))
+    template_path_map = {}
+    template_workspace_dir = clone_options.get('from_workspace')
+    if template_workspace_dir and os.path.isdir(template_workspace_dir):
+        template_path_map = clone_utils.generate_template_path_map(template_workspace_dir, repo_sources)
+    bundle_dir = clone_options.get('bundle_dir')
+    if bundle_dir and not os.path.isdir(bundle_dir):
+        bundle_dir = None
+    # Only the repositories that still need to be downloaded from a remote need a mirror
+    remaining_sources = [repo_source for repo_source in repo_sources
+                         if not journal.has_stage(repo_source.root, clone_journal.STAGE_CLONED)]
+    mirrored_sources = [repo_source for repo_source in remaining_sources
+                        if repo_source.remote_url.lower() not in template_path_map]
+    clone_args, reference_path_map, use_dissociate = _resolve_clone_settings(args, config, clone_options, mirrored_sources)
+    sparse_data = None
+    if clone_options.get('sparse', False):
+        sparse_data = get_sparse_checkout_data(repo_sources, manifest)
+    global_manifest_path = manifest_repos_maintenance.get_manifest_repo_path(manifest.general_config.source_manifest_repo, config)
+
+    ui_functions.print_info_msg(humble.CLONE_RESUMING.format(len(remaining_sources)), header=False)
+    clone_times = clone_repos(clone_args, workspace_path, repo_sources, manifest.repo_hooks, config, manifest,
+                              global_manifest_path, reference_path_map=reference_path_map, dissociate=use_dissociate,
+                              bundle_dir=bundle_dir, template_path_map=template_path_map, sparse_data=sparse_data,
+                              journal=journal)
+    if not clone_options.get('skip_submodule', False) and not journal.has_workspace_stage(clone_journal.STAGE_SUBMODULES):
+        submodule_utils.maintain_submodules(workspace_path, manifest, combo_name, args.verbose)
+        journal.record_workspace_stage(clone_journal.STAGE_SUBMODULES)
+    if sparse_data is not None:
+        sparse_checkout_submodule_repos(workspace_path, repo_sources, manifest)
+    journal.finish()
     return clone_times
 
 def write_included_config(remotes, submodule_alt_remotes, repo_directory):
@@ -213,6 +541,14 @@ def _repin_hook_shebang(hook_file_name):
     except OSError:
         pass
 
+def _get_hook_dir(local_repo_path, dest_path):
+    '''Returns the directory of the repository that dest_path names. Paths in .git are resolved against the git
+    directory shared by the worktrees of the repository, since .git is a file in a linked worktree.'''
+    path_parts = os.path.normpath(str(dest_path)).split(os.sep)
+    if path_parts[0] != '.git':
+        return os.path.join(local_repo_path, str(dest_path))
+    return os.path.join(Repo(local_repo_path).common_dir, *path_parts[1:])
+
 def install_hooks(hooks, local_repo_path, repo_for_install, config, global_manifest_directory):
     # Determine the which hooks are for the repo in question and which are from a URL based source or are in a global
     # manifest repo relative path
@@ -228,10 +564,10 @@ def install_hooks(hooks, local_repo_path, repo_for_install, config, global_manif
     # Download and install any URL sourced hooks
     for hook in hooks_url:
         if hook.dest_file:
-            destination_path = os.path.join(local_repo_path, os.path.dirname(str(hook.dest_path)))
+            destination_path = _get_hook_dir(local_repo_path, os.path.dirname(str(hook.dest_path)))
             hook_file_name = os.path.join(destination_path, str(hook.dest_name))
         else:
-            destination = os.path.join(local_repo_path, hook.dest_path)
+            destination = _get_hook_dir(local_repo_path, hook.dest_path)
             hook_file_name = os.path.join(destination, hook.source.split('/')[-1])
         if not os.path.exists(destination):
             os.makedirs(destination)
@@ -246,10 +582,10 @@ def install_hooks(hooks, local_repo_path, repo_for_install, config, global_manif
         if not os.path.exists(man_dir_rel_hook_path):
             raise edkrepo_exception.EdkrepoHookNotFoundException(humble.HOOK_NOT_FOUND_ERROR.format(hook.source, repo_for_install.root))
         if hook.dest_file:
-            destination_path = os.path.join(local_repo_path, os.path.dirname(str(hook.dest_path)))
+            destination_path = _get_hook_dir(local_repo_path, os.path.dirname(str(hook.dest_path)))
             hook_file_name = os.path.join(destination_path, str(hook.dest_file))
         else:
-            destination_path = os.path.join(local_repo_path, hook.dest_path)
+            destination_path = _get_hook_dir(local_repo_path, hook.dest_path)
             hook_file_name = os.path.join(destination_path, (os.path.basename(str(hook.source))))
         if not os.path.exists(destination_path):
             os.makedirs(destination_path)
@@ -259,22 +595,30 @@ def install_hooks(hooks, local_repo_path, repo_for_install, config, global_manif
             # Need to make sure the script is executable or it will not run on Linux
             os.chmod(hook_file_name, os.stat(hook_file_name).st_mode | 0o111)
 
+def update_fsmonitor(repo, config):
+    '''Registers a repository with a filesystem monitor when fsmonitor = true is set in the [status] section of
+    edkrepo_user.cfg and otherwise removes the monitor registered by edkrepo. Returns True if the configuration was
+    changed.'''
+    if config['user_cfg_file'].fsmonitor_enabled:
+        return fsmonitor_maintenance.enable_fsmonitor(repo, _edkrepo_hook_interpreter())
+    return fsmonitor_maintenance.disable_fsmonitor(repo)
+
 def uninstall_hooks(hooks, local_repo_path, repo_for_uninstall):
     for hook in hooks:
         if repo_for_uninstall.remote_url == hook.remote_url:
             if str(hook.source).startswith('http'):
                 if hook.dest_file:
-                    destination_path = os.path.join(local_repo_path, os.path.dirname(str(hook.dest_path)))
+                    destination_path = _get_hook_dir(local_repo_path, os.path.dirname(str(hook.dest_path)))
                     hook_file = os.path.join(destination_path, str(hook.dest_file))
                 else:
-                    destination = os.path.join(local_repo_path, hook.dest_path)
+                    destination = _get_hook_dir(local_repo_path, hook.dest_path)
                     hook_file = os.path.join(destination, hook.source.split('/')[-1])
             else:
                 if os.path.basename(str(hook.source)) == 'hook-dispatcher':
-                    destination_path = os.path.join(local_repo_path, os.path.dirname(str(hook.dest_path)))
+                    destination_path = _get_hook_dir(local_repo_path, os.path.dirname(str(hook.dest_path)))
                     hook_file = os.path.join(destination_path, (os.path.basename(str(hook.dest_path))))
                 else:
-                    destination = os.path.join(local_repo_path, hook.dest_path)
+                    destination = _get_hook_dir(local_repo_path, hook.dest_path)
                     hook_file = os.path.join(destination, (os.path.basename(str(hook.source))))
             os.remove(hook_file)
 
@@ -287,6 +631,7 @@ def update_hooks (hooks_add, hooks_update, hooks_uninstall, local_repo_path, rep
         uninstall_hooks(hooks_uninstall, local_repo_path, repo)
 
 def sparse_checkout_enabled(workspace_dir, repo_list):
+    repo_list = deferred_repos_maintenance.filter_materialized(workspace_dir, repo_list)
     repo_dirs = [os.path.join(workspace_dir, os.path.normpath(x.root)) for x in repo_list]
     if repo_dirs:
         build_info = sparse.BuildInfo(repo_dirs)
@@ -300,8 +645,7 @@ def get_sparse_folder_list(repo):
         if cr.has_option(section='core', option='sparsecheckout'):
             if not cr.get_value(section='core', option='sparsecheckout'):
                 return None
-    sparse_file_name = os.path.join('.git', 'info', 'sparse-checkout')
-    sparse_file = os.path.normpath(os.path.join(repo.working_tree_dir, sparse_file_name))
+    sparse_file = os.path.normpath(os.path.join(repo.git_dir, 'info', 'sparse-checkout'))
     if not os.path.isfile(sparse_file):
         return []
     with open(sparse_file) as f:
@@ -320,6 +664,7 @@ def get_sparse_folder_list(repo):
 
 def reset_sparse_checkout(workspace_dir, repo_list, disable=False):
     # Determine what repositories are targeted for sparse checkout
+    repo_list = deferred_repos_maintenance.filter_materialized(workspace_dir, repo_list)
     repo_dirs = [workspace_dir]
     repo_dirs.extend([os.path.join(workspace_dir, os.path.normpath(x.root)) for x in repo_list])
     if repo_dirs:
@@ -330,20 +675,83 @@ def reset_sparse_checkout(workspace_dir, repo_list, disable=False):
 
 def sparse_checkout(workspace_dir, repo_list, manifest):
     current_combo = manifest.general_config.current_combo
+    repo_list = deferred_repos_maintenance.filter_materialized(workspace_dir, repo_list)
     try:
         sparse.process_sparse_checkout(workspace_dir, repo_list, current_combo, manifest)
     except RuntimeError as msg:
         print(msg)
 
 
-def check_dirty_repos(manifest, workspace_path):
+def get_sparse_checkout_data(repo_list, manifest):
+    '''Returns the sparse checkout patterns of the current combination for the repositories in repo_list, for use by
+    clone_repos.
+
+    Repositories with submodules enabled are left out. Their sparse checkout is applied by
+    sparse_checkout_submodule_repos once the submodules have been updated, so that submodules are initialized against
+    the full working tree.
+    '''
+    repo_list = [repo_source for repo_source in repo_list if not repo_source.enable_submodule]
+    return sparse.get_sparse_checkout_data(repo_list, manifest.general_config.current_combo, manifest)
+
+
+def sparse_checkout_submodule_repos(workspace_dir, repo_list, manifest):
+    '''Applies sparse checkout to the repositories in repo_list that were left out by get_sparse_checkout_data because
+    they have submodules enabled. Must be called after the submodules have been updated.'''
+    submodule_repos = [repo_source for repo_source in repo_list if repo_source.enable_submodule and repo_source.sparse]
+    if submodule_repos:
+        sparse_checkout(workspace_dir, submodule_repos, manifest)
+
+
+def has_local_changes(repo_path):
+    '''Returns True if the repository at repo_path has staged, modified or untracked files. Submodules are ignored.
+
+    git status is stopped as soon as it reports the first changed path. The check does not change the repository, the
+    untracked cache and split index that speed it up are enabled by clone and by edkrepo maintenance.
+    '''
+    status_cmd = ['git', 'status', '--porcelain', '--untracked-files=normal', '--ignore-submodules']
+    with subprocess.Popen(status_cmd, cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True) as status_process:
+        if status_process.stdout.readline():
+            status_process.kill()
+            status_process.communicate()
+            return True
+        _, stderr = status_process.communicate()
+    if status_process.returncode != 0:
+        raise git.GitCommandError(status_cmd, status_process.returncode, stderr=stderr)
+    return False
+
+
+def check_dirty_repos(manifest, workspace_path, jobs=DIRTY_CHECK_JOBS):
+    '''Raises EdkrepoUncommitedChangesException if a repository of the current combination has local changes.
+
+    Up to jobs repositories are checked at the same time. Once a repository with changes is found the checks that have
+    not started are cancelled, and once the running checks have finished the first repository in manifest order found
+    to have changes is reported.
+
+    Arguments:
+    manifest - the ManifestXml object of the workspace
+    workspace_path - the path to the workspace
+    jobs - the maximum number of repositories to check concurrently
+    '''
     combo = manifest.general_config.current_combo or manifest.general_config.default_combo
-    repos = manifest.get_repo_sources(combo)
-    for repo_to_check in repos:
-        local_repo_path = os.path.join(workspace_path, repo_to_check.root)
-        repo = Repo(local_repo_path)
-        if repo.is_dirty(untracked_files=True, submodules=False):
-            raise edkrepo_exception.EdkrepoUncommitedChangesException(humble.UNCOMMITED_CHANGES.format(repo_to_check.root))
+    repos = deferred_repos_maintenance.filter_materialized(workspace_path, manifest.get_repo_sources(combo))
+    if not repos:
+        return
+    dirty_repos = []
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(repos)))) as executor:
+        futures = {executor.submit(has_local_changes, os.path.join(workspace_path, x.root)): x for x in repos}
+        running = set(futures)
+        try:
+            while running and not dirty_repos:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                dirty_repos.extend(futures[x] for x in done if x.result())
+        finally:
+            for future in running:
+                future.cancel()
+        dirty_repos.extend(futures[x] for x in running if not x.cancelled() and x.result())
+    if dirty_repos:
+        dirty_repo = min(dirty_repos, key=repos.index)
+        raise edkrepo_exception.EdkrepoUncommitedChangesException(humble.UNCOMMITED_CHANGES.format(dirty_repo.root))
 
 
 def check_branches(sources, workspace_path):
@@ -358,62 +766,141 @@ def check_branches(sources, workspace_path):
             except:
                 raise edkrepo_exception.EdkrepoManifestInvalidException(humble.CHECKOUT_NO_REMOTE.format(repo_to_check.root))
 
-def checkout_repos(verbose, override, repos_to_checkout, workspace_path, manifest, global_manifest_path):
+def _checkout_repo(verbose, override, repo_to_checkout, workspace_path, manifest, global_manifest_path):
+    if verbose:
+        if repo_to_checkout.patch_set:
+            print(humble.CHECKING_OUT_PATCHSET.format(repo_to_checkout.patch_set, repo_to_checkout.root))
+        elif repo_to_checkout.branch is not None and repo_to_checkout.commit is None:
+            print(humble.CHECKING_OUT_BRANCH.format(repo_to_checkout.branch, repo_to_checkout.root))
+        elif repo_to_checkout.commit is not None:
+            print(humble.CHECKING_OUT_COMMIT.format(repo_to_checkout.commit, repo_to_checkout.root))
+    local_repo_path = os.path.join(workspace_path, repo_to_checkout.root)
+    repo = Repo(local_repo_path)
+
+    # Checkout the repo onto the correct patchset/branch/commit/tag if multiple attributes are provided in
+    # the source section for the manifest the order of priority is the followiwng 1)patchset 2)commit
+    # 3) tag 4)branch with the highest priority attribute provided beinng checked out
+    if repo_to_checkout.patch_set:
+        try:
+            patchset_branch_creation_flow(repo_to_checkout, repo, workspace_path, manifest, global_manifest_path, override)
+        except edkrepo_exception.EdkrepoLocalBranchExistsException:
+            raise
+    else:
+        if repo_to_checkout.commit:
+            if verbose and (repo_to_checkout.branch or repo_to_checkout.tag):
+                print(humble.MULTIPLE_SOURCE_ATTRIBUTES_SPECIFIED.format(repo_to_checkout.root))
+            # A repository that only fetches the branches it uses may not have the commit of a new combination
+            fetch_missing_commits(repo, [repo_to_checkout.commit])
+            if override:
+                repo.git.checkout(repo_to_checkout.commit, '--force')
+            else:
+                repo.git.checkout(repo_to_checkout.commit)
+        elif repo_to_checkout.tag and repo_to_checkout.commit is None:
+            if verbose and (repo_to_checkout.branch):
+                print(humble.TAG_AND_BRANCH_SPECIFIED.format(repo_to_checkout.root))
+            if override:
+                repo.git.checkout(repo_to_checkout.tag, '--force')
+            else:
+                repo.git.checkout(repo_to_checkout.tag)
+        elif repo_to_checkout.branch and (repo_to_checkout.commit is None and repo_to_checkout.tag is None):
+            branch_name = repo_to_checkout.branch
+            # A repository that only fetches the branches it uses fetches the branch of a new combination on demand
+            if fetch_refspec_maintenance.track_branch(repo, branch_name) or \
+                    (branch_name not in repo.heads and branch_name not in repo.remotes['origin'].refs):
+                fetch_from_remote(repo, repo.remotes.origin, fetch_refspec_maintenance.get_branch_refspec(branch_name))
+            if branch_name in repo.heads:
+                local_branch = repo.heads[branch_name]
+            else:
+                local_branch = repo.create_head(branch_name, repo.remotes['origin'].refs[branch_name])
+            #check to see if the branch being checked out has a tracking branch if not set one up
+            if repo.heads[local_branch.name].tracking_branch() is None:
+                repo.heads[local_branch.name].set_tracking_branch(repo.remotes['origin'].refs[branch_name])
+            if override:
+                repo.heads[local_branch.name].checkout(force=True)
+            else:
+                repo.heads[local_branch.name].checkout()
+        else:
+            raise edkrepo_exception.EdkrepoManifestInvalidException(humble.MISSING_BRANCH_COMMIT)
+
+def _get_repo_head(repo):
+    '''Returns a (branch, commit) tuple describing the HEAD of repo. branch is None if HEAD is detached.'''
+    if repo.head.is_detached:
+        return None, repo.head.commit.hexsha
+    return repo.active_branch.name, repo.head.commit.hexsha
+
+def _restore_repo_heads(repos_to_restore, initial_heads, workspace_path, failed_root):
+    '''Returns each repository in repos_to_restore to the HEAD recorded in initial_heads. The repository whose checkout
+    failed is always restored since the failure may have left its working tree partially updated.'''
+    ui_functions.print_warning_msg(humble.CHECKOUT_ROLLBACK, header=False)
+    for repo_to_restore in repos_to_restore:
+        repo = Repo(os.path.join(workspace_path, repo_to_restore.root))
+        branch, commit = initial_heads[repo_to_restore.root]
+        if repo_to_restore.root != failed_root and _get_repo_head(repo) == (branch, commit):
+            # The repository did not move, a forced checkout would only discard changes kept by --override
+            continue
+        try:
+            if os.path.exists(os.path.join(repo.git_dir, 'CHERRY_PICK_HEAD')):
+                # Patchset branches are created with cherry-picks
+                repo.git.cherry_pick('--abort')
+            repo.git.checkout(branch if branch is not None else commit, '--force')
+        except git.GitCommandError as e:
+            ui_functions.print_error_msg(humble.CHECKOUT_ROLLBACK_FAILED.format(repo_to_restore.root, e), header=False)
+
+def checkout_repos(verbose, override, repos_to_checkout, workspace_path, manifest, global_manifest_path, jobs=1):
+    '''Checks out each repository onto the ref defined in the project manifest file, running up to jobs checkouts at
+    the same time. A nested repository is not checked out until the repository containing it has been checked out.
+
+    The HEAD of every repository is recorded before any checkout starts. If a checkout fails, the checkouts in
+    progress are allowed to finish and every repository that was checked out is returned to its recorded HEAD before
+    the error is raised, so the workspace is left as it was.
+    '''
     if not override:
         try:
             check_dirty_repos(manifest, workspace_path)
         except edkrepo_exception.EdkrepoUncommitedChangesException:
             raise edkrepo_exception.EdkrepoUncommitedChangesException(humble.CHECKOUT_UNCOMMITED_CHANGES)
     #check_branches(repos_to_checkout, workspace_path)
-    for repo_to_checkout in repos_to_checkout:
-        if verbose:
-            if repo_to_checkout.patch_set:
-                print(humble.CHECKING_OUT_PATCHSET.format(repo_to_checkout.patch_set, repo_to_checkout.root))
-            elif repo_to_checkout.branch is not None and repo_to_checkout.commit is None:
-                print(humble.CHECKING_OUT_BRANCH.format(repo_to_checkout.branch, repo_to_checkout.root))
-            elif repo_to_checkout.commit is not None:
-                print(humble.CHECKING_OUT_COMMIT.format(repo_to_checkout.commit, repo_to_checkout.root))
-        local_repo_path = os.path.join(workspace_path, repo_to_checkout.root)
-        repo = Repo(local_repo_path)
-
-        # Checkout the repo onto the correct patchset/branch/commit/tag if multiple attributes are provided in
-        # the source section for the manifest the order of priority is the followiwng 1)patchset 2)commit
-        # 3) tag 4)branch with the highest priority attribute provided beinng checked out
-        if repo_to_checkout.patch_set:
+    # Deferred repositories are checked out onto the current combination when they are materialized
+    repos_to_checkout = deferred_repos_maintenance.filter_materialized(workspace_path, repos_to_checkout)
+    checkout_order = clone_utils.generate_clone_order(manifest, repos_to_checkout)
+    parents = clone_utils.generate_clone_dependencies(manifest, checkout_order)
+    initial_heads = {x.root: _get_repo_head(Repo(os.path.join(workspace_path, x.root))) for x in checkout_order}
+    pending = list(checkout_order)
+    started = []
+    checked_out_roots = set()
+    running = {}
+    failed_root = None
+    jobs = min(jobs, max(len(pending), 1))
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
             try:
-                patchset_branch_creation_flow(repo_to_checkout, repo, workspace_path, manifest, global_manifest_path, override)
-            except edkrepo_exception.EdkrepoLocalBranchExistsException:
+                while pending or running:
+                    for repo_to_checkout in list(pending):
+                        if len(running) >= jobs:
+                            break
+                        parent = parents[repo_to_checkout.root]
+                        if parent is not None and parent.root not in checked_out_roots:
+                            continue
+                        pending.remove(repo_to_checkout)
+                        started.append(repo_to_checkout)
+                        future = executor.submit(_checkout_repo, verbose, override, repo_to_checkout, workspace_path,
+                                                 manifest, global_manifest_path)
+                        running[future] = repo_to_checkout
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        repo_to_checkout = running.pop(future)
+                        failed_root = repo_to_checkout.root
+                        future.result()
+                        failed_root = None
+                        checked_out_roots.add(repo_to_checkout.root)
+            except BaseException:
+                # Do not start any further checkouts, the executor waits for the ones in flight
+                for future in running:
+                    future.cancel()
                 raise
-        else:
-            if repo_to_checkout.commit:
-                if verbose and (repo_to_checkout.branch or repo_to_checkout.tag):
-                    print(humble.MULTIPLE_SOURCE_ATTRIBUTES_SPECIFIED.format(repo_to_checkout.root))
-                if override:
-                    repo.git.checkout(repo_to_checkout.commit, '--force')
-                else:
-                    repo.git.checkout(repo_to_checkout.commit)
-            elif repo_to_checkout.tag and repo_to_checkout.commit is None:
-                if verbose and (repo_to_checkout.branch):
-                    print(humble.TAG_AND_BRANCH_SPECIFIED.format(repo_to_checkout.root))
-                if override:
-                    repo.git.checkout(repo_to_checkout.tag, '--force')
-                else:
-                    repo.git.checkout(repo_to_checkout.tag)
-            elif repo_to_checkout.branch and (repo_to_checkout.commit is None and repo_to_checkout.tag is None):
-                branch_name = repo_to_checkout.branch
-                if branch_name in repo.heads:
-                    local_branch = repo.heads[branch_name]
-                else:
-                    local_branch = repo.create_head(branch_name, repo.remotes['origin'].refs[branch_name])
-                #check to see if the branch being checked out has a tracking branch if not set one up
-                if repo.heads[local_branch.name].tracking_branch() is None:
-                    repo.heads[local_branch.name].set_tracking_branch(repo.remotes['origin'].refs[branch_name])
-                if override:
-                    repo.heads[local_branch.name].checkout(force=True)
-                else:
-                    repo.heads[local_branch.name].checkout()
-            else:
-                raise edkrepo_exception.EdkrepoManifestInvalidException(humble.MISSING_BRANCH_COMMIT)
+    except BaseException:
+        _restore_repo_heads(started, initial_heads, workspace_path, failed_root)
+        raise
 
 def patchset_branch_creation_flow(repo, repo_obj, workspace_path, manifest, global_manifest_path, override):
     json_path = os.path.join(workspace_path, "repo")
@@ -494,7 +981,7 @@ def patchset_operations_similarity(initial_patchset, new_patchset, initial_manif
             == new_manifest.get_patchset_operations(new_patchset.name, new_patchset.remote)
 
 def create_repos(repos_to_create, workspace_path, manifest, global_manifest_path):
-    for repo_to_create in repos_to_create:
+    for repo_to_create in deferred_repos_maintenance.filter_materialized(workspace_path, repos_to_create):
         local_repo_path = os.path.join(workspace_path, repo_to_create.root)
         repo = Repo(local_repo_path)
         json_path = os.path.join(workspace_path, "repo")
@@ -543,7 +1030,8 @@ def verify_single_manifest(cfg_file, manifest_repo, manifest_path, verbose=False
 
 def sort_commits(manifest, workspace_path, max_commits=None):
     colorama.init()
-    repo_sources_to_log = manifest.get_repo_sources(manifest.general_config.current_combo)
+    repo_sources_to_log = deferred_repos_maintenance.filter_materialized(
+        workspace_path, manifest.get_repo_sources(manifest.general_config.current_combo))
 
     commit_dictionary = {}
     for repo_to_log in repo_sources_to_log:
@@ -575,7 +1063,44 @@ def combination_is_in_manifest(combination, manifest):
     return combination in combination_names
 
 
-def checkout(combination, global_manifest_path, verbose=False, override=False, log=None):
+def get_included_configs(workspace_path, manifest):
+    '''Returns the (remote name, path) tuples of the submodule alternate URL configs written by
+    write_included_config() that exist in the workspace.'''
+    included_configs = []
+    for remote in manifest.remotes:
+        included_config_name = os.path.join(workspace_path, 'repo', humble.INCLUDED_FILE_NAME.format(remote.name))
+        if os.path.isfile(included_config_name):
+            included_configs.append((remote.name, pathfix.get_actual_path(included_config_name)))
+    return included_configs
+
+def switch_combo_worktrees(workspace_path, manifest, combo, verbose=False):
+    '''Points the workspace at the worktrees of combo, enabling worktrees per combination if the workspace does not
+    use them yet. Returns the RepoSource tuples of the worktrees that were created.
+
+    Arguments:
+    workspace_path - the path to the workspace
+    manifest - the ManifestXml object of the workspace
+    combo - the combination being checked out
+    verbose - print the worktrees as they are created
+    '''
+    current_combo = manifest.general_config.current_combo
+    if sparse_checkout_enabled(workspace_path, manifest.get_repo_sources(current_combo)):
+        raise edkrepo_exception.EdkrepoInvalidParametersException(humble.COMBO_WORKTREES_SPARSE)
+    if not combo_worktrees_maintenance.combo_worktrees_enabled(workspace_path):
+        print(humble.COMBO_WORKTREES_ENABLE.format(current_combo))
+        view_path = combo_worktrees_maintenance.enable_combo_worktrees(workspace_path, manifest, current_combo)
+        # The submodule alternate URLs are included by the path of the git directory, which is now in the view. The
+        # worktrees of the other views keep their git directories inside it as well.
+        write_conditional_include(view_path, combo_worktrees_maintenance.get_all_sources(manifest),
+                                  get_included_configs(workspace_path, manifest))
+    print(humble.COMBO_WORKTREES_SWITCH.format(combo))
+    added_sources = combo_worktrees_maintenance.switch_combo_view(workspace_path, manifest, combo)
+    if verbose:
+        for source in added_sources:
+            print(humble.COMBO_WORKTREES_ADD.format(source.root, combo))
+    return added_sources
+
+def checkout(combination, global_manifest_path, verbose=False, override=False, log=None, jobs=1, worktree=False):
     workspace_path = config_factory.get_workspace_path()
     manifest = config_factory.get_workspace_manifest()
 
@@ -593,51 +1118,68 @@ def checkout(combination, global_manifest_path, verbose=False, override=False, l
 
     repo_sources = manifest.get_repo_sources(combo)
     initial_repo_sources = manifest.get_repo_sources(manifest.general_config.current_combo)
+    initial_view = combo_worktrees_maintenance.get_active_combo_view(workspace_path)
+    added_worktrees = []
+    if worktree or initial_view is not None:
+        try:
+            added_worktrees = switch_combo_worktrees(workspace_path, manifest, combo, verbose)
+        except:
+            state = combo_worktrees_maintenance.read_combo_worktrees(workspace_path)
+            if state is not None:
+                combo_worktrees_maintenance.activate_view(workspace_path, manifest, initial_view or state['main_view'])
+            raise
+        if initial_view is None:
+            # The workspace was moved into the view of the initial combination
+            initial_view = combo_worktrees_maintenance.read_combo_worktrees(workspace_path)['main_view']
+        # The worktrees of combo were last checked out onto combo, only what changed since then is processed
+        plan = CheckoutPlan(workspace_path, manifest, combo, combo)
+    else:
+        # Only the repositories whose ref, submodules or sparse checkout patterns change are processed
+        plan = CheckoutPlan(workspace_path, manifest, manifest.general_config.current_combo, combo)
 
     # Disable sparse checkout
-    current_repos = initial_repo_sources
     sparse_enabled = sparse_checkout_enabled(workspace_path, initial_repo_sources)
 
-    # Determine if there is a difference in the sparse states of the two combos
-    # sparse_diff = True if there is a difference in sparse enable or if there
-    # is a statically defined sparse list for the combo
-    sparse_diff = False
-    sources_to_check = [(x, y) for x in initial_repo_sources for y in repo_sources if x.root == y.root]
-    for source in sources_to_check:
-        if source[0].sparse != source[1].sparse:
-            sparse_diff = True
-        if sparse_diff:
-            break
-    if set([combo, manifest.general_config.current_combo]).isdisjoint(set([data.combination for data in manifest.sparse_data])) == False :
-        if combo != manifest.general_config.current_combo:
-            sparse_diff =  True
-
-    # Recompute the sparse checkout if the dynamic sparse list is being used or
-    # there is a difference in the sparse settings / static sparse definition
-    # between the two combos
+    # Recompute the sparse checkout of every repository if the dynamic sparse
+    # list is being used, otherwise only for the repositories whose sparse
+    # settings or static sparse definition differ between the two combos
     if sparse_enabled:
         sparse_settings = manifest.sparse_settings
         if sparse_settings is not None:
             sparse_enabled = False
-    if sparse_enabled or sparse_diff:
+    if sparse_enabled:
+        sparse_reset_repos = initial_repo_sources
+        sparse_repos = repo_sources
+    else:
+        sparse_reset_repos = plan.sparse_reset_sources
+        sparse_repos = plan.sparse_sources
+    if sparse_reset_repos:
         print(humble.SPARSE_RESET)
-        reset_sparse_checkout(workspace_path, current_repos)
+        reset_sparse_checkout(workspace_path, sparse_reset_repos)
 
-    # Deinit all submodules due to the potential for issues when switching
+    # Deinit the submodules of the repositories whose commit or submodule
+    # configuration changes due to the potential for issues when switching
     # branches.
-    if combo != manifest.general_config.current_combo:
+    submodule_repos = plan.submodule_update_sources
+    # The submodules of new worktrees have not been initialized yet
+    added_submodule_repos = [x for x in added_worktrees if x.enable_submodule and x not in submodule_repos]
+    submodule_repos.extend(added_submodule_repos)
+    if plan.submodule_deinit_sources:
         try:
-            submodule_utils.deinit_full(workspace_path, manifest, verbose)
+            submodule_utils.deinit_full(workspace_path, manifest, verbose, repo_sources=plan.submodule_deinit_sources)
         except Exception as e:
             print(humble.SUBMODULE_DEINIT_FAILED)
             if verbose:
                 print(e)
 
     print(humble.CHECKING_OUT_COMBO.format(combo))
+    if verbose and plan.unchanged_sources:
+        print(humble.CHECKOUT_REPOS_UNCHANGED.format(len(plan.unchanged_sources)))
 
+    checked_out = False
     try:
-        checkout_repos(verbose, override, repo_sources, workspace_path, manifest, global_manifest_path)
-        current_repos = repo_sources
+        checkout_repos(verbose, override, plan.checkout_sources, workspace_path, manifest, global_manifest_path, jobs)
+        checked_out = True
         # Update the current checkout combo in the manifest only if this
         # combination exists in the manifest
         if combination_is_in_manifest(combo, manifest):
@@ -647,13 +1189,25 @@ def checkout(combination, global_manifest_path, verbose=False, override=False, l
             traceback.print_exc()
         ui_functions.print_error_msg(e)
         print (humble.CHECKOUT_COMBO_UNSUCCESSFULL.format(combo))
-        # Return to the initial combo, since there was an issue with cheking out the selected combo
-        checkout_repos(verbose, override, initial_repo_sources, workspace_path, manifest, global_manifest_path)
     finally:
-        submodule_utils.maintain_submodules(workspace_path, manifest, submodule_combo, verbose)
-        if sparse_enabled or sparse_diff:
+        if not checked_out:
+            # checkout_repos has already returned every repository to the initial combo, restore the submodules and
+            # sparse checkout that were reset for the switch
+            if initial_view is None:
+                submodule_combo = manifest.general_config.current_combo
+                submodule_repos = plan.submodule_deinit_sources
+            else:
+                # The worktrees of combo were returned to where they were, which is still combo
+                submodule_repos = plan.submodule_deinit_sources + added_submodule_repos
+            sparse_repos = sparse_reset_repos
+        if submodule_repos:
+            submodule_utils.maintain_submodules(workspace_path, manifest, submodule_combo, verbose,
+                                                repo_sources=submodule_repos)
+        if sparse_repos:
             print(humble.SPARSE_CHECKOUT)
-            sparse_checkout(workspace_path, current_repos, manifest)
+            sparse_checkout(workspace_path, sparse_repos, manifest)
+        if not checked_out and initial_view is not None:
+            combo_worktrees_maintenance.activate_view(workspace_path, manifest, initial_view)
 
 def get_latest_sha(repo, branch, remote_or_url='origin'):
     if repo is None:
@@ -676,6 +1230,48 @@ def get_latest_sha(repo, branch, remote_or_url='origin'):
     else:
         return None
 
+def _ls_remote(remote_url, patterns):
+    '''Returns a dictionary of ref name to SHA for the refs of remote_url matching patterns, or None if the remote
+    could not be queried. The query never waits for credentials, a remote that requires them is reported as failed.'''
+    env = os.environ.copy()
+    env['GIT_TERMINAL_PROMPT'] = '0'
+    try:
+        result = subprocess.run(['git', 'ls-remote', remote_url] + sorted(patterns), stdin=subprocess.DEVNULL,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True, env=env)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    tips = {}
+    for line in result.stdout.splitlines():
+        sha, separator, ref_name = line.partition('\t')
+        if not separator:
+            return None
+        tips[ref_name] = sha
+    return tips
+
+def get_remote_tips(remote_patterns, jobs=1):
+    '''Queries the tips of several remotes with one git ls-remote per remote URL, running up to jobs queries at the
+    same time.
+
+    Arguments:
+    remote_patterns - a dictionary mapping each remote URL to the collection of ref patterns to query from it
+    jobs - the maximum number of remotes to query concurrently
+
+    Returns a dictionary mapping each remote URL to a dictionary of ref name to SHA, or to None if the remote could not
+    be queried. ls-remote matches patterns against the end of each ref name, so callers should look up exact names.
+    '''
+    if not remote_patterns:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(remote_patterns)))) as executor:
+        results = {url: executor.submit(_ls_remote, url, patterns) for url, patterns in remote_patterns.items()}
+        return {url: future.result() for url, future in results.items()}
+
+def get_configured_refspecs(repo, remote_name=DEFAULT_REMOTE_NAME):
+    '''Returns the list of fetch refspecs configured for remote_name. A fetch given explicit refspecs ignores the
+    configured ones, so they must be included to keep the remote tracking branches up to date.'''
+    return fetch_refspec_maintenance.get_fetch_refspecs(repo, remote_name)
+
 def get_full_path(file_name):
     paths = os.environ['PATH'].split(os.pathsep)
     if sys.platform == "win32":
@@ -1069,13 +1665,33 @@ def _fetch_error_needs_repack(e):
     combined = _get_fetch_error_output(e)
     return 'incorrect old value provided' in combined
 
-def fetch_from_remote(repo, remote, *args, _repack_attempted=False, _prune_attempted=False, **kwargs):
+def _fetch_error_is_transient(e):
+    combined = _get_fetch_error_output(e).lower()
+    return any(message in combined for message in TRANSIENT_FETCH_ERRORS)
+
+def _get_fetch_retry_delay(attempt):
+    """Returns the delay before retry number attempt, doubling each time with jitter so that concurrent fetches
+    that failed together do not retry together."""
+    delay = min(FETCH_RETRY_MAX_DELAY, FETCH_RETRY_BASE_DELAY * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+def _release_file_handles():
+    """Gives the OS time to release file handles Git has open. Only Windows keeps them open after git exits."""
+    if os.name == 'nt':
+        time.sleep(FILE_HANDLE_RELEASE_DELAY)
+
+def fetch_from_remote(repo, remote, *args, **kwargs):
     """
-    Fetch from a remote, automatically pruning stale remote-tracking refs on failure.
+    Fetch from a remote, repairing the local refs beforehand and retrying on failure.
 
-    On case-insensitive filesystems, if the prune itself fails due to
-    case-conflicting ref names in the local .git directory,
-    scrub_repo_case_conflicts() is called before retrying the prune.
+    Before fetching, the refs are checked for broken remote refs, excessive
+    loose refs and, on case-insensitive filesystems, case conflicts and stale
+    reflogs, and any problems found are repaired. Fetches that fail because of
+    conflicting or stale refs are repaired with a refs repack or remote prune
+    and retried once. If the prune itself fails due to case-conflicting ref
+    names, scrub_repo_case_conflicts() is called before retrying the prune.
+    Fetches that fail with a transient network or server error are retried
+    up to FETCH_RETRY_LIMIT times with jittered exponential backoff.
 
     Args:
         repo:     GitPython Repo object
@@ -1083,46 +1699,85 @@ def fetch_from_remote(repo, remote, *args, _repack_attempted=False, _prune_attem
         *args:    Optional refspec arguments forwarded to remote.fetch()
         **kwargs: Optional keyword arguments forwarded to remote.fetch() (e.g. progress=)
     """
-    try:
-        return remote.fetch(*args, **kwargs)
-    except git.GitCommandError as fetch_error:
-        if _fetch_error_needs_repack(fetch_error):
-            if _repack_attempted:
-                raise
-            # Refs exist in both loose and packed forms with conflicting values.
-            # Pack all refs to consolidate them, then retry via a recursive call
-            # so that a potential subsequent prune error is also handled
-            # automatically.
-            ui_functions.print_info_msg(humble.AUTOMATIC_REFS_REPACK, header=False)
-            # Give the OS time to release file handles Git has open
-            time.sleep(1.0)
-            repo.git.pack_refs('--all')
-            time.sleep(1.0)
-            return fetch_from_remote(repo, remote, *args, _repack_attempted=True, _prune_attempted=_prune_attempted, **kwargs)
-        elif _fetch_error_needs_prune(fetch_error):
-            if _prune_attempted:
-                raise
-            ui_functions.print_info_msg(humble.AUTOMATIC_REMOTE_PRUNE, header=False)
-            # Give the OS time to release file handles Git has open
-            time.sleep(1.0)
-            try:
-                repo.git.remote('prune', remote.name)
-            except git.GitCommandError:
-                if _is_case_insensitive_fs():
-                    time.sleep(1.0)
-                    repo_case_conflict_solver.scrub_repo_case_conflicts(repo, verbose=True)
-                    time.sleep(1.0)
-                    ui_functions.print_info_msg(humble.AUTOMATIC_REMOTE_PRUNE, header=False)
+    ref_health.preflight_ref_health(repo, _is_case_insensitive_fs())
+    # The fetch, its retries and the git gc --auto it runs may replace the files of the object store
+    git_object_query.close_object_queries(repo.common_dir)
+    repack_attempted = False
+    prune_attempted = False
+    retry_count = 0
+    while True:
+        try:
+            return remote.fetch(*args, **kwargs)
+        except git.GitCommandError as fetch_error:
+            if _fetch_error_needs_repack(fetch_error) and not repack_attempted:
+                # Refs exist in both loose and packed forms with conflicting values.
+                # Pack all refs to consolidate them, then retry so that a
+                # potential subsequent prune error is also handled automatically.
+                repack_attempted = True
+                ui_functions.print_info_msg(humble.AUTOMATIC_REFS_REPACK, header=False)
+                _release_file_handles()
+                repo.git.pack_refs('--all')
+            elif _fetch_error_needs_prune(fetch_error) and not prune_attempted:
+                prune_attempted = True
+                ui_functions.print_info_msg(humble.AUTOMATIC_REMOTE_PRUNE, header=False)
+                _release_file_handles()
+                try:
                     repo.git.remote('prune', remote.name)
-                else:
-                    raise
-            time.sleep(1.0)
-            if _is_case_insensitive_fs():
-                repo_case_conflict_solver.scrub_stale_remote_reflogs(repo, verbose=True)
-                time.sleep(1.0)
-            return fetch_from_remote(repo, remote, *args, _repack_attempted=_repack_attempted, _prune_attempted=True, **kwargs)
+                except git.GitCommandError:
+                    if _is_case_insensitive_fs():
+                        repo_case_conflict_solver.scrub_repo_case_conflicts(repo, verbose=True)
+                        _release_file_handles()
+                        ui_functions.print_info_msg(humble.AUTOMATIC_REMOTE_PRUNE, header=False)
+                        repo.git.remote('prune', remote.name)
+                    else:
+                        raise
+                if _is_case_insensitive_fs():
+                    repo_case_conflict_solver.scrub_stale_remote_reflogs(repo, verbose=True)
+            elif _fetch_error_is_transient(fetch_error) and retry_count < FETCH_RETRY_LIMIT:
+                delay = _get_fetch_retry_delay(retry_count)
+                retry_count += 1
+                ui_functions.print_info_msg(humble.FETCH_RETRY.format(remote.name, delay), header=False)
+                time.sleep(delay)
+                continue
+            else:
+                raise
+            _release_file_handles()
+
+def find_missing_commits(repo, commits):
+    '''Returns the commits in commits that are not present in repo, looked up through the shared git cat-file process
+    of the repository.
+
+    Arguments:
+    repo - the GitPython Repo object to check
+    commits - the list of commit SHAs to look up
+    '''
+    return git_object_query.get_object_query(repo).missing_commits(commits)
+
+def fetch_missing_commits(repo, commits, remote_name=DEFAULT_REMOTE_NAME):
+    '''Fetches the commits in commits that are not present in repo by their SHA. A repository that already has every
+    commit is not fetched at all. If the remote refuses to send a commit by SHA every branch of the remote is fetched
+    instead, even if the repository only fetches the branches the manifest uses. Returns the commits that are still
+    missing.
+
+    Arguments:
+    repo - the GitPython Repo object to fetch into
+    commits - the list of full commit SHAs that are needed
+    remote_name - the remote to fetch from
+    '''
+    missing_commits = find_missing_commits(repo, commits)
+    if not missing_commits:
+        return []
+    remote = repo.remotes[remote_name]
+    try:
+        fetch_from_remote(repo, remote, missing_commits)
+    except git.GitCommandError:
+        # Servers may only allow fetching the objects reachable from advertised refs. The commits may be on a branch a
+        # scoped repository does not fetch.
+        if fetch_refspec_maintenance.is_full_fetch(repo, remote_name):
+            fetch_from_remote(repo, remote)
         else:
-            raise
+            fetch_from_remote(repo, remote, fetch_refspec_maintenance.FULL_FETCH_REFSPEC.format(remote_name))
+    return find_missing_commits(repo, missing_commits)
 
 def get_proxy_str():
     proxy_out = subprocess.run('git config --global --get-urlmatch http https://github.com',
@@ -1132,4 +1787,4 @@ def get_proxy_str():
         proxy_str = proxy_dict['http.proxy']
     except KeyError:
         raise edkrepo_exception.EdkrepoProxyNotSetException(humble.PROXY_STR_NOT_FOUND)
-    return proxy_str
\ No newline at end of file
+    return proxy_str
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+#
+## @file
+# git_object_query.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Answers questions about the objects of a repository through long-lived git cat-file processes.
+
+Each GitObjectQuery keeps one git cat-file --batch-check process and one git cat-file --batch process open for the
+life of the command, so looking up whether a commit exists, what it resolves to or what its parents and message are
+costs a write and a read on a pipe instead of starting a new git process. get_object_query() shares one instance per
+repository between all callers.
+
+Windows does not allow files that a running process has open, or its working directory, to be replaced or deleted.
+The shared processes of a repository are therefore stopped with close_object_queries() before a step that rewrites or
+deletes its object store, such as a fetch, git gc or removing the repository. They are started again on the next
+query.
+'''
+
+import atexit
+import os
+import subprocess
+import threading
+from collections import namedtuple
+
+ObjectInfo = namedtuple('ObjectInfo', ['sha', 'type', 'size'])
+CommitInfo = namedtuple('CommitInfo', ['sha', 'tree', 'parents', 'message'])
+
+# Printed by git cat-file after the object name it was given when the name does not resolve to a single object
+MISSING_SUFFIXES = (' missing', ' ambiguous')
+
+class GitObjectQuery():
+    '''Looks up the objects of one repository. The cat-file processes are started on first use and stopped by close().
+    Queries may be made from several threads.
+
+    Arguments:
+    repo_path - the path to the working tree or git directory of the repository
+    '''
+    def __init__(self, repo_path):
+        self._repo_path = repo_path
+        self._lock = threading.Lock()
+        self._batch_check = None
+        self._batch = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        '''Stops the cat-file processes. They are started again if another query is made.'''
+        with self._lock:
+            for process in (self._batch_check, self._batch):
+                if process is not None:
+                    process.stdin.close()
+                    process.wait()
+                    process.stdout.close()
+            self._batch_check = None
+            self._batch = None
+
+    def _start(self, mode):
+        return subprocess.Popen(['git', 'cat-file', mode], cwd=self._repo_path, stdin=subprocess.PIPE,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+    @staticmethod
+    def _write_query(process, rev):
+        if '\n' in rev:
+            raise ValueError('Object names cannot contain a newline: {!r}'.format(rev))
+        process.stdin.write('{}\n'.format(rev).encode('utf-8'))
+        process.stdin.flush()
+
+    @staticmethod
+    def _parse_header(header):
+        if not header or header.endswith(MISSING_SUFFIXES):
+            return None
+        sha, object_type, size = header.split(' ')
+        return ObjectInfo(sha, object_type, int(size))
+
+    def info(self, rev):
+        '''Returns an ObjectInfo tuple for the object rev names, or None if it does not name an object.'''
+        with self._lock:
+            if self._batch_check is None:
+                self._batch_check = self._start('--batch-check')
+            self._write_query(self._batch_check, rev)
+            header = self._batch_check.stdout.readline().decode('utf-8').rstrip('\n')
+        return self._parse_header(header)
+
+    def read(self, rev):
+        '''Returns a tuple of the ObjectInfo tuple and the contents of the object rev names, or (None, None) if it does
+        not name an object.'''
+        with self._lock:
+            if self._batch is None:
+                self._batch = self._start('--batch')
+            self._write_query(self._batch, rev)
+            info = self._parse_header(self._batch.stdout.readline().decode('utf-8').rstrip('\n'))
+            if info is None:
+                return None, None
+            # The contents are followed by a newline
+            contents = self._batch.stdout.read(info.size + 1)[:-1]
+        return info, contents
+
+    def resolve(self, rev):
+        '''Returns the full SHA of the commit rev names, or None if it does not name a commit.'''
+        info = self.info('{}^{{commit}}'.format(rev))
+        return info.sha if info is not None else None
+
+    def commit_exists(self, rev):
+        return self.resolve(rev) is not None
+
+    def missing_commits(self, revs):
+        '''Returns the revs in revs that do not name a commit of the repository, in order.'''
+        return [rev for rev in revs if not self.commit_exists(rev)]
+
+    def read_commit(self, rev):
+        '''Returns a CommitInfo tuple for the commit rev names, or None if it does not name a commit.'''
+        info, contents = self.read('{}^{{commit}}'.format(rev))
+        if info is None:
+            return None
+        headers, _, message = contents.partition(b'\n\n')
+        tree = None
+        parents = []
+        for line in headers.split(b'\n'):
+            if line.startswith(b'tree '):
+                tree = line[5:].decode('ascii')
+            elif line.startswith(b'parent '):
+                parents.append(line[7:].decode('ascii'))
+        return CommitInfo(info.sha, tree, parents, message.decode('utf-8', errors='replace'))
+
+    def changed_files(self, revs):
+        '''Returns a dictionary mapping the full SHA of each commit in revs to the list of paths it changes compared to
+        its first parent, matching Commit.stats.files of GitPython. All of the commits are diffed by a single
+        git diff-tree process.'''
+        commits = []
+        changed_files = {}
+        for rev in revs:
+            commit = self.read_commit(rev)
+            if commit is None:
+                raise ValueError('Not a commit: {}'.format(rev))
+            if commit.sha not in changed_files:
+                commits.append(commit)
+                changed_files[commit.sha] = []
+        diff_input = ''.join('{} {}\n'.format(x.sha, x.parents[0]) if x.parents else '{}\n'.format(x.sha)
+                             for x in commits)
+        diff_tree = subprocess.run(['git', 'diff-tree', '--stdin', '-r', '-z', '--name-only', '--no-renames', '--root',
+                                    '--always'], cwd=self._repo_path, input=diff_input.encode('utf-8'),
+                                   stdout=subprocess.PIPE, check=True)
+        # Each commit is printed as its SHA followed by the paths it changes, all terminated by NUL
+        current_files = None
+        pending = [x.sha for x in commits]
+        for field in diff_tree.stdout.split(b'\0'):
+            if not field:
+                continue
+            name = field.decode('utf-8', errors='surrogateescape')
+            if pending and name == pending[0]:
+                current_files = changed_files[pending.pop(0)]
+            elif current_files is not None:
+                current_files.append(name)
+        return changed_files
+
+_object_queries = {}
+_object_queries_lock = threading.Lock()
+
+def get_object_query(repo):
+    '''Returns the GitObjectQuery shared by all callers for the GitPython Repo object repo.'''
+    key = os.path.normcase(os.path.abspath(repo.git_dir))
+    with _object_queries_lock:
+        if key not in _object_queries:
+            _object_queries[key] = GitObjectQuery(repo.git_dir)
+        return _object_queries[key]
+
+def _is_within(path, directory):
+    return path == directory or path.startswith(os.path.join(directory, ''))
+
+@atexit.register
+def close_object_queries(path=None):
+    '''Stops the cat-file processes of the shared GitObjectQuery objects whose git directory is path or inside it, or
+    of every shared GitObjectQuery if path is None. The instances of path stay shared and start new processes when
+    they are queried again, while closing every instance also stops sharing them.
+
+    Arguments:
+    path - the git directory of a repository, such as Repo.common_dir to include its worktrees, or a directory
+           containing repositories
+    '''
+    directory = os.path.normcase(os.path.abspath(path)) if path is not None else None
+    with _object_queries_lock:
+        for key, object_query in _object_queries.items():
+            if directory is None or _is_within(key, directory):
+                object_query.close()
+        if directory is None:
+            _object_queries.clear()
@@ -47,6 +47,11 @@ SPARSE_RESET = 'Resetting sparse checkout state...'
 # Remote fetch/prune messages
 AUTOMATIC_REMOTE_PRUNE = 'Performing automatic remote prune...'
 AUTOMATIC_REFS_REPACK = 'Performing automatic refs repack to fix duplicate ref entries...'
+FETCH_RETRY = 'Fetch from {} failed with a transient error, retrying in {:.1f} seconds...'
+
+# Ref health messages
+REF_HEALTH_BROKEN_REFS = 'Deleting {} broken remote ref(s)...'
+REF_HEALTH_PACK_REFS = 'Packing {} loose ref(s)...'
 
 # Case conflict scrubbing messages
 CASE_CONFLICT_SCRUB = 'Scrubbing case-conflicting remote refs...'
@@ -66,9 +71,16 @@ CHECKOUT_CURRENT_COMBO = 'The selected combination, {0}, is already checked out
 CHECKOUT_UNCOMMITED_CHANGES = 'Uncommited changes present in workspace, unable to complete checkout.\nTo discard all local changes to tracked files rerun edkrepo checkout with the "--override" flag.\n'
 CHECKOUT_NO_REMOTE = 'The specified remote branch for the {0} repo does not exist.'
 CHECKOUT_COMBO_UNSUCCESSFULL = 'The combination {} was not able to be checked out successfully. Returning to initially active combination.'
+CHECKOUT_ROLLBACK = 'Returning the repositories that were checked out to their initial branch or commit...'
+CHECKOUT_ROLLBACK_FAILED = 'Unable to return {} to its initial branch or commit: {}'
+COMBO_WORKTREES_SPARSE = 'Worktrees per combination cannot be used while sparse checkout is enabled. Run "edkrepo sparse --disable" first.'
 
 # Informational messages for checkout_command.py
 CHECKING_OUT_COMBO = 'Checking out combination: {0} ...'
+CHECKOUT_REPOS_UNCHANGED = 'Skipping {} repositories that are already checked out'
+COMBO_WORKTREES_ENABLE = 'Moving the repositories into the worktrees of combination {} ...'
+COMBO_WORKTREES_SWITCH = 'Switching the workspace to the worktrees of combination {} ...'
+COMBO_WORKTREES_ADD = 'Creating a worktree of the {} repo for combination {} ...'
 CHECKING_OUT_BRANCH = 'Checking out {0} branch for {1} repo ...'
 CHECKING_OUT_COMMIT = 'Checking detached HEAD on commit {0} for {1} repo ...'
 CHECKING_OUT_PATCHSET = 'Checking out {0} patchset for {1} repo ...'
@@ -88,6 +100,7 @@ MANIFEST_NAME_INCONSISTENT = 'Index project name {} does not match codename {} i
 # Messages for sparse_command.py
 SPARSE_ENABLE_DISABLE = 'Unable to Enable and Disable sparse checkout at the same time.'
 SPARSE_NO_CHANGE = 'No sparse checkout change required.'
+SPARSE_COMBO_WORKTREES = 'Sparse checkout cannot be enabled in a workspace that uses worktrees per combination.'
 SPARSE_ENABLE = 'Enable Sparse Checkout:'
 SPARSE_DISABLE = 'Disable Sparse Checkout:'
 SPARSE_STATUS = 'Sparse Status:'
@@ -130,6 +143,28 @@ VERIFY_PROJ_NOT_IN_INDEX = 'Unable to find and entry in the CiIndex for project:
 VERIFY_PROJ_FAIL = 'Unable to verify the global manifest repository entry for project: {}\n'
 CLONE_FAIL = 'Unable to clone the {} repository:\n{}\n'
 CLONE_TIME = 'Clone Time [{}]: {}'
+CLONE_TEMPLATE_NOT_WORKSPACE = '{} is not an edkrepo workspace'
+CLONE_TEMPLATE_PROJECT_MISMATCH = 'The workspace {} contains the project {}, it can not be used to clone the project {}'
+CLONE_COMPLETE = 'complete ({})'
+CLONE_RESUMING = 'Resuming an interrupted clone, {} repositories remain to be cloned'
+CLONE_RESUME_CHECKOUT = 'Resuming the checkout of the {} repository'
+CLONE_RESUME_NO_JOURNAL = 'The workspace {} does not contain an interrupted clone that can be resumed.' + CLONE_EXIT
+CLONE_TARGET_NOT_EMPTY = 'Unable to clone the {} repository, the directory {} already exists and was not created by edkrepo'
+MIRROR_POOL_UPDATE = 'Updating the local mirror pool for {} remote repositories'
+MIRROR_POOL_CREATE_FAILED = 'Unable to create a local mirror of {}, it will be cloned without one:\n{}'
+MIRROR_POOL_REFRESH_FAILED = 'Unable to refresh the local mirror of {}, the existing mirror will be used:\n{}'
+MIRROR_POOL_LOCK_WAIT = 'Waiting for another edkrepo process to release the mirror lock {}'
+BUNDLE_DIR_NOT_FOUND = 'The bundle directory {} does not exist'
+BUNDLE_SEED_FAILED = 'Unable to seed {} from bundle {}, all changes will be fetched from the remote:\n{}'
+BUNDLE_GIT_TOO_OLD = 'Seeding repositories from bundles requires git {} or later, the bundle directory will be ignored'
+BUNDLE_GIT_FAILED = 'The git command: {} failed:\n{}'
+MATERIALIZING_REPOS = 'Materializing {} deferred repositories'
+MATERIALIZE_TARGET_NOT_EMPTY = 'Unable to materialize the {} repository, the directory {} already exists and was not created by edkrepo'
+CLONE_LAZY = 'Deferring the clone of {} repositories, use "edkrepo materialize" to clone them'
+INVALID_JOBS_ARG = 'The number of jobs must be a positive integer: {}'
+PREFETCH_WORKSPACE_MISSING = 'The registered workspace {} no longer exists, use "edkrepo prefetch unregister" to remove it'
+PREFETCH_WORKSPACE_FAILED = 'Unable to read the manifest of the registered workspace {}:\n{}'
+PREFETCH_FAILED = 'Unable to prefetch {}:\n{}'
 
 # Git Command Error Messages
 GIT_CMD_ERROR = 'The git command: {} failed to complete successfully with the following errors.\n'
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+#
+## @file
+# json_utilities.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import json
+import os
+
+def write_json_file(path, data):
+    '''Writes data to the JSON file at path.
+
+    The data is written to a temporary file that then replaces path in one step, so an interrupted write never leaves
+    a truncated file behind for a reader that runs at the same time or after the interruption.
+    '''
+    temp_path = '{}.tmp'.format(path)
+    try:
+        with open(temp_path, 'w') as json_file:
+            json.dump(data, json_file, indent=4)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
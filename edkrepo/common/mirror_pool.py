@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+#
+## @file
+# mirror_pool.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Maintains a pool of bare mirror repositories in the edkrepo global data directory.
+
+Each mirror is keyed by the normalized remote URL it mirrors. Mirrors are created the first time a remote is cloned
+and are refreshed with incremental fetches afterwards. The mirrors are passed to git clone as reference repositories
+so that only objects missing from the local pool are downloaded.
+'''
+
+import os
+import shutil
+import socket
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import edkrepo.common.humble as humble
+from edkrepo.common.clone_utilities import normalize_remote_url, generate_remote_url_key
+from edkrepo.common.process_utilities import is_process_running
+import edkrepo.common.ui_functions as ui_functions
+from edkrepo.config.config_factory import get_edkrepo_global_data_directory
+
+MIRROR_POOL_DIRECTORY = 'mirrors'
+LOCK_FILE_SUFFIX = '.lock'
+STALE_LOCK_SECONDS = 6 * 60 * 60
+LOCK_POLL_SECONDS = 1.0
+
+def get_mirror_pool_directory():
+    '''Returns the directory containing all of the managed mirrors, creating it if needed.'''
+    pool_dir = os.path.join(get_edkrepo_global_data_directory(), MIRROR_POOL_DIRECTORY)
+    os.makedirs(pool_dir, exist_ok=True)
+    return pool_dir
+
+def get_mirror_name(url):
+    '''Returns the directory name of the mirror for url.'''
+    return '{}.git'.format(generate_remote_url_key(url))
+
+def get_mirror_path(url, pool_dir=None):
+    if pool_dir is None:
+        pool_dir = get_mirror_pool_directory()
+    return os.path.join(pool_dir, get_mirror_name(url))
+
+def _run_git(cmd):
+    return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+
+def _read_lock_owner(lock_path):
+    '''Returns the (process ID, host name) stored in a lock file, or None if it cannot be read.'''
+    try:
+        with open(lock_path, 'r') as lock_file:
+            pid, host = lock_file.read().split(None, 1)
+        return int(pid), host.strip()
+    except (OSError, ValueError):
+        return None
+
+def _is_stale_lock(lock_path):
+    '''Returns True if the process that took a lock is known to have exited without releasing it.'''
+    owner = _read_lock_owner(lock_path)
+    if owner is not None and owner[1] == socket.gethostname():
+        return not is_process_running(owner[0])
+    # The owner of a lock taken on another machine sharing the pool, or of a lock that is still being written, can not
+    # be checked, so only a lock that has not been released for a long time is considered stale
+    return time.time() - os.path.getmtime(lock_path) > STALE_LOCK_SECONDS
+
+def _acquire_lock(lock_path):
+    '''Takes an exclusive lock on a mirror so that concurrent edkrepo processes do not update it at the same time.'''
+    waiting = False
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.write(fd, '{} {}'.format(os.getpid(), socket.gethostname()).encode('utf-8'))
+            os.close(fd)
+            return
+        except FileExistsError:
+            try:
+                if _is_stale_lock(lock_path):
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+            if not waiting:
+                ui_functions.print_info_msg(humble.MIRROR_POOL_LOCK_WAIT.format(lock_path), header=False)
+                waiting = True
+            time.sleep(LOCK_POLL_SECONDS)
+
+def _release_lock(lock_path):
+    try:
+        os.remove(lock_path)
+    except OSError:
+        pass
+
+def _create_mirror(url, mirror_path):
+    # Clone into a temporary directory and rename it into place so that a partially created mirror is never used
+    temp_path = '{}.tmp'.format(mirror_path)
+    if os.path.isdir(temp_path):
+        shutil.rmtree(temp_path, ignore_errors=True)
+    result = _run_git(['git', 'clone', '--mirror', url, temp_path])
+    if result.returncode != 0:
+        shutil.rmtree(temp_path, ignore_errors=True)
+        return result.stdout
+    # Workspaces may borrow objects from the mirror, so unreachable objects must never be pruned from it
+    _run_git(['git', '-C', temp_path, 'config', 'gc.pruneExpire', 'never'])
+    _run_git(['git', '-C', temp_path, 'config', 'gc.reflogExpireUnreachable', 'never'])
+    os.rename(temp_path, mirror_path)
+    return None
+
+def _refresh_mirror(mirror_path):
+    result = _run_git(['git', '-C', mirror_path, 'fetch', '--prune', '--quiet', 'origin'])
+    if result.returncode != 0:
+        return result.stdout
+    return None
+
+def update_mirror(url, pool_dir=None):
+    '''Creates the mirror for url if it does not exist, otherwise fetches any new objects into it.
+
+    Returns the path to the mirror or None if the mirror could not be created.
+    '''
+    mirror_path = get_mirror_path(url, pool_dir)
+    lock_path = '{}{}'.format(mirror_path, LOCK_FILE_SUFFIX)
+    _acquire_lock(lock_path)
+    try:
+        if os.path.isdir(mirror_path):
+            error = _refresh_mirror(mirror_path)
+            if error:
+                # A stale mirror is still a useful reference, git clone fetches whatever is missing from the remote
+                ui_functions.print_warning_msg(humble.MIRROR_POOL_REFRESH_FAILED.format(url, error), header=False)
+        else:
+            error = _create_mirror(url, mirror_path)
+            if error:
+                ui_functions.print_warning_msg(humble.MIRROR_POOL_CREATE_FAILED.format(url, error), header=False)
+                return None
+    finally:
+        _release_lock(lock_path)
+    return mirror_path
+
+def update_mirrors(repo_sources, jobs=1, pool_dir=None):
+    '''Creates or refreshes the mirrors for all of the given repo_sources.
+
+    Returns a reference_path_map dictionary mapping the lower case remote URL of each repository to its mirror.
+    '''
+    urls = {}
+    for repo_source in repo_sources:
+        urls.setdefault(normalize_remote_url(repo_source.remote_url), []).append(repo_source.remote_url)
+    if not urls:
+        return {}
+    if pool_dir is None:
+        pool_dir = get_mirror_pool_directory()
+    ui_functions.print_info_msg(humble.MIRROR_POOL_UPDATE.format(len(urls)), header=False)
+    reference_path_map = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(urls)))) as executor:
+        results = {key: executor.submit(update_mirror, remote_urls[0], pool_dir) for key, remote_urls in urls.items()}
+        for key, future in results.items():
+            mirror_path = future.result()
+            if mirror_path is not None:
+                for remote_url in urls[key]:
+                    reference_path_map[remote_url.lower()] = mirror_path
+    return reference_path_map
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+#
+## @file
+# prefetch_service.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Fetches the repositories of registered workspaces in the background.
+
+The remote branches each repository fetches are fetched into the hidden refs/prefetch namespace. Local branches,
+remote-tracking branches and working trees are never modified, but the objects downloaded by the prefetch are already
+present when edkrepo sync fetches, so sync only transfers what changed since the last prefetch.
+
+The registered workspaces and the process ID of the background service are stored in the edkrepo global data
+directory.
+'''
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from git import Repo
+from git.exc import GitError
+
+import edkrepo.common.humble as humble
+from edkrepo.common.json_utilities import write_json_file
+from edkrepo.common.process_utilities import is_process_running
+import edkrepo.common.ui_functions as ui_functions
+import edkrepo.common.workspace_maintenance.deferred_repos_maintenance as deferred_repos_maintenance
+import edkrepo.common.workspace_maintenance.fetch_refspec_maintenance as fetch_refspec_maintenance
+from edkrepo.config.config_factory import get_edkrepo_global_data_directory
+from edkrepo_manifest_parser.edk_manifest import ManifestXml
+
+PREFETCH_WORKSPACES_FILE = 'prefetch_workspaces.json'
+PREFETCH_PID_FILE = 'prefetch.pid'
+PREFETCH_LOG_FILE = 'prefetch.log'
+PREFETCH_REF_PREFIX = 'refs/prefetch/'
+DEFAULT_INTERVAL_MINUTES = 60
+DEFAULT_PREFETCH_JOBS = 4
+
+def _get_data_file(file_name):
+    return os.path.join(get_edkrepo_global_data_directory(), file_name)
+
+def _normalize_workspace_path(workspace_path):
+    return os.path.normpath(os.path.abspath(workspace_path))
+
+def _is_workspace(workspace_path):
+    return os.path.isfile(os.path.join(workspace_path, 'repo', 'Manifest.xml'))
+
+def _run_git(cmd):
+    return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+
+def get_registered_workspaces():
+    '''Returns the list of workspaces registered for prefetching.'''
+    registry_path = _get_data_file(PREFETCH_WORKSPACES_FILE)
+    if not os.path.isfile(registry_path):
+        return []
+    with open(registry_path, 'r') as registry_file:
+        return json.load(registry_file).get('workspaces', [])
+
+def _write_registered_workspaces(workspaces):
+    # The background service may read the registry at any time
+    write_json_file(_get_data_file(PREFETCH_WORKSPACES_FILE), {'workspaces': workspaces})
+
+def register_workspace(workspace_path):
+    '''Adds workspace_path to the registered workspaces. Returns False if it was already registered.'''
+    workspace_path = _normalize_workspace_path(workspace_path)
+    workspaces = get_registered_workspaces()
+    if workspace_path in workspaces:
+        return False
+    workspaces.append(workspace_path)
+    _write_registered_workspaces(workspaces)
+    return True
+
+def unregister_workspace(workspace_path):
+    '''Removes workspace_path from the registered workspaces. Returns False if it was not registered.'''
+    workspace_path = _normalize_workspace_path(workspace_path)
+    workspaces = get_registered_workspaces()
+    if workspace_path not in workspaces:
+        return False
+    workspaces.remove(workspace_path)
+    _write_registered_workspaces(workspaces)
+    return True
+
+def get_prefetch_refspecs(repo, remote_name='origin'):
+    '''Returns the refspecs that fetch the branches remote_name is configured to fetch into refs/prefetch instead of
+    their remote-tracking refs. A repository that only fetches the branches the manifest uses only prefetches those
+    branches, one that fetches every branch prefetches every branch.'''
+    prefetch_refspecs = []
+    for refspec in fetch_refspec_maintenance.get_fetch_refspecs(repo, remote_name):
+        source, _, destination = refspec.lstrip('+').partition(':')
+        if source.startswith('refs/heads/') and destination.startswith('refs/'):
+            prefetch_refspecs.append('+{}:{}{}'.format(source, PREFETCH_REF_PREFIX, destination[len('refs/'):]))
+    return prefetch_refspecs
+
+def _remove_stale_prefetch_refs(repo, refspecs):
+    '''Deletes the prefetched refs that none of refspecs fetch into, such as the branches of a remote that was
+    prefetched before its fetches were scoped.'''
+    stale_refs = [ref for ref in repo.git.for_each_ref('--format=%(refname)', PREFETCH_REF_PREFIX).splitlines()
+                  if not fetch_refspec_maintenance.is_fetched(ref, refspecs)]
+    if stale_refs:
+        commands = ''.join('delete {}\n'.format(ref) for ref in stale_refs)
+        subprocess.run(['git', 'update-ref', '--stdin'], cwd=repo.working_dir, input=commands,
+                       universal_newlines=True, check=True)
+
+def prefetch_repo(repo_path, remote_name='origin'):
+    '''Fetches the branches remote_name is configured to fetch into refs/prefetch, see get_prefetch_refspecs.
+
+    The empty --refmap keeps git from also updating the configured remote-tracking branches, so the repository looks
+    unchanged to the user. Returns None on success or the output of git if the fetch failed.
+    '''
+    try:
+        repo = Repo(repo_path)
+        refspecs = get_prefetch_refspecs(repo, remote_name)
+        _remove_stale_prefetch_refs(repo, refspecs)
+    except (GitError, subprocess.CalledProcessError) as e:
+        return str(e)
+    if not refspecs:
+        return None
+    result = _run_git(['git', '-C', repo_path, 'fetch', remote_name, '--quiet', '--prune', '--no-tags',
+                       '--no-write-fetch-head', '--recurse-submodules=no', '--refmap='] + refspecs)
+    if result.returncode != 0:
+        return result.stdout
+    return None
+
+def get_workspace_repo_paths(workspace_path):
+    '''Returns the paths to the repositories of the current combination that are present in workspace_path.'''
+    manifest = ManifestXml(os.path.join(workspace_path, 'repo', 'Manifest.xml'))
+    repo_sources = manifest.get_repo_sources(manifest.general_config.current_combo)
+    repo_sources = deferred_repos_maintenance.filter_materialized(workspace_path, repo_sources)
+    return [(os.path.join(workspace_path, x.root), x.remote_name) for x in repo_sources]
+
+def get_manifest_repo_paths(config):
+    '''Returns the paths to the global manifest repositories listed in the edkrepo configuration files.'''
+    repo_paths = []
+    for cfg_file in (config['cfg_file'], config['user_cfg_file']):
+        for manifest_repo in cfg_file.manifest_repo_list:
+            repo_path = cfg_file.manifest_repo_abs_path(manifest_repo)
+            if os.path.isdir(repo_path) and (repo_path, 'origin') not in repo_paths:
+                repo_paths.append((repo_path, 'origin'))
+    return repo_paths
+
+def prefetch_repos(repo_paths, jobs=DEFAULT_PREFETCH_JOBS):
+    '''Prefetches each (repository path, remote name) pair in repo_paths, up to jobs at a time.
+
+    Returns a list of (repository path, error) tuples for the repositories that could not be fetched.
+    '''
+    if not repo_paths:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(repo_paths)))) as executor:
+        results = [(path, executor.submit(prefetch_repo, path, remote)) for path, remote in repo_paths]
+        errors = []
+        for path, future in results:
+            error = future.result()
+            if error is not None:
+                errors.append((path, error))
+        return errors
+
+def prefetch_all(config, jobs=DEFAULT_PREFETCH_JOBS):
+    '''Prefetches the global manifest repositories and the repositories of every registered workspace.'''
+    repo_paths = get_manifest_repo_paths(config)
+    for workspace_path in get_registered_workspaces():
+        if not _is_workspace(workspace_path):
+            ui_functions.print_warning_msg(humble.PREFETCH_WORKSPACE_MISSING.format(workspace_path), header=False)
+            continue
+        try:
+            repo_paths.extend(get_workspace_repo_paths(workspace_path))
+        except Exception as e:
+            ui_functions.print_warning_msg(humble.PREFETCH_WORKSPACE_FAILED.format(workspace_path, e), header=False)
+    for repo_path, error in prefetch_repos(repo_paths, jobs):
+        ui_functions.print_warning_msg(humble.PREFETCH_FAILED.format(repo_path, error), header=False)
+    return len(repo_paths)
+
+def run_prefetch_loop(config, jobs=DEFAULT_PREFETCH_JOBS, interval=DEFAULT_INTERVAL_MINUTES):
+    '''Prefetches all registered workspaces every interval minutes until the process is stopped.'''
+    pid_path = _get_data_file(PREFETCH_PID_FILE)
+    with open(pid_path, 'w') as pid_file:
+        pid_file.write(str(os.getpid()))
+    try:
+        while True:
+            prefetch_all(config, jobs)
+            time.sleep(interval * 60)
+    finally:
+        if _read_pid() == os.getpid():
+            os.remove(pid_path)
+
+def _read_pid():
+    try:
+        with open(_get_data_file(PREFETCH_PID_FILE), 'r') as pid_file:
+            return int(pid_file.read().strip())
+    except (OSError, ValueError):
+        return None
+
+def get_service_pid():
+    '''Returns the process ID of the background prefetch service or None if it is not running.'''
+    pid = _read_pid()
+    if pid is None or not is_process_running(pid):
+        return None
+    return pid
+
+def start_service(jobs=DEFAULT_PREFETCH_JOBS, interval=DEFAULT_INTERVAL_MINUTES):
+    '''Starts the background prefetch service in a process detached from the console. Returns its process ID.'''
+    cmd = [sys.executable, '-m', 'edkrepo', 'prefetch', 'run', '--loop', '--jobs', str(jobs),
+           '--interval', str(interval)]
+    kwargs = {}
+    if sys.platform == 'win32':
+        kwargs['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs['start_new_session'] = True
+    with open(_get_data_file(PREFETCH_LOG_FILE), 'a') as log_file:
+        process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=log_file, stderr=subprocess.STDOUT,
+                                   close_fds=True, **kwargs)
+    return process.pid
+
+def stop_service():
+    '''Stops the background prefetch service. Returns False if it was not running.'''
+    pid = get_service_pid()
+    if pid is None:
+        return False
+    os.kill(pid, signal.SIGTERM)
+    try:
+        os.remove(_get_data_file(PREFETCH_PID_FILE))
+    except OSError:
+        pass
+    return True
@@ -3,17 +3,231 @@
 ## @file
 # progress_handler.py
 #
-# Copyright (c) 2017- 2019, Intel Corporation. All rights reserved.<BR>
+# Copyright (c) 2017- 2026, Intel Corporation. All rights reserved.<BR>
 # SPDX-License-Identifier: BSD-2-Clause-Patent
 #
 
+import collections
+import contextlib
+import shutil
+import sys
+import threading
+import time
+
 from git import RemoteProgress
 
+CLEAR_LINE = '\x1b[K'
+CURSOR_UP = '\x1b[{}A'
+DEFAULT_REFRESH_RATE = 10
+DEFAULT_SUMMARY_INTERVAL = 15.0
+MAX_OUTPUT_LINES = 20
+
+STATE_PENDING = 'pending'
+STATE_RUNNING = 'running'
+STATE_DONE = 'done'
+STATE_FAILED = 'failed'
+
 class GitProgressHandler(RemoteProgress):
-    def __init__(self):
+    def __init__(self, refresh_rate=DEFAULT_REFRESH_RATE):
         super().__init__()
         self.__max_line_len = 0
+        self.__min_interval = 1.0 / refresh_rate
+        self.__last_update = 0.0
 
-    def update(self, *args):
+    def update(self, op_code, *args):
+        # Only redraw the line at the refresh rate, but always show the final update of each stage
+        now = time.monotonic()
+        if not op_code & RemoteProgress.END and now - self.__last_update < self.__min_interval:
+            return
+        self.__last_update = now
         self.__max_line_len = max(self.__max_line_len, len(self._cur_line))
         print(self._cur_line.ljust(self.__max_line_len), end="\r")
+
+class RepoProgressHandler(RemoteProgress):
+    '''Forwards the progress of a single GitPython remote operation to a MultiProgressRenderer.'''
+    def __init__(self, renderer, key):
+        super().__init__()
+        self.__renderer = renderer
+        self.__key = key
+
+    def update(self, *args):
+        self.__renderer.update(self.__key, self._cur_line)
+
+class MultiProgressRenderer(object):
+    '''Tracks the progress of many concurrent git operations.
+
+    When the output stream is a terminal a status block containing one line per operation is redrawn in place, no
+    more than refresh_rate times per second. Otherwise a single summary line is written every summary_interval
+    seconds so that logs stay readable.
+    '''
+    def __init__(self, stream=None, refresh_rate=DEFAULT_REFRESH_RATE, summary_interval=DEFAULT_SUMMARY_INTERVAL):
+        self._stream = stream if stream is not None else sys.stdout
+        try:
+            self._is_tty = self._stream.isatty()
+        except (AttributeError, ValueError):
+            self._is_tty = False
+        self._min_interval = 1.0 / refresh_rate
+        self._summary_interval = summary_interval
+        self._lock = threading.RLock()
+        self._entries = collections.OrderedDict()
+        self._lines_drawn = 0
+        self._last_draw = 0.0
+        self._start_time = time.monotonic()
+        self._last_summary = self._start_time
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def is_tty(self):
+        return self._is_tty
+
+    def add(self, key, operation):
+        '''Registers an operation that will be started later.'''
+        with self._lock:
+            self._entries[key] = _ProgressEntry(operation, STATE_PENDING, '')
+
+    def start(self, key, operation):
+        with self._lock:
+            self._entries[key] = _ProgressEntry(operation, STATE_RUNNING, '')
+            self._refresh(force=True)
+
+    def update(self, key, status):
+        status = status.strip()
+        if not status:
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            self._entries[key] = entry._replace(state=STATE_RUNNING, status=status)
+            self._refresh()
+
+    def finish(self, key, success=True, status=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            if status is None:
+                status = 'done' if success else 'failed'
+            self._entries[key] = entry._replace(state=STATE_DONE if success else STATE_FAILED, status=status)
+            self._refresh(force=True)
+
+    def message(self, text):
+        '''Writes a line of output without corrupting the status block.'''
+        with self._lock:
+            self._clear_block()
+            self._stream.write('{}\n'.format(text))
+            self._refresh(force=True)
+
+    @contextlib.contextmanager
+    def redirect_stdout(self):
+        '''Writes everything printed to sys.stdout while the block is active through message(), so that output from
+        any thread, such as warnings or hook installation messages, does not corrupt the status block.'''
+        output = _RendererOutput(self)
+        with contextlib.redirect_stdout(output):
+            try:
+                yield
+            finally:
+                output.close()
+
+    def stream_output(self, key, pipe):
+        '''Reads git progress output from pipe until EOF, forwarding each update to the operation identified by key.
+
+        Returns the last lines of output so that they can be included in an error message.
+        '''
+        output = collections.deque(maxlen=MAX_OUTPUT_LINES)
+        for line in pipe:
+            line = line.rstrip()
+            if line:
+                output.append(line)
+                self.update(key, line)
+        return '\n'.join(output)
+
+    def close(self):
+        with self._lock:
+            if self._is_tty:
+                self._refresh(force=True)
+            elif self._entries:
+                self._write_summary()
+
+    def _refresh(self, force=False):
+        now = time.monotonic()
+        if self._is_tty:
+            if force or now - self._last_draw >= self._min_interval:
+                self._draw_block()
+                self._last_draw = now
+        elif now - self._last_summary >= self._summary_interval:
+            self._write_summary()
+            self._last_summary = now
+
+    def _clear_block(self):
+        if self._is_tty and self._lines_drawn:
+            self._stream.write(CURSOR_UP.format(self._lines_drawn))
+            for _ in range(self._lines_drawn):
+                self._stream.write('{}\n'.format(CLEAR_LINE))
+            self._stream.write(CURSOR_UP.format(self._lines_drawn))
+            self._lines_drawn = 0
+
+    def _draw_block(self):
+        if not self._entries:
+            return
+        width = max(shutil.get_terminal_size().columns - 1, 20)
+        key_width = max(len(str(key)) for key in self._entries)
+        if self._lines_drawn:
+            self._stream.write(CURSOR_UP.format(self._lines_drawn))
+        for key, entry in self._entries.items():
+            line = '{}  {}: {}'.format(str(key).ljust(key_width), entry.operation, entry.status or entry.state)
+            self._stream.write('{}{}\n'.format(line[:width], CLEAR_LINE))
+        self._lines_drawn = len(self._entries)
+        self._stream.flush()
+
+    def _write_summary(self):
+        counts = collections.Counter(entry.state for entry in self._entries.values())
+        running = ['{} ({})'.format(key, entry.status) if entry.status else str(key)
+                   for key, entry in self._entries.items() if entry.state == STATE_RUNNING]
+        summary = '[{:.0f}s] {} of {} complete'.format(time.monotonic() - self._start_time,
+                                                      counts[STATE_DONE] + counts[STATE_FAILED],
+                                                      len(self._entries))
+        if counts[STATE_FAILED]:
+            summary = '{}, {} failed'.format(summary, counts[STATE_FAILED])
+        if running:
+            summary = '{}; in progress: {}'.format(summary, ', '.join(running))
+        self._stream.write('{}\n'.format(summary))
+        self._stream.flush()
+
+def redirect_stdout(renderer):
+    '''Returns renderer.redirect_stdout(), or a context manager that does nothing if renderer is None.'''
+    return renderer.redirect_stdout() if renderer is not None else contextlib.nullcontext()
+
+class _RendererOutput(object):
+    '''A file like object that forwards each complete line written to it to MultiProgressRenderer.message().'''
+    def __init__(self, renderer):
+        self._renderer = renderer
+        self._buffer = ''
+
+    def write(self, text):
+        with self._renderer._lock:
+            self._buffer += text
+            while '\n' in self._buffer:
+                line, self._buffer = self._buffer.split('\n', 1)
+                self._renderer.message(line)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return self._renderer.is_tty
+
+    def close(self):
+        '''Writes any partial line that is left.'''
+        with self._renderer._lock:
+            if self._buffer:
+                self._renderer.message(self._buffer)
+                self._buffer = ''
+
+_ProgressEntry = collections.namedtuple('_ProgressEntry', ['operation', 'state', 'status'])
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+#
+## @file
+# ref_health.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Checks the refs of a repository before a fetch and repairs the problems that would make the fetch fail.
+
+The checks only read the refs directory and packed-refs, so they cost far less than a fetch that fails and has to be
+repaired and repeated. The global manifest repositories are only scanned if a case conflict is actually found.
+'''
+
+import os
+import re
+from collections import namedtuple
+
+import edkrepo.common.humble as humble
+import edkrepo.common.repo_case_conflict_solver as repo_case_conflict_solver
+import edkrepo.common.ui_functions as ui_functions
+
+# Above this many loose refs every ref update has to check a large directory tree, so the refs are packed
+LOOSE_REF_LIMIT = 1000
+OBJECT_ID_PATTERN = re.compile('^[0-9a-f]{40}([0-9a-f]{24})?$')
+
+RefHealth = namedtuple('RefHealth', ['loose_ref_count', 'broken_refs', 'case_conflicts', 'stale_reflogs'])
+
+def _is_broken_ref(ref_path):
+    try:
+        with open(ref_path, 'r') as ref_file:
+            content = ref_file.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return True
+    # Interrupted writes leave empty or truncated files that git refuses to resolve
+    return not (OBJECT_ID_PATTERN.match(content) or content.startswith('ref: '))
+
+def _scan_loose_refs(git_dir):
+    '''Returns the number of loose refs and the list of remote refs whose files cannot be resolved.'''
+    refs_dir = os.path.join(git_dir, 'refs')
+    loose_ref_count = 0
+    broken_refs = []
+    for root, _, files in os.walk(refs_dir):
+        for file_name in files:
+            if file_name.endswith('.lock'):
+                continue
+            loose_ref_count += 1
+            ref_path = os.path.join(root, file_name)
+            ref_name = 'refs/' + os.path.relpath(ref_path, refs_dir).replace(os.sep, '/')
+            if ref_name.startswith('refs/remotes/') and _is_broken_ref(ref_path):
+                broken_refs.append(ref_name)
+    return loose_ref_count, sorted(broken_refs)
+
+def check_ref_health(repo, case_insensitive=False):
+    '''Returns a RefHealth tuple describing the refs of repo.
+
+    Arguments:
+    repo - the GitPython Repo object to check
+    case_insensitive - when True, also check for refs that conflict on a case-insensitive filesystem
+    '''
+    loose_ref_count, broken_refs = _scan_loose_refs(repo.common_dir)
+    case_conflicts = False
+    stale_reflogs = []
+    if case_insensitive:
+        remote_refs = repo_case_conflict_solver.get_remote_refs(repo)
+        case_conflicts = repo_case_conflict_solver.has_case_conflicts(remote_refs)
+        stale_reflogs = repo_case_conflict_solver.find_stale_remote_reflogs(repo, remote_refs)
+    return RefHealth(loose_ref_count, broken_refs, case_conflicts, stale_reflogs)
+
+def repair_ref_health(repo, health):
+    '''Repairs the problems listed in health. Broken remote refs are deleted since the fetch recreates them.
+
+    Arguments:
+    repo - the GitPython Repo object to repair
+    health - the RefHealth tuple returned by check_ref_health()
+    '''
+    if health.broken_refs:
+        ui_functions.print_info_msg(humble.REF_HEALTH_BROKEN_REFS.format(len(health.broken_refs)), header=False)
+        for ref_name in health.broken_refs:
+            os.remove(os.path.join(repo.common_dir, ref_name.replace('/', os.sep)))
+    if health.case_conflicts:
+        repo_case_conflict_solver.scrub_repo_case_conflicts(repo)
+    if health.stale_reflogs:
+        repo_case_conflict_solver.scrub_stale_remote_reflogs(repo)
+    if health.loose_ref_count > LOOSE_REF_LIMIT or health.case_conflicts:
+        # Packing also consolidates refs stored both loose and packed, which makes fetch fail with
+        # "incorrect old value provided"
+        ui_functions.print_info_msg(humble.REF_HEALTH_PACK_REFS.format(health.loose_ref_count), header=False)
+        repo.git.pack_refs('--all')
+
+def preflight_ref_health(repo, case_insensitive=False):
+    '''Checks the refs of repo and repairs any problems found before it is fetched. Returns the RefHealth tuple.'''
+    health = check_ref_health(repo, case_insensitive)
+    repair_ref_health(repo, health)
+    return health
@@ -363,6 +363,76 @@ def _scrub_packed_refs(git_dir, refs_to_delete):
 
     return frozenset(deleted_refs)
 
+def get_remote_refs(repo):
+    """
+    Get the names of all remote refs of a git repository, both loose and packed.
+
+    Args:
+        repo: GitPython Repo object
+
+    Returns:
+        Sorted list of ref names (e.g. ``refs/remotes/origin/main``)
+    """
+    git_dir = repo.common_dir
+    return sorted(set(_get_local_remote_refs(git_dir) + _get_packed_remote_refs(git_dir)))
+
+def has_case_conflicts(remote_refs):
+    """
+    Check whether any two remote refs, or any two directories containing
+    them, differ only by case.
+
+    Unlike scrub_repo_case_conflicts() this does not scan the global manifest
+    repositories, so it is cheap enough to run before every fetch.
+
+    Args:
+        remote_refs: List of ref names as returned by get_remote_refs()
+
+    Returns:
+        True if a case conflict exists
+    """
+    seen = {}
+    for ref in remote_refs:
+        components = ref.split('/')
+        for index in range(1, len(components) + 1):
+            path = '/'.join(components[:index])
+            folded = unicodedata.normalize("NFKD", path.casefold())
+            if seen.setdefault(folded, path) != path:
+                return True
+    return False
+
+def find_stale_remote_reflogs(repo, remote_refs=None):
+    """
+    Find reflog files under .git/logs/refs/remotes/ that have no corresponding
+    live ref in .git/refs/remotes/ or packed-refs.
+
+    Args:
+        repo:        GitPython Repo object
+        remote_refs: Optional list of ref names as returned by get_remote_refs()
+
+    Returns:
+        List of paths to stale reflog files
+    """
+    logs_remotes_dir = os.path.join(repo.common_dir, 'logs', 'refs', 'remotes')
+    if not os.path.exists(logs_remotes_dir):
+        return []
+    if remote_refs is None:
+        remote_refs = get_remote_refs(repo)
+
+    # Build a lower-cased set of live ref paths relative to refs/remotes/ so
+    # that comparison is case-insensitive on case-insensitive filesystems.
+    live_refs = set()
+    for ref in remote_refs:
+        if ref.startswith('refs/remotes/'):
+            live_refs.add(ref[len('refs/remotes/'):].replace('/', os.sep).lower())
+
+    stale_reflogs = []
+    for root, _, files in os.walk(logs_remotes_dir):
+        for filename in files:
+            log_file = os.path.join(root, filename)
+            if os.path.relpath(log_file, logs_remotes_dir).lower() not in live_refs:
+                stale_reflogs.append(log_file)
+    return stale_reflogs
+
 def scrub_repo_case_conflicts(repo, verbose=False):
     """
     Scrub case-conflicting remote refs from a git repository.
@@ -381,12 +451,10 @@ def scrub_repo_case_conflicts(repo, verbose=False):
     """
     ui_functions.print_info_msg(CASE_CONFLICT_SCRUB, header=False)
 
-    git_dir = repo.git_dir
+    git_dir = repo.common_dir
 
     # Get all remote refs from both filesystem and packed-refs
-    filesystem_refs = _get_local_remote_refs(git_dir)
-    packed_refs = _get_packed_remote_refs(git_dir)
-    all_refs = sorted(set(filesystem_refs + packed_refs))
+    all_refs = get_remote_refs(repo)
 
     # Strip 'refs/remotes/' prefix for conflict checking
     ref_names_only = []
@@ -444,33 +512,21 @@ def scrub_stale_remote_reflogs(repo, verbose=False):
     """
     ui_functions.print_info_msg(STALE_REFLOG_SCRUB, header=False)
 
-    git_dir = repo.git_dir
-    logs_remotes_dir = os.path.join(git_dir, 'logs', 'refs', 'remotes')
+    logs_remotes_dir = os.path.join(repo.common_dir, 'logs', 'refs', 'remotes')
     if not os.path.exists(logs_remotes_dir):
         return 0
 
-    # Build a lower-cased set of live ref paths relative to refs/remotes/ so
-    # that comparison is case-insensitive on case-insensitive filesystems.
-    all_refs = sorted(_get_local_remote_refs(git_dir) + _get_packed_remote_refs(git_dir))
-    live_refs = set()
-    for ref in all_refs:
-        if ref.startswith('refs/remotes/'):
-            live_refs.add(ref[len('refs/remotes/'):].replace('/', os.sep).lower())
-
     deleted = 0
+    for log_file in find_stale_remote_reflogs(repo):
+        try:
+            os.remove(log_file)
+            deleted += 1
+            if verbose:
+                ui_functions.print_info_msg(STALE_REFLOG_DELETING_FILE.format(log_file), header=False)
+        except OSError:
+            pass
     # Walk bottom-up so directories can be pruned after their files are removed.
-    for root, dirs, files in os.walk(logs_remotes_dir, topdown=False):
-        for filename in files:
-            log_file = os.path.join(root, filename)
-            rel_path = os.path.relpath(log_file, logs_remotes_dir).lower()
-            if rel_path not in live_refs:
-                try:
-                    os.remove(log_file)
-                    deleted += 1
-                    if verbose:
-                        ui_functions.print_info_msg(STALE_REFLOG_DELETING_FILE.format(log_file), header=False)
-                except OSError:
-                    pass
+    for root, dirs, _ in os.walk(logs_remotes_dir, topdown=False):
         for dirname in dirs:
             dir_path = os.path.join(root, dirname)
             try:
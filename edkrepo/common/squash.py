@@ -12,12 +12,13 @@ import sys
 from subprocess import run
 
 from edkrepo.common.edkrepo_exception import EdkrepoInvalidParametersException, EdkrepoWorkspaceInvalidException
+from edkrepo.common.git_object_query import get_object_query
 from edkrepo.common.humble import COMMIT_NOT_FOUND, NOT_GIT_REPO, SQUASH_COMMON_ANCESTOR_REQUIRED
 
 def get_git_repo_root():
     path = os.path.realpath(os.getcwd())
     while True:
-        if os.path.isdir(os.path.join(path, '.git')):
+        if os.path.exists(os.path.join(path, '.git')):
             return path
         if os.path.dirname(path) == path:
             break
@@ -63,11 +64,13 @@ def get_oldest_ancestor(commit1, commit2, repo):
 
 def commit_list_to_message(commit_list, one_line, repo):
     message_list = []
+    object_query = get_object_query(repo)
     for commit in commit_list:
+        message = object_query.read_commit(commit).message
         if one_line:
-            message_list.append('{}: {}'.format(commit, repo.commit(commit).message.split('\n')[0]))
+            message_list.append('{}: {}'.format(commit, message.split('\n')[0]))
         else:
-            for line in repo.commit(commit).message.split('\n'):
+            for line in message.split('\n'):
                 message_list.append(line)
     return '\n'.join(message_list)
 
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+#
+## @file
+# sync_journal.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Records the progress of edkrepo sync so that an interrupted sync can be resumed.
+
+The journal is written to the workspace's repo directory before sync modifies the workspace. A copy of the manifest the
+workspace was synced from is kept next to it, so a resumed sync still knows which repositories to move, clone or check
+out after repo/Manifest.xml has been replaced. Both files are removed once the sync has finished.
+
+The journal also records the combination and a hash of repo/Manifest.xml each time sync finishes changing them. A
+journal is only resumed while they still match, so a workspace that was changed after the interrupted sync is synced
+from scratch instead.
+'''
+
+import hashlib
+import os
+import shutil
+
+from edkrepo.common.workspace_journal import WorkspaceJournal, get_journal_path
+
+SYNC_JOURNAL_FILE = 'sync_journal.json'
+SYNC_JOURNAL_MANIFEST_FILE = 'sync_journal_manifest.xml'
+
+# Stages completed by each repository
+STAGE_ARCHIVED = 'archived'
+STAGE_FETCHED = 'fetched'
+STAGE_SYNCED = 'synced'
+
+# Stages completed once for the entire workspace, in order
+STAGE_MANIFEST_UPDATED = 'manifest_updated'
+STAGE_SUBMODULES = 'submodules'
+
+def get_sync_journal_path(workspace_path):
+    return get_journal_path(workspace_path, SYNC_JOURNAL_FILE)
+
+def sync_journal_exists(workspace_path):
+    '''Returns True if the workspace contains the journal of a sync that did not finish.'''
+    return os.path.isfile(get_sync_journal_path(workspace_path))
+
+def _hash_file(path):
+    with open(path, 'rb') as hashed_file:
+        return hashlib.sha256(hashed_file.read()).hexdigest()
+
+class SyncJournal(WorkspaceJournal):
+    '''Tracks the sync stages completed by the workspace and by each of its repositories.
+
+    The journal is also accepted by clone_repos, so repositories added by the updated manifest are not cloned twice.
+    '''
+    JOURNAL_FILE = SYNC_JOURNAL_FILE
+    OPTIONS_KEY = 'sync_options'
+
+    def __init__(self, workspace_path, sync_options=None):
+        '''Opens the journal of workspace_path, creating it if it does not exist.
+
+        When a new journal is created the current repo/Manifest.xml is saved as the initial manifest of the sync.
+
+        Arguments:
+        workspace_path - the path to the workspace being synced.
+        sync_options - a dictionary of the sync settings, stored when a new journal is created so that a resumed sync
+                       uses the same settings.
+        '''
+        self._manifest_path = get_journal_path(workspace_path, SYNC_JOURNAL_MANIFEST_FILE)
+        self._workspace_manifest_path = os.path.join(workspace_path, 'repo', 'Manifest.xml')
+        if not sync_journal_exists(workspace_path):
+            # Save the manifest before the journal exists so that a journal always has its manifest
+            shutil.copy(self._workspace_manifest_path, self._manifest_path)
+        super().__init__(workspace_path, sync_options)
+
+    @property
+    def sync_options(self):
+        return self.options
+
+    @property
+    def initial_manifest_path(self):
+        '''The path to the copy of the manifest the workspace was synced from.'''
+        return self._manifest_path
+
+    def record_workspace_state(self, combo):
+        '''Records combo and the current contents of repo/Manifest.xml as the state the workspace is expected to be in
+        when the sync is resumed. Must be called each time sync changes the manifest or the current combination.'''
+        with self._lock:
+            self._data['workspace_state'] = {'combo': combo,
+                                             'manifest_hash': _hash_file(self._workspace_manifest_path)}
+            self._write()
+
+    def is_stale(self, combo):
+        '''Returns True if the workspace is no longer in the state last recorded by record_workspace_state, meaning
+        combo is not the recorded combination or repo/Manifest.xml was changed after the sync was interrupted.'''
+        with self._lock:
+            state = self._data.get('workspace_state')
+        if state is None:
+            # The sync was interrupted before it recorded the state, nothing has been changed yet
+            return True
+        return state['combo'] != combo or state['manifest_hash'] != _hash_file(self._workspace_manifest_path)
+
+    def finish(self):
+        '''Removes the journal and the saved manifest once every stage of the sync has completed.'''
+        super().finish()
+        if os.path.isfile(self._manifest_path):
+            os.remove(self._manifest_path)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+#
+## @file
+# base_tests.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import subprocess
+
+from edkrepo_manifest_parser.edk_manifest import ManifestXml
+
+UNKNOWN_COMMIT = '0123456789abcdef0123456789abcdef01234567'
+
+MANIFEST_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<Manifest>
+  <ProjectInfo>
+    <CodeName>Test</CodeName>
+    <Description>Test</Description>
+    <DevLead>Test</DevLead>
+    <LeadReviewers><Reviewer>Test</Reviewer></LeadReviewers>
+    <Org>Test</Org>
+    <ShortName>Test</ShortName>
+  </ProjectInfo>
+  <GeneralConfig>
+    <DefaultCombo combination="main"/>
+    <CurrentClonedCombo combination="main"/>
+  </GeneralConfig>
+  <RemoteList>{remotes}</RemoteList>
+  <CombinationList>{combinations}</CombinationList>
+{extra}</Manifest>
+'''
+
+def run_git(cwd, *args):
+    '''Runs git in cwd with a test identity and returns its output without surrounding whitespace.'''
+    return subprocess.run(['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com'] + list(args),
+                          cwd=cwd, check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout.strip()
+
+def commit_files(repo_path, message, files=None):
+    '''Writes files, a dict mapping paths to contents, and commits them. Returns the SHA of the new commit.'''
+    for file_name, content in (files or {}).items():
+        file_path = os.path.join(repo_path, file_name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'w') as test_file:
+            test_file.write(content)
+        run_git(repo_path, 'add', file_name)
+    run_git(repo_path, 'commit', '-q', '--allow-empty', '-m', message)
+    return run_git(repo_path, 'rev-parse', 'HEAD')
+
+def init_repo(repo_path, files=None):
+    '''Creates a repository on main with a single commit of files. Returns the SHA of the commit.'''
+    os.makedirs(repo_path, exist_ok=True)
+    run_git(repo_path, 'init', '-q', '-b', 'main')
+    return commit_files(repo_path, 'initial', files)
+
+def add_branch(repo_path, branch, files=None):
+    '''Creates branch one commit ahead of main, committing files, and switches back to main. Returns the SHA of the
+    commit.'''
+    run_git(repo_path, 'checkout', '-q', '-b', branch, 'main')
+    sha = commit_files(repo_path, branch, files)
+    run_git(repo_path, 'checkout', '-q', 'main')
+    return sha
+
+def clone_remotes(tmp_path, workspace, roots, files=None, dev_files=None):
+    '''Creates a remote for each root with the branch main and a dev branch one commit ahead, then clones it into the
+    workspace. The remotes are named after the last folder of their root. Returns a dict mapping the remote names to
+    their URLs.'''
+    remotes = {}
+    for root in roots:
+        name = os.path.basename(root)
+        remote_path = str(tmp_path / 'remotes' / name)
+        init_repo(remote_path, files)
+        add_branch(remote_path, 'dev', dev_files)
+        run_git(workspace, 'clone', '-q', remote_path, root)
+        remotes[name] = (tmp_path / 'remotes' / name).as_posix()
+    return remotes
+
+def example_remotes(names):
+    '''Returns a dict mapping each remote name to an unreachable URL, for tests that never fetch.'''
+    return {x: 'https://example.com/{}.git'.format(x) for x in names}
+
+def source_elements(roots, branch='main'):
+    '''Returns a Source element on branch for each root, each using the remote named after the root.'''
+    return ''.join('<Source localRoot="{0}" remote="{0}" branch="{1}"/>'.format(x, branch) for x in roots)
+
+def write_manifest(workspace, remotes, combinations, extra=''):
+    '''Writes the manifest of the workspace and returns it parsed. remotes maps the remote names to their URLs,
+    combinations maps the combination names to their Source elements and extra is inserted after the combinations.'''
+    os.makedirs(os.path.join(workspace, 'repo'), exist_ok=True)
+    remote_list = ''.join('<Remote name="{}">{}</Remote>'.format(name, url) for name, url in remotes.items())
+    combination_list = ''.join('<Combination name="{0}" description="{0}">{1}</Combination>'.format(name, sources)
+                               for name, sources in combinations.items())
+    manifest_path = os.path.join(workspace, 'repo', 'Manifest.xml')
+    with open(manifest_path, 'w') as manifest_file:
+        manifest_file.write(MANIFEST_TEMPLATE.format(remotes=remote_list, combinations=combination_list, extra=extra))
+    return ManifestXml(manifest_path)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_bundle_utilities.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from git import Repo
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo.common.bundle_utilities import get_bundle_path, find_bundle, create_bundle, seed_from_bundle, delete_bundle_refs
+from edkrepo.common.edkrepo_exception import EdkrepoGitException
+import edkrepo.common.bundle_utilities as bundle_utilities
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+def _make_workspace_repo(tmp_path):
+    source = str(tmp_path / 'source')
+    bt.init_repo(source)
+    bt.run_git(source, 'tag', 'v1')
+    workspace_repo = str(tmp_path / 'workspace_repo')
+    bt.run_git(str(tmp_path), 'clone', '-q', source, workspace_repo)
+    return source, workspace_repo
+
+class TestBundlePaths:
+
+    def test_bundle_path_matches_equivalent_urls(self):
+        assert get_bundle_path('bundles', 'https://github.com/tianocore/edk2.git') == get_bundle_path('bundles', 'https://github.com/TianoCore/edk2')
+
+    def test_find_bundle(self, tmp_path):
+        url = 'https://github.com/tianocore/edk2.git'
+        assert find_bundle(str(tmp_path), url) is None
+        assert find_bundle(None, url) is None
+        open(get_bundle_path(str(tmp_path), url), 'w').close()
+        assert find_bundle(str(tmp_path), url) == get_bundle_path(str(tmp_path), url)
+
+class TestCreateBundle:
+
+    def test_remote_branches_bundled_as_heads(self, tmp_path):
+        source, workspace_repo = _make_workspace_repo(tmp_path)
+        bt.run_git(workspace_repo, 'checkout', '-q', '-b', 'local_only')
+        bundle_path = str(tmp_path / 'repo.bundle')
+        assert create_bundle(workspace_repo, bundle_path)
+        heads = bt.run_git(str(tmp_path), 'bundle', 'list-heads', bundle_path)
+        head_sha = bt.run_git(source, 'rev-parse', 'main')
+        assert '{} refs/heads/main'.format(head_sha) in heads
+        assert 'refs/tags/v1' in heads
+        assert 'local_only' not in heads
+        assert 'refs/remotes' not in heads
+        assert not os.path.exists(bundle_path + '.tmp')
+
+    def test_failed_bundle_removes_temporary_file(self, tmp_path):
+        _, workspace_repo = _make_workspace_repo(tmp_path)
+        bundle_path = str(tmp_path / 'repo.bundle')
+        run_git = bundle_utilities._run_git
+        def _fail_bundle_create(cmd, cwd=None, input_data=None):
+            if cmd[1] == 'bundle':
+                # Leave a partial file behind as an interrupted git bundle create would
+                open(cmd[4], 'w').close()
+                raise EdkrepoGitException('git bundle create failed')
+            return run_git(cmd, cwd, input_data)
+        with patch('edkrepo.common.bundle_utilities._run_git', side_effect=_fail_bundle_create):
+            with pytest.raises(EdkrepoGitException):
+                create_bundle(workspace_repo, bundle_path)
+        assert not os.path.exists(bundle_path + '.tmp')
+        assert not os.path.exists(bundle_path)
+
+    def test_no_refs(self, tmp_path):
+        repo_path = str(tmp_path / 'empty')
+        bt.run_git(str(tmp_path), 'init', '-q', repo_path)
+        assert not create_bundle(repo_path, str(tmp_path / 'repo.bundle'))
+        assert not os.path.exists(str(tmp_path / 'repo.bundle'))
+
+class TestSeedFromBundle:
+
+    def test_seed_from_bundle(self, tmp_path):
+        source, workspace_repo = _make_workspace_repo(tmp_path)
+        bundle_path = str(tmp_path / 'repo.bundle')
+        create_bundle(workspace_repo, bundle_path)
+        target = str(tmp_path / 'target')
+        bt.run_git(str(tmp_path), 'init', '-q', target)
+        seed_from_bundle(Repo(target), bundle_path)
+        assert bt.run_git(target, 'rev-parse', 'refs/bundles/main') == bt.run_git(source, 'rev-parse', 'main')
+
+    def test_delete_bundle_refs(self, tmp_path):
+        _, workspace_repo = _make_workspace_repo(tmp_path)
+        bundle_path = str(tmp_path / 'repo.bundle')
+        create_bundle(workspace_repo, bundle_path)
+        target = str(tmp_path / 'target')
+        bt.run_git(str(tmp_path), 'init', '-q', target)
+        seed_from_bundle(Repo(target), bundle_path)
+        delete_bundle_refs(Repo(target))
+        assert bt.run_git(target, 'for-each-ref', 'refs/bundles') == ''
+        # Nothing to delete is not an error
+        delete_bundle_refs(Repo(target))
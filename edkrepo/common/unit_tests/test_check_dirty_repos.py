@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_check_dirty_repos.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+
+import pytest
+from git import Repo
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo.common.common_repo_functions import check_dirty_repos, has_local_changes
+from edkrepo.common.edkrepo_exception import EdkrepoUncommitedChangesException
+from edkrepo.common.unit_test_bases import base_tests as bt
+from edkrepo.common.workspace_maintenance.status_cache_maintenance import enable_status_caches, status_caches_enabled
+
+ROOTS = ['a', 'b', 'c']
+
+def _make_workspace(tmp_path):
+    '''Creates a workspace with a clean repository for each root, each with one committed file.'''
+    workspace = str(tmp_path)
+    for root in ROOTS:
+        bt.init_repo(os.path.join(workspace, root), {'file.txt': 'initial\n'})
+    manifest = bt.write_manifest(workspace, bt.example_remotes(ROOTS), {'main': bt.source_elements(ROOTS)})
+    return workspace, manifest
+
+class TestCheckDirtyRepos:
+
+    def test_clean_workspace(self, tmp_path):
+        workspace, manifest = _make_workspace(tmp_path)
+        check_dirty_repos(manifest, workspace)
+        # Checking for changes leaves the repository config alone
+        assert not any(status_caches_enabled(Repo(os.path.join(workspace, x))) for x in ROOTS)
+
+    @pytest.mark.parametrize('change', ['modified', 'staged', 'untracked'])
+    def test_local_change(self, tmp_path, change):
+        workspace, _ = _make_workspace(tmp_path)
+        repo_path = os.path.join(workspace, 'b')
+        file_name = 'new.txt' if change == 'untracked' else 'file.txt'
+        with open(os.path.join(repo_path, file_name), 'w') as test_file:
+            test_file.write('changed\n')
+        if change == 'staged':
+            bt.run_git(repo_path, 'add', file_name)
+        assert has_local_changes(repo_path)
+        assert not has_local_changes(os.path.join(workspace, 'a'))
+
+    @pytest.mark.parametrize('jobs', [1, 3])
+    def test_first_dirty_repo_reported(self, tmp_path, jobs):
+        workspace, manifest = _make_workspace(tmp_path)
+        for root in ['b', 'c']:
+            with open(os.path.join(workspace, root, 'new.txt'), 'w') as test_file:
+                test_file.write('untracked\n')
+        with pytest.raises(EdkrepoUncommitedChangesException) as exception:
+            check_dirty_repos(manifest, workspace, jobs=jobs)
+        assert ' b repo' in str(exception.value)
+
+    def test_enable_status_caches(self, tmp_path):
+        workspace, _ = _make_workspace(tmp_path)
+        repo = Repo(os.path.join(workspace, 'a'))
+        assert enable_status_caches(repo)
+        assert repo.git.config('--get', 'core.untrackedCache') == 'true'
+        assert repo.git.config('--get', 'core.splitIndex') == 'true'
+        assert os.path.isfile(os.path.join(repo.working_dir, repo.git.rev_parse('--shared-index-path')))
+        assert not enable_status_caches(repo)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_checkout_planner.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo_manifest_parser.edk_manifest import RepoSource, SparseData, SparseSettings, SubmoduleInitPath
+from edkrepo.common.checkout_planner import CheckoutPlan
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+def _source(root, branch='main', commit=None, enable_submodule=False, sparse=False):
+    return RepoSource(root, root, 'https://example.com/{}.git'.format(root), branch, commit, sparse,
+                      enable_submodule, None, None, None, False, False)
+
+class _Manifest():
+    """Minimal stand-in for ManifestXml providing the members used by CheckoutPlan."""
+    def __init__(self, combos, submodules=None, sparse_data=None, sparse_settings=None):
+        self._combos = combos
+        self.repo_hooks = []
+        self._submodules = submodules or []
+        self.sparse_data = sparse_data or []
+        self.sparse_settings = sparse_settings
+
+    def get_repo_sources(self, combo_name):
+        return list(self._combos[combo_name])
+
+    def get_submodule_init_paths(self, remote_name=None, combo=None):
+        return [x for x in self._submodules if (remote_name is None or x.remote_name == remote_name) and
+                (x.combo == combo or x.combo is None)]
+
+def _make_workspace(tmp_path, roots):
+    '''Creates a repository for each root with the branches main and release on the same commit and the branch dev
+    on a later commit.'''
+    workspace = str(tmp_path)
+    os.makedirs(os.path.join(workspace, 'repo'))
+    for root in roots:
+        repo_path = os.path.join(workspace, root)
+        bt.init_repo(repo_path)
+        bt.run_git(repo_path, 'branch', 'release')
+        bt.add_branch(repo_path, 'dev')
+    return workspace
+
+class TestCheckoutPlan:
+
+    def test_identical_combos(self, tmp_path):
+        workspace = _make_workspace(tmp_path, ['a', 'b'])
+        manifest = _Manifest({'main': [_source('a'), _source('b')], 'copy': [_source('a'), _source('b')]})
+        plan = CheckoutPlan(workspace, manifest, 'main', 'copy')
+        assert plan.checkout_sources == []
+        assert plan.submodule_update_sources == []
+        assert plan.sparse_sources == []
+        assert plan.unchanged_sources == [_source('a'), _source('b')]
+
+    def test_one_branch_changed(self, tmp_path):
+        workspace = _make_workspace(tmp_path, ['a', 'b'])
+        manifest = _Manifest({'main': [_source('a', enable_submodule=True), _source('b', enable_submodule=True)],
+                              'dev': [_source('a', enable_submodule=True), _source('b', 'dev', enable_submodule=True)]})
+        plan = CheckoutPlan(workspace, manifest, 'main', 'dev')
+        assert plan.checkout_sources == [_source('b', 'dev', enable_submodule=True)]
+        assert plan.submodule_deinit_sources == [_source('b', enable_submodule=True)]
+        assert plan.submodule_update_sources == [_source('b', 'dev', enable_submodule=True)]
+        assert plan.unchanged_sources == [_source('a', enable_submodule=True)]
+
+    def test_branch_on_same_commit(self, tmp_path):
+        workspace = _make_workspace(tmp_path, ['a'])
+        manifest = _Manifest({'main': [_source('a', enable_submodule=True)],
+                              'release': [_source('a', 'release', enable_submodule=True)]})
+        plan = CheckoutPlan(workspace, manifest, 'main', 'release')
+        assert plan.checkout_sources == [_source('a', 'release', enable_submodule=True)]
+        assert plan.submodule_update_sources == []
+
+    def test_repo_not_on_combo_branch(self, tmp_path):
+        workspace = _make_workspace(tmp_path, ['a'])
+        bt.run_git(os.path.join(workspace, 'a'), 'checkout', '-q', 'dev')
+        manifest = _Manifest({'main': [_source('a')]})
+        plan = CheckoutPlan(workspace, manifest, 'main', 'main')
+        assert plan.checkout_sources == [_source('a')]
+
+    def test_submodule_and_sparse_changes(self, tmp_path):
+        workspace = _make_workspace(tmp_path, ['a', 'b'])
+        combos = {'main': [_source('a', enable_submodule=True), _source('b', sparse=True)],
+                  'dev': [_source('a', enable_submodule=True), _source('b', sparse=True)]}
+        manifest = _Manifest(combos, submodules=[SubmoduleInitPath('a', 'dev', False, 'lib')],
+                             sparse_data=[SparseData('dev', 'b', ['src'], [])], sparse_settings=SparseSettings(False))
+        plan = CheckoutPlan(workspace, manifest, 'main', 'dev')
+        assert plan.checkout_sources == []
+        assert plan.submodule_update_sources == [_source('a', enable_submodule=True)]
+        assert plan.sparse_reset_sources == [_source('b', sparse=True)]
+        assert plan.sparse_sources == [_source('b', sparse=True)]
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_checkout_repos.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+
+import git
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo.common.common_repo_functions import checkout_repos
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+ROOTS = ['a', 'b', 'c']
+
+def _make_workspace(tmp_path, dev_sources):
+    '''Creates a workspace whose repositories are on main, with a dev branch one commit ahead on each remote.'''
+    workspace = str(tmp_path / 'workspace')
+    os.makedirs(workspace)
+    remotes = bt.clone_remotes(tmp_path, workspace, ROOTS)
+    manifest = bt.write_manifest(workspace, remotes, {'main': bt.source_elements(ROOTS), 'dev': dev_sources})
+    return workspace, manifest
+
+def _heads(workspace):
+    return [bt.run_git(os.path.join(workspace, x), 'rev-parse', '--abbrev-ref', 'HEAD') for x in ROOTS]
+
+class TestCheckoutRepos:
+
+    def test_parallel_checkout(self, tmp_path):
+        workspace, manifest = _make_workspace(tmp_path, bt.source_elements(ROOTS, 'dev'))
+        checkout_repos(False, False, manifest.get_repo_sources('dev'), workspace, manifest, None, jobs=3)
+        assert _heads(workspace) == ['dev', 'dev', 'dev']
+
+    @pytest.mark.parametrize('jobs', [1, 3])
+    def test_failure_rolls_back(self, tmp_path, jobs):
+        dev = ('<Source localRoot="a" remote="a" branch="dev"/>'
+               '<Source localRoot="b" remote="b" commit="{}"/>'
+               '<Source localRoot="c" remote="c" branch="dev"/>').format(bt.UNKNOWN_COMMIT)
+        workspace, manifest = _make_workspace(tmp_path, dev)
+        with pytest.raises(git.GitCommandError):
+            checkout_repos(False, False, manifest.get_repo_sources('dev'), workspace, manifest, None, jobs=jobs)
+        assert _heads(workspace) == ['main', 'main', 'main']
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_clone_journal.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo.common.clone_journal import CloneJournal, clone_journal_exists
+from edkrepo.common.clone_journal import STAGE_CLONE_STARTED, STAGE_CLONED, STAGE_CHECKED_OUT, STAGE_HOOKS, STAGE_SUBMODULES
+from edkrepo.common.common_repo_functions import clone_single_repository
+from edkrepo.common.edkrepo_exception import EdkrepoWorkspaceInvalidException
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+def _make_workspace(tmp_path):
+    '''Creates a source repository and a workspace whose manifest clones it into Repo1. Returns the workspace path
+    and the repo source of Repo1.'''
+    bt.init_repo(str(tmp_path / 'source'))
+    workspace = str(tmp_path / 'workspace')
+    manifest = bt.write_manifest(workspace, {'Repo1': (tmp_path / 'source').as_posix()},
+                                 {'main': bt.source_elements(['Repo1'])})
+    return workspace, manifest.get_repo_sources('main')[0]
+
+class TestCloneJournal:
+
+    def test_stages_persist(self, tmp_path):
+        workspace, _ = _make_workspace(tmp_path)
+        journal = CloneJournal(workspace, {'blobless': True})
+        journal.record('Repo1', STAGE_CLONED)
+        journal.record('Repo1', STAGE_CHECKED_OUT)
+        journal.record_workspace_stage(STAGE_SUBMODULES)
+        reopened = CloneJournal(workspace, {'blobless': False})
+        assert reopened.has_stage('Repo1', STAGE_CLONED)
+        assert reopened.has_stage('Repo1', STAGE_CHECKED_OUT)
+        assert not reopened.has_stage('Repo1', STAGE_HOOKS)
+        assert not reopened.has_stage('Repo2', STAGE_CLONED)
+        assert reopened.has_workspace_stage(STAGE_SUBMODULES)
+        assert reopened.clone_options == {'blobless': True}
+
+    def test_finish_removes_journal(self, tmp_path):
+        workspace, _ = _make_workspace(tmp_path)
+        assert not clone_journal_exists(workspace)
+        journal = CloneJournal(workspace)
+        assert clone_journal_exists(workspace)
+        journal.finish()
+        assert not clone_journal_exists(workspace)
+
+    def test_options_recorded_later(self, tmp_path):
+        workspace, _ = _make_workspace(tmp_path)
+        journal = CloneJournal(workspace)
+        journal.record('Repo1', STAGE_CLONED)
+        journal.set_options({'blobless': True})
+        reopened = CloneJournal(workspace)
+        assert reopened.clone_options == {'blobless': True}
+        assert reopened.has_stage('Repo1', STAGE_CLONED)
+
+class TestResumedClone:
+
+    def test_partial_clone_is_replaced(self, tmp_path):
+        workspace, repo_source = _make_workspace(tmp_path)
+        os.makedirs(os.path.join(workspace, 'Repo1', '.git'))
+        journal = CloneJournal(workspace)
+        journal.record('Repo1', STAGE_CLONE_STARTED)
+        clone_single_repository(None, repo_source, workspace, None, journal=journal)
+        assert bt.run_git(os.path.join(workspace, 'Repo1'), 'rev-parse', '--abbrev-ref', 'HEAD') == 'main'
+        assert journal.has_stage('Repo1', STAGE_CLONED)
+        assert journal.has_stage('Repo1', STAGE_CHECKED_OUT)
+
+    def test_existing_directory_is_kept(self, tmp_path):
+        workspace, repo_source = _make_workspace(tmp_path)
+        user_file = os.path.join(workspace, 'Repo1', 'work.txt')
+        os.makedirs(os.path.dirname(user_file))
+        with open(user_file, 'w') as f:
+            f.write('unpushed work')
+        journal = CloneJournal(workspace)
+        with pytest.raises(EdkrepoWorkspaceInvalidException):
+            clone_single_repository(None, repo_source, workspace, None, journal=journal)
+        assert os.path.isfile(user_file)
+        assert not journal.has_stage('Repo1', STAGE_CLONE_STARTED)
+
+    def test_cloned_repo_is_not_downloaded_again(self, tmp_path):
+        workspace, repo_source = _make_workspace(tmp_path)
+        bt.run_git(workspace, 'clone', '-q', repo_source.remote_url, 'Repo1')
+        journal = CloneJournal(workspace)
+        journal.record('Repo1', STAGE_CLONED)
+        with patch('edkrepo.common.common_repo_functions.subprocess.run') as mock_run:
+            clone_single_repository(None, repo_source, workspace, None, journal=journal)
+        mock_run.assert_not_called()
+        assert journal.has_stage('Repo1', STAGE_CHECKED_OUT)
@@ -5,7 +5,8 @@ from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
 from edkrepo_manifest_parser.edk_manifest import RepoSource, ManifestXml
-from edkrepo.common.clone_utilities import generate_clone_order, calculate_source_manifest_repo_directory
+from edkrepo.common.clone_utilities import generate_clone_order, generate_clone_dependencies, calculate_source_manifest_repo_directory
+from edkrepo.common.clone_utilities import generate_template_clone_cmd, generate_template_path_map, generate_clone_cmd
 
 class TestGenerateCloneOrder:
 
@@ -49,6 +50,56 @@ class TestGenerateCloneOrder:
         print(clone_order)
         assert clone_order == self.EXPECTED_NESTED_CLONE_ORDER
 
+class TestGenerateCloneDependencies:
+
+    MOCK_MANIFEST = MagicMock(spec=ManifestXml)
+    MOCK_MANIFEST.get_parent_of_nested_repo = MagicMock(
+        side_effect=lambda sources, root: ManifestXml.get_parent_of_nested_repo(None, sources, root))
+
+    def test_generate_clone_dependencies_no_nesting(self):
+        dependencies = generate_clone_dependencies(self.MOCK_MANIFEST, TestGenerateCloneOrder.NO_NESTED_MOCK_REPO_SOURCES)
+        assert dependencies == {"repo1": None, "repo2": None}
+
+    def test_generate_clone_dependencies_with_nesting(self):
+        sources = TestGenerateCloneOrder.NESTED_MOCK_REPO_SOURCES
+        dependencies = generate_clone_dependencies(self.MOCK_MANIFEST, sources)
+        assert dependencies["repo2"] is None
+        assert dependencies["repo2/repo1"] == sources[1]
+        assert dependencies["repo2/repo1/repo3"] == sources[0]
+
+class TestGenerateTemplatePathMap:
+
+    TEMPLATE_SOURCES = [
+        RepoSource(root="Edk2", remote_name="origin", remote_url="https://example.com/Repo1.git", branch="main", commit=None, sparse=False, enable_submodule=False, tag=None, venv_cfg=None, patch_set=None, blobless=False, treeless=False),
+        RepoSource(root="Missing", remote_name="origin", remote_url="https://example.com/repo2.git", branch="main", commit=None, sparse=False, enable_submodule=False, tag=None, venv_cfg=None, patch_set=None, blobless=False, treeless=False)
+    ]
+
+    @patch('edkrepo.common.clone_utilities.edk_manifest.ManifestXml')
+    def test_generate_template_path_map(self, mock_manifest_xml, tmp_path):
+        os.makedirs(os.path.join(str(tmp_path), "Edk2", ".git"))
+        mock_manifest_xml.return_value.get_repo_sources.return_value = self.TEMPLATE_SOURCES
+        template_path_map = generate_template_path_map(str(tmp_path), TestGenerateCloneOrder.NESTED_MOCK_REPO_SOURCES)
+        assert template_path_map == {"https://example.com/repo1.git": os.path.join(str(tmp_path), "Edk2")}
+
+    def test_generate_template_clone_cmd(self):
+        clone_cmd = generate_template_clone_cmd(TestGenerateCloneOrder.NO_NESTED_MOCK_REPO_SOURCES[0], "ws", "template")
+        assert clone_cmd == 'git clone template {} --local --no-checkout --progress'.format(os.path.join("ws", "repo1"))
+
+class TestGenerateCloneCmd:
+
+    def test_generate_clone_cmd_no_checkout(self):
+        repo_source = TestGenerateCloneOrder.NO_NESTED_MOCK_REPO_SOURCES[0]
+        clone_cmd = generate_clone_cmd(repo_source, "ws", no_checkout=True)
+        assert clone_cmd.endswith(' --no-checkout')
+        assert clone_cmd.startswith('git clone {} {} --progress'.format(repo_source.remote_url, os.path.join("ws", "repo1")))
+        assert '--no-checkout' not in generate_clone_cmd(repo_source, "ws")
+
+    def test_generate_clone_cmd_single_branch(self):
+        repo_source = TestGenerateCloneOrder.NO_NESTED_MOCK_REPO_SOURCES[0]
+        clone_cmd = generate_clone_cmd(repo_source, "ws", single_branch=True)
+        assert '-b main --single-branch' in clone_cmd
+        assert '--single-branch' not in generate_clone_cmd(repo_source, "ws")
+
 class TestCalculateSourceManifestRepoDirectory:
 
     MOCK_MANIFEST = MagicMock(spec=ManifestXml)
@@ -128,4 +179,4 @@ class TestCalculateSourceManifestRepoDirectory:
         mock_find_source_manifest_repo.return_value = None
 
         global_manifest_directory = calculate_source_manifest_repo_directory(self.MOCK_ARGS, self.MOCK_CONFIG, self.MOCK_MANIFEST)
-        assert global_manifest_directory is None
\ No newline at end of file
+        assert global_manifest_directory is None
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_fetch_missing_commits.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import argparse
+import os
+import sys
+
+from git import Repo
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+import edkrepo.common.common_repo_functions as common_repo_functions
+from edkrepo.common.common_repo_functions import fetch_missing_commits, find_missing_commits
+from edkrepo.common.unit_test_bases import base_tests as bt
+from edkrepo_manifest_parser.edk_manifest import RepoSource
+
+def _make_clone(tmp_path):
+    '''Creates a remote and a clone of it, then commits twice to a new branch of the remote. Returns the clone, the
+    commit the clone has and the first commit of the branch, which the clone does not have and which is not the tip of
+    any branch.'''
+    remote_path = str(tmp_path / 'remote')
+    bt.init_repo(remote_path)
+    bt.run_git(str(tmp_path), 'clone', '-q', remote_path, 'clone')
+    bt.add_branch(remote_path, 'dev')
+    bt.run_git(remote_path, 'checkout', '-q', 'dev')
+    bt.commit_files(remote_path, 'dev tip')
+    repo = Repo(str(tmp_path / 'clone'))
+    return repo, bt.run_git(remote_path, 'rev-parse', 'main'), bt.run_git(remote_path, 'rev-parse', 'dev~1')
+
+class _FetchCounter():
+    def __init__(self, monkeypatch):
+        self.fetches = []
+        fetch_from_remote = common_repo_functions.fetch_from_remote
+        def _count(repo, remote, *args, **kwargs):
+            self.fetches.append(args)
+            return fetch_from_remote(repo, remote, *args, **kwargs)
+        monkeypatch.setattr(common_repo_functions, 'fetch_from_remote', _count)
+
+class TestFetchMissingCommits:
+
+    def test_find_missing_commits(self, tmp_path):
+        repo, present, missing = _make_clone(tmp_path)
+        assert find_missing_commits(repo, [present, missing, bt.UNKNOWN_COMMIT]) == [missing, bt.UNKNOWN_COMMIT]
+        assert find_missing_commits(repo, []) == []
+
+    def test_present_commit_not_fetched(self, tmp_path, monkeypatch):
+        repo, present, _ = _make_clone(tmp_path)
+        counter = _FetchCounter(monkeypatch)
+        assert fetch_missing_commits(repo, [present]) == []
+        assert counter.fetches == []
+
+    def test_missing_commit_fetched_by_sha(self, tmp_path, monkeypatch):
+        repo, _, missing = _make_clone(tmp_path)
+        counter = _FetchCounter(monkeypatch)
+        assert fetch_missing_commits(repo, [missing]) == []
+        assert counter.fetches == [([missing],)]
+        assert 'origin/dev' not in [x.name for x in repo.remotes.origin.refs]
+
+    def test_fetch_by_sha_refused(self, tmp_path, monkeypatch):
+        repo, _, missing = _make_clone(tmp_path)
+        # Protocol version 0 only allows wants of the tips of advertised refs
+        bt.run_git(repo.working_dir, 'config', 'protocol.version', '0')
+        counter = _FetchCounter(monkeypatch)
+        assert fetch_missing_commits(repo, [missing]) == []
+        assert counter.fetches == [([missing],), ()]
+
+    def test_fetch_by_sha_refused_scoped(self, tmp_path, monkeypatch):
+        repo, _, missing = _make_clone(tmp_path)
+        bt.run_git(repo.working_dir, 'config', 'protocol.version', '0')
+        bt.run_git(repo.working_dir, 'config', 'remote.origin.fetch', '+refs/heads/main:refs/remotes/origin/main')
+        counter = _FetchCounter(monkeypatch)
+        assert fetch_missing_commits(repo, [missing]) == []
+        assert counter.fetches == [([missing],), ('+refs/heads/*:refs/remotes/origin/*',)]
+
+    def test_unknown_commit(self, tmp_path, monkeypatch):
+        repo, _, _ = _make_clone(tmp_path)
+        assert fetch_missing_commits(repo, [bt.UNKNOWN_COMMIT]) == [bt.UNKNOWN_COMMIT]
+
+class TestCommitSources:
+
+    def _source(self, tmp_path, commit):
+        return RepoSource('pinned', 'origin', str(tmp_path / 'remote'), None, commit, False, False, None, None, None,
+                          False, False)
+
+    def test_clone_fetches_commit(self, tmp_path):
+        _, _, missing = _make_clone(tmp_path)
+        bt.run_git(str(tmp_path / 'remote'), 'checkout', '-q', 'main')
+        common_repo_functions.clone_single_repository(None, self._source(tmp_path, missing), str(tmp_path), None,
+                                                      args=argparse.Namespace(verbose=False), scope_refspecs=True)
+        repo_path = str(tmp_path / 'pinned')
+        assert bt.run_git(repo_path, 'rev-parse', 'HEAD') == missing
+        # Only the default branch was cloned and no branch is kept for the commit
+        fetch_refspecs = bt.run_git(repo_path, 'config', '--get-all', 'remote.origin.fetch')
+        assert '+refs/heads/*:refs/remotes/origin/*' not in fetch_refspecs
+        assert 'refs/remotes/origin/dev' not in bt.run_git(repo_path, 'for-each-ref', '--format=%(refname)')
+
+    def test_checkout_fetches_commit(self, tmp_path):
+        repo, _, missing = _make_clone(tmp_path)
+        bt.run_git(repo.working_dir, 'config', 'remote.origin.fetch', '+refs/heads/main:refs/remotes/origin/main')
+        common_repo_functions._checkout_repo(False, False, self._source(tmp_path, missing)._replace(root='clone'),
+                                             str(tmp_path), None, None)
+        assert bt.run_git(repo.working_dir, 'rev-parse', 'HEAD') == missing
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_git_object_query.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+
+from git import Repo
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo.common.git_object_query import GitObjectQuery, get_object_query, close_object_queries
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+def _make_repo(tmp_path):
+    '''Creates a repository with a root commit, a commit on a branch that is merged back into main and an empty
+    commit.'''
+    repo_path = str(tmp_path / 'repo')
+    bt.init_repo(repo_path, {'a.txt': 'a\n', 'dir/b.txt': 'b\n'})
+    bt.run_git(repo_path, 'checkout', '-q', '-b', 'topic')
+    bt.commit_files(repo_path, 'topic\n\nbody', {'dir/c.txt': 'c\n'})
+    bt.run_git(repo_path, 'checkout', '-q', 'main')
+    bt.commit_files(repo_path, 'main', {'a.txt': 'changed\n'})
+    bt.run_git(repo_path, 'merge', '-q', '--no-ff', '-m', 'merge', 'topic')
+    bt.commit_files(repo_path, 'empty')
+    return Repo(repo_path)
+
+class TestGitObjectQuery:
+
+    def test_resolve(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        with GitObjectQuery(repo.working_dir) as object_query:
+            assert object_query.resolve('topic') == repo.heads.topic.commit.hexsha
+            assert object_query.resolve('HEAD~1') == repo.commit('HEAD~1').hexsha
+            assert object_query.resolve(bt.UNKNOWN_COMMIT) is None
+            assert object_query.resolve('HEAD^{tree}') is None
+            assert object_query.info('HEAD:a.txt').type == 'blob'
+            missing_commits = object_query.missing_commits(['main', bt.UNKNOWN_COMMIT, 'missing-branch'])
+            assert missing_commits == [bt.UNKNOWN_COMMIT, 'missing-branch']
+
+    def test_read_commit(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        with GitObjectQuery(repo.working_dir) as object_query:
+            merge = object_query.read_commit('HEAD~1')
+            assert merge.parents == [x.hexsha for x in repo.commit('HEAD~1').parents]
+            assert merge.tree == repo.commit('HEAD~1').tree.hexsha
+            assert object_query.read_commit('topic').message == repo.heads.topic.commit.message
+            assert object_query.read_commit(bt.UNKNOWN_COMMIT) is None
+
+    def test_changed_files(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        commits = repo.git.rev_list('HEAD').split()
+        with GitObjectQuery(repo.working_dir) as object_query:
+            changed_files = object_query.changed_files(commits + commits[:1])
+        assert list(changed_files) == commits
+        for commit in commits:
+            assert sorted(changed_files[commit]) == sorted(repo.commit(commit).stats.files)
+        assert changed_files[repo.commit('HEAD~1').hexsha] == ['dir/c.txt']
+        assert changed_files[repo.commit('HEAD').hexsha] == []
+
+    def test_process_reused(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        object_query = get_object_query(repo)
+        try:
+            assert get_object_query(Repo(repo.working_dir)) is object_query
+            object_query.resolve('main')
+            process = object_query._batch_check
+            object_query.resolve('topic')
+            object_query.missing_commits(['HEAD~1', 'HEAD~2'])
+            assert object_query._batch_check is process
+            assert process.poll() is None
+        finally:
+            close_object_queries()
+        assert process.poll() is not None
+        assert get_object_query(repo) is not object_query
+
+    def test_close_repository_queries(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        other_path = str(tmp_path / 'other')
+        bt.init_repo(other_path)
+        object_query = get_object_query(repo)
+        other_query = get_object_query(Repo(other_path))
+        try:
+            object_query.resolve('main')
+            other_query.resolve('main')
+            process = object_query._batch_check
+            close_object_queries(repo.working_dir)
+            assert process.poll() is not None
+            assert other_query._batch_check.poll() is None
+            # The shared query starts a new process for the next lookup
+            assert get_object_query(repo) is object_query
+            assert object_query.resolve('topic') == repo.heads.topic.commit.hexsha
+        finally:
+            close_object_queries()
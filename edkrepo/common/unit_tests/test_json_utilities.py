@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_json_utilities.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo.common.json_utilities import write_json_file
+
+class TestWriteJsonFile:
+
+    def test_write_replaces_file(self, tmp_path):
+        path = str(tmp_path / 'state.json')
+        write_json_file(path, {'roots': ['a']})
+        write_json_file(path, {'roots': ['b']})
+        with open(path) as json_file:
+            assert json.load(json_file) == {'roots': ['b']}
+        assert os.listdir(str(tmp_path)) == ['state.json']
+
+    def test_failed_write_keeps_file(self, tmp_path):
+        path = str(tmp_path / 'state.json')
+        write_json_file(path, {'roots': ['a']})
+        with pytest.raises(TypeError):
+            write_json_file(path, {'roots': object()})
+        with open(path) as json_file:
+            assert json.load(json_file) == {'roots': ['a']}
+        assert os.listdir(str(tmp_path)) == ['state.json']
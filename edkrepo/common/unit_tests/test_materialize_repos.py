@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_materialize_repos.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import argparse
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+import edkrepo.common.common_repo_functions as common_repo_functions
+import edkrepo.common.workspace_maintenance.deferred_repos_maintenance as deferred_repos_maintenance
+from edkrepo.common.edkrepo_exception import EdkrepoWorkspaceInvalidException
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+ROOTS = ['a', 'b', 'c']
+
+@pytest.fixture
+def workspace(tmp_path):
+    workspace = str(tmp_path / 'workspace')
+    manifest = bt.write_manifest(workspace, bt.example_remotes(ROOTS), {'main': bt.source_elements(ROOTS)})
+    deferred_repos_maintenance.write_deferred_repos(workspace, ROOTS, {})
+    with patch.object(common_repo_functions, '_resolve_clone_settings', side_effect=lambda args, *_: (args, {}, False)), \
+            patch.object(common_repo_functions.manifest_repos_maintenance, 'get_manifest_repo_path', return_value=None), \
+            patch.object(common_repo_functions.ui_functions, 'print_info_msg'):
+        yield workspace, manifest
+
+def _clone_first_then_fail(args, workspace_dir, repos_to_clone, *_, repo_cloned=None, **kwargs):
+    os.makedirs(os.path.join(workspace_dir, repos_to_clone[0].root, '.git'))
+    repo_cloned(repos_to_clone[0])
+    os.makedirs(os.path.join(workspace_dir, repos_to_clone[1].root, '.git'))
+    raise RuntimeError('clone failed')
+
+class TestMaterializeRepos:
+
+    def test_completed_repos_marked_on_failure(self, workspace):
+        workspace_path, manifest = workspace
+        repo_sources = manifest.get_repo_sources('main')
+        with patch.object(common_repo_functions, 'clone_repos', side_effect=_clone_first_then_fail):
+            with pytest.raises(RuntimeError):
+                common_repo_functions.materialize_repos(argparse.Namespace(), {}, workspace_path, manifest, repo_sources)
+        assert deferred_repos_maintenance.get_deferred_roots(workspace_path) == {'b', 'c'}
+
+    def test_user_directory_kept(self, workspace):
+        workspace_path, manifest = workspace
+        user_file = os.path.join(workspace_path, 'b', 'work.txt')
+        os.makedirs(os.path.dirname(user_file))
+        with open(user_file, 'w') as f:
+            f.write('local work')
+        with patch.object(common_repo_functions, 'clone_repos') as clone_repos:
+            with pytest.raises(EdkrepoWorkspaceInvalidException):
+                common_repo_functions.materialize_repos(argparse.Namespace(), {}, workspace_path, manifest,
+                                                        manifest.get_repo_sources('main'))
+        clone_repos.assert_not_called()
+        assert os.path.isfile(user_file)
+        assert deferred_repos_maintenance.get_started_roots(workspace_path) == set()
+
+    def test_leftover_clone_removed(self, workspace):
+        workspace_path, manifest = workspace
+        repo_sources = manifest.get_repo_sources('main')
+        with patch.object(common_repo_functions, 'clone_repos', side_effect=_clone_first_then_fail):
+            with pytest.raises(RuntimeError):
+                common_repo_functions.materialize_repos(argparse.Namespace(), {}, workspace_path, manifest, repo_sources)
+        with patch.object(common_repo_functions, 'clone_repos') as clone_repos:
+            cloned = common_repo_functions.materialize_repos(argparse.Namespace(), {}, workspace_path, manifest,
+                                                             repo_sources)
+        assert [x.root for x in cloned] == ['b', 'c']
+        assert [x.root for x in clone_repos.call_args[0][2]] == ['b', 'c']
+        # The partial clone of b was removed before cloning again, the completed clone of a was kept
+        assert not os.path.exists(os.path.join(workspace_path, 'b'))
+        assert os.path.isdir(os.path.join(workspace_path, 'a', '.git'))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_mirror_pool.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import socket
+import subprocess
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo.common.mirror_pool import normalize_remote_url, get_mirror_name, update_mirror, update_mirrors, get_mirror_path
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+def _rev_count(path):
+    return int(bt.run_git(path, 'rev-list', '--all', '--count'))
+
+class TestMirrorNames:
+
+    def test_equivalent_urls_share_a_mirror(self):
+        assert normalize_remote_url('https://github.com/tianocore/edk2.git') == normalize_remote_url('https://GitHub.com/tianocore/edk2/')
+        assert get_mirror_name('https://github.com/tianocore/edk2.git') == get_mirror_name('https://github.com/TianoCore/edk2')
+
+    def test_different_urls_use_different_mirrors(self):
+        assert get_mirror_name('https://github.com/tianocore/edk2.git') != get_mirror_name('https://github.com/other/edk2.git')
+
+    def test_mirror_name_is_readable(self):
+        assert get_mirror_name('git@github.com:tianocore/edk2-platforms.git').startswith('edk2-platforms-')
+
+class TestUpdateMirror:
+
+    def test_mirror_created_then_refreshed(self, tmp_path):
+        source = str(tmp_path / 'source')
+        pool = str(tmp_path / 'pool')
+        os.makedirs(pool)
+        bt.init_repo(source)
+        mirror_path = update_mirror(source, pool)
+        assert os.path.isdir(mirror_path)
+        assert _rev_count(mirror_path) == 1
+        bt.commit_files(source, 'second')
+        assert update_mirror(source, pool) == mirror_path
+        assert _rev_count(mirror_path) == 2
+        assert not os.path.exists(mirror_path + '.lock')
+
+    @patch('edkrepo.common.mirror_pool.ui_functions.print_warning_msg')
+    def test_failed_mirror_is_skipped(self, mock_warning, tmp_path):
+        pool = str(tmp_path / 'pool')
+        os.makedirs(pool)
+        manifest = bt.write_manifest(str(tmp_path / 'workspace'), {'repo1': (tmp_path / 'missing').as_posix()},
+                                     {'main': bt.source_elements(['repo1'])})
+        source = manifest.get_repo_sources('main')[0]
+        with patch('edkrepo.common.mirror_pool.ui_functions.print_info_msg'):
+            assert update_mirrors([source], pool_dir=pool) == {}
+        assert mock_warning.called
+        assert os.listdir(pool) == []
+
+def _write_lock(lock_path, pid):
+    with open(lock_path, 'w') as lock_file:
+        lock_file.write('{} {}'.format(pid, socket.gethostname()))
+
+class TestMirrorLock:
+
+    def test_lock_of_exited_process_is_removed(self, tmp_path):
+        source = str(tmp_path / 'source')
+        pool = str(tmp_path / 'pool')
+        os.makedirs(pool)
+        bt.init_repo(source)
+        exited = subprocess.Popen([sys.executable, '-c', 'pass'])
+        exited.wait()
+        lock_path = get_mirror_path(source, pool) + '.lock'
+        _write_lock(lock_path, exited.pid)
+        with patch('edkrepo.common.mirror_pool.time.sleep', side_effect=AssertionError('waited for a stale lock')):
+            assert update_mirror(source, pool) is not None
+        assert not os.path.exists(lock_path)
+
+    @patch('edkrepo.common.mirror_pool.ui_functions.print_info_msg')
+    def test_wait_for_running_process_is_reported(self, mock_info, tmp_path):
+        source = str(tmp_path / 'source')
+        pool = str(tmp_path / 'pool')
+        os.makedirs(pool)
+        bt.init_repo(source)
+        lock_path = get_mirror_path(source, pool) + '.lock'
+        _write_lock(lock_path, os.getpid())
+        sleeps = []
+        def _sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 3:
+                # The process holding the lock releases it
+                os.remove(lock_path)
+        with patch('edkrepo.common.mirror_pool.time.sleep', side_effect=_sleep):
+            assert update_mirror(source, pool) is not None
+        assert len(sleeps) == 3
+        assert mock_info.call_count == 1
+        assert lock_path in mock_info.call_args[0][0]
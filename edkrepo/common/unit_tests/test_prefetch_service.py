@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_prefetch_service.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+from git import Repo
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo.common.prefetch_service import get_registered_workspaces, register_workspace, unregister_workspace
+from edkrepo.common.prefetch_service import prefetch_repo, prefetch_all, get_prefetch_refspecs
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+def _make_clone(tmp_path):
+    source = str(tmp_path / 'source')
+    clone = str(tmp_path / 'clone')
+    bt.init_repo(source)
+    bt.run_git(str(tmp_path), 'clone', '-q', source, clone)
+    return source, clone
+
+def _empty_config():
+    config = {'cfg_file': MagicMock(), 'user_cfg_file': MagicMock()}
+    config['cfg_file'].manifest_repo_list = []
+    config['user_cfg_file'].manifest_repo_list = []
+    return config
+
+class TestPrefetchRegistry:
+
+    def test_register_and_unregister(self, tmp_path):
+        with patch('edkrepo.common.prefetch_service.get_edkrepo_global_data_directory', return_value=str(tmp_path)):
+            workspace = str(tmp_path / 'workspace')
+            assert get_registered_workspaces() == []
+            assert register_workspace(workspace)
+            assert not register_workspace(os.path.join(workspace, '.'))
+            assert get_registered_workspaces() == [os.path.normpath(workspace)]
+            assert unregister_workspace(workspace)
+            assert not unregister_workspace(workspace)
+            assert get_registered_workspaces() == []
+
+class TestPrefetchRepo:
+
+    def test_prefetch_leaves_branches_untouched(self, tmp_path):
+        source, clone = _make_clone(tmp_path)
+        initial_sha = bt.run_git(clone, 'rev-parse', 'HEAD')
+        bt.commit_files(source, 'second')
+        new_sha = bt.run_git(source, 'rev-parse', 'HEAD')
+        assert prefetch_repo(clone) is None
+        assert bt.run_git(clone, 'rev-parse', 'refs/prefetch/remotes/origin/main') == new_sha
+        assert bt.run_git(clone, 'rev-parse', 'HEAD') == initial_sha
+        assert bt.run_git(clone, 'rev-parse', 'refs/remotes/origin/main') == initial_sha
+        assert not os.path.exists(os.path.join(clone, '.git', 'FETCH_HEAD'))
+
+    def test_prefetch_follows_scoped_refspecs(self, tmp_path):
+        source, clone = _make_clone(tmp_path)
+        bt.run_git(source, 'branch', 'dev')
+        assert prefetch_repo(clone) is None
+        assert bt.run_git(clone, 'for-each-ref', '--format=%(refname)', 'refs/prefetch') == \
+            'refs/prefetch/remotes/origin/dev\nrefs/prefetch/remotes/origin/main'
+        bt.run_git(clone, 'config', '--replace-all', 'remote.origin.fetch', '+refs/heads/main:refs/remotes/origin/main')
+        bt.run_git(clone, 'config', '--add', 'remote.origin.fetch', 'refs/notes/*:refs/notes/*')
+        assert get_prefetch_refspecs(Repo(clone)) == ['+refs/heads/main:refs/prefetch/remotes/origin/main']
+        assert prefetch_repo(clone) is None
+        # The branch that is no longer fetched is not prefetched and its prefetched ref is removed
+        assert bt.run_git(clone, 'for-each-ref', '--format=%(refname)', 'refs/prefetch') == \
+            'refs/prefetch/remotes/origin/main'
+
+    def test_failed_prefetch_returns_error(self, tmp_path):
+        _, clone = _make_clone(tmp_path)
+        bt.run_git(clone, 'remote', 'set-url', 'origin', str(tmp_path / 'missing'))
+        assert prefetch_repo(clone)
+
+    @patch('edkrepo.common.prefetch_service.ui_functions.print_warning_msg')
+    def test_missing_workspace_is_skipped(self, mock_warning, tmp_path):
+        with patch('edkrepo.common.prefetch_service.get_edkrepo_global_data_directory', return_value=str(tmp_path)):
+            register_workspace(str(tmp_path / 'missing'))
+            assert prefetch_all(_empty_config()) == 0
+        mock_warning.assert_called_once()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_progress_handler.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import io
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo.common.progress_handler import MultiProgressRenderer, CLEAR_LINE, CURSOR_UP
+
+class _TtyStream(io.StringIO):
+    def isatty(self):
+        return True
+
+class TestMultiProgressRenderer:
+
+    def test_non_tty_writes_single_summary(self):
+        stream = io.StringIO()
+        with MultiProgressRenderer(stream=stream) as renderer:
+            renderer.add('repo1', 'Cloning')
+            renderer.add('repo2', 'Cloning')
+            renderer.start('repo1', 'Cloning')
+            for percent in range(100):
+                renderer.update('repo1', 'Receiving objects: {}%'.format(percent))
+            renderer.finish('repo1')
+            renderer.finish('repo2', success=False)
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 1
+        assert '2 of 2 complete, 1 failed' in lines[0]
+
+    def test_non_tty_periodic_summary(self):
+        stream = io.StringIO()
+        renderer = MultiProgressRenderer(stream=stream, summary_interval=0)
+        renderer.start('repo1', 'Fetching')
+        renderer.update('repo1', 'Counting objects: 50%')
+        assert 'in progress: repo1 (Counting objects: 50%)' in stream.getvalue()
+
+    def test_tty_updates_are_throttled(self):
+        stream = _TtyStream()
+        renderer = MultiProgressRenderer(stream=stream, refresh_rate=10)
+        with patch('edkrepo.common.progress_handler.time.monotonic', return_value=100.0):
+            renderer.start('repo1', 'Cloning')
+            for percent in range(100):
+                renderer.update('repo1', 'Receiving objects: {}%'.format(percent))
+        # Only the forced redraw from start() is written while the clock does not advance
+        assert stream.getvalue().count('repo1') == 1
+        renderer.finish('repo1', status='complete')
+        assert stream.getvalue().count(CURSOR_UP.format(1)) == 1
+        assert stream.getvalue().splitlines()[-1].startswith('{}repo1  Cloning: complete'.format(CURSOR_UP.format(1)))
+
+    def test_message_is_written_above_status_block(self):
+        stream = _TtyStream()
+        renderer = MultiProgressRenderer(stream=stream)
+        renderer.start('repo1', 'Cloning')
+        renderer.message('Hello')
+        lines = stream.getvalue().splitlines()
+        assert 'Hello' in lines[-2]
+        assert 'repo1  Cloning: running' in lines[-1]
+
+    def test_redirect_stdout_writes_above_status_block(self):
+        stream = _TtyStream()
+        renderer = MultiProgressRenderer(stream=stream)
+        renderer.start('repo1', 'Cloning')
+        with renderer.redirect_stdout():
+            print('Hello', end='')
+            print(' world')
+            print('Partial', end='')
+        print('After')
+        output = stream.getvalue()
+        assert 'Hello world\n' in output
+        assert output.index('Hello world') < output.index('Partial\n') < output.rindex('repo1  Cloning: running')
+        assert output.splitlines()[-1].endswith('repo1  Cloning: running{}'.format(CLEAR_LINE))
+        assert 'After' not in output
+
+    def test_stream_output_returns_last_lines(self):
+        renderer = MultiProgressRenderer(stream=io.StringIO())
+        renderer.start('repo1', 'Cloning')
+        output = renderer.stream_output('repo1', io.StringIO("Cloning into 'repo1'...\nfatal: repository not found\n"))
+        assert output == "Cloning into 'repo1'...\nfatal: repository not found"
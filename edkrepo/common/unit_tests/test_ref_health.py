@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_ref_health.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+
+import git
+import pytest
+from git import Repo
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+import edkrepo.common.common_repo_functions as common_repo_functions
+import edkrepo.common.ref_health as ref_health
+from edkrepo.common.repo_case_conflict_solver import has_case_conflicts
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+def _make_repo(tmp_path):
+    repo_path = str(tmp_path / 'repo')
+    bt.init_repo(repo_path)
+    return Repo(repo_path)
+
+def _write_ref(repo, ref_name, content):
+    ref_path = os.path.join(repo.common_dir, ref_name.replace('/', os.sep))
+    os.makedirs(os.path.dirname(ref_path), exist_ok=True)
+    with open(ref_path, 'w') as ref_file:
+        ref_file.write(content)
+
+class _FakeRemote():
+    name = 'origin'
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.fetch_count = 0
+
+    def fetch(self, *args, **kwargs):
+        self.fetch_count += 1
+        if self.errors:
+            raise git.GitCommandError(['git', 'fetch'], 128, stderr=self.errors.pop(0))
+        return []
+
+class TestRefHealth:
+
+    def test_healthy_repo(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        health = ref_health.preflight_ref_health(repo, case_insensitive=True)
+        assert health.broken_refs == []
+        assert not health.case_conflicts
+        assert health.stale_reflogs == []
+
+    def test_broken_remote_ref(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        _write_ref(repo, 'refs/remotes/origin/main', repo.head.commit.hexsha + '\n')
+        _write_ref(repo, 'refs/remotes/origin/truncated', '')
+        health = ref_health.preflight_ref_health(repo)
+        assert health.broken_refs == ['refs/remotes/origin/truncated']
+        assert os.path.isfile(os.path.join(repo.git_dir, 'refs', 'remotes', 'origin', 'main'))
+        assert not os.path.exists(os.path.join(repo.git_dir, 'refs', 'remotes', 'origin', 'truncated'))
+
+    def test_worktree_refs(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        worktree_path = str(tmp_path / 'worktree')
+        bt.run_git(repo.working_dir, 'worktree', 'add', '-q', '-b', 'worktree', worktree_path)
+        _write_ref(repo, 'refs/remotes/origin/truncated', '')
+        health = ref_health.preflight_ref_health(Repo(worktree_path))
+        assert health.broken_refs == ['refs/remotes/origin/truncated']
+        assert not os.path.exists(os.path.join(repo.common_dir, 'refs', 'remotes', 'origin', 'truncated'))
+
+    def test_pack_loose_refs(self, tmp_path, monkeypatch):
+        repo = _make_repo(tmp_path)
+        monkeypatch.setattr(ref_health, 'LOOSE_REF_LIMIT', 2)
+        for index in range(3):
+            _write_ref(repo, 'refs/remotes/origin/branch{}'.format(index), repo.head.commit.hexsha + '\n')
+        assert ref_health.preflight_ref_health(repo).loose_ref_count == 4
+        assert ref_health.check_ref_health(repo).loose_ref_count == 0
+
+    def test_case_conflicts(self):
+        assert not has_case_conflicts(['refs/remotes/origin/main', 'refs/remotes/origin/feature/a'])
+        assert has_case_conflicts(['refs/remotes/origin/Main', 'refs/remotes/origin/main'])
+        assert has_case_conflicts(['refs/remotes/origin/Feature/a', 'refs/remotes/origin/feature/b'])
+
+class TestFetchFromRemote:
+
+    def test_transient_error_retried(self, tmp_path, monkeypatch):
+        delays = []
+        monkeypatch.setattr(common_repo_functions.time, 'sleep', delays.append)
+        repo = _make_repo(tmp_path)
+        remote = _FakeRemote(['fatal: unable to access: Could not resolve host: example.com'] * 2)
+        assert common_repo_functions.fetch_from_remote(repo, remote) == []
+        assert remote.fetch_count == 3
+        assert len(delays) == 2
+        assert 0.5 <= delays[0] <= 1.0
+        assert 1.0 <= delays[1] <= 2.0
+
+    def test_retry_limit(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(common_repo_functions.time, 'sleep', lambda delay: None)
+        repo = _make_repo(tmp_path)
+        remote = _FakeRemote(['fatal: the remote end hung up unexpectedly'] * 10)
+        with pytest.raises(git.GitCommandError):
+            common_repo_functions.fetch_from_remote(repo, remote)
+        assert remote.fetch_count == common_repo_functions.FETCH_RETRY_LIMIT + 1
+
+    def test_permanent_error_not_retried(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(common_repo_functions.time, 'sleep', lambda delay: None)
+        repo = _make_repo(tmp_path)
+        remote = _FakeRemote(["fatal: couldn't find remote ref refs/heads/missing"])
+        with pytest.raises(git.GitCommandError):
+            common_repo_functions.fetch_from_remote(repo, remote)
+        assert remote.fetch_count == 1
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_sparse_checkout_data.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+
+import git
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo.common.common_repo_functions import get_sparse_checkout_data, sparse_checkout_submodule_repos
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+SOURCES = ('<Source localRoot="plain" remote="plain" branch="main" sparseCheckout="true"/>'
+           '<Source localRoot="with_submodules" remote="with_submodules" branch="main" sparseCheckout="true" '
+           'enableSubmodule="true"/>')
+SPARSE_CHECKOUT = '''  <SparseCheckout>
+    <SparseSettings sparseByDefault="true"/>
+    <SparseData>
+      <AlwaysInclude>include</AlwaysInclude>
+    </SparseData>
+  </SparseCheckout>
+'''
+
+def _make_workspace(tmp_path):
+    workspace = str(tmp_path / 'workspace')
+    roots = ['plain', 'with_submodules']
+    for root in roots:
+        bt.init_repo(os.path.join(workspace, root), {'include/file.txt': 'include', 'exclude/file.txt': 'exclude'})
+    manifest = bt.write_manifest(workspace, bt.example_remotes(roots), {'main': SOURCES}, SPARSE_CHECKOUT)
+    return workspace, manifest
+
+class TestSparseCheckoutData:
+
+    def test_submodule_repos_left_out(self, tmp_path):
+        _, manifest = _make_workspace(tmp_path)
+        sparse_data = get_sparse_checkout_data(manifest.get_repo_sources('main'), manifest)
+        assert list(sparse_data) == ['plain']
+        assert sparse_data['plain'] == (['include'], [])
+
+    def test_submodule_repos_checked_out_after(self, tmp_path):
+        workspace, manifest = _make_workspace(tmp_path)
+        sparse_checkout_submodule_repos(workspace, manifest.get_repo_sources('main'), manifest)
+        assert os.path.isfile(os.path.join(workspace, 'with_submodules', 'include', 'file.txt'))
+        assert not os.path.exists(os.path.join(workspace, 'with_submodules', 'exclude'))
+        # Repositories without submodules were already handled when they were cloned
+        assert os.path.isfile(os.path.join(workspace, 'plain', 'exclude', 'file.txt'))
+        with git.Repo(os.path.join(workspace, 'plain')).config_reader() as config:
+            assert not config.has_option('core', 'sparsecheckout')
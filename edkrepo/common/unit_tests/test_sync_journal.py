@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_sync_journal.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo.common.sync_journal import SyncJournal, sync_journal_exists
+from edkrepo.common.sync_journal import STAGE_FETCHED, STAGE_SYNCED, STAGE_MANIFEST_UPDATED
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+def _make_workspace(tmp_path):
+    workspace = str(tmp_path / 'workspace')
+    _write_manifest(workspace, 'main')
+    return workspace
+
+def _write_manifest(workspace, combo):
+    '''Writes a workspace manifest whose only combination is combo and returns its text.'''
+    bt.write_manifest(workspace, bt.example_remotes(['Edk2']), {combo: bt.source_elements(['Edk2'])})
+    return _read(os.path.join(workspace, 'repo', 'Manifest.xml'))
+
+def _read(path):
+    with open(path, 'r') as text_file:
+        return text_file.read()
+
+class TestSyncJournal:
+
+    def test_initial_manifest_is_kept(self, tmp_path):
+        workspace = _make_workspace(tmp_path)
+        initial_manifest = _read(os.path.join(workspace, 'repo', 'Manifest.xml'))
+        journal = SyncJournal(workspace, {'update_local_manifest': True})
+        _write_manifest(workspace, 'dev')
+        reopened = SyncJournal(workspace, {'update_local_manifest': False})
+        assert _read(reopened.initial_manifest_path) == initial_manifest
+        assert reopened.sync_options == {'update_local_manifest': True}
+        assert journal.initial_manifest_path == reopened.initial_manifest_path
+
+    def test_stages_persist(self, tmp_path):
+        workspace = _make_workspace(tmp_path)
+        journal = SyncJournal(workspace)
+        journal.record('Repo1', STAGE_FETCHED)
+        journal.record('Repo1', STAGE_SYNCED)
+        journal.record_workspace_stage(STAGE_MANIFEST_UPDATED)
+        reopened = SyncJournal(workspace)
+        assert reopened.has_stage('Repo1', STAGE_SYNCED)
+        assert not reopened.has_stage('Repo2', STAGE_FETCHED)
+        assert reopened.has_workspace_stage(STAGE_MANIFEST_UPDATED)
+
+    def test_finish_removes_journal_and_manifest(self, tmp_path):
+        workspace = _make_workspace(tmp_path)
+        journal = SyncJournal(workspace)
+        assert sync_journal_exists(workspace)
+        journal.finish()
+        assert not sync_journal_exists(workspace)
+        assert not os.path.exists(journal.initial_manifest_path)
+        assert os.listdir(os.path.join(workspace, 'repo')) == ['Manifest.xml']
+
+class TestSyncJournalWorkspaceState:
+
+    def test_unchanged_workspace_is_resumed(self, tmp_path):
+        workspace = _make_workspace(tmp_path)
+        SyncJournal(workspace).record_workspace_state('main')
+        assert not SyncJournal(workspace).is_stale('main')
+
+    def test_state_follows_sync_changes(self, tmp_path):
+        workspace = _make_workspace(tmp_path)
+        journal = SyncJournal(workspace)
+        journal.record_workspace_state('main')
+        _write_manifest(workspace, 'dev')
+        journal.record_workspace_state('dev')
+        assert not SyncJournal(workspace).is_stale('dev')
+
+    def test_changed_combo_is_stale(self, tmp_path):
+        workspace = _make_workspace(tmp_path)
+        SyncJournal(workspace).record_workspace_state('main')
+        assert SyncJournal(workspace).is_stale('dev')
+
+    def test_changed_manifest_is_stale(self, tmp_path):
+        workspace = _make_workspace(tmp_path)
+        SyncJournal(workspace).record_workspace_state('main')
+        _write_manifest(workspace, 'release')
+        assert SyncJournal(workspace).is_stale('main')
+
+    def test_missing_state_is_stale(self, tmp_path):
+        workspace = _make_workspace(tmp_path)
+        SyncJournal(workspace)
+        assert SyncJournal(workspace).is_stale('main')
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+#
+## @file
+# workspace_journal.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Records the progress of a multi-step workspace operation so that an interrupted operation can be resumed.
+
+A journal is a JSON file in the workspace's repo directory. It lists the stages each repository has completed, the
+stages completed once for the entire workspace, and the options the operation was started with. It is removed once the
+operation has finished, so a workspace containing a journal was interrupted.
+'''
+
+import json
+import os
+import threading
+
+from edkrepo.common.json_utilities import write_json_file
+
+def get_journal_path(workspace_path, journal_file):
+    return os.path.join(workspace_path, 'repo', journal_file)
+
+class WorkspaceJournal(object):
+    '''Tracks the stages completed by each repository of a workspace.
+
+    Stages may be recorded from several threads at the same time, every update is written to disk before record
+    returns. Subclasses set JOURNAL_FILE and OPTIONS_KEY.
+    '''
+    JOURNAL_FILE = None
+    OPTIONS_KEY = 'options'
+
+    def __init__(self, workspace_path, options=None):
+        '''Opens the journal of workspace_path, creating it if it does not exist.
+
+        Arguments:
+        workspace_path - the path to the workspace.
+        options - a dictionary of the operation's settings, stored when a new journal is created so that a resumed
+                  operation uses the same settings.
+        '''
+        self._path = get_journal_path(workspace_path, self.JOURNAL_FILE)
+        self._lock = threading.Lock()
+        if os.path.isfile(self._path):
+            with open(self._path, 'r') as journal_file:
+                self._data = json.load(journal_file)
+            self._data.setdefault('repos', {})
+            self._data.setdefault('workspace', [])
+            self._data.setdefault(self.OPTIONS_KEY, {})
+        else:
+            self._data = {'repos': {}, 'workspace': [], self.OPTIONS_KEY: options or {}}
+            self._write()
+
+    @property
+    def options(self):
+        return self._data[self.OPTIONS_KEY]
+
+    def set_options(self, options):
+        '''Replaces the stored settings, for operations that only know them after the journal was created.'''
+        with self._lock:
+            self._data[self.OPTIONS_KEY] = options
+            self._write()
+
+    def has_stage(self, root, stage):
+        with self._lock:
+            return stage in self._data['repos'].get(root, [])
+
+    def record(self, root, stage):
+        with self._lock:
+            stages = self._data['repos'].setdefault(root, [])
+            if stage not in stages:
+                stages.append(stage)
+                self._write()
+
+    def has_workspace_stage(self, stage):
+        with self._lock:
+            return stage in self._data['workspace']
+
+    def record_workspace_stage(self, stage):
+        with self._lock:
+            if stage not in self._data['workspace']:
+                self._data['workspace'].append(stage)
+                self._write()
+
+    def finish(self):
+        '''Removes the journal once every stage of the operation has completed.'''
+        with self._lock:
+            if os.path.isfile(self._path):
+                os.remove(self._path)
+
+    def _write(self):
+        write_json_file(self._path, self._data)
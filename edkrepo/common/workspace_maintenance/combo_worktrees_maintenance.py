@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+#
+## @file
+# combo_worktrees_maintenance.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Gives each combination of a workspace its own set of git worktrees so that switching combinations re-points the
+workspace instead of rewriting its working trees.
+
+The repositories of each combination, called a view, are kept in repo/combo_worktrees/<view> laid out like the
+workspace. Each top level directory of the workspace that contains repositories is a link (a junction on Windows) to
+the same directory of the active view. The repositories of the view that was active when the mode was enabled own the
+object stores. The repositories of the other views are linked worktrees of them, so all views share one object store
+per repository. The worktrees of inactive views are left on a detached HEAD so that the active view can check out any
+branch.
+'''
+
+import json
+import os
+import re
+import stat
+import sys
+
+from git import Repo
+
+from edkrepo.common.checkout_planner import get_target_ref, resolve_commit
+from edkrepo.common.git_object_query import close_object_queries
+from edkrepo.common.json_utilities import write_json_file
+
+COMBO_WORKTREES_FILE = 'combo_worktrees.json'
+COMBO_WORKTREES_DIR = 'combo_worktrees'
+
+def get_combo_worktrees_path(workspace_path):
+    return os.path.join(workspace_path, 'repo', COMBO_WORKTREES_FILE)
+
+def get_view_path(workspace_path, view_name):
+    return os.path.join(workspace_path, 'repo', COMBO_WORKTREES_DIR, view_name)
+
+def read_combo_worktrees(workspace_path):
+    '''Returns a dictionary with the 'views' of each combination, the 'active_view', the 'main_view' and the branches
+    each inactive view was on ('heads'), or None if the workspace does not use worktrees per combination.'''
+    state_path = get_combo_worktrees_path(workspace_path)
+    if not os.path.isfile(state_path):
+        return None
+    with open(state_path, 'r') as state_file:
+        state = json.load(state_file)
+    state.setdefault('views', {})
+    state.setdefault('heads', {})
+    return state
+
+def write_combo_worktrees(workspace_path, state):
+    write_json_file(get_combo_worktrees_path(workspace_path), state)
+
+def combo_worktrees_enabled(workspace_path):
+    return os.path.isfile(get_combo_worktrees_path(workspace_path))
+
+def get_top_level_dirs(repo_sources):
+    '''Returns the sorted list of the top level workspace directories that contain the repositories in repo_sources.'''
+    return sorted(set(os.path.normpath(x.root).split(os.sep)[0] for x in repo_sources))
+
+def get_all_sources(manifest):
+    '''Returns the RepoSource tuples of every repository used by any combination of the manifest, one per root.'''
+    sources = {}
+    for combo in manifest.combinations + manifest.archived_combinations:
+        for source in manifest.get_repo_sources(combo.name):
+            sources.setdefault(source.root, source)
+    return list(sources.values())
+
+def _get_view_name(state, combo):
+    if combo in state['views']:
+        return state['views'][combo]
+    base_name = re.sub(r'[^\w.-]', '_', combo) or 'combo'
+    view_name = base_name
+    index = 1
+    while view_name in state['views'].values():
+        index += 1
+        view_name = '{}_{}'.format(base_name, index)
+    state['views'][combo] = view_name
+    return view_name
+
+def is_link(path):
+    '''Returns True if path is a symbolic link or a Windows junction.'''
+    if os.path.islink(path):
+        return True
+    if sys.platform == 'win32':
+        try:
+            return bool(os.lstat(path).st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+        except OSError:
+            return False
+    return False
+
+def _create_link(link_path, target_path):
+    if sys.platform == 'win32':
+        # Junctions do not need the symbolic link privilege
+        import _winapi
+        _winapi.CreateJunction(target_path, link_path)
+    else:
+        os.symlink(target_path, link_path, target_is_directory=True)
+
+def _remove_link(link_path):
+    if sys.platform == 'win32':
+        # Removes the junction without touching the directory it points to
+        os.rmdir(link_path)
+    else:
+        os.unlink(link_path)
+
+def enable_combo_worktrees(workspace_path, manifest, combo):
+    '''Moves the repositories of the workspace into the view of the active combination and replaces the top level
+    directories that contain them with links to the view. Returns the path to the view.
+
+    Arguments:
+    workspace_path - the path to the workspace
+    manifest - the ManifestXml object of the workspace
+    combo - the name of the active combination
+    '''
+    state = {'views': {}, 'heads': {}}
+    view_name = _get_view_name(state, combo)
+    state['main_view'] = view_name
+    state['active_view'] = view_name
+    view_path = get_view_path(workspace_path, view_name)
+    os.makedirs(view_path, exist_ok=True)
+    for top_level_dir in get_top_level_dirs(get_all_sources(manifest)):
+        workspace_dir = os.path.join(workspace_path, top_level_dir)
+        if not os.path.isdir(workspace_dir) or is_link(workspace_dir):
+            continue
+        # Windows does not move a directory that a running git cat-file works in
+        close_object_queries(workspace_dir)
+        os.rename(workspace_dir, os.path.join(view_path, top_level_dir))
+        _create_link(workspace_dir, os.path.join(view_path, top_level_dir))
+    write_combo_worktrees(workspace_path, state)
+    return view_path
+
+def _find_main_repo(workspace_path, state, root):
+    '''Returns the Repo object of the repository that owns the object store of root, or None if root has not been
+    cloned.'''
+    view_names = [state['main_view']] + sorted(set(state['views'].values()) - {state['main_view']})
+    for view_name in view_names:
+        repo_path = os.path.join(get_view_path(workspace_path, view_name), root)
+        if os.path.isdir(os.path.join(repo_path, '.git')):
+            return Repo(repo_path)
+    return None
+
+def _detach_view(workspace_path, state, view_name, repo_sources):
+    '''Records the branch each repository of a view is on and detaches its HEAD without touching the working tree.'''
+    heads = {}
+    view_path = get_view_path(workspace_path, view_name)
+    for source in repo_sources:
+        repo_path = os.path.join(view_path, source.root)
+        if not os.path.exists(os.path.join(repo_path, '.git')):
+            continue
+        repo = Repo(repo_path)
+        if repo.head.is_detached or not repo.head.is_valid():
+            continue
+        heads[source.root] = repo.active_branch.name
+        repo.head.reference = repo.head.commit
+    state['heads'][view_name] = heads
+
+def _attach_view(workspace_path, state, view_name):
+    '''Checks the repositories of a view out onto the branches they were on when it was detached, if the branches
+    still point at the same commit. Other repositories are left detached for the checkout to update.'''
+    view_path = get_view_path(workspace_path, view_name)
+    for root, branch in state['heads'].pop(view_name, {}).items():
+        repo_path = os.path.join(view_path, root)
+        if not os.path.exists(os.path.join(repo_path, '.git')):
+            continue
+        repo = Repo(repo_path)
+        if branch in repo.heads and repo.heads[branch].commit == repo.head.commit:
+            repo.head.reference = repo.heads[branch]
+
+def _add_worktrees(workspace_path, state, view_name, combo, repo_sources):
+    '''Creates the worktrees of the repositories of repo_sources that are missing from a view. Returns the RepoSource
+    tuples of the created worktrees.'''
+    view_path = get_view_path(workspace_path, view_name)
+    added_sources = []
+    # Parents are created before the repositories nested in them
+    for source in sorted(repo_sources, key=lambda x: len(os.path.normpath(x.root).split(os.sep))):
+        worktree_path = os.path.join(view_path, source.root)
+        if os.path.exists(os.path.join(worktree_path, '.git')):
+            continue
+        main_repo = _find_main_repo(workspace_path, state, source.root)
+        if main_repo is None:
+            continue
+        # Start on the commit the combination uses so that the checkout does not have to rewrite the files again
+        target_ref = get_target_ref(main_repo, source)
+        start_point = resolve_commit(main_repo, target_ref) if target_ref is not None else None
+        if start_point is None:
+            start_point = main_repo.head.commit.hexsha
+        main_repo.git.worktree('add', '--detach', worktree_path, start_point)
+        # Keep git worktree prune and git gc from removing the worktrees of inactive views
+        main_repo.git.worktree('lock', '--reason', 'edkrepo combination {}'.format(combo), worktree_path)
+        added_sources.append(source)
+    return added_sources
+
+def _point_workspace_at_view(workspace_path, view_name, top_level_dirs):
+    view_path = get_view_path(workspace_path, view_name)
+    for top_level_dir in top_level_dirs:
+        workspace_dir = os.path.join(workspace_path, top_level_dir)
+        view_dir = os.path.join(view_path, top_level_dir)
+        if os.path.lexists(workspace_dir):
+            if not is_link(workspace_dir):
+                # A directory that is not part of any view, such as a repository added by sync, is left in place
+                continue
+            _remove_link(workspace_dir)
+        if os.path.isdir(view_dir):
+            _create_link(workspace_dir, view_dir)
+
+def switch_combo_view(workspace_path, manifest, combo):
+    '''Points the workspace at the view of combo, creating the worktrees of the view that do not exist yet. Returns
+    the RepoSource tuples of the created worktrees, whose submodules still need to be initialized.
+
+    Arguments:
+    workspace_path - the path to the workspace
+    manifest - the ManifestXml object of the workspace
+    combo - the combination to switch to
+    '''
+    state = read_combo_worktrees(workspace_path)
+    all_sources = get_all_sources(manifest)
+    active_view = state['active_view']
+    view_name = _get_view_name(state, combo)
+    if view_name != active_view:
+        _detach_view(workspace_path, state, active_view, all_sources)
+        _point_workspace_at_view(workspace_path, view_name, get_top_level_dirs(all_sources))
+        state['active_view'] = view_name
+    added_sources = _add_worktrees(workspace_path, state, view_name, combo, manifest.get_repo_sources(combo))
+    if added_sources:
+        _point_workspace_at_view(workspace_path, view_name, get_top_level_dirs(added_sources))
+    _attach_view(workspace_path, state, view_name)
+    write_combo_worktrees(workspace_path, state)
+    return added_sources
+
+def get_active_combo_view(workspace_path):
+    '''Returns the name of the active view or None if the workspace does not use worktrees per combination.'''
+    state = read_combo_worktrees(workspace_path)
+    return state['active_view'] if state is not None else None
+
+def activate_view(workspace_path, manifest, view_name):
+    '''Points the workspace back at a view that was active before, for use when a checkout fails.'''
+    state = read_combo_worktrees(workspace_path)
+    if state['active_view'] == view_name:
+        return
+    all_sources = get_all_sources(manifest)
+    _detach_view(workspace_path, state, state['active_view'], all_sources)
+    _point_workspace_at_view(workspace_path, view_name, get_top_level_dirs(all_sources))
+    state['active_view'] = view_name
+    _attach_view(workspace_path, state, view_name)
+    write_combo_worktrees(workspace_path, state)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+#
+## @file
+# deferred_repos_maintenance.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Tracks the repositories of a lazily cloned workspace that have not been cloned yet.
+
+edkrepo clone --lazy writes the workspace manifest but defers cloning the repositories of the combination. The roots
+of the deferred repositories and the clone options used to create the workspace are stored in the workspace's repo
+directory until each repository is materialized. The roots whose clone was started by edkrepo materialize are recorded
+as well, so that only directories edkrepo created are removed when a failed materialize is repeated.
+'''
+
+import json
+import os
+
+from edkrepo.common.json_utilities import write_json_file
+
+DEFERRED_REPOS_FILE = 'deferred_repos.json'
+DEFERRED_CLONE_OPTIONS = ['treeless', 'blobless', 'full', 'single_branch', 'no_tags', 'full_fetch']
+
+def get_deferred_repos_path(workspace_path):
+    return os.path.join(workspace_path, 'repo', DEFERRED_REPOS_FILE)
+
+def read_deferred_repos(workspace_path):
+    '''Returns a dictionary with the deferred 'roots' and the 'clone_options' of the workspace or None if the workspace
+    was not cloned with --lazy.'''
+    deferred_repos_path = get_deferred_repos_path(workspace_path)
+    if not os.path.isfile(deferred_repos_path):
+        return None
+    with open(deferred_repos_path, 'r') as deferred_repos_file:
+        state = json.load(deferred_repos_file)
+    state.setdefault('roots', [])
+    state.setdefault('clone_options', {})
+    return state
+
+def write_deferred_repos(workspace_path, roots, clone_options, started_roots=None):
+    '''Records the deferred repositories of the workspace.
+
+    Arguments:
+    workspace_path - the path to the workspace.
+    roots - the local roots of the repositories that have not been cloned.
+    clone_options - a dictionary of the clone settings to use when the repositories are materialized.
+    started_roots - the deferred roots whose clone was started but has not completed.
+    '''
+    state = {'roots': sorted(set(roots)), 'clone_options': clone_options}
+    started_roots = set(started_roots or []).intersection(state['roots'])
+    if started_roots:
+        state['started_roots'] = sorted(started_roots)
+    write_json_file(get_deferred_repos_path(workspace_path), state)
+
+def is_lazy_workspace(workspace_path):
+    return os.path.isfile(get_deferred_repos_path(workspace_path))
+
+def get_deferred_roots(workspace_path):
+    '''Returns the set of local roots that have not been cloned into the workspace.'''
+    state = read_deferred_repos(workspace_path)
+    if state is None:
+        return set()
+    return set(state['roots'])
+
+def filter_materialized(workspace_path, repo_sources):
+    '''Returns the repo sources in repo_sources that are present in the workspace, skipping deferred repositories.'''
+    deferred_roots = get_deferred_roots(workspace_path)
+    return [repo_source for repo_source in repo_sources if repo_source.root not in deferred_roots]
+
+def filter_deferred(workspace_path, repo_sources):
+    '''Returns the repo sources in repo_sources that have not been cloned into the workspace.'''
+    deferred_roots = get_deferred_roots(workspace_path)
+    return [repo_source for repo_source in repo_sources if repo_source.root in deferred_roots]
+
+def defer_repos(workspace_path, roots, clone_options=None):
+    '''Adds roots to the deferred repositories of the workspace. The recorded clone options are replaced only when
+    clone_options is given.'''
+    state = read_deferred_repos(workspace_path)
+    if state is None:
+        state = {'roots': [], 'clone_options': {}}
+    if clone_options is None:
+        clone_options = state['clone_options']
+    write_deferred_repos(workspace_path, set(state['roots']).union(roots), clone_options, state.get('started_roots'))
+
+def get_started_roots(workspace_path):
+    '''Returns the set of deferred roots whose clone was started by a materialize that did not complete it.'''
+    state = read_deferred_repos(workspace_path)
+    if state is None:
+        return set()
+    return set(state.get('started_roots', []))
+
+def mark_materialize_started(workspace_path, roots):
+    '''Records that the clones of the deferred roots are about to start.'''
+    state = read_deferred_repos(workspace_path)
+    if state is None:
+        return
+    write_deferred_repos(workspace_path, state['roots'], state['clone_options'],
+                         set(state.get('started_roots', [])).union(roots))
+
+def mark_materialized(workspace_path, roots):
+    '''Removes roots from the deferred repositories of the workspace.'''
+    state = read_deferred_repos(workspace_path)
+    if state is None:
+        return
+    write_deferred_repos(workspace_path, set(state['roots']).difference(roots), state['clone_options'],
+                         state.get('started_roots'))
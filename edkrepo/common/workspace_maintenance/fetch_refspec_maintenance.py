@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+#
+## @file
+# fetch_refspec_maintenance.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Limits the fetch refspecs of workspace repositories to the refs the project manifest uses.
+
+git clone configures +refs/heads/*:refs/remotes/origin/*, so every fetch negotiates and stores every branch on the
+server. A scoped repository instead fetches one refspec per branch it needs: the branch of each combination that was
+checked out, the branches used by its patchset, the branches its local branches track, and the git notes. Branches of
+other combinations are added when a combination using them is checked out.
+
+A workspace cloned with --full-fetch is recorded in the workspace's repo directory so that later commands, such as
+edkrepo maintenance and the clones of repositories added by edkrepo sync, keep fetching every branch.
+'''
+
+import json
+import os
+import subprocess
+
+from git.exc import GitCommandError
+
+from edkrepo.common.json_utilities import write_json_file
+
+FETCH_SETTINGS_FILE = 'fetch_settings.json'
+FULL_FETCH_REFSPEC = '+refs/heads/*:refs/remotes/{}/*'
+BRANCH_REFSPEC = '+refs/heads/{1}:refs/remotes/{0}/{1}'
+NOTES_REFSPEC = 'refs/notes/*:refs/notes/*'
+
+def get_fetch_settings_path(workspace_path):
+    return os.path.join(workspace_path, 'repo', FETCH_SETTINGS_FILE)
+
+def set_workspace_full_fetch(workspace_path):
+    '''Records that the repositories of the workspace fetch every branch.'''
+    write_json_file(get_fetch_settings_path(workspace_path), {'full_fetch': True})
+
+def is_workspace_full_fetch(workspace_path):
+    '''Returns True if the workspace was cloned with --full-fetch.'''
+    fetch_settings_path = get_fetch_settings_path(workspace_path)
+    if not os.path.isfile(fetch_settings_path):
+        return False
+    with open(fetch_settings_path, 'r') as fetch_settings_file:
+        return bool(json.load(fetch_settings_file).get('full_fetch', False))
+
+def get_branch_refspec(branch, remote_name='origin'):
+    return BRANCH_REFSPEC.format(remote_name, branch)
+
+def get_fetch_refspecs(repo, remote_name='origin'):
+    '''Returns the list of fetch refspecs configured for remote_name.'''
+    try:
+        return repo.git.config('--get-all', 'remote.{}.fetch'.format(remote_name)).splitlines()
+    except GitCommandError:
+        return []
+
+def is_full_fetch(repo, remote_name='origin'):
+    '''Returns True if the repository fetches every branch of remote_name.'''
+    return FULL_FETCH_REFSPEC.format(remote_name) in get_fetch_refspecs(repo, remote_name)
+
+def get_manifest_branches(manifest, repo_source):
+    '''Returns the set of branches of the remote that repo_source needs: its branch and, for a patchset, the branch
+    the patchset is fetched from and the branches its cherry-picks are taken from.'''
+    branches = set()
+    if repo_source.branch:
+        branches.add(repo_source.branch)
+    if repo_source.patch_set:
+        try:
+            patchset = manifest.get_patchset(repo_source.patch_set, repo_source.remote_name)
+            operations_list = manifest.get_patchset_operations(patchset.name, patchset.remote)
+        except (KeyError, ValueError):
+            return branches
+        if patchset.fetch_branch:
+            branches.add(patchset.fetch_branch)
+        for operations in operations_list:
+            for operation in operations:
+                # Operations naming another remote fetch from a temporary remote
+                if operation.source_branch and not operation.source_remote:
+                    branches.add(operation.source_branch)
+    return branches
+
+def get_upstream_branches(repo, remote_name='origin'):
+    '''Returns the set of branches of remote_name that local branches track.'''
+    branches = set()
+    prefix = 'refs/heads/'
+    for line in repo.git.for_each_ref('--format=%(upstream:remotename) %(upstream:remoteref)', 'refs/heads').splitlines():
+        upstream_remote, _, upstream_ref = line.partition(' ')
+        if upstream_remote == remote_name and upstream_ref.startswith(prefix):
+            branches.add(upstream_ref[len(prefix):])
+    return branches
+
+def _set_fetch_refspecs(repo, refspecs, remote_name):
+    key = 'remote.{}.fetch'.format(remote_name)
+    try:
+        repo.git.config('--unset-all', key)
+    except GitCommandError:
+        # The remote had no fetch refspecs
+        pass
+    for refspec in refspecs:
+        repo.git.config('--add', key, refspec)
+
+def is_fetched(ref, refspecs):
+    '''Returns True if one of refspecs fetches into ref.'''
+    for refspec in refspecs:
+        destination = refspec.partition(':')[2]
+        if '*' in destination:
+            head, _, tail = destination.partition('*')
+            if ref.startswith(head) and ref.endswith(tail):
+                return True
+        elif ref == destination:
+            return True
+    return False
+
+def _remove_untracked_remote_refs(repo, refspecs, remote_name):
+    '''Deletes the remote-tracking refs of remote_name that none of refspecs fetch into.'''
+    prefix = 'refs/remotes/{}/'.format(remote_name)
+    head_ref = '{}HEAD'.format(prefix)
+    untracked_refs = [ref for ref in repo.git.for_each_ref('--format=%(refname)', prefix).splitlines()
+                      if ref != head_ref and not is_fetched(ref, refspecs)]
+    try:
+        head_target = repo.git.symbolic_ref('-q', head_ref)
+    except GitCommandError:
+        head_target = None
+    if head_target is not None and not is_fetched(head_target, refspecs):
+        # A dangling origin/HEAD makes git warn on every command that resolves refs
+        repo.git.symbolic_ref('--delete', head_ref)
+    if untracked_refs:
+        # Delete every ref in one transaction, servers may have thousands of branches
+        commands = ''.join('delete {}\n'.format(ref) for ref in untracked_refs)
+        subprocess.run(['git', 'update-ref', '--stdin'], cwd=repo.working_dir, input=commands,
+                       universal_newlines=True, check=True)
+    return untracked_refs
+
+def scope_fetch_refspecs(repo, manifest, repo_source, remote_name='origin'):
+    '''Replaces a fetch of every branch with a fetch of the branches repo_source needs.
+
+    Refspecs already configured for individual branches, such as the branches of combinations checked out earlier,
+    are kept. The remote-tracking refs of branches that are no longer fetched are deleted. Returns the list of deleted
+    refs.
+
+    Arguments:
+    repo - the GitPython Repo object of the workspace repository
+    manifest - the ManifestXml object of the workspace
+    repo_source - the RepoSource tuple of the repository in the current combination
+    remote_name - the remote to scope
+    '''
+    full_refspec = FULL_FETCH_REFSPEC.format(remote_name)
+    refspecs = [refspec for refspec in get_fetch_refspecs(repo, remote_name) if refspec != full_refspec]
+    branches = get_manifest_branches(manifest, repo_source) | get_upstream_branches(repo, remote_name)
+    for branch in sorted(branches):
+        branch_refspec = get_branch_refspec(branch, remote_name)
+        if branch_refspec not in refspecs:
+            refspecs.append(branch_refspec)
+    if NOTES_REFSPEC not in refspecs:
+        refspecs.append(NOTES_REFSPEC)
+    _set_fetch_refspecs(repo, refspecs, remote_name)
+    return _remove_untracked_remote_refs(repo, refspecs, remote_name)
+
+def track_branch(repo, branch, remote_name='origin'):
+    '''Adds a refspec for branch to a scoped repository. Returns True if the refspec was added, in which case the
+    branch has to be fetched before its remote-tracking ref is used.'''
+    refspecs = get_fetch_refspecs(repo, remote_name)
+    branch_refspec = get_branch_refspec(branch, remote_name)
+    if FULL_FETCH_REFSPEC.format(remote_name) in refspecs or branch_refspec in refspecs:
+        return False
+    repo.git.config('--add', 'remote.{}.fetch'.format(remote_name), branch_refspec)
+    return True
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+#
+## @file
+# fsmonitor_maintenance.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Registers workspace repositories with a filesystem monitor.
+
+With core.fsmonitor set, git asks the monitor which paths changed since the index was last written instead of checking
+every file and directory of the working tree, which speeds up git status, the check for uncommitted changes and the
+working tree updates of sparse checkout. git's builtin monitor daemon is used on Windows and macOS. On Linux, where git
+does not provide one, a hook shipped with edkrepo queries Watchman, which watches the working tree with inotify.
+
+The value edkrepo writes to core.fsmonitor is also recorded in edkrepo.fsmonitor, so that a monitor configured by the
+user, even one using git's builtin daemon, is never changed or removed.
+'''
+
+import os
+import shutil
+import sys
+
+import git
+from git.exc import GitCommandError
+
+import edkrepo.git_automation as git_automation
+
+FSMONITOR_MODE_BUILTIN = 'builtin'
+FSMONITOR_MODE_WATCHMAN = 'watchman'
+BUILTIN_FSMONITOR_MIN_GIT_VERSION = (2, 36)
+BUILTIN_FSMONITOR_PLATFORMS = ('win32', 'darwin')
+WATCHMAN_HOOK = os.path.join(os.path.dirname(git_automation.__file__), 'fsmonitor_watchman.py')
+FSMONITOR_KEY = 'core.fsmonitor'
+EDKREPO_FSMONITOR_KEY = 'edkrepo.fsmonitor'
+
+def get_fsmonitor_mode():
+    '''Returns the filesystem monitor available on this system, FSMONITOR_MODE_BUILTIN or FSMONITOR_MODE_WATCHMAN, or
+    None if there is none.'''
+    if sys.platform in BUILTIN_FSMONITOR_PLATFORMS:
+        if git.Git().version_info >= BUILTIN_FSMONITOR_MIN_GIT_VERSION:
+            return FSMONITOR_MODE_BUILTIN
+        return None
+    if shutil.which('watchman'):
+        return FSMONITOR_MODE_WATCHMAN
+    return None
+
+def get_watchman_hook_command(interpreter=sys.executable):
+    '''Returns the core.fsmonitor value that runs the Watchman hook with interpreter. git runs it through the shell.'''
+    return '"{}" "{}"'.format(interpreter, WATCHMAN_HOOK)
+
+def _get_config(repo, key):
+    try:
+        return repo.git.config('--local', '--get', key)
+    except GitCommandError:
+        return None
+
+def _unset_config(repo, key):
+    try:
+        repo.git.config('--local', '--unset', key)
+    except GitCommandError:
+        # The key was not set
+        pass
+
+def _is_edkrepo_fsmonitor(repo, value):
+    '''Returns True if value, the core.fsmonitor setting of repo, was written by enable_fsmonitor().'''
+    if value is None:
+        return False
+    return WATCHMAN_HOOK in value or _get_config(repo, EDKREPO_FSMONITOR_KEY) == value
+
+def enable_fsmonitor(repo, interpreter=sys.executable):
+    '''Registers a repository with the filesystem monitor returned by get_fsmonitor_mode(). A monitor configured by
+    the user is left as is. Returns True if the configuration was changed.
+
+    Arguments:
+    repo - the GitPython Repo object of the workspace repository
+    interpreter - the Python interpreter that runs the Watchman hook
+    '''
+    mode = get_fsmonitor_mode()
+    if mode == FSMONITOR_MODE_BUILTIN:
+        value = 'true'
+    elif mode == FSMONITOR_MODE_WATCHMAN:
+        value = get_watchman_hook_command(interpreter)
+    else:
+        return False
+    current_value = _get_config(repo, FSMONITOR_KEY)
+    if current_value == value or (current_value is not None and not _is_edkrepo_fsmonitor(repo, current_value)):
+        return False
+    repo.git.config('--local', FSMONITOR_KEY, value)
+    repo.git.config('--local', EDKREPO_FSMONITOR_KEY, value)
+    return True
+
+def disable_fsmonitor(repo):
+    '''Removes a repository from the filesystem monitor registered by enable_fsmonitor(). Returns True if the
+    configuration was changed.'''
+    value = _get_config(repo, FSMONITOR_KEY)
+    if not _is_edkrepo_fsmonitor(repo, value):
+        return False
+    if value == 'true':
+        try:
+            repo.git.fsmonitor__daemon('stop')
+        except GitCommandError:
+            # The daemon was not running
+            pass
+    _unset_config(repo, FSMONITOR_KEY)
+    _unset_config(repo, EDKREPO_FSMONITOR_KEY)
+    return True
@@ -9,6 +9,8 @@
 
 import os
 
+from git import Repo
+
 def write_git_exclude(repo_path, exclude_pattern):
     '''Writes the given exclude patterns to the .git/info/exclude file in the specified repository.
 
@@ -16,7 +18,11 @@ def write_git_exclude(repo_path, exclude_pattern):
     repo_path - The path to the repository
     exclude_patterns - A list of patterns to add to the exclude file
     '''
-    exclude_file_path = os.path.join(repo_path, '.git', 'info', 'exclude')
+    git_dir = os.path.join(repo_path, '.git')
+    if os.path.isfile(git_dir):
+        # A linked worktree shares the exclude file of its main repository
+        git_dir = Repo(repo_path).common_dir
+    exclude_file_path = os.path.join(git_dir, 'info', 'exclude')
     with open(exclude_file_path, 'a') as exclude_file:
         exclude_file.write(exclude_pattern + '\n')
 
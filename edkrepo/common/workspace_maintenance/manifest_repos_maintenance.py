@@ -223,7 +223,7 @@ def find_project_in_all_indices (project, edkrepo_cfg, edkrepo_user_cfg, except_
         except KeyError:
             raise EdkrepoInvalidParametersException(except_msg_man_repo)
     elif os.path.isabs(project):
-        manifest = ManifestXml(project)
+        manifest = ManifestXml(project, lazy=True)
         try:
             found_manifest_repo, found_cfg, found_project = find_project_in_all_indices(manifest.project_info.codename,
                                                                                         edkrepo_cfg,
@@ -235,7 +235,7 @@ def find_project_in_all_indices (project, edkrepo_cfg, edkrepo_user_cfg, except_
         except EdkrepoManifestNotFoundException:
             return None, None, project
     elif os.path.isfile(os.path.join(os.getcwd(), project)):
-        manifest = ManifestXml(os.path.join(os.getcwd(), project))
+        manifest = ManifestXml(os.path.join(os.getcwd(), project), lazy=True)
         try:
             found_manifest_repo, found_cfg, found_project = find_project_in_all_indices(manifest.project_info.codename,
                                                                                         edkrepo_cfg,
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+#
+## @file
+# status_cache_maintenance.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''Enables the git index extensions that make checking a workspace repository for local changes cheap.
+
+The untracked cache records the mtime of every directory so that git status only reads the directories that changed
+since the last status instead of the whole working tree. The split index keeps the bulk of the index in a shared file,
+so the refreshed index git status writes back only contains the entries that changed.
+'''
+
+from git.exc import GitCommandError
+
+STATUS_CACHE_CONFIG = [('core.untrackedCache', 'true'), ('core.splitIndex', 'true')]
+
+def status_caches_enabled(repo):
+    '''Returns True if the untracked cache and the split index are enabled in the repository config.'''
+    for key, value in STATUS_CACHE_CONFIG:
+        try:
+            if repo.git.config('--local', '--get', key) != value:
+                return False
+        except GitCommandError:
+            return False
+    return True
+
+def enable_status_caches(repo):
+    '''Enables the untracked cache and the split index of a repository and writes its index with both extensions.
+    Returns True if the configuration was changed.
+
+    Arguments:
+    repo - the GitPython Repo object of the workspace repository
+    '''
+    if status_caches_enabled(repo):
+        return False
+    for key, value in STATUS_CACHE_CONFIG:
+        repo.git.config('--local', key, value)
+    # Write the extensions now, commands that only read the index would not add them. Filesystems without reliable
+    # directory mtimes reject the untracked cache, in which case git status keeps scanning the whole working tree
+    try:
+        repo.git.update_index('--untracked-cache', '--split-index')
+    except GitCommandError:
+        pass
+    return True
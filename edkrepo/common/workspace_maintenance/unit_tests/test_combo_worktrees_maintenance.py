@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_combo_worktrees_maintenance.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import argparse
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../..")))
+import edkrepo.commands.sync_command as sync_command
+import edkrepo.common.workspace_maintenance.combo_worktrees_maintenance as combo_worktrees_maintenance
+from edkrepo.common.common_repo_functions import checkout
+from edkrepo.common.unit_test_bases import base_tests as bt
+from edkrepo_manifest_parser.edk_manifest import ManifestXml
+
+ROOTS = ['edk2', os.path.join('Platform', 'Board')]
+HOOKS = '''  <ClientGitHookList>
+    <ClientGitHook source="hooks/pre-commit" destination=".git/hooks" remote="edk2"/>
+  </ClientGitHookList>
+'''
+
+def _make_workspace(tmp_path, extra=''):
+    '''Creates a workspace whose repositories are on main, with a dev branch one commit ahead on each remote.'''
+    workspace = str(tmp_path / 'workspace')
+    os.makedirs(workspace)
+    remotes = bt.clone_remotes(tmp_path, workspace, ROOTS, {'file.txt': 'main\n'}, {'file.txt': 'dev\n'})
+    combinations = {'main': ('<Source localRoot="edk2" remote="edk2" branch="main"/>'
+                             '<Source localRoot="Platform/Board" remote="Board" branch="main"/>'),
+                    'dev/next': ('<Source localRoot="edk2" remote="edk2" branch="dev"/>'
+                                 '<Source localRoot="Platform/Board" remote="Board" branch="main"/>')}
+    return workspace, bt.write_manifest(workspace, remotes, combinations, extra)
+
+def _read(workspace, root):
+    with open(os.path.join(workspace, root, 'file.txt')) as test_file:
+        return test_file.read()
+
+class TestComboWorktreesMaintenance:
+
+    def test_enable(self, tmp_path):
+        workspace, manifest = _make_workspace(tmp_path)
+        view_path = combo_worktrees_maintenance.enable_combo_worktrees(workspace, manifest, 'main')
+        for top_level_dir in ['edk2', 'Platform']:
+            assert combo_worktrees_maintenance.is_link(os.path.join(workspace, top_level_dir))
+            assert os.path.isdir(os.path.join(view_path, top_level_dir))
+        assert bt.run_git(os.path.join(workspace, 'edk2'), 'rev-parse', '--abbrev-ref', 'HEAD') == 'main'
+        state = combo_worktrees_maintenance.read_combo_worktrees(workspace)
+        assert state['main_view'] == state['active_view'] == 'main'
+        assert combo_worktrees_maintenance.get_active_combo_view(workspace) == 'main'
+
+    def test_switch_creates_worktrees(self, tmp_path):
+        workspace, manifest = _make_workspace(tmp_path)
+        main_path = combo_worktrees_maintenance.enable_combo_worktrees(workspace, manifest, 'main')
+        added = combo_worktrees_maintenance.switch_combo_view(workspace, manifest, 'dev/next')
+        assert sorted(x.root for x in added) == sorted(ROOTS)
+        view_name = combo_worktrees_maintenance.get_active_combo_view(workspace)
+        assert view_name == 'dev_next'
+        dev_path = combo_worktrees_maintenance.get_view_path(workspace, view_name)
+        # The worktrees share the object store of the repositories of the main view and start on the commit of the
+        # combination
+        for root, branch in zip(ROOTS, ['origin/dev', 'main']):
+            assert os.path.isfile(os.path.join(dev_path, root, '.git'))
+            assert bt.run_git(os.path.join(dev_path, root), 'rev-parse', 'HEAD') == \
+                bt.run_git(os.path.join(main_path, root), 'rev-parse', branch)
+        assert _read(workspace, 'edk2') == 'dev\n'
+        assert _read(workspace, ROOTS[1]) == 'main\n'
+        worktrees = bt.run_git(os.path.join(main_path, 'edk2'), 'worktree', 'list', '--porcelain')
+        assert 'locked edkrepo combination dev/next' in worktrees
+        # The main view is parked on a detached HEAD so the worktrees can check out its branches
+        assert bt.run_git(os.path.join(main_path, 'edk2'), 'rev-parse', '--abbrev-ref', 'HEAD') == 'HEAD'
+        state = combo_worktrees_maintenance.read_combo_worktrees(workspace)
+        assert state['heads']['main'] == {root: 'main' for root in ROOTS}
+
+    def test_switch_back(self, tmp_path):
+        workspace, manifest = _make_workspace(tmp_path)
+        combo_worktrees_maintenance.enable_combo_worktrees(workspace, manifest, 'main')
+        combo_worktrees_maintenance.switch_combo_view(workspace, manifest, 'dev/next')
+        with open(os.path.join(workspace, 'edk2', 'file.txt'), 'w') as test_file:
+            test_file.write('local change\n')
+        assert combo_worktrees_maintenance.switch_combo_view(workspace, manifest, 'main') == []
+        assert bt.run_git(os.path.join(workspace, 'edk2'), 'rev-parse', '--abbrev-ref', 'HEAD') == 'main'
+        assert _read(workspace, 'edk2') == 'main\n'
+        # The local change stays in the worktree of the inactive combination
+        assert combo_worktrees_maintenance.switch_combo_view(workspace, manifest, 'dev/next') == []
+        assert _read(workspace, 'edk2') == 'local change\n'
+
+    def test_unmanaged_directory_left_in_place(self, tmp_path):
+        workspace, manifest = _make_workspace(tmp_path)
+        combo_worktrees_maintenance.enable_combo_worktrees(workspace, manifest, 'main')
+        os.makedirs(os.path.join(workspace, 'Build'))
+        combo_worktrees_maintenance.switch_combo_view(workspace, manifest, 'dev/next')
+        assert os.path.isdir(os.path.join(workspace, 'Build'))
+        assert not combo_worktrees_maintenance.is_link(os.path.join(workspace, 'Build'))
+
+    @pytest.mark.parametrize('jobs', [1, 2])
+    def test_checkout_worktree(self, tmp_path, monkeypatch, jobs):
+        workspace, _ = _make_workspace(tmp_path)
+        monkeypatch.chdir(workspace)
+        checkout('dev/next', None, worktree=True, jobs=jobs)
+        assert combo_worktrees_maintenance.get_active_combo_view(workspace) == 'dev_next'
+        assert bt.run_git(os.path.join(workspace, 'edk2'), 'rev-parse', '--abbrev-ref', 'HEAD') == 'dev'
+        assert bt.run_git(os.path.join(workspace, ROOTS[1]), 'rev-parse', '--abbrev-ref', 'HEAD') == 'main'
+        assert _read(workspace, 'edk2') == 'dev\n'
+        assert ManifestXml(os.path.join(workspace, 'repo', 'Manifest.xml')).general_config.current_combo == 'dev/next'
+        # Worktrees stay in use without the flag once enabled
+        checkout('main', None, jobs=jobs)
+        assert combo_worktrees_maintenance.get_active_combo_view(workspace) == 'main'
+        assert bt.run_git(os.path.join(workspace, 'edk2'), 'rev-parse', '--abbrev-ref', 'HEAD') == 'main'
+        assert _read(workspace, 'edk2') == 'main\n'
+
+    def test_sync_in_second_view(self, tmp_path, monkeypatch):
+        workspace, manifest = _make_workspace(tmp_path, HOOKS)
+        manifest_repo_path = str(tmp_path / 'manifest_repo')
+        os.makedirs(os.path.join(manifest_repo_path, 'hooks'))
+        with open(os.path.join(manifest_repo_path, 'hooks', 'pre-commit'), 'w') as hook_file:
+            hook_file.write('#!/bin/sh\n')
+        remote_path = str(tmp_path / 'remotes' / 'edk2')
+        bt.run_git(remote_path, 'checkout', '-q', 'dev')
+        dev_sha = bt.commit_files(remote_path, 'dev update')
+        # Keep the manifest repository handling and the global git config of the sync away from the test system
+        monkeypatch.setenv('HOME', str(tmp_path))
+        monkeypatch.setattr(sync_command, 'pull_workspace_manifest_repo', MagicMock())
+        monkeypatch.setattr(sync_command, 'find_source_manifest_repo', MagicMock(return_value='test'))
+        monkeypatch.setattr(sync_command, 'get_manifest_repo_path', MagicMock(return_value=manifest_repo_path))
+        monkeypatch.setattr(sync_command, 'list_available_manifest_repos', MagicMock(return_value=(['test'], [], [])))
+        monkeypatch.setattr(sync_command, 'verify_single_manifest', MagicMock())
+        monkeypatch.setattr(sync_command, 'update_editor_config', MagicMock())
+        monkeypatch.setattr(sync_command.SyncCommand, '_SyncCommand__check_for_new_manifest', MagicMock())
+        monkeypatch.chdir(workspace)
+        checkout('dev/next', None, worktree=True)
+        args = argparse.Namespace(jobs=None, bundle_dir=None, no_resume=False, update_local_manifest=False,
+                                  source_manifest_repo=None, override=False, fetch=False, verbose=False,
+                                  skip_submodule=True)
+        sync_command.SyncCommand().run_command(args, {'cfg_file': MagicMock(), 'user_cfg_file': MagicMock()})
+        dev_path = combo_worktrees_maintenance.get_view_path(workspace, 'dev_next')
+        assert bt.run_git(os.path.join(dev_path, 'edk2'), 'rev-parse', 'HEAD') == dev_sha
+        # The hooks are installed in the git directory the worktrees share with the main view
+        main_path = combo_worktrees_maintenance.get_view_path(workspace, 'main')
+        assert os.path.isfile(os.path.join(main_path, 'edk2', '.git', 'hooks', 'pre-commit'))
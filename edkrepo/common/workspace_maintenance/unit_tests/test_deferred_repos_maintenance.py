@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_deferred_repos_maintenance.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../..")))
+from edkrepo.common.workspace_maintenance.deferred_repos_maintenance import read_deferred_repos, write_deferred_repos
+from edkrepo.common.workspace_maintenance.deferred_repos_maintenance import is_lazy_workspace, get_deferred_roots
+from edkrepo.common.workspace_maintenance.deferred_repos_maintenance import filter_materialized, filter_deferred
+from edkrepo.common.workspace_maintenance.deferred_repos_maintenance import defer_repos, mark_materialized
+from edkrepo.common.workspace_maintenance.deferred_repos_maintenance import get_started_roots, mark_materialize_started
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+ROOTS = ['Edk2', 'Edk2Platforms', 'FSP']
+
+def _make_workspace(tmp_path):
+    '''Writes a workspace manifest with a repository for each of ROOTS. Returns the workspace path and the repo
+    sources.'''
+    workspace = str(tmp_path)
+    manifest = bt.write_manifest(workspace, bt.example_remotes(ROOTS), {'main': bt.source_elements(ROOTS)})
+    return workspace, manifest.get_repo_sources('main')
+
+class TestDeferredReposState:
+
+    def test_workspace_not_lazy(self, tmp_path):
+        workspace, sources = _make_workspace(tmp_path)
+        assert read_deferred_repos(workspace) is None
+        assert not is_lazy_workspace(workspace)
+        assert get_deferred_roots(workspace) == set()
+        assert filter_materialized(workspace, sources) == sources
+        assert filter_deferred(workspace, sources) == []
+
+    def test_write_and_read(self, tmp_path):
+        workspace, _ = _make_workspace(tmp_path)
+        write_deferred_repos(workspace, ['Edk2Platforms', 'Edk2'], {'blobless': True})
+        state = read_deferred_repos(workspace)
+        assert state == {'roots': ['Edk2', 'Edk2Platforms'], 'clone_options': {'blobless': True}}
+        assert is_lazy_workspace(workspace)
+        assert not os.path.exists(os.path.join(workspace, 'repo', 'deferred_repos.json.tmp'))
+
+    def test_filter_sources(self, tmp_path):
+        workspace, sources = _make_workspace(tmp_path)
+        write_deferred_repos(workspace, ['Edk2Platforms', 'FSP'], {})
+        assert filter_materialized(workspace, sources) == [sources[0]]
+        assert filter_deferred(workspace, sources) == sources[1:]
+
+class TestDeferredReposUpdates:
+
+    def test_mark_materialized(self, tmp_path):
+        workspace, _ = _make_workspace(tmp_path)
+        write_deferred_repos(workspace, ['Edk2', 'Edk2Platforms'], {'no_tags': True})
+        mark_materialized(workspace, ['Edk2'])
+        assert read_deferred_repos(workspace) == {'roots': ['Edk2Platforms'], 'clone_options': {'no_tags': True}}
+        mark_materialized(workspace, ['Edk2Platforms'])
+        # The workspace remains a lazy workspace once every repository has been materialized
+        assert is_lazy_workspace(workspace)
+        assert get_deferred_roots(workspace) == set()
+
+    def test_defer_repos_keeps_clone_options(self, tmp_path):
+        workspace, _ = _make_workspace(tmp_path)
+        write_deferred_repos(workspace, ['Edk2'], {'treeless': True})
+        defer_repos(workspace, ['FSP'])
+        assert read_deferred_repos(workspace) == {'roots': ['Edk2', 'FSP'], 'clone_options': {'treeless': True}}
+
+    def test_mark_materialized_not_lazy(self, tmp_path):
+        workspace, _ = _make_workspace(tmp_path)
+        mark_materialized(workspace, ['Edk2'])
+        assert not is_lazy_workspace(workspace)
+
+    def test_started_roots(self, tmp_path):
+        workspace, _ = _make_workspace(tmp_path)
+        write_deferred_repos(workspace, ['Edk2', 'Edk2Platforms'], {})
+        assert get_started_roots(workspace) == set()
+        mark_materialize_started(workspace, ['Edk2', 'Edk2Platforms'])
+        defer_repos(workspace, ['FSP'])
+        assert get_started_roots(workspace) == {'Edk2', 'Edk2Platforms'}
+        # A root stops being started once it is materialized
+        mark_materialized(workspace, ['Edk2'])
+        assert get_started_roots(workspace) == {'Edk2Platforms'}
+        mark_materialized(workspace, ['Edk2Platforms'])
+        assert read_deferred_repos(workspace) == {'roots': ['FSP'], 'clone_options': {}}
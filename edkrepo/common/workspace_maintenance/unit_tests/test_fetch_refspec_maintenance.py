@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_fetch_refspec_maintenance.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+
+from git import Repo
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../..")))
+from edkrepo_manifest_parser.edk_manifest import RepoSource, PatchSet, PatchOperation
+from edkrepo.common.workspace_maintenance.fetch_refspec_maintenance import get_manifest_branches, get_fetch_refspecs
+from edkrepo.common.workspace_maintenance.fetch_refspec_maintenance import scope_fetch_refspecs, track_branch
+from edkrepo.common.workspace_maintenance.fetch_refspec_maintenance import get_branch_refspec, is_full_fetch
+from edkrepo.common.workspace_maintenance.fetch_refspec_maintenance import NOTES_REFSPEC
+from edkrepo.common.workspace_maintenance.fetch_refspec_maintenance import is_workspace_full_fetch, set_workspace_full_fetch
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+class _FakeManifest():
+    def __init__(self, patchsets=None, operations=None):
+        self._patchsets = patchsets or {}
+        self._operations = operations or {}
+
+    def get_patchset(self, name, remote):
+        return self._patchsets[(name, remote)]
+
+    def get_patchset_operations(self, name, remote):
+        return self._operations.get((name, remote), [])
+
+def _source(branch='main', patch_set=None):
+    return RepoSource('repo', 'origin', 'https://example.com/repo.git', branch, None, False, False, None, None,
+                      patch_set, False, False)
+
+def _make_remote(tmp_path, branches):
+    remote = str(tmp_path / 'remote')
+    bt.init_repo(remote)
+    for branch in branches:
+        bt.run_git(remote, 'branch', branch)
+    return remote
+
+def _clone(tmp_path, remote):
+    local = str(tmp_path / 'local')
+    bt.run_git(str(tmp_path), 'clone', '-q', remote, local)
+    return Repo(local)
+
+def _remote_refs(repo):
+    return repo.git.for_each_ref('--format=%(refname)', 'refs/remotes/origin/').splitlines()
+
+class TestGetManifestBranches:
+
+    def test_branch_source(self):
+        assert get_manifest_branches(_FakeManifest(), _source()) == {'main'}
+
+    def test_patchset_source(self):
+        patchset = PatchSet('origin', 'Fix', 'abc123', 'fix-base')
+        operations = [[PatchOperation('Cherry-Pick', None, 'def456', None, 'fix-source', None),
+                       PatchOperation('Cherry-Pick', None, '789abc', 'other', 'other-branch', None)]]
+        manifest = _FakeManifest({('Fix', 'origin'): patchset}, {('Fix', 'origin'): operations})
+        assert get_manifest_branches(manifest, _source(None, 'Fix')) == {'fix-base', 'fix-source'}
+
+class TestScopeFetchRefspecs:
+
+    def test_scope_full_clone(self, tmp_path):
+        remote = _make_remote(tmp_path, ['feature1', 'feature2'])
+        repo = _clone(tmp_path, remote)
+        repo.git.branch('--track', 'feature2', 'origin/feature2')
+        assert is_full_fetch(repo)
+        removed = scope_fetch_refspecs(repo, _FakeManifest(), _source())
+        assert removed == ['refs/remotes/origin/feature1']
+        assert get_fetch_refspecs(repo) == [get_branch_refspec('feature2'), get_branch_refspec('main'), NOTES_REFSPEC]
+        assert not is_full_fetch(repo)
+        assert _remote_refs(repo) == ['refs/remotes/origin/HEAD', 'refs/remotes/origin/feature2',
+                                      'refs/remotes/origin/main']
+
+    def test_fetch_after_scope(self, tmp_path):
+        remote = _make_remote(tmp_path, [])
+        repo = _clone(tmp_path, remote)
+        scope_fetch_refspecs(repo, _FakeManifest(), _source())
+        bt.run_git(remote, 'branch', 'feature3')
+        repo.git.fetch('origin')
+        assert 'refs/remotes/origin/feature3' not in _remote_refs(repo)
+
+    def test_track_branch(self, tmp_path):
+        remote = _make_remote(tmp_path, ['feature1'])
+        repo = _clone(tmp_path, remote)
+        assert not track_branch(repo, 'feature1')
+        scope_fetch_refspecs(repo, _FakeManifest(), _source())
+        assert track_branch(repo, 'feature1')
+        assert not track_branch(repo, 'feature1')
+        repo.git.fetch('origin')
+        assert 'refs/remotes/origin/feature1' in _remote_refs(repo)
+
+class TestWorkspaceFullFetch:
+
+    def test_workspace_full_fetch(self, tmp_path):
+        workspace = str(tmp_path)
+        os.makedirs(os.path.join(workspace, 'repo'))
+        assert not is_workspace_full_fetch(workspace)
+        set_workspace_full_fetch(workspace)
+        assert is_workspace_full_fetch(workspace)
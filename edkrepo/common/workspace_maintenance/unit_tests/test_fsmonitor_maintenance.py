@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_fsmonitor_maintenance.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import sys
+
+from git import Repo
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../..")))
+import edkrepo.common.workspace_maintenance.fsmonitor_maintenance as fsmonitor_maintenance
+from edkrepo.git_automation.fsmonitor_watchman import format_response
+from edkrepo.common.unit_test_bases import base_tests as bt
+
+def _make_repo(tmp_path):
+    repo_path = str(tmp_path / 'repo')
+    bt.init_repo(repo_path)
+    return Repo(repo_path)
+
+def _get_fsmonitor(repo):
+    return repo.git.config('--local', '--get', 'core.fsmonitor', with_exceptions=False) or None
+
+class TestFsmonitorMaintenance:
+
+    def test_enable_watchman(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(fsmonitor_maintenance, 'get_fsmonitor_mode', lambda: fsmonitor_maintenance.FSMONITOR_MODE_WATCHMAN)
+        repo = _make_repo(tmp_path)
+        assert fsmonitor_maintenance.enable_fsmonitor(repo, '/usr/bin/python3')
+        assert _get_fsmonitor(repo) == '"/usr/bin/python3" "{}"'.format(fsmonitor_maintenance.WATCHMAN_HOOK)
+        assert not fsmonitor_maintenance.enable_fsmonitor(repo, '/usr/bin/python3')
+        assert fsmonitor_maintenance.disable_fsmonitor(repo)
+        assert _get_fsmonitor(repo) is None
+        assert not fsmonitor_maintenance.disable_fsmonitor(repo)
+
+    def test_enable_builtin(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(fsmonitor_maintenance, 'get_fsmonitor_mode', lambda: fsmonitor_maintenance.FSMONITOR_MODE_BUILTIN)
+        repo = _make_repo(tmp_path)
+        assert fsmonitor_maintenance.enable_fsmonitor(repo)
+        assert _get_fsmonitor(repo) == 'true'
+        assert repo.git.config('--get', fsmonitor_maintenance.EDKREPO_FSMONITOR_KEY) == 'true'
+        assert fsmonitor_maintenance.disable_fsmonitor(repo)
+        assert _get_fsmonitor(repo) is None
+        assert not repo.git.config('--get-regexp', '^edkrepo\\.', with_exceptions=False)
+
+    def test_no_monitor_available(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(fsmonitor_maintenance, 'get_fsmonitor_mode', lambda: None)
+        repo = _make_repo(tmp_path)
+        assert not fsmonitor_maintenance.enable_fsmonitor(repo)
+        assert _get_fsmonitor(repo) is None
+
+    def test_user_monitor_kept(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(fsmonitor_maintenance, 'get_fsmonitor_mode', lambda: fsmonitor_maintenance.FSMONITOR_MODE_WATCHMAN)
+        repo = _make_repo(tmp_path)
+        repo.git.config('core.fsmonitor', '.git/hooks/query-watchman')
+        assert not fsmonitor_maintenance.enable_fsmonitor(repo)
+        assert not fsmonitor_maintenance.disable_fsmonitor(repo)
+        assert _get_fsmonitor(repo) == '.git/hooks/query-watchman'
+
+    def test_user_builtin_monitor_kept(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(fsmonitor_maintenance, 'get_fsmonitor_mode', lambda: fsmonitor_maintenance.FSMONITOR_MODE_BUILTIN)
+        repo = _make_repo(tmp_path)
+        repo.git.config('core.fsmonitor', 'true')
+        assert not fsmonitor_maintenance.enable_fsmonitor(repo)
+        assert not fsmonitor_maintenance.disable_fsmonitor(repo)
+        assert _get_fsmonitor(repo) == 'true'
+
+class TestWatchmanHook:
+
+    def test_changed_paths(self):
+        response = {'clock': 'c:1:2', 'is_fresh_instance': False, 'files': ['a.txt', 'dir/b.txt']}
+        assert format_response(response) == 'c:1:2\0a.txt\0dir/b.txt\0'
+
+    def test_fresh_instance(self):
+        assert format_response({'clock': 'c:1:2', 'is_fresh_instance': True, 'files': ['a.txt']}) == 'c:1:2\0/\0'
+
+    def test_error(self):
+        assert format_response({'error': 'unable to resolve root'}) is None
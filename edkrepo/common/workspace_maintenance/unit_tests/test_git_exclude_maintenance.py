@@ -12,6 +12,7 @@ import sys
 from unittest.mock import mock_open, patch
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from edkrepo.common.unit_test_bases import base_tests as bt
 from edkrepo.common.workspace_maintenance.git_exclude_maintenance import write_git_exclude, generate_exclude_pattern
 
 class TestWriteGitExclude:
@@ -31,6 +32,14 @@ class TestWriteGitExclude:
             write_git_exclude(self.REPO_PATH, self.EXCLUDE_PATTERN)
             mocked_open().write.assert_called_once_with(self.EXCLUDE_PATTERN + "\n")
 
+    def test_linked_worktree(self, tmp_path):
+        repo_path = str(tmp_path / 'repo')
+        bt.init_repo(repo_path)
+        bt.run_git(repo_path, 'worktree', 'add', '-q', '--detach', str(tmp_path / 'worktree'))
+        write_git_exclude(str(tmp_path / 'worktree'), self.EXCLUDE_PATTERN)
+        with open(os.path.join(repo_path, '.git', 'info', 'exclude')) as exclude_file:
+            assert exclude_file.read().endswith(self.EXCLUDE_PATTERN + "\n")
+
 class TestGenerateExcludePattern:
     def test_generate_exclude_pattern(self):
         parent_repo_path = "/home/user/project"
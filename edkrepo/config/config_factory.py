@@ -23,6 +23,7 @@ from edkrepo.common.edkrepo_exception import EdkrepoPinFileNotFoundException
 from edkrepo.common.humble import MIRROR_PRIMARY_REPOS_MISSING, MIRROR_DECODE_WARNING, MAX_PATCH_SET_INVALID
 from edkrepo.common.pathfix import get_subst_drive_dict
 from edkrepo_manifest_parser import edk_manifest
+from edkrepo_manifest_parser import edk_manifest_cache
 from edkrepo.common.pathfix import expanduser
 
 def get_edkrepo_global_data_directory():
@@ -45,6 +46,18 @@ def get_edkrepo_global_data_directory():
         os.mkdir(global_data_dir)
     return global_data_dir
 
+def get_manifest_cache_directory():
+    '''Returns the directory of the parsed manifest cache. The cache holds pickled objects, so it is kept in a per user
+    directory instead of the global data directory, which all users of a Windows system share.'''
+    if sys.platform == "win32" and os.environ.get('LOCALAPPDATA'):
+        return os.path.join(os.environ['LOCALAPPDATA'], 'edkrepo', 'manifest_cache')
+    return os.path.join(expanduser("~/.edkrepo"), 'manifest_cache')
+
+def enable_manifest_cache(user_config):
+    '''Enables the cache of parsed manifest files unless the user has turned it off.'''
+    if user_config.manifest_cache_enabled:
+        edk_manifest_cache.enable(get_manifest_cache_directory())
+
 # Data structure used to describe configuration properties and associated values
 class CfgProp():
     """
@@ -225,7 +238,11 @@ class GlobalUserConfig(BaseConfig):
             CfgProp('send-review', 'max-patch-set', 'max_patch_set', '10', False),
             CfgProp('reference-repos', 'enable-by-default', 'ref_repos_enable_by_default', 'false', False),
             CfgProp('reference-repos', 'dissociate-by-default', 'ref_repos_dissociate_by_default', 'true', False),
-            CfgProp('reference-repos', 'reference-enabled-for', 'ref_repos_enabled_for', '', False)]
+            CfgProp('reference-repos', 'reference-enabled-for', 'ref_repos_enabled_for', '', False),
+            CfgProp('mirror-pool', 'enable-by-default', 'mirror_pool_enable_by_default', 'false', False),
+            CfgProp('fetch', 'full-fetch', 'full_fetch', 'false', False),
+            CfgProp('status', 'fsmonitor', 'fsmonitor', 'false', False),
+            CfgProp('manifest-cache', 'enable', 'manifest_cache', 'true', False)]
         super().__init__(self.filename, get_edkrepo_global_data_directory(), False)
 
     @property
@@ -243,6 +260,22 @@ class GlobalUserConfig(BaseConfig):
             return []
         return [name.strip() for name in value.split(',') if name.strip()]
 
+    @property
+    def mirror_pool_enabled_by_default(self):
+        return self.mirror_pool_enable_by_default.lower() == 'true'
+
+    @property
+    def full_fetch_enabled(self):
+        return self.full_fetch.lower() == 'true'
+
+    @property
+    def fsmonitor_enabled(self):
+        return self.fsmonitor.lower() == 'true'
+
+    @property
+    def manifest_cache_enabled(self):
+        return self.manifest_cache.lower() == 'true'
+
     def get_reference_repo_url(self, name):
         if self.cfg.has_section(name) and self.cfg.has_option(name, 'url'):
             return self.cfg[name]['url']
@@ -93,6 +93,9 @@ def generate_command_line(command):
                         choices.append(choice.get('choice'))
                         help_text += '\n' + choice.get('help-text')
                 subparser_name.add_argument(arg.get('name'), choices=choices, help=help_text)
+            #check for positionals accepting a list of values
+            elif 'nargs' in arg:
+                subparser_name.add_argument(arg.get('name'), nargs=arg.get('nargs'), help=arg.get('help-text'))
             #check if non-required positional
             elif not arg.get('required'):
                 subparser_name.add_argument(arg.get('name'), nargs='?', help=arg.get('help-text'))
@@ -218,6 +221,7 @@ def main():
     try:
         config["cfg_file"] = config_factory.GlobalConfig()
         config["user_cfg_file"] = config_factory.GlobalUserConfig()
+        config_factory.enable_manifest_cache(config["user_cfg_file"])
     except EdkrepoGlobalConfigNotFoundException as e:
         print("Error: {}".format(str(e)))
         return e.exit_code
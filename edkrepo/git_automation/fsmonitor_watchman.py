@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+#
+## @file
+# fsmonitor_watchman.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''git core.fsmonitor hook, version 2 of the hook protocol, backed by Watchman.
+
+Watchman watches the working tree with inotify and answers which paths changed since the token git passes in, so git
+status only examines those paths instead of scanning the whole tree. Any failure exits with an error, after which git
+falls back to a full scan.
+'''
+
+import json
+import os
+import subprocess
+import sys
+
+HOOK_VERSION = '2'
+# Tells git that every path may have changed
+ALL_PATHS = '/'
+
+def query_watchman(query):
+    # Watchman exits with an error when the response is an error, which is handled by the caller
+    watchman = subprocess.run(['watchman', '-j', '--no-pretty'], input=json.dumps(query), stdout=subprocess.PIPE,
+                              universal_newlines=True)
+    return json.loads(watchman.stdout)
+
+def format_response(response):
+    '''Returns the hook output for a Watchman query response: the new token followed by the changed paths, each
+    terminated by NUL. A fresh Watchman instance has no history, so every path is reported as changed.'''
+    if 'error' in response or 'clock' not in response:
+        return None
+    paths = [ALL_PATHS] if response.get('is_fresh_instance') else response.get('files', [])
+    return ''.join('{}\0'.format(x) for x in [response['clock']] + paths)
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] != HOOK_VERSION:
+        return 1
+    token = sys.argv[2]
+    # git runs the hook in the root of the working tree
+    worktree = os.getcwd()
+    try:
+        response = None
+        if token.startswith('c:'):
+            response = query_watchman(['query', worktree, {'since': token, 'fields': ['name'],
+                                                           'expression': ['not', ['dirname', '.git']]}])
+        if response is None or 'error' in response:
+            # There is no Watchman clock yet or the working tree is no longer watched, for example after a reboot.
+            # Start watching and let git scan the whole tree once.
+            query_watchman(['watch', worktree])
+            response = query_watchman(['clock', worktree])
+            response['is_fresh_instance'] = True
+    except (OSError, ValueError):
+        return 1
+    output = format_response(response)
+    if output is None:
+        return 1
+    sys.stdout.write(output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,9 @@ import xml.etree.ElementTree as ET
 # 3rd party imports
 #   None planned at this time
 
+# Local imports
+import edkrepo_manifest_parser.edk_manifest_cache as edk_manifest_cache
+
 
 #
 # All the namedtuple data structures that consumers of this module will need.
@@ -149,29 +152,47 @@ class CiIndexXml(BaseXmlHelper):
     def __init__(self, fileref):
         """Parse `fileref` as a CiIndex XML file and populate the internal project map."""
         super().__init__(fileref, 'ProjectList')
-        self._projects = {}
+        projects = {}
         for element in self._tree.iter(tag='Project'):
             proj = _Project(element)
             # Todo: add check for unique
-            self._projects[proj.name] = proj
+            projects[proj.name] = proj
+        self._projects = projects
+
+    @property
+    def _projects(self):
+        """Return the dict of _Project objs, with Project.name as key."""
+        return self.__projects
+
+    @_projects.setter
+    def _projects(self, projects):
+        """Replace the project map and drop the project name lists built from the previous one."""
+        self.__projects = projects
+        self._project_names = None
+
+    def _get_project_names(self):
+        """Return the (non-archived, archived) lists of project names, building both on first use."""
+        if self._project_names is None:
+            proj_names = []
+            archived_proj_names = []
+            for proj in self._projects.values():
+                if proj.archived is False:
+                    proj_names.append(proj.name)
+                elif proj.archived is True:
+                    archived_proj_names.append(proj.name)
+            self._project_names = (proj_names, archived_proj_names)
+        return self._project_names
 
     @property
     def project_list(self):
         """Return a list of names for all non-archived projects in the index."""
-        proj_names = []
-        for proj in self._projects.values():
-            if proj.archived is False:
-                proj_names.append(proj.name)
-        return proj_names
+        # Callers may extend the list they get, so each call returns a copy
+        return list(self._get_project_names()[0])
 
     @property
     def archived_project_list(self):
         """Return a list of names for all archived projects in the index."""
-        proj_names = []
-        for proj in self._projects.values():
-            if proj.archived is True:
-                proj_names.append(proj.name)
-        return proj_names
+        return list(self._get_project_names()[1])
 
     def get_project_xml(self, project_name):
         """Return the XML path for `project_name`, or raise `ValueError` if not found."""
@@ -200,50 +221,131 @@ def _parse_project_required_attribs(element):
     return name, xml_path
 
 
+class _LazySection():
+    def __init__(self, parser):
+        """Declare a ManifestXml attribute that is set by the method named `parser` the first time it is read."""
+        self._parser = parser
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        """Parse the section; the parser stores it on the instance, which hides this descriptor from then on."""
+        if instance is None:
+            return self
+        getattr(instance, self._parser)()
+        return instance.__dict__[self._name]
+
+
 #
 #  This class will parse and the manifest XML file and populate the named
 #  tuples defined above to provide abstracted access to the manifest data
 #
 class ManifestXml(BaseXmlHelper):
-    def __init__(self, fileref):
+    #
+    # The sections that are only parsed when first used if the manifest is loaded with lazy=True
+    #
+    _combinations = _LazySection('_parse_combinations')          # dict of _Combination objs, with Combination.name as key
+    _combo_sources = _LazySection('_parse_combo_sources')        # dict of _RepoSource obj lists, with Combination.name as key
+    _dsc_list = _LazySection('_parse_dsc_list')
+    _sparse_settings = _LazySection('_parse_sparse_checkout')    # A single instance of platform sparse checkout settings
+    _sparse_data = _LazySection('_parse_sparse_checkout')        # List of SparseData objects
+    _commit_templates = _LazySection('_parse_commit_templates')  # dict of commit message templates with the remote name as the key
+    _folder_to_folder_mappings = _LazySection('_parse_folder_to_folder_mappings')  # List of FolderToFolderMapping objects
+    _patch_sets = _LazySection('_parse_patch_sets')
+    _patch_set_operations = _LazySection('_parse_patch_sets')
+
+    def __init__(self, fileref, lazy=False):
         """
         Most of the attributes of this class are intended to be private as they are used for
         internally gathering and storing the manifest data. As such, all access to them should be
         done through the provided methods to ensure future compatibility if the xml schema changes
+
+        If lazy is True, the combinations, sources, sparse data, patchsets, commit templates and the other
+        optional sections are only parsed when they are first used, so errors in them are raised then instead of here.
         """
-        super().__init__(fileref, ['Pin', 'Manifest'])
-        self._project_info = None
-        self._general_config = None
-        self._remotes = {}                    # dict of _Remote objs, with Remote.name as key
-        self._client_hook_list = []
-        self._combinations = {}               # dict of _Combination objs, with Combination.name as key
-        self._combo_sources = {}              # dict of _RepoSource obj lists, with Combination.name as key
-        self._dsc_list = []
-        self._sparse_settings = None          # A single instance of platform sparse checkout settings
-        self._sparse_data = []                # List of SparseData objects
-        self._commit_templates = {}           # dict of commit message templates with the remote name as the key
-        self._folder_to_folder_mappings = []  # List of FolderToFolderMapping objects
-        self._submodule_alternate_remotes = []
-        self._submodule_init_list = []
-        self._patch_sets = {}
-        self._patch_set_operations = {}
+        cached_state, cache_key = edk_manifest_cache.load(fileref)
+        if cached_state is not None:
+            self.__dict__.update(cached_state)
+            self._fileref = fileref
+            # The tree is only needed to modify, write or compare the manifest, so it is loaded on first use
+            self._tree_path = os.path.abspath(fileref)
+            self._etree = None
+            return
+        self._parse(fileref)
+        if lazy:
+            # Only a fully parsed manifest can be cached
+            return
+        self._parse_sections()
+        edk_manifest_cache.store(cache_key, self._included_files,
+                                 {name: value for name, value in self.__dict__.items() if name != '_etree'})
 
-        #
-        # Append include XML's to the Manifest etree before parsing
-        #
-        tree_root = self._tree.getroot()
+    @property
+    def _tree(self):
+        """Return the ElementTree of the manifest with its included files appended, loading it if needed."""
+        if self._etree is None:
+            tree = self._load_tree(self._tree_path)
+            self._append_includes(tree, self._tree_path)
+            if self._xml_type == 'Pin':
+                self._wrap_pin_combination(tree, self._tree_path)
+            self._etree = tree
+        return self._etree
+
+    @_tree.setter
+    def _tree(self, tree):
+        self._etree = tree
+
+    def _append_includes(self, tree, fileref):
+        """Append the elements of the files included by `tree` to its root and return the paths of the included files."""
+        included_files = []
+        tree_root = tree.getroot()
         incl_path = os.path.dirname(os.path.abspath(fileref))
-        for include_elem in self._tree.iter(tag='Include'):
+        for include_elem in tree.iter(tag='Include'):
             incl_file = os.path.join(incl_path, include_elem.attrib['xml'])
             try:
                 include_tree = ET.ElementTree(file=incl_file)
             except Exception:
                 raise TypeError("{} is not a valid xml file".format(incl_file))
+            included_files.append(incl_file)
             for elem in include_tree.iterfind('*'):
                 if elem.tag != 'ProjectInfo' and elem.tag != 'GeneralConfig':
                     tree_root.append(elem)
             # remove include tags after added to etree to prevent feedback issues
             tree_root.remove(include_elem)
+        return included_files
+
+    def _wrap_pin_combination(self, tree, fileref):
+        """Check that the pin in `tree` has a single <Combination> and move it into a <CombinationList> if needed."""
+        combos_list = tree.findall('CombinationList')
+        if len(combos_list) == 1:
+            combos = tree.find('CombinationList').findall('Combination')
+        else:
+            combos = tree.findall('Combination')
+        if len(combos) != 1:
+            raise KeyError(PIN_COMBO_ERROR.format(fileref))
+
+        # <CombinationList> container tag not required for pin files
+        if tree.find('CombinationList') is None:
+            tree_root = tree.getroot()
+            combolist = ET.SubElement(tree_root, 'CombinationList')
+            combolist.append(combos[0])
+            tree_root.remove(combos[0])
+
+    def _parse(self, fileref):
+        """Load `fileref` and its included files and populate the attributes of the manifest that are always parsed."""
+        super().__init__(fileref, ['Pin', 'Manifest'])
+        self._tree_path = os.path.abspath(fileref)
+        self._project_info = None
+        self._general_config = None
+        self._remotes = {}                    # dict of _Remote objs, with Remote.name as key
+        self._client_hook_list = []
+        self._submodule_alternate_remotes = []
+        self._submodule_init_list = []
+
+        #
+        # Append include XML's to the Manifest etree before parsing
+        #
+        self._included_files = self._append_includes(self._tree, fileref)
 
         #
         # parse <RemoteList> tags
@@ -288,73 +390,89 @@ class ManifestXml(BaseXmlHelper):
                 self._submodule_init_list.append(_SubmoduleInitEntry(element))
 
         #
-        # parse <CombinationList> tags
-        # requires RemoteList to be parsed first
+        # Check the single <Combination> of a pin file
         #
         if self._xml_type == 'Pin':
-            combos_list = self._tree.findall('CombinationList')
-            if len(combos_list) == 1:
-                combos = self._tree.find('CombinationList').findall('Combination')
-            else:
-                combos = self._tree.findall('Combination')
-            if len(combos) != 1:
-                raise KeyError(PIN_COMBO_ERROR.format(fileref))
+            self._wrap_pin_combination(self._tree, fileref)
+        return
 
-            # <CombinationList> container tag not required for pin files
-            if self._tree.find('CombinationList') is None:
-                combolist = ET.SubElement(tree_root, 'CombinationList')
-                combolist.append(combos[0])
-                tree_root.remove(combos[0])
+    def _parse_sections(self):
+        """Parse every section that is left to be parsed on first use when the manifest is loaded with lazy=True."""
+        for parser in ['_parse_combinations', '_parse_combo_sources', '_parse_sparse_checkout', '_parse_patch_sets',
+                       '_parse_dsc_list', '_parse_commit_templates', '_parse_folder_to_folder_mappings']:
+            getattr(self, parser)()
 
+    def _iter_combination_elements(self):
+        """Yield the <Combination> elements of every <CombinationList>."""
         for subroot in self._tree.iter(tag='CombinationList'):
             for element in subroot.iter(tag='Combination'):
-                combo = _Combination(element)
-
-                # add the combo obj to the combinations and combo_sources dicts
-                self._add_combo_source(element, combo)
-
-        #
-        # Process <SparseCheckout> tag
-        #
+                yield element
+
+    def _parse_combinations(self):
+        """Parse the <Combination> tags without their <Source> tags into self._combinations."""
+        combinations = {}
+        for element in self._iter_combination_elements():
+            self._add_unique_item(_Combination(element), combinations, element.tag)
+        self._combinations = combinations
+
+    def _parse_combo_sources(self):
+        """Parse the <Source> tags of every combination into self._combo_sources; requires RemoteList to be parsed first."""
+        combo_sources = {}
+        for element in self._iter_combination_elements():
+            combo = _Combination(element)
+            if combo.name in combo_sources:
+                raise KeyError(DUPLICATE_TAG_ERROR.format(element.tag, combo.name))
+            combo_sources[combo.name] = self._parse_repo_sources(element)
+        self._combo_sources = combo_sources
+
+    def _parse_sparse_checkout(self):
+        """Process the <SparseCheckout> tag into self._sparse_settings and self._sparse_data."""
+        sparse_settings = None
+        sparse_data_list = []
         subroot = self._tree.find('SparseCheckout')
         if subroot is not None:
             try:
-                self._sparse_settings = _SparseSettings(subroot.find('SparseSettings'))
+                sparse_settings = _SparseSettings(subroot.find('SparseSettings'))
             except KeyError as k:
                 raise KeyError(REQUIRED_ATTRIB_ERROR_MSG.format(k, subroot.tag))
             for sparse_data in subroot.iter(tag='SparseData'):
-                self._sparse_data.append(_SparseData(sparse_data))
-
-        #
-        # Process <PatchSets> tag
-        #
+                sparse_data_list.append(_SparseData(sparse_data))
+        self._sparse_settings = sparse_settings
+        self._sparse_data = sparse_data_list
+
+    def _parse_patch_sets(self):
+        """Process the <PatchSets> tag into self._patch_sets and self._patch_set_operations."""
+        patch_sets = {}
+        patch_set_operations = {}
         subroot = self._tree.find('PatchSets')
         if subroot is not None:
             for patchset in subroot.iter(tag='PatchSet'):
                 if patchset.attrib['name'] == "main" or patchset.attrib['name'] == "master":
                     raise ValueError(INVALID_PATCHSET_NAME_ERROR.format(patchset.attrib['name']))
-                self._patch_sets[(patchset.attrib['name'], getattr(_PatchSet(patchset).tuple, "remote"))] =_PatchSet(patchset).tuple
+                patch_sets[(patchset.attrib['name'], getattr(_PatchSet(patchset).tuple, "remote"))] =_PatchSet(patchset).tuple
                 operations = []
                 for subelem in patchset:
                     operations.append(_PatchSetOperations(subelem).tuple)
-                self._patch_set_operations[(patchset.attrib['name'], getattr(_PatchSet(patchset).tuple, "remote"))] = operations
+                patch_set_operations[(patchset.attrib['name'], getattr(_PatchSet(patchset).tuple, "remote"))] = operations
+        self._patch_sets = patch_sets
+        self._patch_set_operations = patch_set_operations
 
-        if self._xml_type == 'Pin':
-            # done with Pin parsing at this point, so exit init
-            # remaining tag types are unique to manifest xml (for now...)
-            return
-
-        #
-        # parse <DscList> tags
-        #
-        for subroot in self._tree.iter(tag='DscList'):
-            for element in subroot.iter(tag='Dsc'):
-                self._dsc_list.append(element.text)
-
-        #
-        # Process any commit log templates that may exist (optional)
-        #
-        subroot = self._tree.find('CommitTemplates')
+    #
+    # The remaining tag types are unique to manifest xml (for now...), so they are empty for a Pin
+    #
+    def _parse_dsc_list(self):
+        """Parse the <DscList> tags into self._dsc_list."""
+        dsc_list = []
+        if self._xml_type != 'Pin':
+            for subroot in self._tree.iter(tag='DscList'):
+                for element in subroot.iter(tag='Dsc'):
+                    dsc_list.append(element.text)
+        self._dsc_list = dsc_list
+
+    def _parse_commit_templates(self):
+        """Process any commit log templates that may exist (optional) into self._commit_templates."""
+        commit_templates = {}
+        subroot = self._tree.find('CommitTemplates') if self._xml_type != 'Pin' else None
         if subroot is not None:
             for template_element in subroot.iter(tag='Template'):
                 try:
@@ -362,16 +480,17 @@ class ManifestXml(BaseXmlHelper):
                     template_text = template_element.text
                 except KeyError as k:
                     raise KeyError(REQUIRED_ATTRIB_ERROR_MSG.format(k, subroot.tag))
-                self._commit_templates[remote_name] = template_text
+                commit_templates[remote_name] = template_text
+        self._commit_templates = commit_templates
 
-        #
-        # Process <FolderToFolderMappingList> tag
-        #
-        subroot = self._tree.find('FolderToFolderMappingList')
+    def _parse_folder_to_folder_mappings(self):
+        """Process the <FolderToFolderMappingList> tag into self._folder_to_folder_mappings."""
+        f2f_mappings = []
+        subroot = self._tree.find('FolderToFolderMappingList') if self._xml_type != 'Pin' else None
         if subroot is not None:
             for f2f_mapping in subroot.iter(tag='FolderToFolderMapping'):
-                self._folder_to_folder_mappings.append(_FolderToFolderMapping(f2f_mapping))
-        return
+                f2f_mappings.append(_FolderToFolderMapping(f2f_mapping))
+        self._folder_to_folder_mappings = f2f_mappings
 
     def is_pin_file(self):
         """Return True if the parsed file is of type Pin, False otherwise."""
@@ -382,17 +501,22 @@ class ManifestXml(BaseXmlHelper):
 
     def add_combo(self, element):
         """Append `element` to the CombinationList in the tree and register it internally."""
-        self._tree.find('CombinationList').append(element)
+        # Registered before it is added to the tree, so that combinations parsed lazily from the tree do not include it
         combo = _Combination(element)
         self._add_combo_source(element, combo)
+        self._tree.find('CombinationList').append(element)
 
     def _add_combo_source(self, subroot, combo):
         """Create a list of _RepoSource objs from the <Source> tags in subroot and add it to the _combo_sources dictionary."""
         self._add_unique_item(combo, self._combinations, subroot.tag)
+        self._combo_sources[combo.name] = self._parse_repo_sources(subroot)
+
+    def _parse_repo_sources(self, subroot):
+        """Return a list of _RepoSource objs for the <Source> tags in subroot."""
         temp_sources = []
         for element in subroot.iter(tag='Source'):
             temp_sources.append(_RepoSource(element, self._remotes))
-        self._combo_sources[combo.name] = temp_sources
+        return temp_sources
 
     def _add_unique_item(self, obj, item_dict, tag):
         """Add `obj` to `item_dict` keyed by name, or raise KeyError if the key already exists."""
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+#
+## @file
+# edk_manifest_cache.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+"""
+Cache of parsed manifest files, so that loading an unchanged manifest does not parse it again.
+
+The parsed model of a ManifestXml is stored as a pickle, keyed by the absolute path of the file. An entry is only used
+if the SHA-256 of the file and of every file it includes still match, and if it was written by the same parser. The
+entries are kept in memory and, if a cache directory is given to enable(), in files that later processes reuse. Every
+load unpickles a new copy, so callers may modify what they get. The cache is disabled until enable() is called.
+"""
+
+# Standard imports
+import hashlib
+import os
+import pickle
+import threading
+
+CACHE_FILE_EXTENSION = '.pickle'
+_PARSER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'edk_manifest.py')
+
+_lock = threading.Lock()
+_enabled = False
+_cache_dir = None
+_memory_entries = {}
+_parser_version = None
+
+
+def enable(cache_dir=None):
+    """Enable the cache; entries are also written to cache_dir, which is created when needed, unless it is None."""
+    global _enabled, _cache_dir
+    with _lock:
+        _enabled = True
+        _cache_dir = cache_dir
+
+
+def disable():
+    """Disable the cache and drop the entries held in memory; files already written to the cache directory are kept."""
+    global _enabled, _cache_dir
+    with _lock:
+        _enabled = False
+        _cache_dir = None
+        _memory_entries.clear()
+
+
+def is_enabled():
+    """Return True if enable() has been called since the last disable()."""
+    return _enabled
+
+
+def _get_parser_version():
+    """Return a stamp of the parser source, so that entries written by another version of the parser are not used."""
+    global _parser_version
+    if _parser_version is None:
+        stat = os.stat(_PARSER_FILE)
+        _parser_version = '{}-{}'.format(stat.st_size, stat.st_mtime_ns)
+    return _parser_version
+
+
+def _hash_file(path):
+    """Return the SHA-256 of the contents of path, or None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _get_entry_file(cache_dir, path):
+    """Return the path of the cache file holding the entry of the manifest at path."""
+    name = hashlib.sha256(os.path.normcase(path).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, name + CACHE_FILE_EXTENSION)
+
+
+def _read_entry(cache_dir, path):
+    """Return the entry stored in cache_dir for path, or None if there is none or it cannot be read."""
+    try:
+        with open(_get_entry_file(cache_dir, path), 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        # A missing, truncated or incompatible cache file is treated as a miss
+        return None
+
+
+def _write_entry(cache_dir, path, entry):
+    """Atomically write entry to cache_dir; failures are ignored since the cache is only an optimization."""
+    entry_file = _get_entry_file(cache_dir, path)
+    temp_file = '{}.{}.tmp'.format(entry_file, os.getpid())
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(temp_file, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, entry_file)
+    except OSError:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def _is_current(entry, digest):
+    """Return True if entry was written by this parser for the current contents of the file and its includes."""
+    if not isinstance(entry, dict) or entry.get('version') != _get_parser_version():
+        return False
+    if entry.get('digest') != digest:
+        return False
+    return all(_hash_file(include) == include_digest for include, include_digest in entry['includes'])
+
+
+def load(fileref):
+    """
+    Return (state, key) for fileref. state is a new copy of the attributes stored for the file, or None if the cache
+    is disabled, fileref is not a path or the file has changed since it was stored. key identifies the contents of the
+    file read by this call and must be passed to store() after parsing; it is None when nothing can be stored.
+    """
+    if not _enabled or not isinstance(fileref, str):
+        return None, None
+    path = os.path.abspath(fileref)
+    # Hash the file before it is parsed, so a change made while parsing is not stored as the current contents
+    digest = _hash_file(path)
+    if digest is None:
+        return None, None
+    with _lock:
+        entry = _memory_entries.get(path)
+        cache_dir = _cache_dir
+    if entry is None and cache_dir is not None:
+        entry = _read_entry(cache_dir, path)
+    if entry is None or not _is_current(entry, digest):
+        return None, (path, digest)
+    with _lock:
+        _memory_entries[path] = entry
+    return pickle.loads(entry['state']), (path, digest)
+
+
+def store(key, included_files, state):
+    """
+    Store state, the attributes of a ManifestXml parsed from the file identified by key, which was returned by load().
+
+    Arguments:
+    key - the key returned by load(), nothing is stored if it is None
+    included_files - the paths of the files included by the manifest
+    state - the dictionary of attributes to store, which must be picklable
+    """
+    if key is None or not _enabled:
+        return
+    path, digest = key
+    try:
+        state_data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        # Only plain parsed data can be cached
+        return
+    includes = []
+    for include in included_files:
+        include_digest = _hash_file(include)
+        if include_digest is None:
+            return
+        includes.append((include, include_digest))
+    entry = {'version': _get_parser_version(), 'digest': digest, 'includes': includes, 'state': state_data}
+    with _lock:
+        _memory_entries[path] = entry
+        cache_dir = _cache_dir
+    if cache_dir is not None:
+        _write_entry(cache_dir, path, entry)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+#
+## @file
+# edk_manifest_diff.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+# Standard imports
+from collections import namedtuple
+
+#
+# A repository present in both manifests, as described by the initial and the new manifest.
+#
+SourceChange = namedtuple('SourceChange', ['initial', 'new'])
+
+
+def _source_key(source):
+    """Return the identity of a repository; a repository keeps its identity when only its ref changes."""
+    return (source.root, source.remote_name, source.remote_url)
+
+
+def _source_ref(source):
+    """Return the ref a repository is checked out onto."""
+    return (source.branch, source.commit, source.tag, source.patch_set)
+
+
+def _submodule_init_key(init_path):
+    """Return a SubmoduleInitPath without the combination it was selected for."""
+    return (init_path.remote_name, init_path.recursive, init_path.path)
+
+
+def _combo_sparse_data(manifest, combo):
+    """Return the sparse checkout entries that apply to `combo` in a comparable form."""
+    return sorted((str(x.remote_name), tuple(x.always_include), tuple(x.always_exclude))
+                  for x in manifest.sparse_data if x.combination is None or x.combination == combo)
+
+
+class ManifestDiff():
+    """Compares a combination of one manifest with a combination of another manifest in a single pass.
+
+    The two manifests may be the same object when switching between combinations, or the local and the updated global
+    manifest when syncing. Repositories are matched by local root, remote name and remote URL.
+    """
+    def __init__(self, initial_manifest, initial_combo, new_manifest, new_combo):
+        """Compare the repo sources, hooks, submodule init entries and sparse settings of the two combinations."""
+        initial_sources = initial_manifest.get_repo_sources(initial_combo)
+        new_sources = new_manifest.get_repo_sources(new_combo)
+        new_by_key = {_source_key(source): source for source in new_sources}
+        new_roots = set(source.root for source in new_sources)
+        initial_keys = set()
+
+        self._common = []
+        self._ref_changes = []
+        self._removed = []
+        self._replaced = []
+        sparse_flag_changed = False
+        submodule_flag_changed = False
+        for initial in initial_sources:
+            key = _source_key(initial)
+            initial_keys.add(key)
+            new = new_by_key.get(key)
+            if new is None:
+                # A different repository that takes over the root must not be cloned on top of the old one
+                if initial.root in new_roots:
+                    self._replaced.append(initial)
+                else:
+                    self._removed.append(initial)
+                continue
+            change = SourceChange(initial, new)
+            self._common.append(change)
+            if _source_ref(initial) != _source_ref(new):
+                self._ref_changes.append(change)
+            sparse_flag_changed = sparse_flag_changed or initial.sparse != new.sparse
+            submodule_flag_changed = submodule_flag_changed or initial.enable_submodule != new.enable_submodule
+        self._added = [source for source in new_sources if _source_key(source) not in initial_keys]
+
+        obsolete_by_remote = {(source.remote_name, source.remote_url): source for source in self._removed + self._replaced}
+        self._relocated = [SourceChange(obsolete_by_remote[(source.remote_name, source.remote_url)], source)
+                           for source in self._added if (source.remote_name, source.remote_url) in obsolete_by_remote]
+
+        initial_hooks = initial_manifest.repo_hooks
+        new_hooks = new_manifest.repo_hooks
+        self._hooks_added = [hook for hook in new_hooks if hook not in initial_hooks]
+        self._hooks_removed = [hook for hook in initial_hooks if hook not in new_hooks]
+        self._hooks_kept = [hook for hook in initial_hooks if hook in new_hooks]
+
+        initial_inits = {_submodule_init_key(x): x for x in initial_manifest.get_submodule_init_paths(combo=initial_combo)}
+        new_inits = {_submodule_init_key(x): x for x in new_manifest.get_submodule_init_paths(combo=new_combo)}
+        self._submodule_inits_added = [x for key, x in new_inits.items() if key not in initial_inits]
+        self._submodule_inits_removed = [x for key, x in initial_inits.items() if key not in new_inits]
+        self._submodule_flag_changed = submodule_flag_changed
+
+        self._sparse_changed = (sparse_flag_changed or
+                                initial_manifest.sparse_settings != new_manifest.sparse_settings or
+                                _combo_sparse_data(initial_manifest, initial_combo) != _combo_sparse_data(new_manifest, new_combo))
+
+    @property
+    def common(self):
+        """Return SourceChange tuples for the repositories present in both combinations."""
+        return list(self._common)
+
+    @property
+    def ref_changes(self):
+        """Return SourceChange tuples for the common repositories whose branch, commit, tag or patchset changed."""
+        return list(self._ref_changes)
+
+    @property
+    def added(self):
+        """Return the RepoSource tuples of the new combination that are not in the initial combination."""
+        return list(self._added)
+
+    @property
+    def removed(self):
+        """Return the RepoSource tuples of the initial combination whose root is not used by the new combination."""
+        return list(self._removed)
+
+    @property
+    def replaced(self):
+        """Return the RepoSource tuples of the initial combination whose root is used by a different repository."""
+        return list(self._replaced)
+
+    @property
+    def relocated(self):
+        """Return SourceChange tuples for repositories whose remote is unchanged but whose root changed."""
+        return list(self._relocated)
+
+    @property
+    def has_source_changes(self):
+        """Return True if repositories were added, removed or replaced."""
+        return bool(self._added or self._removed or self._replaced)
+
+    @property
+    def hooks_added(self):
+        """Return the RepoHook tuples that are only in the new manifest."""
+        return list(self._hooks_added)
+
+    @property
+    def hooks_removed(self):
+        """Return the RepoHook tuples that are only in the initial manifest."""
+        return list(self._hooks_removed)
+
+    @property
+    def hooks_kept(self):
+        """Return the RepoHook tuples that are in both manifests."""
+        return list(self._hooks_kept)
+
+    @property
+    def submodule_inits_added(self):
+        """Return the SubmoduleInitPath tuples that only apply to the new combination."""
+        return list(self._submodule_inits_added)
+
+    @property
+    def submodule_inits_removed(self):
+        """Return the SubmoduleInitPath tuples that only apply to the initial combination."""
+        return list(self._submodule_inits_removed)
+
+    @property
+    def submodules_changed(self):
+        """Return True if the submodules initialized for the combination may differ."""
+        return bool(self._submodule_inits_added or self._submodule_inits_removed or self._submodule_flag_changed)
+
+    @property
+    def sparse_changed(self):
+        """Return True if the sparse checkout settings or the sparse flag of a common repository changed."""
+        return self._sparse_changed
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_lazy_manifest.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import shutil
+
+import pytest
+
+import edkrepo_manifest_parser.edk_manifest_cache as edk_manifest_cache
+from edkrepo_manifest_parser.edk_manifest import CiIndexXml, ManifestXml
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'integration_test_bases',
+                            'fixtures')
+COMPLETE_MANIFEST = os.path.join(FIXTURES_DIR, 'complete_manifest.xml')
+CI_INDEX = os.path.join(FIXTURES_DIR, 'ci_index_multiple_projects.xml')
+LAZY_SECTIONS = ['_combinations', '_combo_sources', '_dsc_list', '_sparse_settings', '_sparse_data',
+                 '_commit_templates', '_folder_to_folder_mappings', '_patch_sets', '_patch_set_operations']
+
+
+@pytest.fixture(autouse=True)
+def disable_cache():
+    yield
+    edk_manifest_cache.disable()
+
+
+def _summary(manifest):
+    return (manifest.project_info, manifest.general_config, manifest.remotes, manifest.repo_hooks,
+            manifest.combinations, manifest.archived_combinations,
+            {x.name: manifest.get_repo_sources(x.name) for x in manifest.combinations},
+            manifest.dsc_list, manifest.sparse_settings, manifest.sparse_data, manifest.commit_templates,
+            manifest.folder_to_folder_mappings, manifest.get_all_patchsets,
+            manifest.get_patchset_operations('test-patch', 'origin'), manifest.submodule_alternate_remotes,
+            manifest.get_submodule_init_paths())
+
+
+def _parsed_sections(manifest):
+    return [x for x in LAZY_SECTIONS if x in manifest.__dict__]
+
+
+class TestLazyManifestXml:
+
+    def test_eager_by_default(self):
+        assert _parsed_sections(ManifestXml(COMPLETE_MANIFEST)) == LAZY_SECTIONS
+
+    def test_sections_parsed_on_first_use(self):
+        manifest = ManifestXml(COMPLETE_MANIFEST, lazy=True)
+        assert manifest.project_info.codename == 'CompleteTestProject'
+        assert _parsed_sections(manifest) == []
+        # Listing the combinations does not parse their sources
+        assert [x.name for x in manifest.combinations] == ['main', 'dev']
+        assert _parsed_sections(manifest) == ['_combinations']
+        combinations = manifest._combinations
+        manifest.get_repo_sources('main')
+        assert _parsed_sections(manifest) == ['_combinations', '_combo_sources']
+        # Each section is only parsed once
+        assert manifest._combinations is combinations
+
+    def test_same_data_as_eager(self):
+        assert _summary(ManifestXml(COMPLETE_MANIFEST, lazy=True)) == _summary(ManifestXml(COMPLETE_MANIFEST))
+
+    def test_section_errors_raised_on_use(self, tmp_path):
+        manifest_path = str(tmp_path / 'manifest.xml')
+        shutil.copy(COMPLETE_MANIFEST, manifest_path)
+        with open(manifest_path) as f:
+            contents = f.read()
+        with open(manifest_path, 'w') as f:
+            f.write(contents.replace('<PatchSet name="test-patch"', '<PatchSet name="main"'))
+        with pytest.raises(ValueError, match='cannot be named'):
+            ManifestXml(manifest_path)
+        manifest = ManifestXml(manifest_path, lazy=True)
+        assert [x.name for x in manifest.combinations] == ['main', 'dev']
+        with pytest.raises(ValueError, match='cannot be named'):
+            manifest.get_patchset('main', 'origin')
+
+    def test_add_combo(self):
+        manifest = ManifestXml(COMPLETE_MANIFEST, lazy=True)
+        combo = manifest.get_combo_element('main')
+        combo.attrib['name'] = 'new'
+        manifest.add_combo(combo)
+        assert [x.name for x in manifest.combinations] == ['main', 'dev', 'new']
+        assert manifest.get_repo_sources('new') == manifest.get_repo_sources('main')
+
+    def test_lazy_manifest_not_cached(self):
+        edk_manifest_cache.enable()
+        ManifestXml(COMPLETE_MANIFEST, lazy=True)
+        assert edk_manifest_cache.load(COMPLETE_MANIFEST)[0] is None
+        ManifestXml(COMPLETE_MANIFEST)
+        # A lazy load uses the entry stored by a full parse
+        assert _parsed_sections(ManifestXml(COMPLETE_MANIFEST, lazy=True)) == LAZY_SECTIONS
+
+
+class TestCiIndexXmlProjectLists:
+
+    def test_project_lists(self):
+        ci_index = CiIndexXml(CI_INDEX)
+        assert ci_index.project_list == ['Project1', 'Project2']
+        assert ci_index.archived_project_list == ['Project3']
+
+    def test_project_list_is_a_copy(self):
+        ci_index = CiIndexXml(CI_INDEX)
+        ci_index.project_list.extend(ci_index.archived_project_list)
+        assert ci_index.project_list == ['Project1', 'Project2']
+
+    def test_lists_follow_project_map(self):
+        ci_index = CiIndexXml(CI_INDEX)
+        assert ci_index.project_list == ['Project1', 'Project2']
+        ci_index._projects = {}
+        assert ci_index.project_list == []
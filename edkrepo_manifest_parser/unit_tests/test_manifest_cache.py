@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_manifest_cache.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+import os
+import shutil
+
+import pytest
+
+import edkrepo_manifest_parser.edk_manifest_cache as edk_manifest_cache
+from edkrepo_manifest_parser.edk_manifest import ManifestXml
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'integration_test_bases',
+                            'fixtures')
+MANIFEST_FILE = 'manifest_with_include.xml'
+INCLUDED_FILE = 'included_manifest.xml'
+
+
+@pytest.fixture(autouse=True)
+def disable_cache():
+    yield
+    edk_manifest_cache.disable()
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    """Copy the manifest with an include and its included file to a temporary directory."""
+    for file_name in (MANIFEST_FILE, INCLUDED_FILE):
+        shutil.copy(os.path.join(FIXTURES_DIR, file_name), str(tmp_path / file_name))
+    return str(tmp_path / MANIFEST_FILE)
+
+
+def _forbid_parsing(monkeypatch):
+    """Make parsing fail, so that a test can check a manifest is loaded from the cache."""
+    def _parse(self, fileref):
+        raise AssertionError('{} was parsed'.format(fileref))
+    monkeypatch.setattr(ManifestXml, '_parse', _parse)
+
+
+def _replace(path, old, new):
+    with open(path) as f:
+        contents = f.read()
+    with open(path, 'w') as f:
+        f.write(contents.replace(old, new))
+
+
+def _summary(manifest):
+    return (manifest.project_info, manifest.general_config, manifest.remotes, manifest.combinations,
+            {x.name: manifest.get_repo_sources(x.name) for x in manifest.combinations})
+
+
+class TestManifestCache:
+
+    def test_disabled_by_default(self, manifest_path):
+        assert not edk_manifest_cache.is_enabled()
+        assert edk_manifest_cache.load(manifest_path) == (None, None)
+
+    def test_memory_hit(self, manifest_path, monkeypatch):
+        edk_manifest_cache.enable()
+        parsed = ManifestXml(manifest_path)
+        _forbid_parsing(monkeypatch)
+        cached = ManifestXml(manifest_path)
+        assert _summary(cached) == _summary(parsed)
+        assert cached._etree is None
+        # Each load is an independent copy
+        cached.write_current_combo('included-combo', filename=os.path.join(os.path.dirname(manifest_path), 'out.xml'))
+        assert cached.general_config.current_combo == 'included-combo'
+        assert ManifestXml(manifest_path).general_config.current_combo == 'main'
+
+    @pytest.mark.parametrize('changed_file', [MANIFEST_FILE, INCLUDED_FILE])
+    def test_change_invalidates(self, manifest_path, changed_file):
+        edk_manifest_cache.enable()
+        ManifestXml(manifest_path)
+        changed_path = os.path.join(os.path.dirname(manifest_path), changed_file)
+        _replace(changed_path, 'https://github.com/test/', 'https://example.com/test/')
+        urls = [x.url for x in ManifestXml(manifest_path).remotes]
+        assert any(x.startswith('https://example.com/') for x in urls)
+
+    def test_disk_hit(self, manifest_path, tmp_path, monkeypatch):
+        cache_dir = str(tmp_path / 'cache')
+        edk_manifest_cache.enable(cache_dir)
+        parsed = ManifestXml(manifest_path)
+        assert len(os.listdir(cache_dir)) == 1
+        # Drop the entries held in memory, as a new process would start without them
+        edk_manifest_cache.disable()
+        edk_manifest_cache.enable(cache_dir)
+        _forbid_parsing(monkeypatch)
+        cached = ManifestXml(manifest_path)
+        assert _summary(cached) == _summary(parsed)
+        assert cached.equals(parsed)
+
+    def test_corrupt_cache_file_ignored(self, manifest_path, tmp_path):
+        cache_dir = str(tmp_path / 'cache')
+        edk_manifest_cache.enable(cache_dir)
+        parsed = ManifestXml(manifest_path)
+        cache_file = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+        with open(cache_file, 'wb') as f:
+            f.write(b'not a pickle')
+        edk_manifest_cache.disable()
+        edk_manifest_cache.enable(cache_dir)
+        assert _summary(ManifestXml(manifest_path)) == _summary(parsed)
+
+    def test_pin_tree_loaded_on_use(self, manifest_path, tmp_path):
+        manifest = ManifestXml(manifest_path)
+        pin_path = str(tmp_path / 'pin.xml')
+        sources = [x._replace(commit='0' * 40) for x in manifest.get_repo_sources('main')]
+        manifest.generate_pin_xml('Pin', 'main', sources, filename=pin_path)
+        edk_manifest_cache.enable()
+        parsed = ManifestXml(pin_path)
+        cached = ManifestXml(pin_path)
+        assert cached.is_pin_file()
+        assert cached._etree is None
+        # The combination of the pin is moved into a <CombinationList> again when the tree is loaded
+        assert cached.get_combo_element('main').attrib['name'] == 'main'
+        assert cached.equals(parsed)
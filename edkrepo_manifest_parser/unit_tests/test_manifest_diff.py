@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+#
+## @file
+# test_manifest_diff.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+from edkrepo_manifest_parser.edk_manifest import RepoSource, RepoHook, SparseData, SparseSettings, SubmoduleInitPath
+from edkrepo_manifest_parser.edk_manifest_diff import ManifestDiff, SourceChange
+
+URL_A = 'https://example.com/a.git'
+URL_B = 'https://example.com/b.git'
+URL_C = 'https://example.com/c.git'
+
+
+def _source(root, url, branch='main', commit=None, sparse=False):
+    return RepoSource(root=root, remote_name=root.split('/')[-1], remote_url=url, branch=branch, commit=commit,
+                      sparse=sparse, enable_submodule=False, tag=None, venv_cfg=None, patch_set=None, blobless=False,
+                      treeless=False)
+
+
+class _Manifest():
+    """Minimal stand-in for ManifestXml providing the members used by ManifestDiff."""
+    def __init__(self, combos, hooks=None, submodules=None, sparse_data=None, sparse_settings=None):
+        self._combos = combos
+        self.repo_hooks = hooks or []
+        self._submodules = submodules or []
+        self.sparse_data = sparse_data or []
+        self.sparse_settings = sparse_settings
+
+    def get_repo_sources(self, combo_name):
+        return list(self._combos[combo_name])
+
+    def get_submodule_init_paths(self, remote_name=None, combo=None):
+        return [x for x in self._submodules if x.combo == combo or x.combo is None]
+
+
+class TestManifestDiff:
+
+    def test_identical_combos_have_no_changes(self):
+        manifest = _Manifest({'main': [_source('a', URL_A), _source('b', URL_B)]})
+        diff = ManifestDiff(manifest, 'main', manifest, 'main')
+        assert len(diff.common) == 2
+        assert not diff.ref_changes
+        assert not diff.has_source_changes
+        assert not diff.relocated
+        assert not diff.submodules_changed
+        assert not diff.sparse_changed
+
+    def test_ref_changes(self):
+        manifest = _Manifest({'main': [_source('a', URL_A), _source('b', URL_B)],
+                              'dev': [_source('a', URL_A, branch='dev'), _source('b', URL_B)]})
+        diff = ManifestDiff(manifest, 'main', manifest, 'dev')
+        assert diff.ref_changes == [SourceChange(_source('a', URL_A), _source('a', URL_A, branch='dev'))]
+        assert not diff.has_source_changes
+
+    def test_added_removed_replaced_relocated(self):
+        initial = _Manifest({'main': [_source('a', URL_A), _source('b', URL_B), _source('c', URL_C)]})
+        new = _Manifest({'main': [_source('a', URL_B), _source('d/c', URL_C), _source('b', URL_B)]})
+        diff = ManifestDiff(initial, 'main', new, 'main')
+        assert [x.initial.root for x in diff.common] == ['b']
+        assert diff.replaced == [_source('a', URL_A)]
+        assert diff.removed == [_source('c', URL_C)]
+        assert diff.added == [_source('a', URL_B), _source('d/c', URL_C)]
+        assert diff.relocated == [SourceChange(_source('c', URL_C), _source('d/c', URL_C))]
+        assert diff.has_source_changes
+
+    def test_hook_changes(self):
+        kept = RepoHook('kept', '.git/hooks', None, URL_A)
+        removed = RepoHook('removed', '.git/hooks', None, URL_A)
+        added = RepoHook('added', '.git/hooks', None, URL_A)
+        initial = _Manifest({'main': [_source('a', URL_A)]}, hooks=[kept, removed])
+        new = _Manifest({'main': [_source('a', URL_A)]}, hooks=[kept, added])
+        diff = ManifestDiff(initial, 'main', new, 'main')
+        assert diff.hooks_added == [added]
+        assert diff.hooks_removed == [removed]
+        assert diff.hooks_kept == [kept]
+
+    def test_submodule_init_changes(self):
+        shared = SubmoduleInitPath('a', None, False, 'shared')
+        main_only = SubmoduleInitPath('a', 'main', True, 'core')
+        manifest = _Manifest({'main': [_source('a', URL_A)], 'dev': [_source('a', URL_A)]},
+                             submodules=[shared, main_only])
+        diff = ManifestDiff(manifest, 'main', manifest, 'dev')
+        assert diff.submodule_inits_removed == [main_only]
+        assert not diff.submodule_inits_added
+        assert diff.submodules_changed
+
+    def test_sparse_changes(self):
+        combos = {'main': [_source('a', URL_A)], 'dev': [_source('a', URL_A)],
+                  'sparse': [_source('a', URL_A, sparse=True)]}
+        shared = SparseData(None, 'a', ['src'], [])
+        manifest = _Manifest(combos, sparse_data=[shared], sparse_settings=SparseSettings(False))
+        assert not ManifestDiff(manifest, 'main', manifest, 'dev').sparse_changed
+        assert ManifestDiff(manifest, 'main', manifest, 'sparse').sparse_changed
+        dev_only = _Manifest(combos, sparse_data=[shared, SparseData('dev', 'a', ['docs'], [])],
+                             sparse_settings=SparseSettings(False))
+        assert ManifestDiff(dev_only, 'main', dev_only, 'dev').sparse_changed
@@ -519,7 +519,6 @@ class BuildInfo:
         self.__workspace_list = workspace_list
         self.__define_data = None
         self.__use_comments = False
-        self.__sparse_file_name = os.path.join('.git', 'info', 'sparse-checkout')
         self.__sparse_all_files = ['/*']
 
     def find_sparse_checkout(self):
@@ -537,12 +536,12 @@ class BuildInfo:
 
     def reset_sparse_checkout(self, disable=False):
         for root in self.__workspace_list:
-            out_file = os.path.join(root, self.__sparse_file_name)
+            try:
+                repo = git.Repo(root)
+            except:
+                continue
+            out_file = os.path.join(repo.git_dir, 'info', 'sparse-checkout')
             if os.path.exists(out_file):
-                try:
-                    repo = git.Repo(root)
-                except:
-                    continue
                 print('- {}'.format(root))
                 fileutils.write_lines(out_file, self.__sparse_all_files)
                 repo.head.reset(working_tree=True)
@@ -550,32 +549,41 @@ class BuildInfo:
                     with repo.config_writer() as cw:
                         cw.set_value(section='core', option='sparsecheckout', value='false')
 
-    def sparse_checkout(self, root=None, always_include=[], always_exclude=[]):
-        """Performs a sparse checkout operation on a single repository"""
-        local_prune_data = []
-        for item in always_include:
-            local_prune_data.append('/{}'.format(item))
-        for item in always_exclude:
-            local_prune_data.append('!/{}'.format(item))
+    def sparse_checkout(self, root=None, always_include=[], always_exclude=[], populate=True):
+        """Performs a sparse checkout operation on a single repository.  If populate is False only the sparse
+        checkout patterns are installed and the working tree is left untouched."""
         try:
             repo = git.Repo(root)
         except:
             return
         print('- {}'.format(root))
-        out_file = os.path.join(root, self.__sparse_file_name)
-        fileutils.write_lines(out_file, local_prune_data)
-        with repo.config_writer() as cw:
-            cw.set_value(section='core', option='sparsecheckout', value='true')
-        repo.head.reset(working_tree=True)
-
-def process_sparse_checkout(workspace_root, repo_list, current_combo, manifest):
+        install_sparse_patterns(repo, always_include, always_exclude)
+        if populate:
+            repo.head.reset(working_tree=True)
+
+def install_sparse_patterns(repo, always_include=[], always_exclude=[]):
+    """Writes the sparse checkout patterns for a repository and enables sparse checkout without updating the
+    working tree"""
+    local_prune_data = []
+    for item in always_include:
+        local_prune_data.append('/{}'.format(item))
+    for item in always_exclude:
+        local_prune_data.append('!/{}'.format(item))
+    info_dir = os.path.join(repo.git_dir, 'info')
+    if not os.path.isdir(info_dir):
+        os.makedirs(info_dir)
+    fileutils.write_lines(os.path.join(info_dir, 'sparse-checkout'), local_prune_data)
+    with repo.config_writer() as cw:
+        cw.set_value(section='core', option='sparsecheckout', value='true')
+
+def get_sparse_checkout_data(repo_list, current_combo, manifest):
+    """Returns a dictionary mapping the root of each repository in repo_list that uses sparse checkout to a tuple
+    of the (always_include, always_exclude) lists that apply to it"""
     # Determine if sparse checkout support is enabled in the manifest.
     sparse_settings = manifest.sparse_settings
     if sparse_settings is None:
         raise RuntimeError('Sparse checkout not enabled in manifest file.')
     sparse_list = [x for x in repo_list if x.sparse]
-    workspace_list = [workspace_root]
-    workspace_list.extend([os.path.join(workspace_root, os.path.normpath(x.root)) for x in repo_list])
 
     # Filter sparse data entries that apply to the current combo or all combos
     # Build list in three steps (all, repo, combo) to make sure the priority is correct
@@ -584,10 +592,7 @@ def process_sparse_checkout(workspace_root, repo_list, current_combo, manifest):
     sparse_data.extend([x for x in manifest.sparse_data if x.remote_name is not None and x.combination is None])
     sparse_data.extend([x for x in manifest.sparse_data if x.remote_name is not None and x.combination == current_combo])
 
-    # Create object that processes build information.
-    build_info = BuildInfo(workspace_list)
-
-    # Apply sparse checkout data to each repository
+    checkout_data = collections.OrderedDict()
     for repo in sparse_list:
         always_exclude = []
         always_include = []
@@ -595,7 +600,20 @@ def process_sparse_checkout(workspace_root, repo_list, current_combo, manifest):
             if item.remote_name is None or item.remote_name == repo.remote_name:
                 always_include.extend(item.always_include)
                 always_exclude.extend(item.always_exclude)
-        root = os.path.join(workspace_root, os.path.normpath(repo.root))
+        checkout_data[repo.root] = (always_include, always_exclude)
+    return checkout_data
+
+def process_sparse_checkout(workspace_root, repo_list, current_combo, manifest):
+    checkout_data = get_sparse_checkout_data(repo_list, current_combo, manifest)
+    workspace_list = [workspace_root]
+    workspace_list.extend([os.path.join(workspace_root, os.path.normpath(x.root)) for x in repo_list])
+
+    # Create object that processes build information.
+    build_info = BuildInfo(workspace_list)
+
+    # Apply sparse checkout data to each repository
+    for repo_root, (always_include, always_exclude) in checkout_data.items():
+        root = os.path.join(workspace_root, os.path.normpath(repo_root))
         build_info.sparse_checkout(root, always_include, always_exclude)
 
 #
@@ -189,23 +189,25 @@ def _get_submodule_state(remote_name, start_manifest, start_combo, end_manifest=
     return start_subs, start_subs_enabled, end_subs, end_subs_enabled
 
 
-def deinit_full(workspace, manifest, verbose=False):
+def deinit_full(workspace, manifest, verbose=False, repo_sources=None):
     """
     Does full submodule deinit based on the current combo.
 
-        workspace - Path to the current workspace.
-        manifest  - The current manifest parser object.
+        workspace    - Path to the current workspace.
+        manifest     - The current manifest parser object.
+        repo_sources - The repos of the current combo to process.  If None all repos are processed.
     """
     print(strings.SUBMOD_DEINIT_FULL)
     current_combo = manifest.general_config.current_combo
-    repo_sources = manifest.get_repo_sources(current_combo)
+    if repo_sources is None:
+        repo_sources = manifest.get_repo_sources(current_combo)
     for source in repo_sources:
         if _get_submodule_enable(manifest, source.remote_name, current_combo):
             # Open the repo and process submodules
             try:
                 repo = git.Repo(os.path.join(workspace, source.root))
             except Exception as repo_error:
-                if args.verbose:
+                if verbose:
                     print(strings.SUBMOD_EXCEPTION.format(repo_error))
                 continue
             _deinit(repo, None, verbose)
@@ -227,7 +229,7 @@ def init_full(workspace, manifest, verbose=False):
             try:
                 repo = git.Repo(os.path.join(workspace, source.root))
             except Exception as repo_error:
-                if args.verbose:
+                if verbose:
                     print(strings.SUBMOD_EXCEPTION.format(repo_error))
                 continue
             _update(repo, None, verbose, True)
@@ -256,7 +258,7 @@ def deinit_submodules(workspace, start_manifest, start_combo,
         try:
             repo = git.Repo(os.path.join(workspace, source.root))
         except Exception as repo_error:
-            if args.verbose:
+            if verbose:
                 print(strings.SUBMOD_EXCEPTION.format(repo_error))
             continue
 
@@ -284,24 +286,26 @@ def deinit_submodules(workspace, start_manifest, start_combo,
             _deinit(repo, deinit_list, verbose)
 
 
-def maintain_submodules(workspace, manifest, combo_name, verbose=False):
+def maintain_submodules(workspace, manifest, combo_name, verbose=False, repo_sources=None):
     """
     Updates the submodules for a specific repo.
 
-        workspace  - Path to the current workspace.
-        manifest   - The manifest parser object for the project.
-        combo_name - The combination name to use for submodule maintenance.
-        verbose    - Enable verbose messages.
+        workspace    - Path to the current workspace.
+        manifest     - The manifest parser object for the project.
+        combo_name   - The combination name to use for submodule maintenance.
+        verbose      - Enable verbose messages.
+        repo_sources - The repos of the combo to process.  If None all repos are processed.
     """
     # Process each repo that may have submodules enabled
     ui_functions.print_info_msg(strings.SUBMOD_INIT_UPDATE)
-    repo_sources = manifest.get_repo_sources(combo_name)
+    if repo_sources is None:
+        repo_sources = manifest.get_repo_sources(combo_name)
     for source in repo_sources:
         # Open the repo and process submodules
         try:
             repo = git.Repo(os.path.join(workspace, source.root))
         except Exception as repo_error:
-            if args.verbose:
+            if verbose:
                 ui_functions.print_error_msg(strings.SUBMOD_EXCEPTION.format(repo_error))
             continue
 